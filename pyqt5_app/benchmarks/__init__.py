@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+성능 측정 (GUI/DB 없이 실행)
+
+    python -m benchmarks.run --output benchmarks/results/before.json
+    python -m benchmarks.run --quick --compare benchmarks/results/before.json
+"""
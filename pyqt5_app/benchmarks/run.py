@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+시간표 생성/날짜 계산 성능 측정
+
+합성 카탈로그(과목 10~500개, 요일/격주/주차 혼합, 촘촘한 공휴일, 1~3년 기간)로
+아래 작업의 실행 시간과 최대 메모리(tracemalloc)를 재고 결과를 JSON으로 저장한다.
+
+- create_timetable: 시간표 작성 화면의 배정 (schedule + to_timetable, 강사 중복 색인 포함)
+- generate_timetable: 시간표 자동 생성의 행 생성 (build_course_entries + INSERT 파라미터)
+  (DB 조회/저장은 제외)
+- work_calendar: 공휴일로 근무일 달력 생성
+- calculate_dates: CourseDialog.calculate_dates와 같은 단계별 종료일 계산 (시작일 하나씩)
+- plan_start_dates: 후보 시작일 전체를 한 번에 계산
+- korean_holidays: 100년치 법정공휴일 계산
+
+사용 예:
+    python -m benchmarks.run
+    python -m benchmarks.run --quick --compare benchmarks/results/before.json --max-slowdown 1.5
+"""
+
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.synthetic import make_subjects, make_holidays, make_conflicts, make_course
+from utils.schedule_engine import schedule
+from utils.timetable_generator import build_course_entries, entry_params
+from utils.work_calendar import WorkCalendar
+from utils.start_date_planner import plan_start_dates, days_for_hours
+from utils.korean_holidays import holidays_between
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# 측정 기준 시작일 (월요일)
+BASE_DATE = date(2026, 3, 2)
+
+# name: 측정 이름, params: 조건 dict, setup: () → 측정할 함수 (반환값은 결과 요약 dict)
+Case = namedtuple('Case', 'name params setup')
+
+
+def _calendar(years):
+    holidays = make_holidays(BASE_DATE.year - 1, BASE_DATE.year + years + 2)
+    return holidays, WorkCalendar(holidays)
+
+
+def _create_timetable_case(count, years):
+    def setup():
+        subjects = make_subjects(count)
+        holidays, _ = _calendar(years)
+        holiday_set = set(holidays)
+        end_date = BASE_DATE + timedelta(days=365 * years)
+        conflicts = make_conflicts(subjects, BASE_DATE, end_date)
+
+        def run():
+            result = schedule(subjects, holiday_set, BASE_DATE, end_date, conflicts=conflicts)
+            timetable = result.to_timetable(subjects)
+            return {'days': len(timetable), 'incomplete_hours': sum(h for h in result.remaining.values() if h > 0)}
+        return run
+    return Case('create_timetable', {'subjects': count, 'years': years}, setup)
+
+
+def _generate_timetable_case(count, years):
+    def setup():
+        subjects = make_subjects(count)
+        _, calendar = _calendar(years)
+        course = make_course('C-BENCH', BASE_DATE, years)
+        conflicts = make_conflicts(subjects, BASE_DATE, course['lecture_end_date'])
+
+        def run():
+            entries, details, _ = build_course_entries(course, subjects, calendar, BASE_DATE,
+                                                       conflicts=conflicts)
+            params = [entry_params(entry) for entry in entries]
+            return {'entries': len(params), 'total_days': details['total_days']}
+        return run
+    return Case('generate_timetable', {'subjects': count, 'years': years}, setup)
+
+
+def _work_calendar_case(years):
+    def setup():
+        holidays = make_holidays(BASE_DATE.year, BASE_DATE.year + years - 1)
+
+        def run():
+            calendar = WorkCalendar(holidays)
+            return {'holidays': len(calendar.holidays)}
+        return run
+    return Case('work_calendar', {'years': years}, setup)
+
+
+def _calculate_dates_case(candidates, hours=(260, 220, 120)):
+    def setup():
+        _, calendar = _calendar(3)
+        starts = [BASE_DATE + timedelta(days=i) for i in range(candidates)]
+        lecture_days, project_days, internship_days = [days_for_hours(h) for h in hours]
+
+        def run():
+            finish = None
+            for start in starts:
+                lecture_end = calendar.nth_working_day(start, lecture_days)
+                project_start = calendar.next_working_day(lecture_end + timedelta(days=1))
+                project_end = calendar.nth_working_day(project_start, project_days)
+                internship_start = calendar.next_working_day(project_end + timedelta(days=1))
+                internship_end = calendar.nth_working_day(internship_start, internship_days)
+                calendar.holidays_between(start, internship_end, weekdays_only=True)
+                calendar.working_days_between(start, internship_end)
+                finish = internship_end
+            return {'last_end': finish.isoformat()}
+        return run
+    return Case('calculate_dates', {'candidates': candidates}, setup)
+
+
+def _plan_start_dates_case(candidates, hours=(260, 220, 120)):
+    def setup():
+        _, calendar = _calendar(3)
+        last = BASE_DATE + timedelta(days=candidates - 1)
+
+        def run():
+            plans = plan_start_dates(calendar, BASE_DATE, last, *hours, working_only=False)
+            plans.order('fewest_lecture_holidays')
+            return {'candidates': len(plans)}
+        return run
+    return Case('plan_start_dates', {'candidates': candidates}, setup)
+
+
+def _korean_holidays_case(years):
+    def setup():
+        def run():
+            return {'holidays': len(holidays_between(2000, 2000 + years - 1))}
+        return run
+    return Case('korean_holidays', {'years': years}, setup)
+
+
+def build_cases(quick=False):
+    """측정 목록 (quick이면 작은 조건만)"""
+    subject_counts = (10, 50) if quick else (10, 50, 200, 500)
+    year_counts = (1,) if quick else (1, 2, 3)
+    candidate_counts = (100,) if quick else (100, 500)
+
+    cases = []
+    for years in year_counts:
+        for count in subject_counts:
+            cases.append(_create_timetable_case(count, years))
+            cases.append(_generate_timetable_case(count, years))
+    for years in year_counts:
+        cases.append(_work_calendar_case(years))
+    for candidates in candidate_counts:
+        cases.append(_calculate_dates_case(candidates))
+        cases.append(_plan_start_dates_case(candidates))
+    cases.append(_korean_holidays_case(101))
+    return cases
+
+
+def measure(case, repeat=5):
+    """한 측정 실행: (시간 통계, 최대 메모리) 결과 dict
+
+    시간은 한 번 예열한 뒤 repeat번 잰다. 메모리는 tracemalloc이 실행을 느리게 하므로 따로 한 번 잰다.
+    """
+    run = case.setup()
+    info = run()
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'name': case.name,
+        'params': case.params,
+        'repeat': repeat,
+        'min_ms': round(min(timings) * 1000, 3),
+        'median_ms': round(statistics.median(timings) * 1000, 3),
+        'mean_ms': round(statistics.mean(timings) * 1000, 3),
+        'peak_kib': round(peak / 1024, 1),
+        'info': info,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _key(result):
+    return result['name'], json.dumps(result['params'], sort_keys=True)
+
+
+def compare(results, baseline, max_slowdown=None):
+    """이전 결과와 중앙값 비교 출력
+
+    Returns:
+        list: max_slowdown 배 이상 느려진 (이름, 조건, 배율) 목록
+    """
+    previous = {_key(result): result for result in baseline['results']}
+    regressions = []
+    print(f"\n이전 결과와 비교 (기준: {baseline['meta'].get('git_commit') or baseline['meta'].get('created_at')})")
+    for result in results:
+        before = previous.get(_key(result))
+        if not before or not before['median_ms']:
+            continue
+        ratio = result['median_ms'] / before['median_ms']
+        mark = ""
+        if max_slowdown and ratio >= max_slowdown:
+            mark = "  ← 느려짐"
+            regressions.append((result['name'], result['params'], ratio))
+        print(f"  {result['name']:<20} {_params_text(result['params']):<28} "
+              f"{before['median_ms']:>10.2f}ms → {result['median_ms']:>10.2f}ms  x{ratio:.2f}{mark}")
+    return regressions
+
+
+def _params_text(params):
+    return ", ".join(f"{key}={value}" for key, value in params.items())
+
+
+def main(argv=None):
+    """명령줄 실행: 측정 후 JSON 저장 (--compare로 이전 결과와 비교)"""
+    parser = argparse.ArgumentParser(description="시간표 생성/날짜 계산 성능 측정")
+    parser.add_argument('--quick', action='store_true', help="작은 조건만 측정")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 반복 횟수 (기본 5)")
+    parser.add_argument('--filter', help="이름에 이 문자열이 들어간 측정만")
+    parser.add_argument('--output', help="결과 JSON 경로 (기본 benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    parser.add_argument('--max-slowdown', type=float,
+                        help="이전 결과보다 이 배율 이상 느려지면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in build_cases(args.quick) if not args.filter or args.filter in case.name]
+    commit = _git_commit()
+    meta = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': args.quick,
+        'repeat': args.repeat,
+    }
+
+    results = []
+    for case in cases:
+        result = measure(case, args.repeat)
+        results.append(result)
+        print(f"{case.name:<20} {_params_text(case.params):<28} "
+              f"중앙값 {result['median_ms']:>10.2f}ms  최대 메모리 {result['peak_kib']:>10.1f}KiB")
+
+    output = args.output
+    if not output:
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        output = os.path.join(RESULTS_DIR, f"{stamp}-{commit or 'nogit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'results': results}, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_slowdown)
+        if regressions:
+            print(f"\n⚠️ {len(regressions)}개 측정이 x{args.max_slowdown} 이상 느려졌습니다.")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
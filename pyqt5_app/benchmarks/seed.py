@@ -0,0 +1,509 @@
+# -*- coding: utf-8 -*-
+"""
+대용량 합성 데이터 적재 (부하/화면 규모 시험용)
+
+create_tables의 테이블과 면담/면담 사진 테이블을 운영 규모의 합성 데이터로 채운다.
+같은 preset/seed면 항상 같은 데이터가 만들어지므로 성능 개선 전후를 같은 데이터로 비교할 수 있다.
+
+- 강사/과목/공휴일(법정공휴일)/과정/과정-과목/시간표/학생/프로젝트/면담/면담 사진
+- 이름/전화번호/주소는 한국어 형식, 시간표는 시간표 자동 생성과 같은 build_course_entries로 생성
+- 과정 수만으로 timetable_rows에 못 미치면 같은 교육과정의 이전 기수 과정을 더 만든다
+- 모든 INSERT는 execute_many(다중 행 VALUES)로 BATCH_ROWS 행씩 트랜잭션 단위로 적재
+- 사진은 자리표시 PNG 몇 장을 photo_dir에 만들고 모든 사진 행이 그 파일을 가리킨다
+
+대상은 config_db의 MySQL(KDT_DB_BACKEND) 또는 --sqlite로 지정한 로컬 SQLite 파일이다.
+적재할 테이블이 비어 있어야 하며, --reset을 주면 기존 행을 지우고 적재한다.
+
+사용 예:
+    python -m benchmarks.seed --preset small --sqlite /tmp/kdt_small.db
+    python -m benchmarks.seed --preset production --seed 1 --reset
+"""
+
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+import argparse
+import random
+import struct
+import time
+import zlib
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.synthetic import make_subjects
+from config_db import CODE_PREFIX
+from utils.helpers import to_date
+from utils.korean_holidays import holidays_between, upsert_holidays
+from utils.timetable_generator import INSERT_QUERY, build_course_entries, entry_params
+from utils.work_calendar import WorkCalendar
+
+# courses: 과정 수, instructors/subjects: 강사/과목 수, students: 학생 수,
+# consultations: 면담 수, photo_ratio: 사진이 있는 면담/학생 비율,
+# timetable_rows: 시간표 최소 행 수 (None이면 과정 수만큼), years: 데이터 기간 (년)
+Preset = namedtuple('Preset', 'courses instructors subjects students consultations photo_ratio timetable_rows years')
+
+PRESETS = {
+    'tiny': Preset(3, 10, 30, 100, 300, 0.3, None, 1),
+    'small': Preset(10, 30, 80, 1000, 5000, 0.3, None, 2),
+    'medium': Preset(30, 80, 200, 3000, 15000, 0.3, 100000, 3),
+    'production': Preset(100, 200, 400, 10000, 50000, 0.3, 1000000, 5),
+}
+
+# 한 트랜잭션(execute_many)으로 적재할 최대 행 수
+BATCH_ROWS = 5000
+
+# 데이터 기간의 마지막 해 (기간은 여기서 years년 전까지)
+END_YEAR = 2026
+
+# 적재 대상 테이블 (외래 키 순서, 지울 때는 역순)
+SEED_TABLES = ('instructor_codes', 'instructors', 'subjects', 'holidays', 'courses', 'course_subjects',
+               'timetables', 'students', 'projects', 'consultations', 'consultation_photos')
+
+DEFAULT_PHOTO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'photos')
+
+# 자리표시 사진 (파일 수, 크기)
+PHOTO_VARIANTS = 8
+PHOTO_SIZE = (640, 480)
+THUMBNAIL_SIZE = (150, 150)
+
+# 성씨 (대략적인 인구 비율)
+SURNAMES = (('김', 21.5), ('이', 14.7), ('박', 8.4), ('최', 4.7), ('정', 4.3), ('강', 2.4), ('조', 2.1),
+            ('윤', 2.1), ('장', 2.0), ('임', 1.7), ('한', 1.5), ('오', 1.5), ('서', 1.5), ('신', 1.4),
+            ('권', 1.4), ('황', 1.4), ('안', 1.4), ('송', 1.3), ('류', 1.2), ('홍', 1.1))
+GIVEN_SYLLABLES = "민서지현수준영예도하윤우진은주연성유재태승혜동원경가채시아호나리"
+
+DISTRICTS = {
+    '서울특별시': ('강남구', '관악구', '노원구', '마포구', '송파구', '영등포구', '은평구'),
+    '부산광역시': ('해운대구', '부산진구', '동래구', '사하구'),
+    '대구광역시': ('수성구', '달서구', '북구'),
+    '인천광역시': ('연수구', '남동구', '부평구'),
+    '광주광역시': ('서구', '북구', '광산구'),
+    '대전광역시': ('유성구', '서구', '중구'),
+    '경기도': ('수원시 영통구', '성남시 분당구', '고양시 일산동구', '용인시 수지구'),
+}
+ROADS = ('중앙로', '대학로', '문화로', '한빛로', '새싹로', '희망로', '은행로')
+EMAIL_DOMAINS = ('naver.com', 'gmail.com', 'daum.net', 'kakao.com')
+
+CAMPUSES = ('서울 캠퍼스', '대전 캠퍼스', '광주 캠퍼스', '부산 캠퍼스')
+LOCATIONS = ('본관 301호', '본관 302호', '별관 201호', '바이오헬스 실습실', '온라인 강의실')
+MAJORS = ('생명공학', '컴퓨터공학', '통계학', '의공학', '간호학', '약학', '데이터사이언스', '산업공학')
+SCHOOLS = ('한국대학교', '미래대학교', '새빛대학교', '한빛대학교', '중앙과학기술원', '동방대학교')
+EDUCATION_STATUS = ('졸업', '졸업예정', '4학년 재학', '석사 졸업')
+INTERESTS = ('바이오 데이터 분석', '의료 영상 AI', '유전체 분석', '헬스케어 서비스 기획', '임상 데이터 관리',
+             '디지털 치료제', '웨어러블 헬스케어', '신약 개발 AI')
+
+PROGRAMS = ('바이오헬스 데이터 분석', '의료 AI 개발자', '헬스케어 빅데이터', '바이오 인포매틱스',
+            '디지털 헬스케어 서비스 기획', '임상 데이터 사이언스', '의료기기 SW 개발', '정밀의료 데이터 엔지니어')
+SUBJECT_TOPICS = ('파이썬 프로그래밍', '데이터베이스', 'SQL 활용', '통계 분석', '머신러닝', '딥러닝',
+                  '의료 영상 처리', '유전체 데이터 분석', 'R 데이터 분석', '데이터 시각화', '생물정보학',
+                  '임상시험 데이터 관리', '의료 정보 표준', '클라우드 컴퓨팅', '웹 개발', '자연어 처리',
+                  '헬스케어 서비스 기획', '개인정보 보호와 윤리', '리눅스', '협업 도구 활용')
+SUBJECT_LEVELS = ('기초', '실습', '심화', '응용', '프로젝트')
+PROJECT_TOPICS = ('환자 데이터 대시보드', '흉부 X선 판독 보조', '복약 알림 서비스', '유전체 변이 탐색 도구',
+                  '병원 예약 챗봇', '임상시험 대상자 매칭', '수면 데이터 분석', '식단 인식 앱')
+
+CONSULTATION_TOPICS = ('진로 상담', '학습 진도 점검', '출결 상담', '취업 준비', '프로젝트 진행 상황',
+                       '심리 상담', '수료 요건 안내', '인턴십 연계')
+CONSULTATION_SENTENCES = (
+    '최근 수업 참여도는 양호한 편이다.',
+    '과제 제출이 늦어지는 이유를 확인하였다.',
+    '희망 직무와 필요한 역량을 함께 정리하였다.',
+    '프로젝트 팀 내 역할 분담에 어려움이 있다고 함.',
+    '통계 과목 보충 학습 자료를 안내하였다.',
+    '이력서 초안을 검토하고 보완점을 전달하였다.',
+    '출석률이 기준에 근접하여 수료 요건을 안내하였다.',
+    '인턴십 희망 기관을 세 곳으로 정리하였다.',
+    '다음 면담 전까지 포트폴리오를 준비하기로 함.',
+    '학습 방법에 대한 고민을 듣고 스터디 참여를 권유하였다.',
+)
+CONSULTATION_TYPES = (('정기', 60), ('수시', 30), ('긴급', 5), ('학부모', 5))
+CONSULTATION_STATUS = (('완료', 85), ('예정', 10), ('취소', 5))
+
+INSTRUCTOR_CODES = (('IC-001', '주강사', '1. 주강사'), ('IC-002', '보조강사', '2. 보조강사'),
+                    ('IC-003', '멘토', '3. 멘토'))
+
+# 과정당 강의/프로젝트/인턴쉽 시수 후보
+LECTURE_HOURS = (260, 400, 520)
+PROJECT_HOURS = (160, 220)
+INTERNSHIP_HOURS = (0, 120)
+
+SeedResult = namedtuple('SeedResult', 'counts elapsed')
+
+
+def placeholder_png(width, height, shade):
+    """단색 자리표시 PNG 바이트 (표준 라이브러리만 사용)"""
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    row = b'\x00' + bytes((shade, shade, min(255, shade + 24))) * width
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(row * height))
+            + chunk(b'IEND', b''))
+
+
+def write_placeholder_photos(photo_dir, count=PHOTO_VARIANTS):
+    """자리표시 사진 count장 저장 (이미 있으면 그대로 사용) → 파일 경로 목록"""
+    os.makedirs(photo_dir, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.abspath(os.path.join(photo_dir, f"placeholder_{i + 1}.png"))
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(placeholder_png(*PHOTO_SIZE, shade=96 + i * 16))
+        paths.append(path)
+    return paths
+
+
+class KoreanFaker:
+    """결정적 한국어 인적 정보 생성 (이름, 휴대폰 번호, 주소, 이메일)"""
+
+    def __init__(self, seed):
+        self.rng = random.Random(f"people-{seed}")
+        self._surnames = [name for name, _ in SURNAMES]
+        self._weights = [weight for _, weight in SURNAMES]
+        self._phones = set()
+
+    def name(self):
+        length = 1 if self.rng.random() < 0.1 else 2
+        return (self.rng.choices(self._surnames, weights=self._weights)[0]
+                + ''.join(self.rng.choice(GIVEN_SYLLABLES) for _ in range(length)))
+
+    def phone(self):
+        """중복 없는 010 번호"""
+        while True:
+            phone = f"010-{self.rng.randrange(2000, 10000):04d}-{self.rng.randrange(10000):04d}"
+            if phone not in self._phones:
+                self._phones.add(phone)
+                return phone
+
+    def address(self):
+        city = self.rng.choice(list(DISTRICTS))
+        return (f"{city} {self.rng.choice(DISTRICTS[city])} "
+                f"{self.rng.choice(ROADS)}{self.rng.randrange(1, 80)}길 {self.rng.randrange(1, 200)}")
+
+    def email(self, number):
+        return f"user{number:05d}@{self.rng.choice(EMAIL_DOMAINS)}"
+
+    def birth_date(self):
+        return date(self.rng.randrange(1975, 2004), self.rng.randrange(1, 13), self.rng.randrange(1, 29)).isoformat()
+
+
+class BulkWriter:
+    """INSERT 파라미터를 모아 BATCH_ROWS 행마다 execute_many로 적재
+
+    depends: 먼저 적재해야 하는 BulkWriter (외래 키가 가리키는 행)
+    """
+
+    def __init__(self, db, query, batch_rows=BATCH_ROWS, depends=()):
+        self.db = db
+        self.query = query
+        self.batch_rows = batch_rows
+        self.depends = depends
+        self.rows = []
+        self.count = 0
+
+    def add(self, params):
+        self.rows.append(params)
+        if len(self.rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        for writer in self.depends:
+            writer.flush()
+        with self.db.transaction():
+            self.db.execute_many(self.query, self.rows, chunk_size=self.batch_rows)
+        self.count += len(self.rows)
+        self.rows = []
+
+
+def _insert_query(table, columns):
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+
+def _write_all(db, table, columns, rows):
+    writer = BulkWriter(db, _insert_query(table, columns))
+    for row in rows:
+        writer.add(row)
+    writer.flush()
+    return writer.count
+
+
+def _weighted(rng, pairs):
+    return rng.choices([value for value, _ in pairs], weights=[weight for _, weight in pairs])[0]
+
+
+def _random_monday(rng, first, last):
+    day = first + timedelta(days=rng.randrange((last - first).days + 1))
+    return day - timedelta(days=day.weekday())
+
+
+def _class_datetime(rng, first, last):
+    """first~last 사이 평일 근무 시간 (30분 단위)"""
+    day = first + timedelta(days=rng.randrange(max(1, (last - first).days + 1)))
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return datetime(day.year, day.month, day.day, 9) + timedelta(minutes=30 * rng.randrange(17))
+
+
+def table_counts(db, tables=SEED_TABLES):
+    """테이블별 행 수"""
+    return {table: db.fetch_one(f"SELECT COUNT(*) AS cnt FROM {table}")['cnt'] for table in tables}
+
+
+def reset_tables(db, tables=SEED_TABLES):
+    """적재 대상 테이블 비우기 (외래 키 역순) + 코드 시퀀스 초기화"""
+    with db.transaction():
+        for table in reversed(tables):
+            db.execute_query(f"DELETE FROM {table}")
+        db.execute_query("DELETE FROM code_sequences")
+
+
+def subject_name(index):
+    """i번째 과목 이름 (주제 × 수준, 다 쓰면 뒤에 회차 번호)"""
+    topic = SUBJECT_TOPICS[index % len(SUBJECT_TOPICS)]
+    level_index = index // len(SUBJECT_TOPICS)
+    name = f"{topic} {SUBJECT_LEVELS[level_index % len(SUBJECT_LEVELS)]}"
+    if level_index >= len(SUBJECT_LEVELS):
+        name += f" {level_index // len(SUBJECT_LEVELS) + 1}"
+    return name
+
+
+def make_curricula(rng, subjects, count):
+    """교육과정 목록 [(이름, 과목 목록, 강의 시수), ...] (같은 교육과정의 기수는 과목을 공유)"""
+    curricula = []
+    for i in range(count):
+        name = PROGRAMS[i % len(PROGRAMS)]
+        if i >= len(PROGRAMS):
+            name = f"{name} {i // len(PROGRAMS) + 1}트랙"
+        target = rng.choice(LECTURE_HOURS)
+        picked, hours = [], 0
+        for subject in rng.sample(subjects, len(subjects)):
+            if hours >= target:
+                break
+            picked.append(subject)
+            hours += subject['hours']
+        curricula.append((name, picked, hours))
+    return curricula
+
+
+def seed_database(db, preset, seed=0, end_year=END_YEAR, photo_dir=DEFAULT_PHOTO_DIR, log=print):
+    """합성 데이터 적재
+
+    Args:
+        preset: Preset (PRESETS 값)
+        seed: 같은 값이면 같은 데이터
+        end_year: 데이터 기간의 마지막 해
+        photo_dir: 자리표시 사진 저장 폴더
+
+    Returns:
+        SeedResult: (테이블별 적재 행 수, 걸린 시간(초))
+    """
+    started = time.perf_counter()
+    rng = random.Random(f"seed-{seed}")
+    faker = KoreanFaker(seed)
+    counts = {}
+
+    def done(table, count):
+        counts[table] = count
+        log(f"  {table:<20} {count:>10,}행  ({time.perf_counter() - started:.1f}초)")
+
+    first_day = date(end_year - preset.years + 1, 1, 1)
+    last_start = date(end_year, 6, 30)
+
+    # 강사
+    done('instructor_codes', _write_all(db, 'instructor_codes', ('code', 'name', 'type'), INSTRUCTOR_CODES))
+    instructors = [{'code': f"{CODE_PREFIX['instructor']}{i + 1:03d}", 'name': faker.name()}
+                   for i in range(max(3, preset.instructors))]
+    done('instructors', _write_all(
+        db, 'instructors', ('code', 'name', 'phone', 'major', 'instructor_type', 'email'),
+        ((row['code'], row['name'], faker.phone(), rng.choice(MAJORS),
+          _weighted(rng, (('IC-001', 6), ('IC-002', 3), ('IC-003', 1))), faker.email(i + 1))
+         for i, row in enumerate(instructors))))
+
+    # 과목 (요일/격주 배정은 성능 측정용 카탈로그와 같은 분포)
+    subjects = make_subjects(preset.subjects, seed=seed, instructors=instructors, prefix=CODE_PREFIX['subject'])
+    for i, subject in enumerate(subjects):
+        subject['name'] = subject_name(i)
+    done('subjects', _write_all(
+        db, 'subjects', ('code', 'name', 'hours', 'day_of_week', 'is_biweekly', 'week_offset',
+                         'main_instructor', 'assistant_instructor', 'reserve_instructor'),
+        ((s['code'], s['name'], s['hours'], s['day_of_week'], s['is_biweekly'], s['week_offset'],
+          s['main_instructor'], s['assistant_instructor'], s['reserve_instructor']) for s in subjects)))
+
+    # 공휴일 (과정이 기간 끝을 넘어가도 되도록 2년 더)
+    holidays = holidays_between(first_day.year, end_year + 2)
+    inserted, _, _ = upsert_holidays(db, holidays)
+    done('holidays', inserted)
+    calendar = WorkCalendar({row.holiday_date: row.name for row in holidays})
+
+    # 과정 + 과정-과목 + 시간표 (timetable_rows에 못 미치면 이전 기수를 더 생성)
+    curricula = make_curricula(rng, subjects, max(len(PROGRAMS), preset.courses // 5))
+    course_writer = BulkWriter(db, _insert_query('courses', (
+        'code', 'name', 'start_date', 'lecture_end_date', 'project_end_date', 'internship_end_date',
+        'final_end_date', 'lecture_hours', 'project_hours', 'internship_hours', 'total_days',
+        'capacity', 'location', 'notes')))
+    mapping_writer = BulkWriter(db, _insert_query('course_subjects', ('course_code', 'subject_code', 'display_order')),
+                                depends=(course_writer,))
+    timetable_writer = BulkWriter(db, INSERT_QUERY, depends=(course_writer,))
+    courses = []
+    cohorts = {}
+    timetable_rows = 0
+
+    while len(courses) < preset.courses or timetable_rows < (preset.timetable_rows or 0):
+        code = f"{CODE_PREFIX['course']}{len(courses) + 1:03d}"
+        index = rng.randrange(len(curricula))
+        name, course_subjects, lecture_hours = curricula[index]
+        cohorts[index] = cohorts.get(index, 0) + 1
+        start = _random_monday(rng, first_day, last_start)
+        course = {'code': code, 'lecture_hours': lecture_hours, 'project_hours': rng.choice(PROJECT_HOURS),
+                  'internship_hours': rng.choice(INTERNSHIP_HOURS)}
+        entries, details, _ = build_course_entries(course, course_subjects, calendar, start)
+        # 단계별 마지막 수업일 (행은 강의 → 프로젝트 → 인턴쉽, 날짜 순)
+        last = {entry['type']: to_date(entry['class_date']) for entry in entries}
+        lecture_end = last.get('lecture', start)
+        project_end = last.get('project', lecture_end)
+        final_end = last.get('internship', project_end)
+
+        course_writer.add((code, f"{name} {cohorts[index]}기", start, lecture_end, project_end, final_end,
+                           final_end, lecture_hours, course['project_hours'], course['internship_hours'],
+                           details['total_days'], rng.choice((20, 25, 30)), rng.choice(CAMPUSES), None))
+        for order, subject in enumerate(course_subjects, start=1):
+            mapping_writer.add((code, subject['code'], order))
+        for entry in entries:
+            timetable_writer.add(entry_params(entry))
+        timetable_rows += len(entries)
+        courses.append((code, start, final_end))
+
+    course_writer.flush()
+    mapping_writer.flush()
+    timetable_writer.flush()
+    done('courses', course_writer.count)
+    done('course_subjects', mapping_writer.count)
+    done('timetables', timetable_writer.count)
+
+    # 학생 (사진이 있는 학생은 자리표시 사진 경로 + 썸네일)
+    photos = write_placeholder_photos(photo_dir)
+    thumbnail = placeholder_png(*THUMBNAIL_SIZE, shade=128)
+    student_courses = []
+
+    def students():
+        for i in range(preset.students):
+            course_code, start, final_end = rng.choice(courses)
+            student_courses.append((start, final_end))
+            has_photo = rng.random() < preset.photo_ratio
+            yield (f"{CODE_PREFIX['student']}{i + 1:03d}", faker.name(), faker.birth_date(),
+                   rng.choice(('남', '여')), faker.phone(), faker.email(i + 1), faker.address(),
+                   ', '.join(rng.sample(INTERESTS, 2)),
+                   f"{rng.choice(SCHOOLS)} {rng.choice(MAJORS)}과 {rng.choice(EDUCATION_STATUS)}",
+                   f"{rng.choice(INTERESTS)} 분야로 진로를 정하고 지원했습니다.", rng.choice(CAMPUSES),
+                   course_code, datetime.combine(start - timedelta(days=rng.randrange(7, 60)), datetime.min.time()),
+                   rng.choice(photos) if has_photo else None, thumbnail if has_photo else None)
+
+    done('students', _write_all(
+        db, 'students', ('code', 'name', 'birth_date', 'gender', 'phone', 'email', 'address', 'interests',
+                         'education', 'introduction', 'campus', 'course_code', 'registered_at',
+                         'photo_path', 'thumbnail'), students()))
+
+    # 프로젝트 (과정마다 2~5팀, 팀원 3~5명)
+    def projects():
+        number = 0
+        for code, _, _ in courses:
+            for _ in range(rng.randrange(2, 6)):
+                number += 1
+                members = [(faker.name(), faker.phone()) for _ in range(rng.randrange(3, 6))]
+                members += [(None, None)] * (5 - len(members))
+                yield ((f"{CODE_PREFIX['project']}{number:03d}", f"{rng.choice(PROJECT_TOPICS)} {number}", code)
+                       + tuple(value for member in members for value in member))
+
+    member_columns = tuple(f"member{i}_{field}" for i in range(1, 6) for field in ('name', 'phone'))
+    done('projects', _write_all(db, 'projects', ('code', 'name', 'course_code') + member_columns, projects()))
+
+    # 면담 (학생의 과정 기간 안, 일부는 다음 면담 예정일 포함)
+    student_ids = [row['id'] for row in db.fetch_all("SELECT id FROM students ORDER BY id")]
+    consultants = [row['name'] for row in instructors]
+
+    def consultations():
+        for _ in range(preset.consultations):
+            index = rng.randrange(len(student_ids))
+            start, final_end = student_courses[index]
+            when = _class_datetime(rng, start, final_end)
+            follow_up = when + timedelta(days=rng.randrange(7, 31)) if rng.random() < 0.4 else None
+            topic = rng.choice(CONSULTATION_TOPICS)
+            yield (student_ids[index], when, rng.choice(LOCATIONS), topic,
+                   ' '.join(rng.sample(CONSULTATION_SENTENCES, rng.randrange(2, 5))),
+                   rng.choice(consultants), follow_up, _weighted(rng, CONSULTATION_TYPES),
+                   _weighted(rng, CONSULTATION_STATUS))
+
+    done('consultations', _write_all(
+        db, 'consultations', ('student_id', 'consultation_date', 'location', 'main_topic', 'content',
+                              'consultant_name', 'next_consultation_date', 'consultation_type', 'status'),
+        consultations()))
+
+    # 면담 사진 (적재 순서 = id 순서)
+    consultation_ids = [row['id'] for row in db.fetch_all("SELECT id FROM consultations ORDER BY id")]
+
+    def consultation_photos():
+        for consultation_id in consultation_ids:
+            if rng.random() < preset.photo_ratio:
+                for n in range(rng.randrange(1, 4)):
+                    yield consultation_id, rng.choice(photos), f"면담 사진 {n + 1}"
+
+    done('consultation_photos', _write_all(
+        db, 'consultation_photos', ('consultation_id', 'photo_path', 'photo_description'), consultation_photos()))
+
+    return SeedResult(counts, time.perf_counter() - started)
+
+
+def main(argv=None):
+    """명령줄 실행: 스키마 준비 후 preset 규모의 합성 데이터 적재"""
+    parser = argparse.ArgumentParser(description="대용량 합성 데이터 적재 (부하/화면 규모 시험용)")
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='small', help="데이터 규모 (기본 small)")
+    parser.add_argument('--seed', type=int, default=0, help="난수 seed (같으면 같은 데이터)")
+    parser.add_argument('--sqlite', metavar='PATH', help="MySQL 대신 로컬 SQLite 파일에 적재")
+    parser.add_argument('--end-year', type=int, default=END_YEAR, help=f"데이터 기간의 마지막 해 (기본 {END_YEAR})")
+    parser.add_argument('--photo-dir', default=DEFAULT_PHOTO_DIR, help="자리표시 사진 저장 폴더")
+    parser.add_argument('--reset', action='store_true', help="적재 대상 테이블의 기존 행을 지우고 적재")
+    args = parser.parse_args(argv)
+
+    from database.connection_pool import configure_backend
+    from database.db_manager import DatabaseManager
+    from database.migrations import run_migrations
+
+    if args.sqlite:
+        configure_backend('sqlite', args.sqlite)
+    db = DatabaseManager()
+    if not db.connect():
+        print("❌ 데이터베이스 연결 실패")
+        return 1
+    try:
+        if not db.create_tables():
+            return 1
+        run_migrations(db)
+
+        existing = {table: count for table, count in table_counts(db).items() if count}
+        if existing and not args.reset:
+            print("❌ 비어 있지 않은 테이블이 있습니다 (--reset으로 지우고 적재):")
+            for table, count in existing.items():
+                print(f"  {table}: {count:,}행")
+            return 1
+        if existing:
+            print("기존 데이터 삭제 중...")
+            reset_tables(db)
+
+        preset = PRESETS[args.preset]
+        print(f"합성 데이터 적재: {args.preset} {preset._asdict()} (seed {args.seed}, 대상 {db.backend})")
+        result = seed_database(db, preset, seed=args.seed, end_year=args.end_year, photo_dir=args.photo_dir)
+        print(f"\n✅ 총 {sum(result.counts.values()):,}행 적재 ({result.elapsed:.1f}초)")
+        return 0
+    except Exception as e:
+        print(f"❌ 적재 실패: {e}")
+        return 1
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+합성 데이터 생성 (성능 측정용)
+
+같은 seed면 항상 같은 데이터를 만든다.
+
+- make_subjects: 과목 카탈로그 (요일 지정/미지정, 매주/격주, 주차 혼합)
+- make_holidays: 법정공휴일 + 임의 휴무일 (공휴일이 촘촘한 달력)
+- make_conflicts: 다른 과정 강사 배정 색인 (일부 반일에 강사가 이미 수업 중)
+- make_course: courses 행 형식의 과정
+"""
+
+from datetime import date, timedelta
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.korean_holidays import holidays_between
+from utils.instructor_conflicts import ConflictIndex
+
+# 과목 시수 후보 (4시간 단위)
+SUBJECT_HOURS = (4, 8, 12, 16, 20, 24, 32, 40, 60, 80)
+
+# 과목 배정 방식 비율: 요일 미지정 / 매주 / 격주
+DAY_MIX = (0.3, 0.45, 0.25)
+
+
+def make_instructors(count):
+    """강사 목록 [{'code', 'name'}, ...]"""
+    return [{'code': f"I-{i + 1:04d}", 'name': f"강사{i + 1:04d}"} for i in range(count)]
+
+
+def make_subjects(count, seed=0, instructors=None, prefix='S-'):
+    """과목 카탈로그 (get_course_subjects 형식의 dict 목록)
+
+    Args:
+        instructors: 강사 목록 (3명 이상, 없으면 과목 4개당 1명 생성)
+        prefix: 과목 코드 접두사
+    """
+    rng = random.Random(f"subjects-{seed}")
+    instructors = instructors or make_instructors(max(3, count // 4))
+    subjects = []
+    for i in range(count):
+        main, assistant, reserve = rng.sample(instructors, 3)
+        kind = rng.choices(('free', 'weekly', 'biweekly'), weights=DAY_MIX)[0]
+        subjects.append({
+            'code': f"{prefix}{i + 1:04d}",
+            'name': f"과목{i + 1:04d}",
+            'hours': rng.choice(SUBJECT_HOURS),
+            'main_instructor': main['code'],
+            'assistant_instructor': assistant['code'],
+            'reserve_instructor': reserve['code'],
+            'day_of_week': None if kind == 'free' else rng.randrange(5),
+            'is_biweekly': kind == 'biweekly',
+            'week_offset': rng.randrange(2) if kind == 'biweekly' else 0,
+            'main_instructor_name': main['name'],
+            'assistant_instructor_name': assistant['name'],
+            'reserve_instructor_name': reserve['name'],
+        })
+    return subjects
+
+
+def make_holidays(start_year, end_year, seed=0, extra_per_year=20):
+    """법정공휴일 + 해마다 extra_per_year개의 임의 평일 휴무일 ({date: 이름})"""
+    rng = random.Random(f"holidays-{seed}")
+    holidays = {row.holiday_date: row.name for row in holidays_between(start_year, end_year)}
+    for year in range(start_year, end_year + 1):
+        first = date(year, 1, 1)
+        weekdays = [first + timedelta(days=i) for i in range((date(year, 12, 31) - first).days + 1)
+                    if (first + timedelta(days=i)).weekday() < 5]
+        for day in rng.sample(weekdays, min(extra_per_year, len(weekdays))):
+            holidays.setdefault(day, "휴무일")
+    return holidays
+
+
+def make_conflicts(subjects, start_date, end_date, seed=0, density=0.1):
+    """다른 과정 강사 배정 색인 (주강사 반일의 density 비율을 다른 과정 수업으로 채움)"""
+    rng = random.Random(f"conflicts-{seed}")
+    index = ConflictIndex()
+    instructors = sorted({s['main_instructor'] for s in subjects if s.get('main_instructor')})
+    day = start_date
+    while day <= end_date:
+        if day.weekday() < 5:
+            for code in instructors:
+                for slot in ('am', 'pm'):
+                    if rng.random() < density:
+                        index.add(code, day, slot, 'OTHER')
+        day += timedelta(days=1)
+    return index
+
+
+def make_course(code, start_date, years=1, project_hours=220, internship_hours=120):
+    """courses 행 형식의 과정 (강의 기간은 시작일부터 약 years년: 연 52주 × 5일 × 8시간)"""
+    return {
+        'code': code,
+        'name': f"합성 과정 {code}",
+        'start_date': start_date,
+        'lecture_end_date': start_date + timedelta(days=365 * years),
+        'lecture_hours': 52 * 5 * 8 * years,
+        'project_hours': project_hours,
+        'internship_hours': internship_hours,
+    }
@@ -3,6 +3,14 @@
 데이터베이스 설정 파일
 """
 
+import os
+
+# 데이터베이스 종류: 'mysql' (기본, DB_CONFIG 서버) 또는 'sqlite' (로컬 파일, 오프라인 테스트/성능 측정용)
+# 환경변수 KDT_DB_BACKEND, KDT_SQLITE_PATH로 바꿀 수 있다.
+DB_BACKEND = os.environ.get('KDT_DB_BACKEND', 'mysql')
+SQLITE_PATH = os.environ.get('KDT_SQLITE_PATH',
+                             os.path.join(os.path.dirname(os.path.abspath(__file__)), 'local_kdt.db'))
+
 # MySQL 데이터베이스 설정
 DB_CONFIG = {
     'host': 'bitnmeta2.synology.me',
@@ -13,6 +21,15 @@ DB_CONFIG = {
     'port': 3307,
 }
 
+# 커넥션 풀 설정
+# 탭/다이얼로그마다 커넥션 1개를 계속 쥐고 있고(약 15개) 비동기 조회 스레드가 4개 더 쓰므로 여유 있게 잡는다.
+DB_POOL_CONFIG = {
+    'max_size': 32,        # 최대 커넥션 수
+    'ping_interval': 60,   # 유휴 커넥션 생존 확인 주기 (초)
+    'timeout': 10,         # 풀이 가득 찼을 때 작업 스레드 대기 시간 (초)
+    'ui_timeout': 1,       # 풀이 가득 찼을 때 GUI 스레드 대기 시간 (초, 화면 멈춤 방지)
+}
+
 # 애플리케이션 설정
 APP_NAME = "바이오헬스 올인원테크 이노베이터 for KDT"
 APP_VERSION = "2.0.0"
@@ -25,4 +42,5 @@ CODE_PREFIX = {
     'subject': 'G-',         # 교과목 코드
     'course': 'C-',          # 과정 코드
     'project': 'P-',         # 프로젝트 코드
+    'student': 'S',          # 학생 코드 (엑셀 일괄 등록)
 }
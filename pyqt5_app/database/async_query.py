@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 DB 조회 (QThreadPool)
+
+원격 DB 조회를 GUI 스레드에서 실행하면 느린 회선에서 창 전체가 멈춘다.
+AsyncQuery는 조회를 작업 스레드에서 실행하고 결과를 Qt 시그널로 돌려준다.
+작업 스레드는 각자 DatabaseManager를 만들어 공용 커넥션 풀에서 커넥션을 빌린다.
+
+사용 예:
+    self.list_query = AsyncQuery(self)
+    self.list_query.finished.connect(self.populate_table)
+    self.list_query.busy_changed.connect(self.loading_label.setVisible)
+    self.list_query.fetch_all("SELECT ...", params)
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+import traceback
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.db_manager import DatabaseManager
+
+# 동시에 실행할 최대 조회 수 (커넥션 풀 크기보다 작게)
+MAX_QUERY_THREADS = 4
+
+_thread_pool = None
+
+
+def query_thread_pool():
+    """조회 전용 스레드 풀 (최초 호출 시 생성)"""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = QThreadPool()
+        _thread_pool.setMaxThreadCount(MAX_QUERY_THREADS)
+    return _thread_pool
+
+
+def _fetch_all(db, query, params=None, transform=None):
+    """조회 실행 (오류는 그대로 전달)"""
+    cursor = db.connection.cursor()
+    if params:
+        cursor.execute(query, params)
+    else:
+        cursor.execute(query)
+    rows = cursor.fetchall()
+    return transform(rows) if transform else rows
+
+
+class _TaskSignals(QObject):
+    """작업 스레드 → GUI 스레드 전달용 시그널"""
+    done = pyqtSignal(int, object)
+    error = pyqtSignal(int, str)
+
+
+class _QueryTask(QRunnable):
+    """작업 스레드에서 func(db, *args, **kwargs) 실행"""
+
+    def __init__(self, request_id, func, args, kwargs):
+        super().__init__()
+        self.request_id = request_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.signals = _TaskSignals()
+
+    def run(self):
+        # 시작 전에 취소된 요청은 DB에 보내지 않음
+        if self.cancelled:
+            return
+
+        db = DatabaseManager()
+        try:
+            if not db.connect():
+                raise Exception("데이터베이스 연결 실패")
+            result = self.func(db, *self.args, **self.kwargs)
+        except Exception as e:
+            print(f"비동기 조회 오류: {str(e)}\n{traceback.format_exc()}")
+            if not self.cancelled:
+                self.signals.error.emit(self.request_id, str(e))
+            return
+        finally:
+            db.disconnect()
+
+        if not self.cancelled:
+            self.signals.done.emit(self.request_id, result)
+
+
+class AsyncQuery(QObject):
+    """비동기 조회 채널
+
+    같은 채널에 새 요청을 보내면 이전 요청은 취소되어 결과가 전달되지 않는다.
+    (이미 실행 중인 쿼리는 끝까지 실행되지만 결과는 버린다)
+
+    Signals:
+        finished(object): 최신 요청의 결과
+        failed(str): 최신 요청의 오류 메시지
+        busy_changed(bool): 조회 중 여부 (로딩 표시용)
+    """
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._request_id = 0
+        self._task = None
+
+    @property
+    def busy(self):
+        return self._task is not None
+
+    def submit(self, func, *args, **kwargs):
+        """func(db, *args, **kwargs)를 작업 스레드에서 실행
+
+        Returns:
+            int: 요청 번호
+        """
+        was_busy = self.busy
+        self._cancel_task()
+
+        self._request_id += 1
+        task = _QueryTask(self._request_id, func, args, kwargs)
+        task.signals.done.connect(self._on_done)
+        task.signals.error.connect(self._on_error)
+        self._task = task
+
+        if not was_busy:
+            self.busy_changed.emit(True)
+        query_thread_pool().start(task)
+        return self._request_id
+
+    def fetch_all(self, query, params=None, transform=None):
+        """SELECT 결과 전체 조회
+
+        Args:
+            query: 쿼리
+            params: 파라미터
+            transform: 작업 스레드에서 결과 행 목록에 적용할 함수 (선택)
+        """
+        return self.submit(_fetch_all, query, params, transform)
+
+    def cancel(self):
+        """진행 중인 요청 취소"""
+        if self.busy:
+            self._cancel_task()
+            self.busy_changed.emit(False)
+
+    def _cancel_task(self):
+        if self._task is not None:
+            self._task.cancelled = True
+            self._task = None
+
+    def _on_done(self, request_id, result):
+        if self._task is None or request_id != self._request_id:
+            return
+        self._task = None
+        self.busy_changed.emit(False)
+        self.finished.emit(result)
+
+    def _on_error(self, request_id, message):
+        if self._task is None or request_id != self._request_id:
+            return
+        self._task = None
+        self.busy_changed.emit(False)
+        self.failed.emit(message)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+데이터 변경 알림 버스 (Qt 시그널)
+
+- 이 프로그램 안의 쓰기: DatabaseManager → change_events → ChangeBus.changed
+- 다른 PC의 쓰기: 감시 중인 테이블의 (MAX(updated_at), COUNT(*))를 주기적으로 확인해서
+  바뀐 행의 키를 ChangeEvent(action='remote')로 알림
+
+열려 있는 탭은 changed 시그널을 받아 바뀐 행만 다시 읽어서 표에 반영한다. (TableSync)
+
+사용 예:
+    self.table_sync = TableSync(
+        self.table_model, 'students', fetch=self.fetch_students, reload=self.load_data, parent=self)
+"""
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.change_events import ChangeEvent, KEY_COLUMNS, add_change_listener
+from database.reference_cache import invalidate_reference
+from database.async_query import AsyncQuery
+
+# 원격 변경 확인 주기 (밀리초)
+POLL_INTERVAL_MS = 15000
+
+
+def _poll_stamps(db, previous):
+    """감시 테이블의 버전 값 조회 + 이전 값 이후 바뀐 행의 키
+
+    Args:
+        previous: {테이블: (stamp, count) 또는 None}
+
+    Returns:
+        list: [(테이블, (stamp, count), 바뀐 키 목록 또는 None), ...]
+    """
+    cursor = db.connection.cursor()
+    results = []
+    for table, last in previous.items():
+        cursor.execute(f"SELECT MAX(updated_at) AS stamp, COUNT(*) AS cnt FROM {table}")
+        row = cursor.fetchone()
+        version = (row['stamp'], row['cnt'])
+        if last is None or version == last:
+            results.append((table, version, []))
+            continue
+
+        last_stamp, last_count = last
+        key = KEY_COLUMNS[table][0]
+        if last_stamp is None:
+            results.append((table, version, None))
+            continue
+
+        # 같은 초에 바뀐 행을 놓치지 않도록 >= 로 조회 (이미 반영한 행이 섞여도 무방)
+        cursor.execute(
+            f"SELECT {key} AS k, created_at > %s AS is_new FROM {table} WHERE updated_at >= %s",
+            (last_stamp, last_stamp)
+        )
+        changed = cursor.fetchall()
+        created = sum(1 for r in changed if r['is_new'])
+        if version[1] < last_count + created:
+            # 삭제된 행이 있음 (어느 행인지 알 수 없으므로 전체 다시 읽기)
+            results.append((table, version, None))
+        else:
+            results.append((table, version, [r['k'] for r in changed]))
+    return results
+
+
+class ChangeBus(QObject):
+    """변경 알림 시그널 버스 (get_change_bus()로 사용)
+
+    Signals:
+        changed(object): ChangeEvent
+    """
+
+    changed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watchers = {}  # 테이블 → 감시 중인 화면 수
+        self._stamps = {}    # 테이블 → 마지막으로 확인한 (stamp, count)
+
+        self._poll_query = AsyncQuery(self)
+        self._poll_query.finished.connect(self._on_polled)
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_INTERVAL_MS)
+        self._timer.timeout.connect(self.poll)
+
+        # 시그널은 스레드 간에 큐로 전달되므로 작업 스레드의 쓰기도 안전하게 받음
+        add_change_listener(self.changed.emit)
+        self.changed.connect(self._on_local_change)
+
+    def watch(self, table):
+        """table의 원격 변경 감시 시작 (unwatch와 짝으로 호출)"""
+        self._watchers[table] = self._watchers.get(table, 0) + 1
+        self._stamps.setdefault(table, None)
+        if not self._timer.isActive():
+            self._timer.start()
+            self.poll()
+
+    def unwatch(self, table):
+        count = self._watchers.get(table, 0) - 1
+        if count > 0:
+            self._watchers[table] = count
+            return
+        self._watchers.pop(table, None)
+        self._stamps.pop(table, None)
+        if not self._watchers:
+            self._timer.stop()
+
+    def poll(self):
+        """감시 중인 테이블의 원격 변경 확인 (작업 스레드)"""
+        if self._stamps and not self._poll_query.busy:
+            self._poll_query.submit(_poll_stamps, dict(self._stamps))
+
+    def _on_local_change(self, event):
+        """이 프로그램에서 지운 행 수만큼 기준 행 수를 줄여서 원격 삭제로 오인하지 않게 함"""
+        if event.action != 'delete' or event.keys is None:
+            return
+        last = self._stamps.get(event.table)
+        if last is not None:
+            self._stamps[event.table] = (last[0], last[1] - len(event.keys))
+
+    def _on_polled(self, results):
+        for table, version, keys in results:
+            if table not in self._stamps:
+                continue  # 확인하는 동안 감시 해제됨
+            first = self._stamps[table] is None
+            self._stamps[table] = version
+            if first or keys == []:
+                continue
+            invalidate_reference(table)
+            column = KEY_COLUMNS[table][0] if keys is not None else None
+            self.changed.emit(ChangeEvent(table, 'remote', column, keys))
+
+
+_bus = None
+
+
+def get_change_bus():
+    """공용 변경 알림 버스 (GUI 스레드에서 최초 호출)"""
+    global _bus
+    if _bus is None:
+        _bus = ChangeBus()
+    return _bus
+
+
+class TableSync(QObject):
+    """변경 알림을 받아 RowTableModel의 해당 행만 갱신
+
+    Args:
+        model: RowTableModel
+        table: 감시할 테이블
+        fetch: (db, 컬럼, 키 목록) → 화면에 보여야 하는 행 목록 (작업 스레드에서 실행)
+        reload: 바뀐 행을 알 수 없을 때 호출할 전체 다시 읽기 함수
+    """
+
+    def __init__(self, model, table, fetch, reload, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.table = table
+        self.fetch = fetch
+        self.reload = reload
+        self._pending = {}  # 컬럼 → 다시 읽을 키 집합
+
+        self._query = AsyncQuery(self)
+        self._query.finished.connect(self._on_fetched)
+
+        bus = get_change_bus()
+        bus.changed.connect(self.on_changed)
+        bus.watch(table)
+        self.destroyed.connect(lambda *_: bus.unwatch(table))
+
+    def on_changed(self, event):
+        if event.table != self.table:
+            return
+        if event.keys is None:
+            self._pending.clear()
+            self._query.cancel()
+            self.reload()
+            return
+        if event.action == 'delete':
+            self.model.patch_rows(event.column, [], removed=event.keys)
+            return
+
+        self._pending.setdefault(event.column, set()).update(event.keys)
+        # 진행 중인 조회는 취소되므로 아직 반영하지 않은 키를 모두 다시 요청
+        requests = {column: list(keys) for column, keys in self._pending.items()}
+        self._query.submit(self._fetch_all, requests)
+
+    def _fetch_all(self, db, requests):
+        return [(column, keys, self.fetch(db, column, keys)) for column, keys in requests.items()]
+
+    def _on_fetched(self, results):
+        for column, keys, rows in results:
+            found = {row.get(column) for row in rows}
+            self.model.patch_rows(column, rows, removed=[k for k in keys if k not in found])
+            pending = self._pending.get(column)
+            if pending is not None:
+                pending.difference_update(keys)
+                if not pending:
+                    del self._pending[column]
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+데이터 변경 이벤트 (Qt 없이 사용 가능)
+
+DatabaseManager가 INSERT/UPDATE/DELETE를 실행하면 쿼리와 파라미터에서
+대상 테이블과 바뀐 행의 키를 뽑아 ChangeEvent로 등록된 리스너에 알린다.
+트랜잭션 안의 쓰기는 커밋된 뒤에 알리고, 롤백되면 버린다.
+
+키를 알 수 없는 쓰기(예: WHERE course_code = %s 로 여러 행 삭제)는 keys=None으로 알리며,
+받는 쪽은 이 경우 전체를 다시 읽는다.
+"""
+
+from collections import namedtuple
+import threading
+import re
+
+
+# table: 테이블, action: 'insert'/'update'/'delete'/'remote',
+# column: 키 컬럼 (keys를 알 수 없으면 None), keys: 키 값 목록 (알 수 없으면 None)
+ChangeEvent = namedtuple('ChangeEvent', 'table action column keys')
+
+# 테이블별 행을 식별할 수 있는 컬럼 (앞쪽 우선)
+KEY_COLUMNS = {
+    'courses': ('code',),
+    'subjects': ('code',),
+    'instructors': ('code',),
+    'instructor_codes': ('code',),
+    'projects': ('code',),
+    'students': ('code', 'id'),
+    'holidays': ('id', 'holiday_date'),
+    'timetables': ('id',),
+    'consultations': ('id',),
+    'consultation_photos': ('id',),
+    'course_subjects': ('id',),
+}
+
+_WRITE_PATTERN = re.compile(
+    r"^\s*(INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM|"
+    r"ALTER\s+TABLE|TRUNCATE\s+(?:TABLE\s+)?|DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?)\s*`?(\w+)`?",
+    re.IGNORECASE
+)
+_INSERT_COLUMNS = re.compile(r"^\s*\w+(?:\s+IGNORE)?\s+INTO\s+`?\w+`?\s*\(([^)]*)\)", re.IGNORECASE)
+_WHERE_SPLIT = re.compile(r"\bWHERE\b", re.IGNORECASE)
+_WHERE_EQUALS = re.compile(r"^\s*(?:\w+\.)?`?(\w+)`?\s*=\s*%s\s*$")
+_WHERE_IN = re.compile(r"^\s*(?:\w+\.)?`?(\w+)`?\s+IN\s*\(\s*%s(?:\s*,\s*%s)*\s*\)\s*$", re.IGNORECASE)
+_SET_ASSIGN = re.compile(r"(?:\w+\.)?`?(\w+)`?\s*=\s*(%s|[^,]+)")
+
+
+def _action_of(keyword):
+    keyword = keyword.split()[0].upper()
+    return {'INSERT': 'insert', 'REPLACE': 'insert', 'UPDATE': 'update', 'DELETE': 'delete'}.get(keyword)
+
+
+def describe_write(query, params_rows, lastrowid=None):
+    """쓰기 쿼리 → ChangeEvent (쓰기가 아니면 None)
+
+    Args:
+        query: 실행한 쿼리
+        params_rows: 행별 파라미터 목록 (단일 실행이면 [params])
+        lastrowid: 단일 INSERT의 AUTO_INCREMENT 값
+    """
+    match = _WRITE_PATTERN.match(query)
+    if not match:
+        return None
+    table = match.group(2).lower()
+    action = _action_of(match.group(1))
+    if action is None:
+        # DDL 등은 전체 변경으로 취급
+        return ChangeEvent(table, 'update', None, None)
+
+    key_columns = KEY_COLUMNS.get(table, ())
+    params_rows = [tuple(p) if isinstance(p, (list, tuple)) else (p,)
+                   for p in params_rows if p is not None]
+    column, keys = None, None
+
+    if action == 'insert':
+        columns_match = _INSERT_COLUMNS.match(query)
+        columns = [c.strip(' `').lower() for c in columns_match.group(1).split(',')] if columns_match else []
+        for key in key_columns:
+            if key in columns:
+                index = columns.index(key)
+                column, keys = key, [row[index] for row in params_rows if index < len(row)]
+                break
+        else:
+            if 'id' in key_columns and lastrowid and len(params_rows) <= 1:
+                column, keys = 'id', [lastrowid]
+    else:
+        column, keys = _where_keys(query, action, params_rows, key_columns)
+
+    if keys is None:
+        column = None
+    return ChangeEvent(table, action, column, keys)
+
+
+def _where_keys(query, action, params_rows, key_columns):
+    """UPDATE/DELETE의 WHERE가 키 컬럼 조건 하나일 때 (컬럼, 키 목록)"""
+    parts = _WHERE_SPLIT.split(query)
+    if len(parts) != 2:
+        return None, None
+    head, where = parts
+
+    match = _WHERE_EQUALS.match(where) or _WHERE_IN.match(where)
+    if not match or match.group(1).lower() not in key_columns:
+        return None, None
+    column = match.group(1).lower()
+    where_count = where.count('%s')
+    head_count = head.count('%s')
+
+    # UPDATE가 키 컬럼 자체를 바꾸면 새 값도 포함 (예: SET code = %s ... WHERE code = %s)
+    set_index = None
+    if action == 'update':
+        set_clause = re.split(r"\bSET\b", head, flags=re.IGNORECASE)[-1]
+        placeholder = 0
+        for name, value in _SET_ASSIGN.findall(set_clause):
+            if value == '%s':
+                if name.lower() == column:
+                    set_index = placeholder
+                placeholder += 1
+
+    keys = []
+    for row in params_rows:
+        if len(row) < head_count + where_count:
+            return None, None
+        keys.extend(row[head_count:head_count + where_count])
+        if set_index is not None:
+            keys.append(row[set_index])
+    return column, list(dict.fromkeys(keys))
+
+
+# --- 리스너 ---
+
+_listeners = []
+_listeners_lock = threading.Lock()
+
+
+def add_change_listener(listener):
+    """변경 리스너 등록 (listener(event)는 쓰기를 실행한 스레드에서 호출됨)"""
+    with _listeners_lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+
+def remove_change_listener(listener):
+    with _listeners_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def notify_change(event):
+    """등록된 리스너에 변경 알림 (리스너 오류는 출력만 하고 무시)"""
+    with _listeners_lock:
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception as e:
+            print(f"변경 알림 처리 오류: {str(e)}")
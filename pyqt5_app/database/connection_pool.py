@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+데이터베이스 커넥션 풀
+
+탭/다이얼로그마다 DatabaseManager를 만들고 connect()를 반복 호출해도
+매번 새 TCP 연결을 열지 않도록, 프로세스 전체에서 하나의 풀을 공유한다.
+
+커넥션 종류는 config_db.DB_BACKEND ('mysql' 또는 'sqlite')를 따르고,
+테스트/성능 측정에서는 configure_backend()로 실행 중에 바꿀 수 있다.
+"""
+
+import atexit
+import threading
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config_db import DB_CONFIG, DB_POOL_CONFIG, DB_BACKEND, SQLITE_PATH
+
+BACKENDS = ('mysql', 'sqlite')
+
+# 현재 백엔드 설정 (configure_backend로 변경)
+_backend = {'name': DB_BACKEND, 'sqlite_path': SQLITE_PATH}
+
+
+def create_mysql_connection():
+    """MySQL 커넥션 생성 (DictCursor)"""
+    import pymysql
+    return pymysql.connect(
+        host=DB_CONFIG['host'],
+        user=DB_CONFIG['user'],
+        passwd=DB_CONFIG['passwd'],
+        db=DB_CONFIG['db'],
+        charset=DB_CONFIG['charset'],
+        port=DB_CONFIG['port'],
+        cursorclass=pymysql.cursors.DictCursor
+    )
+
+
+def create_sqlite_connection():
+    """로컬 SQLite 파일 커넥션 생성 (pymysql 커넥션과 같은 인터페이스)"""
+    from database.sqlite_backend import connect
+    return connect(_backend['sqlite_path'], timeout=DB_POOL_CONFIG.get('timeout', 10))
+
+
+def current_backend():
+    """현재 데이터베이스 종류 ('mysql' 또는 'sqlite')"""
+    return _backend['name']
+
+
+def configure_backend(name, sqlite_path=None):
+    """데이터베이스 종류 변경 (기존 풀의 유휴 커넥션은 닫고 다음 대여부터 새 백엔드 사용)
+
+    사용 중이던 기존 풀의 커넥션은 새 풀에 반납될 때 새 풀 소유가 아니므로 닫힌다.
+
+    Args:
+        name: 'mysql' 또는 'sqlite'
+        sqlite_path: SQLite 파일 경로 (없으면 config_db.SQLITE_PATH)
+    """
+    global _pool
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 데이터베이스 종류: {name}")
+    with _pool_lock:
+        _backend['name'] = name
+        _backend['sqlite_path'] = sqlite_path or SQLITE_PATH
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close_all()
+
+    # 다른 DB의 기준 데이터가 캐시에 남지 않도록
+    from database.reference_cache import invalidate_reference
+    invalidate_reference()
+
+
+class PoolTimeoutError(Exception):
+    """풀의 모든 커넥션이 사용 중이고 대기 시간이 초과된 경우"""
+
+
+class ConnectionPool:
+    """크기가 제한된 스레드 안전 커넥션 풀
+
+    - acquire(): 유휴 커넥션을 재사용하거나 새로 생성 (최대 max_size개)
+      GUI(메인) 스레드는 ui_timeout까지만 기다리고 실패해서 화면이 멈추지 않게 한다.
+    - release(): 사용이 끝난 커넥션을 반납 (열린 트랜잭션은 롤백)
+      다른 풀에서 만든 커넥션(백엔드 변경 전 풀 등)은 받지 않고 닫는다.
+    - check(): ping_interval이 지난 커넥션만 ping으로 생존 확인
+    - stats(): 생성/재사용/ping 실패 등 통계
+    """
+
+    def __init__(self, factory, max_size=10, ping_interval=60, timeout=10, ui_timeout=1):
+        self.factory = factory
+        self.max_size = max_size
+        self.ping_interval = ping_interval
+        self.timeout = timeout
+        self.ui_timeout = ui_timeout
+
+        self._cond = threading.Condition()
+        self._idle = []          # 유휴 커넥션 (LIFO)
+        self._size = 0           # 생성되어 살아있는 커넥션 수 (사용 중 + 유휴)
+        self._owned = set()      # 이 풀이 만든 살아있는 커넥션
+        self._last_checked = {}  # id(conn) -> 마지막 생존 확인 시각
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'checkouts': 0,
+            'returns': 0,
+            'pings': 0,
+            'ping_failures': 0,
+            'discarded': 0,
+            'waits': 0,
+        }
+
+    def acquire(self):
+        """커넥션 대여"""
+        on_ui_thread = threading.current_thread() is threading.main_thread()
+        deadline = time.monotonic() + (self.ui_timeout if on_ui_thread else self.timeout)
+
+        while True:
+            conn = None
+            create = False
+
+            with self._cond:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"커넥션 풀 대기 시간 초과 (최대 {self.max_size}개 모두 사용 중)"
+                        )
+                    self._stats['waits'] += 1
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    conn = self._idle.pop()
+                else:
+                    self._size += 1
+                    create = True
+
+            if create:
+                try:
+                    conn = self.factory()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._owned.add(conn)
+                    self._stats['created'] += 1
+                    self._stats['checkouts'] += 1
+                    self._last_checked[id(conn)] = time.monotonic()
+                return conn
+
+            # 유휴 커넥션은 생존 확인 후 재사용
+            if self.check(conn):
+                with self._cond:
+                    self._stats['reused'] += 1
+                    self._stats['checkouts'] += 1
+                return conn
+
+            self.discard(conn)
+
+    def owns(self, conn):
+        """이 풀이 만든 커넥션인지"""
+        with self._cond:
+            return conn in self._owned
+
+    def release(self, conn):
+        """커넥션 반납 (다른 풀의 커넥션은 닫기만 함)"""
+        if conn is None:
+            return
+        if not self.owns(conn):
+            self._close(conn)
+            return
+
+        try:
+            # 조회만 하고 끝난 트랜잭션(스냅샷)도 정리해서 반납
+            conn.rollback()
+        except Exception:
+            self.discard(conn)
+            return
+
+        with self._cond:
+            if conn in self._idle:
+                return
+            self._idle.append(conn)
+            self._stats['returns'] += 1
+            self._cond.notify()
+
+    def check(self, conn):
+        """커넥션 생존 확인 (ping_interval 이내에 확인했으면 생략)"""
+        now = time.monotonic()
+        last = self._last_checked.get(id(conn), 0)
+        if now - last < self.ping_interval:
+            return True
+
+        try:
+            conn.ping(reconnect=True)
+            with self._cond:
+                self._stats['pings'] += 1
+                self._last_checked[id(conn)] = now
+            return True
+        except Exception as e:
+            print(f"커넥션 ping 실패: {str(e)}")
+            with self._cond:
+                self._stats['ping_failures'] += 1
+            return False
+
+    def discard(self, conn):
+        """끊어진 커넥션 폐기 (다른 풀의 커넥션은 닫기만 함)"""
+        self._close(conn)
+
+        with self._cond:
+            if conn not in self._owned:
+                return
+            self._owned.discard(conn)
+            if conn in self._idle:
+                self._idle.remove(conn)
+            self._last_checked.pop(id(conn), None)
+            self._size = max(self._size - 1, 0)
+            self._stats['discarded'] += 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def close_all(self):
+        """유휴 커넥션 모두 종료 (프로그램 종료 시)"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            for conn in idle:
+                self._owned.discard(conn)
+                self._last_checked.pop(id(conn), None)
+
+        for conn in idle:
+            self._close(conn)
+
+    def stats(self):
+        """풀 사용 통계"""
+        with self._cond:
+            result = dict(self._stats)
+            result['idle'] = len(self._idle)
+            result['in_use'] = self._size - len(self._idle)
+            result['max_size'] = self.max_size
+        checkouts = result['checkouts']
+        result['reuse_ratio'] = (result['reused'] / checkouts) if checkouts else 0.0
+        return result
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """프로세스 전역 커넥션 풀 반환 (최초 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                factory = create_sqlite_connection if _backend['name'] == 'sqlite' else create_mysql_connection
+                _pool = ConnectionPool(
+                    factory,
+                    max_size=DB_POOL_CONFIG.get('max_size', 10),
+                    ping_interval=DB_POOL_CONFIG.get('ping_interval', 60),
+                    timeout=DB_POOL_CONFIG.get('timeout', 10),
+                    ui_timeout=DB_POOL_CONFIG.get('ui_timeout', 1),
+                )
+                atexit.register(_pool.close_all)
+    return _pool
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+면담 검색 (FULLTEXT ngram 인덱스 + 관련도 순위 + 페이지 단위 조회)
+
+주제/내용/상담사는 consultations의 FULLTEXT(ngram) 인덱스로 찾고,
+학생 이름은 students에서 먼저 id를 찾아 idx_student_id로 연결한다 (두 결과를 id로 합침).
+여러 단어를 입력하면 본문과 이름 모두 단어를 전부 포함해야 일치한다.
+검색어가 있으면 관련도(학생 이름 일치 > 본문 점수) 순, 없으면 최신 면담 순으로 정렬한다.
+
+ngram 토큰(기본 2글자)보다 짧은 검색어나 인덱스가 없는 DB(마이그레이션 8 미적용)는
+예전처럼 LIKE 검색으로 처리한다.
+
+목록에는 본문(content)을 싣지 않는다. 상세 내용은 선택할 때 get_consultation으로 조회.
+
+사용 예:
+    page = search_consultations(db, '진로', date_from='2026-01-01', page=0)
+    page.rows, page.total, page.has_more
+"""
+
+from collections import namedtuple
+from datetime import datetime, timedelta
+import re
+
+# 한 페이지 행 수
+PAGE_SIZE = 100
+
+# ngram_token_size (MySQL 기본값 2) 보다 짧은 검색어는 FULLTEXT로 찾을 수 없음
+NGRAM_TOKEN_SIZE = 2
+
+# 학생 이름이 일치할 때 더하는 점수 (본문 점수보다 항상 앞서도록 충분히 크게)
+NAME_MATCH_BONUS = 1000
+
+# 목록에 필요한 컬럼만 조회
+LIST_COLUMNS = """
+    c.id, c.student_id, c.consultation_date, c.consultation_type, c.status,
+    c.main_topic, c.consultant_name, c.next_consultation_date,
+    s.name AS student_name, s.code AS student_code
+"""
+
+FULLTEXT_COLUMNS = "c.main_topic, c.content, c.consultant_name"
+
+
+class SearchPage(namedtuple('SearchPage', 'rows total page page_size')):
+    """검색 결과 한 페이지 (rows: 현재 페이지 행, total: 전체 결과 수, page: 0부터)"""
+
+    __slots__ = ()
+
+    @property
+    def has_more(self):
+        return (self.page + 1) * self.page_size < self.total
+
+    @property
+    def after(self):
+        """다음 페이지 번호 (KeysetPage.after와 같은 용도)"""
+        return self.page + 1
+
+
+_fulltext_available = True
+
+
+def _words(keyword):
+    """검색어 → FULLTEXT 연산자를 뺀 단어 목록"""
+    words = [re.sub(r'["+\-<>()~*@]', '', word) for word in keyword.split()]
+    return [word for word in words if word]
+
+
+def _boolean_query(keyword):
+    """검색어 → BOOLEAN MODE 질의 (단어마다 필수 구문 검색: +"단어")"""
+    return ' '.join(f'+"{word}"' for word in _words(keyword))
+
+
+def _filters(consultation_type, date_from, date_to):
+    """유형/기간 조건 (date_to는 그 날짜 하루 전체를 포함)"""
+    conditions, params = [], []
+    if consultation_type:
+        conditions.append("c.consultation_type = %s")
+        params.append(consultation_type)
+    if date_from:
+        conditions.append("c.consultation_date >= %s")
+        params.append(date_from)
+    if date_to:
+        if isinstance(date_to, str):
+            date_to = datetime.strptime(date_to[:10], '%Y-%m-%d').date()
+        if isinstance(date_to, datetime):
+            date_to = date_to.date()
+        conditions.append("c.consultation_date < %s")
+        params.append(date_to + timedelta(days=1))
+    return conditions, params
+
+
+def _student_ids(cursor, words):
+    """이름에 모든 단어를 포함하는 학생 id (students만 조회)"""
+    if not words:
+        return []
+    condition = " AND ".join("name LIKE %s" for _ in words)
+    cursor.execute(f"SELECT id FROM students WHERE {condition}",
+                   tuple(f"%{word}%" for word in words))
+    return [row['id'] for row in cursor.fetchall()]
+
+
+def _placeholders(values):
+    return ", ".join(["%s"] * len(values))
+
+
+def _fulltext_source(keyword, student_ids):
+    """FULLTEXT 검색 대상 (FROM 절, 파라미터)
+
+    본문 MATCH와 학생 id 조회를 각각 인덱스로 찾은 뒤 id로 합치고(UNION),
+    면담 행은 그 id로만 읽는다. 점수는 본문 점수 + 학생 이름 일치 점수.
+    """
+    against = _boolean_query(keyword)
+    match = f"MATCH({FULLTEXT_COLUMNS}) AGAINST(%s IN BOOLEAN MODE)"
+    matches = f"SELECT c.id, {match} AS score FROM consultations c WHERE {match}"
+    params = [against, against]
+    if student_ids:
+        matches += (f" UNION ALL SELECT c.id, {NAME_MATCH_BONUS} AS score FROM consultations c"
+                    f" WHERE c.student_id IN ({_placeholders(student_ids)})")
+        params.extend(student_ids)
+    source = (f"(SELECT id, SUM(score) AS score FROM ({matches}) u GROUP BY id) m "
+              "JOIN consultations c ON c.id = m.id")
+    return source, params
+
+
+def _like_parts(keyword, student_ids):
+    """LIKE 검색 (짧은 검색어/인덱스 없음): 단어마다 주제/내용/상담사 중 하나에 포함"""
+    words = keyword.split()
+    body = " AND ".join("(c.main_topic LIKE %s OR c.content LIKE %s OR c.consultant_name LIKE %s)"
+                        for _ in words)
+    condition_params = [f"%{word}%" for word in words for _ in range(3)]
+    score, score_params = "(c.main_topic LIKE %s)", [f"%{keyword}%"]
+    if student_ids:
+        name_match = f"c.student_id IN ({_placeholders(student_ids)})"
+        score = f"IF({name_match}, {NAME_MATCH_BONUS}, 0) + {score}"
+        score_params = list(student_ids) + score_params
+        return score, score_params, f"({name_match} OR ({body}))", list(student_ids) + condition_params
+    return score, score_params, f"({body})", condition_params
+
+
+def _run(db, keyword, conditions, params, page, page_size, use_fulltext):
+    cursor = db.connection.cursor()
+    conditions = list(conditions)
+    params = list(params)
+    source, source_params = "consultations c", []
+    score, score_params = "0", []
+    if keyword:
+        words = _words(keyword) if use_fulltext else keyword.split()
+        student_ids = _student_ids(cursor, words)
+        if use_fulltext:
+            source, source_params = _fulltext_source(keyword, student_ids)
+            score = "m.score"
+        else:
+            score, score_params, condition, condition_params = _like_parts(keyword, student_ids)
+            conditions.append(condition)
+            params.extend(condition_params)
+    where = " AND ".join(conditions) if conditions else "1=1"
+
+    cursor.execute(f"SELECT COUNT(*) AS cnt FROM {source} WHERE {where}", tuple(source_params + params))
+    total = cursor.fetchone()['cnt']
+    if total == 0 or page * page_size >= total:
+        return SearchPage([], total, page, page_size)
+
+    cursor.execute(f"""
+        SELECT {LIST_COLUMNS}, {score} AS score
+        FROM {source}
+        LEFT JOIN students s ON c.student_id = s.id
+        WHERE {where}
+        ORDER BY score DESC, c.consultation_date DESC, c.id DESC
+        LIMIT %s OFFSET %s
+    """, tuple(score_params + source_params + params + [page_size, page * page_size]))
+    return SearchPage(cursor.fetchall(), total, page, page_size)
+
+
+def search_consultations(db, keyword='', consultation_type=None, date_from=None, date_to=None,
+                         page=0, page_size=PAGE_SIZE):
+    """면담 검색 (오류는 호출한 쪽으로 전달)
+
+    Args:
+        db: 연결된 DatabaseManager
+        keyword: 검색어 (공백으로 나눈 단어를 모두 포함하는 면담)
+        consultation_type: 면담 유형 (None이면 전체)
+        date_from, date_to: 면담 기간 ('yyyy-MM-dd' 또는 date, 양 끝 포함)
+        page: 0부터 시작하는 페이지 번호
+
+    Returns:
+        SearchPage
+    """
+    global _fulltext_available
+    keyword = (keyword or '').strip()
+    conditions, params = _filters(consultation_type, date_from, date_to)
+
+    words = _words(keyword)
+    use_fulltext = (_fulltext_available and bool(words)
+                    and all(len(word) >= NGRAM_TOKEN_SIZE for word in words))
+    if not use_fulltext:
+        return _run(db, keyword, conditions, params, page, page_size, False)
+
+    try:
+        return _run(db, keyword, conditions, params, page, page_size, True)
+    except Exception as e:
+        # 1191: Can't find FULLTEXT index (마이그레이션 전 DB) → 이후로는 LIKE 검색
+        if getattr(e, 'args', None) and e.args[0] == 1191:
+            print("면담 FULLTEXT 인덱스가 없어 LIKE 검색으로 전환합니다.")
+            _fulltext_available = False
+            return _run(db, keyword, conditions, params, page, page_size, False)
+        raise
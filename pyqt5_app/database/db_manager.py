@@ -3,43 +3,96 @@
 데이터베이스 매니저
 """
 
-import pymysql
 import sys
 import os
+from contextlib import contextmanager
 from datetime import datetime
 
 # 상위 디렉토리를 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config_db import DB_CONFIG
+from database.connection_pool import get_pool, current_backend
+from database.reference_cache import invalidate_reference
+from database.change_events import describe_write, notify_change
+from database import consultation_search
+from database.keyset import fetch_page, LIST_PAGE_SIZE
 
 
 class DatabaseManager:
-    """MySQL 데이터베이스 연결 및 관리"""
+    """데이터베이스 연결 및 관리 (MySQL, 오프라인에서는 SQLite 백엔드 - database.sqlite_backend)"""
+    
+    # 목록 화면용 조회 (TEXT 컬럼은 앞부분만, 전체 값은 선택할 때 get_* 로 조회)
+    STUDENT_LIST_QUERY = """
+        SELECT s.id, s.code, s.name, s.birth_date, s.gender, s.phone, s.email, s.campus,
+               s.course_code, s.registered_at,
+               LEFT(s.interests, 50) AS interests, LEFT(s.education, 50) AS education,
+               LEFT(s.notes, 50) AS notes, c.name AS course_name
+        FROM students s
+        LEFT JOIN courses c ON s.course_code = c.code
+    """
+    CONSULTATION_LIST_QUERY = """
+        SELECT c.id, c.student_id, c.consultation_date, c.consultation_type, c.status,
+               c.main_topic, c.consultant_name, c.next_consultation_date,
+               s.name AS student_name, s.code AS student_code
+        FROM consultations c
+        LEFT JOIN students s ON c.student_id = s.id
+    """
+    TIMETABLE_LIST_QUERY = """
+        SELECT t.id, t.course_code, t.subject_code, t.instructor_code, t.class_date,
+               t.start_time, t.end_time, t.type, LEFT(t.notes, 100) AS notes,
+               c.name AS course_name, s.name AS subject_name, i.name AS instructor_name
+        FROM timetables t
+        LEFT JOIN courses c ON t.course_code = c.code
+        LEFT JOIN subjects s ON t.subject_code = s.code
+        LEFT JOIN instructors i ON t.instructor_code = i.code
+    """
     
     def __init__(self):
         self.connection = None
+        self._transaction_depth = 0  # transaction() 중첩 깊이
+        self._pending_events = []  # 트랜잭션 중 쓰기 이벤트 (커밋 후 알림)
         
     def connect(self):
-        """데이터베이스 연결"""
+        """데이터베이스 연결 (공용 커넥션 풀에서 대여)
+        
+        이미 연결되어 있으면 기존 커넥션을 그대로 사용하므로
+        load_data 등에서 반복 호출해도 새 연결을 만들지 않는다.
+        """
         try:
-            self.connection = pymysql.connect(
-                host=DB_CONFIG['host'],
-                user=DB_CONFIG['user'],
-                passwd=DB_CONFIG['passwd'],
-                db=DB_CONFIG['db'],
-                charset=DB_CONFIG['charset'],
-                port=DB_CONFIG['port'],
-                cursorclass=pymysql.cursors.DictCursor
-            )
+            pool = get_pool()
+            if self.connection is not None:
+                if pool.owns(self.connection) and pool.check(self.connection):
+                    return True
+                # 끊어진 커넥션이나 백엔드 변경 전 풀의 커넥션은 폐기하고 새로 대여
+                pool.discard(self.connection)
+                self.connection = None
+            
+            self.connection = pool.acquire()
             return True
         except Exception as e:
             print(f"데이터베이스 연결 오류: {str(e)}")
             return False
     
     def disconnect(self):
-        """데이터베이스 연결 종료"""
+        """데이터베이스 연결 종료 (커넥션을 풀에 반납)"""
         if self.connection:
-            self.connection.close()
+            get_pool().release(self.connection)
+            self.connection = None
+    
+    def __del__(self):
+        # 반납하지 않은 커넥션이 풀에서 새지 않도록 정리
+        try:
+            self.disconnect()
+        except Exception:
+            pass
+    
+    def pool_stats(self):
+        """커넥션 풀 사용 통계"""
+        return get_pool().stats()
+    
+    @property
+    def backend(self):
+        """데이터베이스 종류 ('mysql' 또는 'sqlite')"""
+        return current_backend()
             
     def create_tables(self):
         """필요한 테이블 생성"""
@@ -207,6 +260,17 @@ class DatabaseManager:
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
             """)
             
+            # 9. 코드 자동 생성용 번호 테이블 (마이그레이션 7과 같은 정의)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS code_sequences (
+                    table_name VARCHAR(64) NOT NULL,
+                    prefix VARCHAR(10) NOT NULL,
+                    next_value INT UNSIGNED NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    PRIMARY KEY (table_name, prefix)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+            """)
+            
             self.connection.commit()
             print("테이블이 성공적으로 생성되었습니다.")
             return True
@@ -216,23 +280,131 @@ class DatabaseManager:
             self.connection.rollback()
             return False
     
+    @contextmanager
+    def transaction(self):
+        """트랜잭션 블록
+        
+        블록 안의 execute_query/execute_many는 개별 커밋하지 않고
+        블록이 정상 종료될 때 한 번만 커밋한다. 오류가 나면 전체 롤백.
+        
+        중첩된 블록은 SAVEPOINT로 처리한다. 안쪽 블록에서 오류가 나면 그 블록의 쓰기만
+        되돌리고(ROLLBACK TO SAVEPOINT) 오류를 전달하므로, 바깥 블록이 오류를 잡고 계속해도
+        안쪽 블록의 일부 쓰기가 커밋되지 않는다.
+        
+        사용 예:
+            with db.transaction():
+                db.execute_query("DELETE FROM ...", (...))
+                db.execute_many("INSERT INTO ... VALUES (%s, %s)", rows)
+        """
+        if self.connection is None and not self.connect():
+            raise Exception("데이터베이스 연결 실패")
+        
+        savepoint = f"sp_{self._transaction_depth}" if self._transaction_depth else None
+        if savepoint:
+            self.connection.cursor().execute(f"SAVEPOINT {savepoint}")
+        pending = len(self._pending_events)
+        
+        self._transaction_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._transaction_depth -= 1
+            if savepoint:
+                self.connection.cursor().execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                for event in self._pending_events[pending:]:
+                    invalidate_reference(event.table)
+                del self._pending_events[pending:]
+            else:
+                self.connection.rollback()
+                self._flush_pending_events(committed=False)
+            raise
+        else:
+            self._transaction_depth -= 1
+            if savepoint:
+                self.connection.cursor().execute(f"RELEASE SAVEPOINT {savepoint}")
+            else:
+                self.connection.commit()
+                self._flush_pending_events(committed=True)
+    
+    def _note_write(self, query, params_rows, lastrowid=None):
+        """쓰기 쿼리면 기준 데이터 캐시 무효화 + 변경 이벤트 알림
+        
+        트랜잭션 중에는 커밋 시점에 캐시를 한 번 더 무효화하고 이벤트를 알린다.
+        (커밋 전에 다른 커넥션이 이전 값을 다시 캐시했을 수 있으므로)
+        """
+        event = describe_write(query, params_rows, lastrowid)
+        if event is None:
+            return
+        invalidate_reference(event.table)
+        if self._transaction_depth:
+            self._pending_events.append(event)
+        else:
+            notify_change(event)
+    
+    def _flush_pending_events(self, committed):
+        events, self._pending_events = self._pending_events, []
+        for event in events:
+            invalidate_reference(event.table)
+            if committed:
+                notify_change(event)
+    
     def execute_query(self, query, params=None):
-        """쿼리 실행"""
+        """쿼리 실행 (트랜잭션 블록 밖에서는 즉시 커밋)"""
         try:
             cursor = self.connection.cursor()
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
-            self.connection.commit()
+            if not self._transaction_depth:
+                self.connection.commit()
+            self._note_write(query, [params], cursor.lastrowid)
             return cursor
         except Exception as e:
             print(f"쿼리 실행 오류: {str(e)}")
+            if self._transaction_depth:
+                # 트랜잭션 블록에서 롤백하도록 전달
+                raise
+            self.connection.rollback()
+            return None
+    
+    def execute_many(self, query, params_list, chunk_size=1000):
+        """여러 행 일괄 실행
+        
+        INSERT ... VALUES (%s, ...) 형태는 pymysql이 다중 행 VALUES 한 문장으로
+        묶어서 전송하므로 행마다 왕복/커밋하지 않는다.
+        (VALUES 안에 리터럴이 섞이면 묶이지 않으므로 모든 값을 %s로 전달할 것)
+        
+        Args:
+            query: 실행할 쿼리
+            params_list: 행별 파라미터 튜플 목록
+            chunk_size: 한 번에 전송할 최대 행 수
+        
+        Returns:
+            int: 영향받은 행 수 (오류 시 None)
+        """
+        params_list = list(params_list)
+        if not params_list:
+            return 0
+        
+        try:
+            cursor = self.connection.cursor()
+            affected = 0
+            for start in range(0, len(params_list), chunk_size):
+                affected += cursor.executemany(query, params_list[start:start + chunk_size]) or 0
+            if not self._transaction_depth:
+                self.connection.commit()
+            self._note_write(query, params_list)
+            return affected
+        except Exception as e:
+            print(f"일괄 실행 오류: {str(e)}")
+            if self._transaction_depth:
+                raise
             self.connection.rollback()
             return None
     
     def fetch_all(self, query, params=None):
-        """모든 결과 조회"""
+        """모든 결과 조회 (트랜잭션 블록 밖에서는 오류 시 빈 목록)"""
         try:
             cursor = self.connection.cursor()
             if params:
@@ -242,10 +414,50 @@ class DatabaseManager:
             return cursor.fetchall()
         except Exception as e:
             print(f"조회 오류: {str(e)}")
+            if self._transaction_depth:
+                # 트랜잭션 블록에서는 빈 결과로 이어서 쓰지 않도록 전달 (롤백)
+                raise
             return []
     
+    def stream_rows(self, query, params=None, chunk_size=1000):
+        """서버 측 커서(SSDictCursor)로 결과를 chunk_size 행씩 나눠 읽기
+        
+        전체 결과를 한 번에 메모리에 올리지 않는다. 반환된 이터레이터를 끝까지 읽어야
+        커서가 닫히고 커넥션을 다시 사용할 수 있다. (오류는 그대로 전달)
+        
+        Returns:
+            tuple: (컬럼 이름 목록, 행 dict 이터레이터)
+        """
+        if self.backend == 'sqlite':
+            # sqlite3 커서는 원래 필요한 만큼만 읽음
+            cursor = self.connection.cursor()
+        else:
+            import pymysql
+            cursor = self.connection.cursor(pymysql.cursors.SSDictCursor)
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+        except Exception:
+            cursor.close()
+            raise
+        columns = [desc[0] for desc in cursor.description or []]
+        
+        def rows():
+            try:
+                while True:
+                    chunk = cursor.fetchmany(chunk_size)
+                    if not chunk:
+                        break
+                    yield from chunk
+            finally:
+                cursor.close()
+        
+        return columns, rows()
+    
     def fetch_one(self, query, params=None):
-        """단일 결과 조회"""
+        """단일 결과 조회 (트랜잭션 블록 밖에서는 오류 시 None)"""
         try:
             cursor = self.connection.cursor()
             if params:
@@ -255,28 +467,108 @@ class DatabaseManager:
             return cursor.fetchone()
         except Exception as e:
             print(f"조회 오류: {str(e)}")
+            if self._transaction_depth:
+                # 트랜잭션 블록에서는 빈 결과로 이어서 쓰지 않도록 전달 (롤백)
+                raise
             return None
     
     def get_next_code(self, table_name, prefix):
-        """다음 코드 번호 생성"""
+        """다음 코드 번호 생성 (code_sequences에서 1개 예약, 실패하면 {prefix}001)"""
         try:
-            query = f"SELECT code FROM {table_name} WHERE code LIKE %s ORDER BY code DESC LIMIT 1"
-            result = self.fetch_one(query, (f"{prefix}%",))
-            
-            if result:
-                last_code = result['code']
-                # 숫자 부분 추출
-                num = int(last_code.replace(prefix, ''))
-                next_num = num + 1
-            else:
-                next_num = 1
-            
-            # 3자리 숫자로 포맷팅
-            return f"{prefix}{next_num:03d}"
+            return self.reserve_codes(table_name, prefix, 1)[0]
         except Exception as e:
             print(f"코드 생성 오류: {str(e)}")
             return f"{prefix}001"
-    
+
+    def reserve_codes(self, table_name, prefix, count):
+        """연속된 코드 count개 예약
+
+        code_sequences의 다음 번호를 UPDATE 한 문장으로 count만큼 올리고
+        LAST_INSERT_ID(expr)로 올린 값을 같은 왕복에서 돌려받는다.
+        행 잠금으로 동시에 예약해도 번호가 겹치지 않으며, 테이블을 훑지 않는다.
+        - transaction() 블록 안: 커밋/롤백과 함께 확정/취소 (롤백하면 번호도 반환됨)
+        - 블록 밖: 즉시 커밋 (INSERT가 실패하면 번호가 비어도 무방)
+
+        처음 쓰는 (테이블, 접두사)는 기존 코드의 최대 번호로 한 번만 초기화한다.
+        code_sequences가 없는 DB(마이그레이션 7 전)는 기존 코드의 최대 번호 다음부터 만든다.
+
+        Returns:
+            list: [f"{prefix}{번호:03d}", ...] (count개, 연속 번호)
+        """
+        if count <= 0:
+            return []
+        if self.connection is None and not self.connect():
+            raise Exception("데이터베이스 연결 실패")
+
+        cursor = self.connection.cursor()
+        try:
+            for _ in range(2):
+                cursor.execute("""
+                    UPDATE code_sequences
+                    SET next_value = LAST_INSERT_ID(next_value + %s)
+                    WHERE table_name = %s AND prefix = %s
+                """, (count, table_name, prefix))
+                if cursor.rowcount:
+                    break
+                self._seed_code_sequence(cursor, table_name, prefix)
+            else:
+                raise Exception(f"코드 시퀀스 초기화 실패: {table_name} {prefix}")
+            end = cursor.lastrowid
+            if not self._transaction_depth:
+                self.connection.commit()
+        except Exception as e:
+            if not self._transaction_depth:
+                self.connection.rollback()
+            if not self._is_missing_table(e):
+                raise
+            print("code_sequences 테이블이 없어 기존 코드의 최대 번호로 생성합니다. (마이그레이션 필요)")
+            end = self._scan_last_code(cursor, table_name, prefix) + 1 + count
+        return [f"{prefix}{num:03d}" for num in range(end - count, end)]
+
+    def advance_code_sequence(self, table_name, prefix, code):
+        """직접 입력한 코드가 시퀀스를 앞지르면 다음 번호를 그 뒤로 옮김"""
+        number = code[len(prefix):] if code.startswith(prefix) else ''
+        if not number.isdigit():
+            return
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                UPDATE code_sequences SET next_value = GREATEST(next_value, %s)
+                WHERE table_name = %s AND prefix = %s
+            """, (int(number) + 1, table_name, prefix))
+        except Exception as e:
+            # 시퀀스 테이블이 없으면 다음 번호를 기존 코드에서 찾으므로 옮길 필요 없음
+            if not self._is_missing_table(e):
+                raise
+            return
+        if not self._transaction_depth:
+            self.connection.commit()
+
+    @staticmethod
+    def _is_missing_table(error):
+        # 1146: Table doesn't exist
+        return bool(getattr(error, 'args', None)) and error.args[0] == 1146
+
+    @staticmethod
+    def _scan_last_code(cursor, table_name, prefix):
+        """기존 코드의 최대 번호 (없으면 0)"""
+        cursor.execute(f"""
+            SELECT COALESCE(MAX(CAST(SUBSTRING(code, %s) AS UNSIGNED)), 0) AS last_value
+            FROM {table_name}
+            WHERE code LIKE %s AND SUBSTRING(code, %s) REGEXP '^[0-9]+$'
+        """, (len(prefix) + 1, f"{prefix}%", len(prefix) + 1))
+        return cursor.fetchone()['last_value']
+
+    @staticmethod
+    def _seed_code_sequence(cursor, table_name, prefix):
+        """기존 코드의 최대 번호 + 1로 시퀀스 행 생성 (이미 있으면 그대로)"""
+        cursor.execute(f"""
+            INSERT IGNORE INTO code_sequences (table_name, prefix, next_value)
+            SELECT %s, %s, COALESCE(MAX(CAST(SUBSTRING(code, %s) AS UNSIGNED)), 0) + 1
+            FROM {table_name}
+            WHERE code LIKE %s AND SUBSTRING(code, %s) REGEXP '^[0-9]+$'
+        """, (table_name, prefix, len(prefix) + 1, f"{prefix}%", len(prefix) + 1))
+
     # ==================== 면담 관리 메서드 ====================
     
     def add_consultation(self, consultation_data):
@@ -447,38 +739,49 @@ class DatabaseManager:
             print(f"면담 사진 조회 오류: {str(e)}")
             return []
     
-    def search_consultations(self, keyword='', consultation_type=None, date_from=None, date_to=None):
-        """면담 검색"""
+    def search_consultations(self, keyword='', consultation_type=None, date_from=None, date_to=None,
+                             page=0, page_size=None):
+        """면담 검색 (관련도 순, 페이지 단위)
+        
+        Returns:
+            SearchPage: rows/total/page/page_size/has_more (database.consultation_search)
+        """
         try:
-            query = """
-                SELECT c.*, s.name as student_name, s.code as student_code
-                FROM consultations c
-                LEFT JOIN students s ON c.student_id = s.id
-                WHERE 1=1
-            """
-            params = []
-            
-            if keyword:
-                query += """ AND (s.name LIKE %s OR c.main_topic LIKE %s 
-                            OR c.content LIKE %s OR c.consultant_name LIKE %s)"""
-                keyword_param = f"%{keyword}%"
-                params.extend([keyword_param, keyword_param, keyword_param, keyword_param])
-            
-            if consultation_type:
-                query += " AND c.consultation_type = %s"
-                params.append(consultation_type)
-            
-            if date_from:
-                query += " AND c.consultation_date >= %s"
-                params.append(date_from)
-            
-            if date_to:
-                query += " AND c.consultation_date <= %s"
-                params.append(date_to)
-            
-            query += " ORDER BY c.consultation_date DESC"
-            
-            return self.fetch_all(query, tuple(params) if params else None)
+            return consultation_search.search_consultations(
+                self, keyword, consultation_type, date_from, date_to,
+                page=page, page_size=page_size or consultation_search.PAGE_SIZE)
         except Exception as e:
             print(f"면담 검색 오류: {str(e)}")
-            return []
+            raise
+    
+    # ==================== 목록 조회 (키셋 페이지) ====================
+    # 작업 스레드(AsyncQuery)에서 호출하므로 오류는 그대로 전달한다.
+    
+    def list_students(self, after=None, limit=None, conditions=(), params=()):
+        """학생 목록 한 페이지 (코드 순)
+        
+        Returns:
+            KeysetPage: rows/after/has_more
+        """
+        return fetch_page(self, self.STUDENT_LIST_QUERY, conditions, params,
+                          keys=[('s.code', 'code')], after=after, limit=limit or LIST_PAGE_SIZE)
+    
+    def get_student(self, code):
+        """학생 상세 정보 (모든 컬럼)"""
+        return self.fetch_one("SELECT * FROM students WHERE code = %s", (code,))
+    
+    def list_consultations(self, after=None, limit=None, conditions=(), params=()):
+        """면담 목록 한 페이지 (최근 면담 순)"""
+        return fetch_page(self, self.CONSULTATION_LIST_QUERY, conditions, params,
+                          keys=[('c.consultation_date', 'consultation_date'), ('c.id', 'id')],
+                          after=after, descending=True, limit=limit or LIST_PAGE_SIZE)
+    
+    def list_timetables(self, conditions=(), params=(), after=None, limit=None):
+        """시간표 목록 한 페이지 (날짜, 시작시간 순)"""
+        return fetch_page(self, self.TIMETABLE_LIST_QUERY, conditions, params,
+                          keys=[('t.class_date', 'class_date'), ('t.start_time', 'start_time'), ('t.id', 'id')],
+                          after=after, limit=limit or LIST_PAGE_SIZE)
+    
+    def get_timetable(self, timetable_id):
+        """시간표 상세 정보 (모든 컬럼)"""
+        return self.fetch_one("SELECT * FROM timetables WHERE id = %s", (timetable_id,))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+키셋(keyset) 페이지 조회
+
+OFFSET은 건너뛸 행을 모두 읽어야 해서 뒤쪽 페이지일수록 느려진다.
+키셋 방식은 마지막으로 받은 행의 정렬 키 다음부터 LIMIT만큼 읽으므로
+데이터가 쌓여도 페이지마다 걸리는 시간이 같다.
+
+정렬 키는 유일해야 한다. (같은 값이 있으면 뒤에 id 등을 붙일 것)
+
+사용 예:
+    page = fetch_page(db, "SELECT ... FROM students s", [], [], keys=[('s.code', 'code')])
+    next_page = fetch_page(db, ..., after=page.after)
+"""
+
+from collections import namedtuple
+
+# 목록 한 페이지 행 수
+LIST_PAGE_SIZE = 200
+
+
+class KeysetPage(namedtuple('KeysetPage', 'rows after has_more')):
+    """키셋 페이지 (rows: 행 목록, after: 다음 페이지 요청에 넘길 키, has_more: 다음 페이지 여부)"""
+
+    __slots__ = ()
+
+
+def fetch_page(db, select, conditions, params, keys, after=None, limit=LIST_PAGE_SIZE, descending=False):
+    """정렬 키 기준 다음 페이지 조회 (오류는 호출한 쪽으로 전달)
+
+    Args:
+        db: 연결된 DatabaseManager
+        select: "SELECT ... FROM ... JOIN ..." (WHERE/ORDER BY 없이)
+        conditions: WHERE 조건 목록
+        params: 조건 파라미터
+        keys: [(정렬 SQL 식, 결과 행 키), ...] 앞쪽이 우선
+        after: 이전 페이지의 KeysetPage.after (첫 페이지는 None)
+        descending: True면 모든 키 내림차순
+
+    Returns:
+        KeysetPage
+    """
+    conditions = list(conditions)
+    params = list(params)
+    expressions = [expression for expression, _ in keys]
+    if after is not None:
+        # 행 생성자 비교는 MySQL이 인덱스 범위 조회로 처리함
+        operator = '<' if descending else '>'
+        placeholders = ', '.join(['%s'] * len(keys))
+        conditions.append(f"({', '.join(expressions)}) {operator} ({placeholders})")
+        params.extend(after)
+
+    direction = ' DESC' if descending else ''
+    query = select
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY " + ", ".join(expression + direction for expression in expressions)
+    query += " LIMIT %s"
+    params.append(limit + 1)
+
+    cursor = db.connection.cursor()
+    cursor.execute(query, tuple(params))
+    rows = cursor.fetchall()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    last = rows[-1] if rows else None
+    next_after = tuple(last[name] for _, name in keys) if last else after
+    return KeysetPage(rows, next_after, has_more)
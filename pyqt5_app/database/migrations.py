@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+"""
+스키마 마이그레이션 (버전 관리)
+
+흩어져 있던 일회성 스크립트(컬럼 추가, ENUM 수정, 면담 테이블 생성)를 번호 순서대로 모았다.
+적용된 버전은 schema_version 테이블에 기록하고, 아직 적용되지 않은 단계만 실행한다.
+각 단계는 information_schema로 현재 상태를 확인해서 필요한 DDL만 만들기 때문에
+예전 스크립트로 이미 반영된 DB에서 실행해도 안전하다.
+
+사용법 (pyqt5_app 폴더에서):
+    python -m database.migrations            # 미적용 단계 실행
+    python -m database.migrations --plan     # 실행할 DDL과 주요 쿼리 EXPLAIN만 출력 (변경 없음)
+    python -m database.migrations --explain  # 실행 전/후 주요 쿼리 EXPLAIN 비교
+    python -m database.migrations --status   # 적용 이력 출력
+
+새 마이그레이션은 MIGRATIONS 끝에 다음 번호로 추가한다. (적용된 단계는 수정하지 않음)
+"""
+
+from collections import namedtuple
+from datetime import date
+import argparse
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.db_manager import DatabaseManager
+from database.connection_pool import current_backend
+from database.change_events import KEY_COLUMNS
+
+
+# version: 순번, description: 설명, statements: cursor → 실행할 SQL 목록,
+# unsupported_errors: 서버가 기능을 지원하지 않을 때의 오류 코드 (이 오류면 단계를 건너뛰고 적용으로 기록)
+Migration = namedtuple('Migration', 'version description statements unsupported_errors', defaults=((),))
+
+# FULLTEXT ngram 파서를 쓸 수 없는 서버 (MariaDB 등)
+# 1128: Function 'ngram' is not defined, 1214: 테이블 엔진이 FULLTEXT 미지원, 1235: 미지원 기능
+FULLTEXT_UNSUPPORTED = (1128, 1214, 1235)
+
+
+# --- 현재 스키마 확인 (SQLite 백엔드는 sqlite_master/pragma_table_info) ---
+
+def _sqlite():
+    return current_backend() == 'sqlite'
+
+
+def _table_exists(cursor, table):
+    if _sqlite():
+        cursor.execute("SELECT COUNT(*) AS cnt FROM sqlite_master WHERE type = 'table' AND name = %s",
+                       (table,))
+        return cursor.fetchone()['cnt'] > 0
+    cursor.execute("""
+        SELECT COUNT(*) AS cnt FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,))
+    return cursor.fetchone()['cnt'] > 0
+
+
+def _column_exists(cursor, table, column):
+    return _column_type(cursor, table, column) is not None
+
+
+def _column_type(cursor, table, column):
+    if _sqlite():
+        cursor.execute("SELECT type AS COLUMN_TYPE FROM pragma_table_info(%s) WHERE name = %s",
+                       (table, column))
+    else:
+        cursor.execute("""
+            SELECT COLUMN_TYPE FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """, (table, column))
+    row = cursor.fetchone()
+    return row['COLUMN_TYPE'] if row else None
+
+
+def _index_exists(cursor, table, index):
+    if _sqlite():
+        cursor.execute("""
+            SELECT COUNT(*) AS cnt FROM sqlite_master
+            WHERE type = 'index' AND tbl_name = %s AND name = %s
+        """, (table, index))
+        return cursor.fetchone()['cnt'] > 0
+    cursor.execute("""
+        SELECT COUNT(*) AS cnt FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+    """, (table, index))
+    return cursor.fetchone()['cnt'] > 0
+
+
+def _add_columns(cursor, table, columns):
+    """없는 컬럼만 ADD COLUMN 문으로 만들기
+
+    Args:
+        columns: [(컬럼명, 정의), ...]
+    """
+    return [f"ALTER TABLE {table} ADD COLUMN {name} {definition}"
+            for name, definition in columns
+            if not _column_exists(cursor, table, name)]
+
+
+def _add_indexes(cursor, table, indexes):
+    """없는 인덱스만 CREATE INDEX 문으로 만들기
+
+    Args:
+        indexes: [(인덱스명, 컬럼 목록 문자열), ...]
+    """
+    return [f"CREATE INDEX {name} ON {table} ({columns})"
+            for name, columns in indexes
+            if not _index_exists(cursor, table, name)]
+
+
+# --- 마이그레이션 단계 ---
+
+def _timetable_indexes(cursor):
+    """시간표 조회/삭제 조건 인덱스
+
+    과정별 시간표 조회·저장·삭제는 (course_code, type, class_date),
+    강사별 일정 조회는 (instructor_code, class_date) 조건을 사용한다.
+    """
+    return _add_indexes(cursor, 'timetables', [
+        ('idx_timetables_course_type_date', 'course_code, type, class_date'),
+        ('idx_timetables_instructor_date', 'instructor_code, class_date'),
+    ])
+
+
+def _subject_schedule_columns(cursor):
+    """교과목 요일/격주 컬럼 (구 migrate_subjects_table.py)"""
+    return _add_columns(cursor, 'subjects', [
+        ('day_of_week', "INT COMMENT '요일: 0=월, 1=화, 2=수, 3=목, 4=금' AFTER hours"),
+        ('is_biweekly', "BOOLEAN DEFAULT FALSE COMMENT '격주 여부' AFTER day_of_week"),
+        ('week_offset', "INT DEFAULT 0 COMMENT '격주인 경우: 0=1주차, 1=2주차' AFTER is_biweekly"),
+    ])
+
+
+def _course_period_columns(cursor):
+    """과정 기간/시수 컬럼 (구 update_courses_table.py)"""
+    return _add_columns(cursor, 'courses', [
+        ('start_date', "DATE COMMENT '시작일'"),
+        ('lecture_end_date', "DATE COMMENT '강의 종료일'"),
+        ('project_end_date', "DATE COMMENT '프로젝트 종료일'"),
+        ('internship_end_date', "DATE COMMENT '인턴십 종료일'"),
+        ('final_end_date', "DATE COMMENT '최종 종료일'"),
+        ('lecture_hours', "INT NOT NULL DEFAULT 260 COMMENT '강의 시간'"),
+        ('project_hours', "INT NOT NULL DEFAULT 220 COMMENT '프로젝트 시간'"),
+        ('internship_hours', "INT NOT NULL DEFAULT 120 COMMENT '인턴십 시간'"),
+        ('total_days', "INT COMMENT '총 일수'"),
+    ])
+
+
+def _student_photo_columns(cursor):
+    """학생 사진 컬럼 (구 add_photo_column.py, add_photo_columns.py)
+
+    photo_path 인덱스는 조회 조건에 쓰이지 않으므로 만들지 않는다.
+    """
+    return _add_columns(cursor, 'students', [
+        ('photo_path', "VARCHAR(500) COMMENT '원본 사진 파일 경로' AFTER campus"),
+        ('thumbnail', "MEDIUMBLOB COMMENT '썸네일 이미지 (150x150)' AFTER photo_path"),
+    ])
+
+
+INSTRUCTOR_TYPES = [
+    '1. 주강사', '2. 보조강사', '3. 멘토', '4. 행정지원', '5. 외부강사', '6. 인턴',
+    '7. 방문강사', '8. 온라인강사', '9. 특별강사', '10. 객원강사', '11. 수석강사', '12. 조교',
+]
+
+
+def _instructor_type_enum(cursor):
+    """강사 구분 ENUM 12가지 타입으로 확장 (구 fix_instructor_type_enum.py)
+
+    예전 값('1', '2', '3')이 남아 있으면 바로 MODIFY할 때 잘리므로
+    두 값 목록을 합친 ENUM으로 바꾸고 → 값 변환 → 새 ENUM으로 좁힌다.
+    """
+    column_type = _column_type(cursor, 'instructor_codes', 'type')
+    if column_type is None or "'12. 조교'" in column_type:
+        return []
+
+    def enum(values):
+        return "ENUM(" + ", ".join(f"'{v}'" for v in values) + ")"
+
+    legacy = ['1', '2', '3']
+    statements = [
+        f"ALTER TABLE instructor_codes MODIFY COLUMN type {enum(legacy + INSTRUCTOR_TYPES)} NOT NULL",
+    ]
+    for value in legacy:
+        new_value = INSTRUCTOR_TYPES[int(value) - 1]
+        statements.append(f"UPDATE instructor_codes SET type = '{new_value}' WHERE type = '{value}'")
+    statements.append(
+        f"ALTER TABLE instructor_codes MODIFY COLUMN type {enum(INSTRUCTOR_TYPES)} "
+        f"NOT NULL DEFAULT '1. 주강사' COMMENT '강사 구분'"
+    )
+    return statements
+
+
+def _consultation_tables(cursor):
+    """면담 관리 테이블 (구 create_consultation_tables.py / .sql)"""
+    statements = []
+    if not _table_exists(cursor, 'consultations'):
+        statements.append("""
+            CREATE TABLE consultations (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                student_id INT NOT NULL,
+                consultation_date DATETIME NOT NULL,
+                location VARCHAR(200),
+                main_topic VARCHAR(500),
+                content TEXT,
+                consultant_name VARCHAR(100),
+                next_consultation_date DATETIME,
+                consultation_type ENUM('정기', '수시', '긴급', '학부모') DEFAULT '정기',
+                status ENUM('예정', '완료', '취소') DEFAULT '예정',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
+                INDEX idx_student_id (student_id),
+                INDEX idx_consultation_date (consultation_date),
+                INDEX idx_next_consultation_date (next_consultation_date)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+    if not _table_exists(cursor, 'consultation_photos'):
+        statements.append("""
+            CREATE TABLE consultation_photos (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                consultation_id INT NOT NULL,
+                photo_path VARCHAR(500) NOT NULL,
+                photo_description VARCHAR(500),
+                uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (consultation_id) REFERENCES consultations(id) ON DELETE CASCADE,
+                INDEX idx_consultation_id (consultation_id)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+    return statements
+
+
+def _code_sequences_table(cursor):
+    """코드 자동 생성용 번호 테이블 (번호는 첫 예약 때 기존 코드의 최대값으로 초기화)"""
+    if _table_exists(cursor, 'code_sequences'):
+        return []
+    return ["""
+        CREATE TABLE code_sequences (
+            table_name VARCHAR(64) NOT NULL,
+            prefix VARCHAR(10) NOT NULL,
+            next_value INT UNSIGNED NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (table_name, prefix)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """]
+
+
+def _consultation_fulltext(cursor):
+    """면담 검색용 FULLTEXT 인덱스 (한국어는 공백 단위 분리가 안 되므로 ngram 파서)"""
+    if _index_exists(cursor, 'consultations', 'ft_consultations_text'):
+        return []
+    return ["""
+        ALTER TABLE consultations
+        ADD FULLTEXT INDEX ft_consultations_text (main_topic, content, consultant_name) WITH PARSER ngram
+    """]
+
+
+def _timetable_list_index(cursor):
+    """시간표 목록 키셋 페이지 정렬 (class_date, start_time, id) 인덱스
+
+    InnoDB 보조 인덱스 끝에는 기본 키(id)가 붙으므로 두 컬럼만 지정한다.
+    """
+    return _add_indexes(cursor, 'timetables', [
+        ('idx_timetables_date_time', 'class_date, start_time'),
+    ])
+
+
+def _updated_at_indexes(cursor):
+    """원격 변경 확인(ChangeBus 폴링)용 updated_at 인덱스
+
+    MAX(updated_at)은 인덱스 끝 값 하나만 읽고, 바뀐 행 조회(updated_at >= 마지막 값)는
+    범위 검색이 된다. 변경 알림 대상(KEY_COLUMNS) 중 updated_at이 있는 테이블에 만든다.
+    """
+    statements = []
+    for table in KEY_COLUMNS:
+        if _table_exists(cursor, table) and _column_exists(cursor, table, 'updated_at'):
+            statements.extend(_add_indexes(cursor, table, [(f'idx_{table}_updated_at', 'updated_at')]))
+    return statements
+
+
+MIGRATIONS = [
+    Migration(1, "시간표 조회 인덱스", _timetable_indexes),
+    Migration(2, "교과목 요일/격주 컬럼", _subject_schedule_columns),
+    Migration(3, "과정 기간/시수 컬럼", _course_period_columns),
+    Migration(4, "학생 사진 컬럼", _student_photo_columns),
+    Migration(5, "강사 구분 ENUM 확장", _instructor_type_enum),
+    Migration(6, "면담 관리 테이블", _consultation_tables),
+    Migration(7, "코드 시퀀스 테이블", _code_sequences_table),
+    # 인덱스가 없으면 면담 검색은 LIKE로 동작하므로 지원하지 않는 서버에서는 건너뜀
+    Migration(8, "면담 검색 FULLTEXT 인덱스", _consultation_fulltext, FULLTEXT_UNSUPPORTED),
+    Migration(9, "시간표 목록 정렬 인덱스", _timetable_list_index),
+    Migration(10, "변경 확인 updated_at 인덱스", _updated_at_indexes),
+]
+
+
+# --- 실행 ---
+
+def _ensure_version_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            description VARCHAR(200) NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+
+
+def applied_versions(db):
+    """적용된 버전 목록 (schema_version이 없으면 빈 목록)"""
+    cursor = db.connection.cursor()
+    if not _table_exists(cursor, 'schema_version'):
+        return []
+    cursor.execute("SELECT version FROM schema_version ORDER BY version")
+    return [row['version'] for row in cursor.fetchall()]
+
+
+def pending_migrations(db):
+    """아직 적용되지 않은 마이그레이션 (버전 순)"""
+    applied = set(applied_versions(db))
+    return [m for m in MIGRATIONS if m.version not in applied]
+
+
+def run_migrations(db, dry_run=False, log=print):
+    """미적용 마이그레이션 실행
+
+    MySQL DDL은 자동 커밋되므로 단계 단위로 실행하고 끝날 때마다 버전을 기록한다.
+    (SQLite 백엔드에서는 MySQL DDL을 database.sqlite_backend가 변환해서 실행)
+    중간에 실패하면 그 단계는 기록되지 않고, 다시 실행하면 남은 DDL만 만들어진다.
+    단, 서버가 지원하지 않는 기능(unsupported_errors)이면 그 단계만 건너뛰고 적용으로 기록한 뒤
+    다음 단계를 계속 실행한다.
+
+    Args:
+        db: 연결된 DatabaseManager
+        dry_run: True면 실행할 SQL만 출력
+        log: 진행 메시지 출력 함수
+
+    Returns:
+        list: 적용한(dry_run이면 적용할) 버전 목록
+    """
+    cursor = db.connection.cursor()
+    if not dry_run:
+        _ensure_version_table(cursor)
+
+    done = []
+    for migration in pending_migrations(db):
+        statements = migration.statements(cursor)
+        log(f"[{migration.version}] {migration.description} ({len(statements)}개 문)")
+        for sql in statements:
+            log("    " + " ".join(sql.split()))
+            if dry_run:
+                continue
+            try:
+                cursor.execute(sql)
+            except Exception as e:
+                code = e.args[0] if getattr(e, 'args', None) else None
+                if code not in migration.unsupported_errors:
+                    raise
+                log(f"    ⚠️ 서버가 지원하지 않아 건너뜀: {e}")
+                break
+
+        if not dry_run:
+            cursor.execute(
+                "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                (migration.version, migration.description)
+            )
+            db.connection.commit()
+        done.append(migration.version)
+
+    if not done:
+        log("적용할 마이그레이션이 없습니다.")
+    return done
+
+
+# --- 주요 쿼리 실행 계획 ---
+
+def hot_queries(db):
+    """인덱스 효과를 확인할 주요 시간표 쿼리 [(이름, 쿼리, 파라미터), ...]"""
+    course = db.fetch_one("SELECT code FROM courses ORDER BY code LIMIT 1") or {}
+    instructor = db.fetch_one("SELECT code FROM instructors ORDER BY code LIMIT 1") or {}
+    course_code = course.get('code', 'C-001')
+    instructor_code = instructor.get('code', 'T-001')
+    today = date.today()
+
+    return [
+        ("과정 강의 시간표 조회",
+         "SELECT id, class_date, start_time FROM timetables "
+         "WHERE course_code = %s AND type = 'lecture' ORDER BY class_date, start_time",
+         (course_code,)),
+        ("과정 시간표 기간 조회",
+         "SELECT * FROM timetables WHERE course_code = %s AND class_date BETWEEN %s AND %s",
+         (course_code, today.replace(month=1, day=1), today.replace(month=12, day=31))),
+        ("강사 일정 조회",
+         "SELECT * FROM timetables WHERE instructor_code = %s AND class_date >= %s ORDER BY class_date",
+         (instructor_code, today)),
+        ("과정 강의 시간표 삭제 대상",
+         "SELECT COUNT(*) FROM timetables WHERE course_code = %s AND type = 'lecture'",
+         (course_code,)),
+        ("원격 변경 확인",
+         "SELECT MAX(updated_at) FROM timetables",
+         ()),
+    ]
+
+
+def explain_hot_queries(db, log=print):
+    """주요 쿼리 EXPLAIN 출력 (사용 인덱스, 검사 행 수)"""
+    cursor = db.connection.cursor()
+    for name, query, params in hot_queries(db):
+        if _sqlite():
+            cursor.execute("EXPLAIN QUERY PLAN " + query, params)
+            for row in cursor.fetchall():
+                log(f"  {name:<20} {row['detail']}")
+            continue
+        cursor.execute("EXPLAIN " + query, params)
+        for row in cursor.fetchall():
+            log(f"  {name:<20} type={row.get('type')}, key={row.get('key') or '-'}, "
+                f"rows={row.get('rows')}, extra={row.get('Extra') or '-'}")
+
+
+def print_status(db):
+    """적용 이력 출력"""
+    applied = set(applied_versions(db))
+    for migration in MIGRATIONS:
+        mark = "✅" if migration.version in applied else "⏳"
+        print(f"{mark} [{migration.version}] {migration.description}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스키마 마이그레이션")
+    parser.add_argument('--plan', action='store_true', help="실행할 DDL과 주요 쿼리 EXPLAIN만 출력")
+    parser.add_argument('--explain', action='store_true', help="실행 전/후 주요 쿼리 EXPLAIN 비교")
+    parser.add_argument('--status', action='store_true', help="적용 이력 출력")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager()
+    if not db.connect():
+        print("❌ 데이터베이스 연결 실패")
+        return 1
+
+    try:
+        if args.status:
+            print_status(db)
+            return 0
+
+        if args.plan:
+            print("=== 실행 예정 (dry-run) ===")
+            run_migrations(db, dry_run=True)
+            print("\n=== 현재 실행 계획 ===")
+            explain_hot_queries(db)
+            return 0
+
+        if args.explain:
+            print("=== 실행 전 계획 ===")
+            explain_hot_queries(db)
+            print()
+
+        print("=== 마이그레이션 ===")
+        run_migrations(db)
+
+        if args.explain:
+            print("\n=== 실행 후 계획 ===")
+            explain_hot_queries(db)
+        return 0
+    except Exception as e:
+        print(f"❌ 마이그레이션 실패: {str(e)}")
+        return 1
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+기준 데이터 캐시 (과정/교과목/강사/강사코드/공휴일)
+
+여러 탭이 같은 작은 테이블을 열 때마다 다시 조회하지 않도록 프로세스 안에서 공유한다.
+- TTL 안에서는 DB에 묻지 않고 캐시를 그대로 반환
+- TTL이 지나면 (MAX(updated_at), COUNT(*)) 버전 값만 조회해서 바뀐 경우에만 다시 로드
+  (다른 PC에서 수정한 내용도 TTL 뒤에는 반영됨)
+- 이 프로세스의 DatabaseManager 쓰기(INSERT/UPDATE/DELETE)는 즉시 무효화
+
+반환되는 행 목록은 여러 화면이 공유하므로 수정하지 말고 읽기만 할 것.
+
+사용 예:
+    courses = get_reference_cache().rows('courses', self.db)
+"""
+
+from collections import namedtuple
+import threading
+import time
+
+
+# 캐시 대상 테이블 → 전체 조회 쿼리
+REFERENCE_QUERIES = {
+    'courses': "SELECT * FROM courses ORDER BY code",
+    'subjects': "SELECT * FROM subjects ORDER BY code",
+    'instructors': "SELECT * FROM instructors ORDER BY code",
+    'instructor_codes': "SELECT * FROM instructor_codes ORDER BY code",
+    'holidays': "SELECT * FROM holidays ORDER BY holiday_date",
+}
+
+_Entry = namedtuple('_Entry', 'rows version checked_at')
+
+
+class ReferenceCache:
+    """기준 데이터 테이블 캐시
+
+    Args:
+        ttl: 버전 확인 없이 캐시를 쓰는 시간 (초)
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._entries = {}
+        self._generations = {}  # 테이블별 무효화 횟수 (조회 중 무효화 감지용)
+        self._lock = threading.Lock()
+
+    def rows(self, table, db=None):
+        """테이블 전체 행 목록 (공유 목록이므로 읽기 전용)
+
+        Args:
+            table: REFERENCE_QUERIES의 테이블 이름
+            db: 조회에 사용할 DatabaseManager (없으면 새로 생성)
+        """
+        query = REFERENCE_QUERIES[table]
+        entry = self._entries.get(table)
+        generation = self._generations.get(table, 0)
+        now = time.monotonic()
+        if entry is not None and now - entry.checked_at < self.ttl:
+            return entry.rows
+
+        db = self._connected(db)
+        if db is None:
+            # 연결 실패 시 오래된 캐시라도 반환
+            return entry.rows if entry is not None else []
+
+        version = self._version(db, table)
+        if entry is not None and version is not None and version == entry.version:
+            with self._lock:
+                if self._generations.get(table, 0) == generation:
+                    self._entries[table] = entry._replace(checked_at=now)
+            return entry.rows
+
+        rows = db.fetch_all(query) or []
+        with self._lock:
+            # 조회 중에 무효화됐으면 저장하지 않음 (다음 호출에서 다시 로드)
+            if self._generations.get(table, 0) == generation:
+                self._entries[table] = _Entry(rows, version, now)
+        return rows
+
+    def invalidate(self, table=None):
+        """캐시 무효화 (table이 None이면 전체, 캐시 대상이 아닌 테이블은 무시)"""
+        if table is not None and table not in REFERENCE_QUERIES:
+            return
+        with self._lock:
+            tables = list(REFERENCE_QUERIES) if table is None else [table]
+            for name in tables:
+                self._entries.pop(name, None)
+                self._generations[name] = self._generations.get(name, 0) + 1
+
+    @staticmethod
+    def _connected(db):
+        if db is None:
+            from database.db_manager import DatabaseManager
+            db = DatabaseManager()
+        return db if db.connect() else None
+
+    @staticmethod
+    def _version(db, table):
+        """테이블 버전 값 (MAX(updated_at), 행 수) - 삭제는 행 수로 감지"""
+        row = db.fetch_one(f"SELECT MAX(updated_at) AS stamp, COUNT(*) AS cnt FROM {table}")
+        if not row:
+            return None
+        return (row['stamp'], row['cnt'])
+
+
+_cache = ReferenceCache()
+
+
+def get_reference_cache():
+    """공용 기준 데이터 캐시"""
+    return _cache
+
+
+def invalidate_reference(table=None):
+    """기준 데이터 캐시 무효화 (table이 None이면 전체)"""
+    _cache.invalidate(table)
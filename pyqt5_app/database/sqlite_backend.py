@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 백엔드 (네트워크 없이 로컬 파일 DB로 실행)
+
+DatabaseManager와 마이그레이션이 쓰는 pymysql 커넥션/커서 인터페이스를
+sqlite3 위에 그대로 제공하고, 앱이 보내는 MySQL 문법을 SQLite 문법으로 바꿔서 실행한다.
+오프라인 PC나 CI에서 데이터 경로를 테스트/성능 측정할 때 쓴다.
+
+- 파라미터: %s → ?, %% → %
+- 함수: CURDATE(), NOW(), YEAR(), MONTH(), LEFT(), SUBSTRING(), IF(), GREATEST(), LEAST(),
+  CONCAT(), CAST(... AS UNSIGNED), REGEXP
+- INSERT IGNORE → INSERT OR IGNORE, ON DUPLICATE KEY UPDATE → ON CONFLICT DO UPDATE
+- SET col = LAST_INSERT_ID(식) → RETURNING으로 받은 값을 cursor.lastrowid로 돌려줌
+- SELECT ... FOR UPDATE → FOR UPDATE 제거 (SQLite는 쓰기 시 DB 전체 잠금)
+- SAVEPOINT: 트랜잭션 밖이면 먼저 BEGIN (MySQL처럼 RELEASE가 커밋하지 않고 바깥 트랜잭션에 남음)
+- CREATE TABLE: AUTO_INCREMENT, ENUM(→ TEXT), COMMENT, 테이블 옵션 정리,
+  INDEX/KEY 정의는 CREATE INDEX로, ON UPDATE CURRENT_TIMESTAMP는 트리거로 변환
+- ALTER TABLE: ADD COLUMN의 COMMENT/AFTER 제거, MODIFY COLUMN과 FULLTEXT 인덱스는 생략
+  (SQLite는 컬럼 타입을 강제하지 않음)
+- MATCH ... AGAINST: MySQL의 "FULLTEXT 인덱스 없음"(1191) 오류를 내서 LIKE 검색으로 전환시킴
+- 없는 테이블: MySQL과 같은 1146 오류 (테이블이 없는 DB를 처리하는 경로도 같은 코드로 동작)
+
+조회 결과는 DictCursor처럼 dict 행이고, DATE/DATETIME/TIMESTAMP/TIME 컬럼은
+pymysql과 같은 date/datetime/timedelta 값으로 돌려준다.
+
+사용법 (pyqt5_app 폴더에서):
+    KDT_DB_BACKEND=sqlite KDT_SQLITE_PATH=local.db python main_kdt_full.py
+    python -m database.sqlite_backend local.db     # 테이블 생성 + 마이그레이션
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+import argparse
+import re
+import sqlite3
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FulltextUnavailable(sqlite3.OperationalError):
+    """FULLTEXT 검색 요청 (MySQL 1191 오류와 같은 args로 LIKE 검색 전환을 유도)"""
+
+
+class TableMissing(sqlite3.OperationalError):
+    """없는 테이블 (MySQL 1146 오류와 같은 args)"""
+
+
+def _run(method, statement, params):
+    try:
+        return method(statement, params)
+    except sqlite3.OperationalError as e:
+        if str(e).startswith('no such table'):
+            raise TableMissing(1146, str(e)) from e
+        raise
+
+
+# --- 값 변환 (pymysql과 같은 파이썬 타입) ---
+
+def _adapt_timedelta(value):
+    seconds = int(value.total_seconds())
+    return f"{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}"
+
+
+def _convert_date(raw):
+    text = raw.decode()
+    try:
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        return text
+
+
+def _convert_datetime(raw):
+    text = raw.decode()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return text
+
+
+def _convert_time(raw):
+    text = raw.decode()
+    try:
+        parts = [int(float(part)) for part in text.split(':')]
+    except ValueError:
+        return text
+    parts += [0] * (3 - len(parts))
+    return timedelta(hours=parts[0], minutes=parts[1], seconds=parts[2])
+
+
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.strftime('%Y-%m-%d %H:%M:%S'))
+sqlite3.register_adapter(time, lambda value: value.strftime('%H:%M:%S'))
+sqlite3.register_adapter(timedelta, _adapt_timedelta)
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_converter('DATE', _convert_date)
+sqlite3.register_converter('DATETIME', _convert_datetime)
+sqlite3.register_converter('TIMESTAMP', _convert_datetime)
+sqlite3.register_converter('TIME', _convert_time)
+
+
+def _regexp(pattern, value):
+    return value is not None and re.search(pattern, str(value)) is not None
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+# --- SQL 변환 ---
+
+NOW_SQL = "datetime('now', 'localtime')"
+TODAY_SQL = "date('now', 'localtime')"
+
+
+def _scan(sql):
+    """(위치, 문자, 따옴표 밖 여부) 순회"""
+    quote = None
+    i = 0
+    while i < len(sql):
+        ch = sql[i]
+        if quote:
+            if ch == '\\':
+                yield i, ch, False
+                i += 1
+                if i < len(sql):
+                    yield i, sql[i], False
+            elif ch == quote:
+                if i + 1 < len(sql) and sql[i + 1] == quote:
+                    yield i, ch, False
+                    i += 1
+                    yield i, sql[i], False
+                else:
+                    quote = None
+                    yield i, ch, False
+            else:
+                yield i, ch, False
+        elif ch in ("'", '"', '`'):
+            quote = ch
+            yield i, ch, False
+        else:
+            yield i, ch, True
+        i += 1
+
+
+def _outside_quotes(sql, replace):
+    """따옴표 밖 부분에만 replace(문자열) 적용"""
+    parts, start, outside = [], 0, True
+    for i, ch, free in _scan(sql):
+        if free != outside:
+            parts.append(replace(sql[start:i]) if outside else sql[start:i])
+            start, outside = i, free
+    parts.append(replace(sql[start:]) if outside else sql[start:])
+    return ''.join(parts)
+
+
+def _split_top_level(text, separator=','):
+    """괄호/따옴표 밖의 separator로 나누기"""
+    parts, depth, start = [], 0, 0
+    for i, ch, free in _scan(text):
+        if not free:
+            continue
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _closing_paren(sql, open_index):
+    depth = 0
+    for i, ch, free in _scan(sql[open_index:]):
+        if not free:
+            continue
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth == 0:
+                return open_index + i
+    raise sqlite3.OperationalError(f"괄호가 닫히지 않은 SQL: {sql}")
+
+
+def _rewrite_calls(sql, name, build):
+    """NAME(인자, ...) 호출을 build(인자 목록) 결과로 바꾸기 (따옴표 안은 제외)"""
+    pattern = re.compile(r'\b' + name + r'\s*\(', re.IGNORECASE)
+    position = 0
+    while True:
+        match = pattern.search(sql, position)
+        if not match:
+            return sql
+        if not _is_outside_quotes(sql, match.start()):
+            position = match.end()
+            continue
+        open_index = match.end() - 1
+        close_index = _closing_paren(sql, open_index)
+        args = [arg.strip() for arg in _split_top_level(sql[open_index + 1:close_index])]
+        replacement = build(args)
+        sql = sql[:match.start()] + replacement + sql[close_index + 1:]
+        position = match.start() + len(replacement)
+
+
+def _is_outside_quotes(sql, index):
+    for i, _, free in _scan(sql[:index + 1]):
+        if i == index:
+            return free
+    return True
+
+
+_CALL_REWRITES = [
+    ('YEAR', lambda a: f"CAST(strftime('%Y', {a[0]}) AS INTEGER)"),
+    ('MONTH', lambda a: f"CAST(strftime('%m', {a[0]}) AS INTEGER)"),
+    ('LEFT', lambda a: f"substr({a[0]}, 1, {a[1]})"),
+    ('SUBSTRING', lambda a: f"substr({', '.join(a)})"),
+    ('IF', lambda a: f"iif({', '.join(a)})"),
+    ('GREATEST', lambda a: f"max({', '.join(a)})"),
+    ('LEAST', lambda a: f"min({', '.join(a)})"),
+    ('CONCAT', lambda a: "(" + " || ".join(a) + ")"),
+]
+
+_SIMPLE_REWRITES = [
+    (re.compile(r'\bCURDATE\s*\(\s*\)', re.IGNORECASE), TODAY_SQL),
+    (re.compile(r'\bNOW\s*\(\s*\)', re.IGNORECASE), NOW_SQL),
+    (re.compile(r'\bINSERT\s+IGNORE\b', re.IGNORECASE), 'INSERT OR IGNORE'),
+    (re.compile(r'\bAS\s+(UNSIGNED|SIGNED)(\s+INTEGER)?\b', re.IGNORECASE), 'AS INTEGER'),
+    (re.compile(r'\s+FOR\s+UPDATE\b', re.IGNORECASE), ''),
+]
+
+_LAST_INSERT_ID = re.compile(r'\bSET\s+(\w+)\s*=\s*LAST_INSERT_ID\s*\(', re.IGNORECASE)
+_DUPLICATE_KEY = re.compile(r'\bON\s+DUPLICATE\s+KEY\s+UPDATE\b', re.IGNORECASE)
+_VALUES_CALL = re.compile(r'\bVALUES\s*\(\s*(\w+)\s*\)', re.IGNORECASE)
+
+
+def _translate_dml(sql):
+    """SELECT/INSERT/UPDATE/DELETE 변환 → (SQL, RETURNING 컬럼 또는 None)"""
+    if re.search(r'\bAGAINST\s*\(', sql, re.IGNORECASE):
+        raise FulltextUnavailable(1191, "SQLite 백엔드는 FULLTEXT 검색을 지원하지 않습니다.")
+
+    def simple(text):
+        for pattern, replacement in _SIMPLE_REWRITES:
+            text = pattern.sub(replacement, text)
+        return text
+
+    sql = _outside_quotes(sql, simple)
+    for name, build in _CALL_REWRITES:
+        sql = _rewrite_calls(sql, name, build)
+
+    returning = None
+    match = _LAST_INSERT_ID.search(sql)
+    if match:
+        # SET col = LAST_INSERT_ID(식) → SET col = 식 ... RETURNING col
+        returning = match.group(1)
+        open_index = match.end() - 1
+        close_index = _closing_paren(sql, open_index)
+        sql = (sql[:match.start()] + f"SET {returning} = " + sql[open_index + 1:close_index]
+               + sql[close_index + 1:]).rstrip().rstrip(';') + f" RETURNING {returning}"
+
+    match = _DUPLICATE_KEY.search(sql)
+    if match:
+        head, assignments = sql[:match.start()], sql[match.end():]
+        assignments = _VALUES_CALL.sub(r'excluded.\1', assignments)
+        sql = head + "ON CONFLICT DO UPDATE SET" + assignments
+    return sql, returning
+
+
+# CREATE TABLE 안의 인덱스 정의
+_INDEX_DEFINITION = re.compile(r'^(?:(UNIQUE|FULLTEXT)\s+)?(?:INDEX|KEY)\s+(\w+)\s*\((.*)\)$',
+                               re.IGNORECASE | re.DOTALL)
+_COMMENT = re.compile(r"\s+COMMENT\s+'(?:[^'\\]|\\.|'')*'", re.IGNORECASE)
+_ENUM = re.compile(r'\bENUM\s*\((?:[^()\']|\'(?:[^\'\\]|\\.|\'\')*\')*\)', re.IGNORECASE)
+_ON_UPDATE_NOW = re.compile(r'\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP(\(\))?', re.IGNORECASE)
+_DEFAULT_NOW = re.compile(r'\bDEFAULT\s+CURRENT_TIMESTAMP(\(\))?', re.IGNORECASE)
+_POSITION = re.compile(r'\s+(AFTER\s+\w+|FIRST)\s*$', re.IGNORECASE)
+
+
+def _column_definition(definition):
+    """컬럼 정의 변환 → (정의, ON UPDATE CURRENT_TIMESTAMP 여부)"""
+    definition = _COMMENT.sub('', definition)
+    definition = _ENUM.sub('TEXT', definition)
+    definition = re.sub(r'\s+UNSIGNED\b', '', definition, flags=re.IGNORECASE)
+    on_update = bool(_ON_UPDATE_NOW.search(definition))
+    definition = _ON_UPDATE_NOW.sub('', definition)
+    definition = _DEFAULT_NOW.sub(f"DEFAULT ({NOW_SQL})", definition)
+    if re.search(r'\bAUTO_INCREMENT\b', definition, re.IGNORECASE):
+        name = definition.split()[0]
+        definition = f"{name} INTEGER PRIMARY KEY AUTOINCREMENT"
+    return definition.strip(), on_update
+
+
+def _touch_trigger(table, column):
+    return (f"CREATE TRIGGER IF NOT EXISTS trg_{table}_{column}_touch AFTER UPDATE ON {table} "
+            f"FOR EACH ROW BEGIN UPDATE {table} SET {column} = {NOW_SQL} WHERE rowid = NEW.rowid; END")
+
+
+def _translate_create_table(sql):
+    match = re.match(r'\s*CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\(', sql, re.IGNORECASE)
+    table = match.group(2)
+    open_index = match.end() - 1
+    close_index = _closing_paren(sql, open_index)
+
+    definitions, extra = [], []
+    for part in _split_top_level(sql[open_index + 1:close_index]):
+        part = part.strip()
+        if not part:
+            continue
+        index = _INDEX_DEFINITION.match(part)
+        if index:
+            kind, name, columns = index.groups()
+            if kind and kind.upper() == 'FULLTEXT':
+                continue
+            if kind and kind.upper() == 'UNIQUE':
+                definitions.append(f"CONSTRAINT {name} UNIQUE ({columns})")
+            else:
+                extra.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+            continue
+        if re.match(r'(PRIMARY|FOREIGN|CONSTRAINT|UNIQUE|CHECK)\b', part, re.IGNORECASE):
+            definitions.append(part)
+            continue
+        definition, on_update = _column_definition(part)
+        definitions.append(definition)
+        if on_update:
+            extra.append(_touch_trigger(table, definition.split()[0]))
+
+    head = f"CREATE TABLE {match.group(1) or ''}{table}"
+    return f"{head} (\n    " + ",\n    ".join(definitions) + "\n)", extra
+
+
+def _translate_alter_table(sql):
+    match = re.match(r'\s*ALTER\s+TABLE\s+(\w+)\s+(.*)$', sql, re.IGNORECASE | re.DOTALL)
+    table, action = match.group(1), match.group(2).strip()
+    if re.match(r'(MODIFY|CHANGE)\b', action, re.IGNORECASE):
+        return None, []
+    if re.match(r'ADD\s+FULLTEXT\b', action, re.IGNORECASE):
+        return None, []
+    column = re.match(r'ADD\s+(?:COLUMN\s+)?(.*)$', action, re.IGNORECASE | re.DOTALL)
+    if column and not re.match(r'(INDEX|KEY|UNIQUE|PRIMARY|FOREIGN|CONSTRAINT)\b', column.group(1), re.IGNORECASE):
+        definition, on_update = _column_definition(_POSITION.sub('', column.group(1).strip()))
+        extra = [_touch_trigger(table, definition.split()[0])] if on_update else []
+        return f"ALTER TABLE {table} ADD COLUMN {definition}", extra
+    index = re.match(r'ADD\s+(UNIQUE\s+)?(?:INDEX|KEY)\s+(\w+)\s*\((.*)\)$', action, re.IGNORECASE | re.DOTALL)
+    if index:
+        unique = 'UNIQUE ' if index.group(1) else ''
+        return f"CREATE {unique}INDEX IF NOT EXISTS {index.group(2)} ON {table} ({index.group(3)})", []
+    return sql, []
+
+
+@lru_cache(maxsize=1024)
+def translate(query, has_params=True):
+    """MySQL 문 → (SQLite 문 또는 None(생략), 이어서 실행할 문 목록, RETURNING 컬럼)"""
+    sql = query.strip().rstrip(';')
+    if has_params:
+        sql = _outside_quotes(sql, lambda text: text.replace('%s', '?').replace('%%', '%'))
+    sql = re.sub(r'\)\s*ENGINE\s*=.*$', ')', sql, flags=re.IGNORECASE | re.DOTALL)
+
+    keyword = sql.split(None, 1)[0].upper() if sql else ''
+    if keyword == 'CREATE' and re.match(r'CREATE\s+TABLE\b', sql, re.IGNORECASE):
+        statement, extra = _translate_create_table(sql)
+        return statement, tuple(extra), None
+    if keyword == 'ALTER':
+        statement, extra = _translate_alter_table(sql)
+        return statement, tuple(extra), None
+    statement, returning = _translate_dml(sql)
+    return statement, (), returning
+
+
+def _params(args):
+    if args is None:
+        return ()
+    if isinstance(args, (tuple, list)):
+        return tuple(args)
+    if isinstance(args, dict):
+        raise sqlite3.ProgrammingError("SQLite 백엔드는 %(name)s 형식 파라미터를 지원하지 않습니다.")
+    return (args,)
+
+
+# --- 커넥션 / 커서 (pymysql 인터페이스) ---
+
+class SQLiteCursor:
+    """pymysql DictCursor와 같은 방식으로 쓰는 커서"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._cursor = connection.raw.cursor()
+        self._returned = None
+        self.lastrowid = None
+        self.rowcount = -1
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, query, args=None):
+        statement, extra, returning = translate(query, args is not None)
+        self._returned = None
+        if statement is None:
+            self.rowcount = 0
+            return 0
+
+        if statement.lstrip()[:9].upper() == 'SAVEPOINT' and not self.connection.raw.in_transaction:
+            self.connection.raw.execute("BEGIN")
+        _run(self._cursor.execute, statement, _params(args))
+        for sql in extra:
+            self.connection.raw.execute(sql)
+
+        if returning:
+            rows = self._cursor.fetchall()
+            self.rowcount = len(rows)
+            self.lastrowid = rows[-1][returning] if rows else 0
+            self._returned = []
+        else:
+            self.rowcount = self._cursor.rowcount
+            self.lastrowid = self._cursor.lastrowid
+        return self.rowcount
+
+    def executemany(self, query, args):
+        statement, _, _ = translate(query, True)
+        if statement is None:
+            return 0
+        self._returned = None
+        _run(self._cursor.executemany, statement, [_params(row) for row in args])
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+        return self.rowcount
+
+    def fetchone(self):
+        if self._returned is not None:
+            return None
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size=None):
+        if self._returned is not None:
+            return []
+        return self._cursor.fetchmany(size or self._cursor.arraysize)
+
+    def fetchall(self):
+        if self._returned is not None:
+            return []
+        return self._cursor.fetchall()
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """pymysql 커넥션과 같은 방식으로 쓰는 SQLite 커넥션 (커넥션 풀에서 사용)"""
+
+    def __init__(self, path, timeout=10):
+        self.path = path
+        self.raw = sqlite3.connect(path, timeout=timeout, detect_types=sqlite3.PARSE_DECLTYPES,
+                                   check_same_thread=False)
+        self.raw.row_factory = _dict_row
+        self.raw.create_function('REGEXP', 2, _regexp, deterministic=True)
+        self.raw.execute("PRAGMA foreign_keys = ON")
+        if path != ':memory:':
+            # 읽기와 쓰기가 서로 막지 않도록 (작업 스레드 조회 중에도 저장 가능)
+            self.raw.execute("PRAGMA journal_mode = WAL")
+
+    def cursor(self, cursorclass=None):
+        """커서 생성 (cursorclass는 pymysql 호환용, 무시)"""
+        return SQLiteCursor(self)
+
+    def commit(self):
+        self.raw.commit()
+
+    def rollback(self):
+        self.raw.rollback()
+
+    def ping(self, reconnect=True):
+        self.raw.execute("SELECT 1")
+
+    def close(self):
+        self.raw.close()
+
+
+def connect(path, timeout=10):
+    """SQLite 파일 DB 연결 (파일이 없으면 생성)"""
+    directory = os.path.dirname(os.path.abspath(path)) if path != ':memory:' else None
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return SQLiteConnection(path, timeout)
+
+
+def init_database(db, log=print):
+    """기본 테이블 생성 + 마이그레이션 적용 (이미 있으면 남은 단계만)"""
+    from database.migrations import run_migrations
+
+    if not db.create_tables():
+        return False
+    run_migrations(db, log=log)
+    return True
+
+
+def main(argv=None):
+    """명령줄 실행: 로컬 SQLite DB 생성"""
+    parser = argparse.ArgumentParser(description="로컬 SQLite DB 생성 (테이블 + 마이그레이션)")
+    parser.add_argument('path', help="DB 파일 경로")
+    args = parser.parse_args(argv)
+
+    from database.connection_pool import configure_backend
+    from database.db_manager import DatabaseManager
+
+    configure_backend('sqlite', args.path)
+    db = DatabaseManager()
+    if not db.connect():
+        print("❌ 데이터베이스 연결 실패")
+        return 1
+    try:
+        return 0 if init_database(db) else 1
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,17 +4,9 @@
 시간표 생성 알고리즘 테스트
 """
 
-import os
-os.environ['QT_QPA_PLATFORM'] = 'offscreen'
-
-from PyQt5.QtWidgets import QApplication
-import sys
-from ui.timetable_create_dialog import TimetableCreateDialog
+from utils.schedule_engine import schedule
 from datetime import date, timedelta
 
-# QApplication 생성
-app = QApplication(sys.argv)
-
 # 테스트 과목 데이터 (총 156시간)
 subjects = [
     {'code': 'S001', 'name': '파이썬 기초', 'hours': 24, 
@@ -27,11 +19,7 @@ subjects = [
      'main_instructor_name': '임강사', 'assistant_instructor_name': '오조교', 'reserve_instructor_name': '전예비'},
 ]
 
-# 테스트 실행
-dialog = TimetableCreateDialog()
-dialog.subjects = subjects
-dialog.holidays = set()
-
+# 테스트 실행 (GUI 없이 엔진 직접 호출)
 start_date = date(2025, 1, 6)  # 월요일
 end_date = start_date + timedelta(days=100)
 
@@ -40,7 +28,8 @@ print("시간표 생성 알고리즘 테스트")
 print("=" * 70)
 print()
 
-timetable = dialog.create_timetable(start_date, end_date)
+result = schedule(subjects, set(), start_date, end_date, trace=print)
+timetable = result.to_timetable(subjects)
 
 print(f'\n총 {len(timetable)}일 생성됨')
 print()
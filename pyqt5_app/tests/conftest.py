@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공통 픽스처 (로컬 SQLite 백엔드)
+
+db: 빈 임시 파일 DB에 create_tables만 실행한 DatabaseManager.
+끝나면 연결을 닫고 config_db의 백엔드로 되돌린다.
+시드 행이 필요한 테스트 파일은 같은 이름(db)의 픽스처로 덮어써서 추가한다.
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config_db import DB_BACKEND
+from database.connection_pool import configure_backend
+from database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    configure_backend('sqlite', str(tmp_path / 'kdt.db'))
+    manager = DatabaseManager()
+    assert manager.connect()
+    assert manager.create_tables()
+    yield manager
+    manager.disconnect()
+    configure_backend(DB_BACKEND)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+코드 자동 생성 테스트 (로컬 SQLite 백엔드)
+
+실행 (pyqt5_app 폴더에서):
+    python -m pytest tests
+"""
+
+import pytest
+
+
+@pytest.fixture
+def db(db):
+    """마이그레이션 없이 create_tables만 실행한 DB (기존 배포와 같은 상태)"""
+    db.execute_many("INSERT INTO instructors (code, name) VALUES (%s, %s)",
+                    [('T-001', '김강사'), ('T-007', '이강사')])
+    return db
+
+
+def test_create_tables_creates_code_sequences(db):
+    assert db.get_next_code('instructors', 'T-') == 'T-008'
+    assert db.reserve_codes('instructors', 'T-', 2) == ['T-009', 'T-010']
+
+
+def test_missing_sequence_table_falls_back_to_max_scan(db):
+    db.execute_query("DROP TABLE code_sequences")
+    assert db.get_next_code('instructors', 'T-') == 'T-008'
+    assert db.reserve_codes('subjects', 'G-', 2) == ['G-001', 'G-002']
+
+    # 시퀀스가 없어도 직접 입력한 코드 반영은 오류 없이 넘어감
+    db.advance_code_sequence('instructors', 'T-', 'T-050')
+
+
+def test_get_next_code_falls_back_on_error(db):
+    assert db.get_next_code('no_such_table', 'X-') == 'X-001'
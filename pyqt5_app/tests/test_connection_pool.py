@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+커넥션 풀 테스트 (DB 없이 가짜 커넥션으로)
+
+실행 (pyqt5_app 폴더에서):
+    python -m pytest tests
+"""
+
+import threading
+import time
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def rollback(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_foreign_connection_is_closed_not_pooled():
+    old_pool = ConnectionPool(FakeConnection, max_size=2)
+    new_pool = ConnectionPool(FakeConnection, max_size=2)
+    conn = old_pool.acquire()
+
+    new_pool.release(conn)
+    assert conn.closed
+    stats = new_pool.stats()
+    assert stats['idle'] == 0 and stats['in_use'] == 0
+
+    new_pool.discard(conn)
+    assert new_pool.stats()['in_use'] == 0
+
+    # 새 풀은 자기 커넥션으로 max_size까지 그대로 쓸 수 있음
+    assert new_pool.acquire() is not new_pool.acquire()
+
+
+def test_own_connection_is_reused():
+    pool = ConnectionPool(FakeConnection, max_size=1)
+    conn = pool.acquire()
+    pool.release(conn)
+    assert not conn.closed
+    assert pool.acquire() is conn
+
+
+def test_ui_thread_waits_only_ui_timeout():
+    pool = ConnectionPool(FakeConnection, max_size=1, timeout=10, ui_timeout=0.2)
+    pool.acquire()
+
+    started = time.monotonic()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    assert time.monotonic() - started < 2
+
+
+def test_worker_thread_waits_for_release():
+    pool = ConnectionPool(FakeConnection, max_size=1, timeout=5, ui_timeout=0.1)
+    conn = pool.acquire()
+    result = []
+    worker = threading.Thread(target=lambda: result.append(pool.acquire()))
+    worker.start()
+    time.sleep(0.3)
+    pool.release(conn)
+    worker.join(2)
+    assert result == [conn]
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+면담 검색 테스트 (로컬 SQLite 백엔드 - FULLTEXT가 없어 LIKE 검색으로 전환)
+
+실행 (pyqt5_app 폴더에서):
+    python -m pytest tests
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database import consultation_search
+from database.sqlite_backend import init_database
+
+
+@pytest.fixture
+def db(db, monkeypatch):
+    monkeypatch.setattr(consultation_search, '_fulltext_available', True)
+    assert init_database(db, log=lambda message: None)
+    db.execute_many("INSERT INTO students (code, name, phone) VALUES (%s, %s, %s)",
+                    [('S-001', '홍길동', '010'), ('S-002', '홍길순', '010'), ('S-003', '김철수', '010')])
+    db.execute_many("""
+        INSERT INTO consultations (student_id, consultation_date, main_topic, content, consultant_name)
+        VALUES (%s, %s, %s, %s, %s)
+    """, [(1, '2026-03-02 10:00:00', '진로 상담', '취업 준비', '박상담'),
+          (2, '2026-03-03 10:00:00', '출결', '지각 길동 언급', '박상담'),
+          (3, '2026-03-04 10:00:00', '진로', '대학원 진학', '이상담')])
+    return db
+
+
+def _topics(page):
+    return [row['main_topic'] for row in page.rows]
+
+
+def test_every_word_must_match(db):
+    # 본문: 단어마다 주제/내용/상담사 중 하나에 있으면 일치
+    assert _topics(db.search_consultations('진로 취업')) == ['진로 상담']
+    # 이름: 모든 단어가 이름에 있어야 일치 ('홍 길동' → 홍길동만, 홍길순은 제외)
+    assert _topics(db.search_consultations('홍 길동')) == ['진로 상담']
+
+
+def test_name_match_ranks_first(db):
+    page = db.search_consultations('길동')
+    assert page.total == 2
+    assert _topics(page) == ['진로 상담', '출결']
+    assert not consultation_search._fulltext_available
+
+
+def test_filters_apply_to_both_branches(db):
+    page = db.search_consultations('진로', date_from='2026-03-04')
+    assert _topics(page) == ['진로']
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+마이그레이션 실행 테스트 (로컬 SQLite 백엔드)
+
+실행 (pyqt5_app 폴더에서):
+    python -m pytest tests
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.migrations import MIGRATIONS, applied_versions, run_migrations
+
+
+class _RejectingCursor:
+    """특정 문장에서 MySQL 오류를 내는 커서 (지원하지 않는 서버 흉내)"""
+
+    def __init__(self, cursor, marker, error):
+        self._cursor = cursor
+        self._marker = marker
+        self._error = error
+
+    def execute(self, query, params=None):
+        if self._marker in query:
+            raise self._error
+        return self._cursor.execute(query, params)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def _reject(db, monkeypatch, marker, error):
+    connection = db.connection
+    real_cursor = connection.cursor
+    monkeypatch.setattr(connection, 'cursor', lambda *args: _RejectingCursor(real_cursor(*args), marker, error))
+
+
+def test_unsupported_fulltext_parser_is_skipped(db, monkeypatch):
+    _reject(db, monkeypatch, 'WITH PARSER ngram', Exception(1128, "Function 'ngram' is not defined"))
+
+    run_migrations(db, log=lambda message: None)
+
+    assert applied_versions(db) == [m.version for m in MIGRATIONS]
+    assert db.fetch_one("SELECT name FROM sqlite_master WHERE type = 'index' AND name = %s",
+                        ('idx_timetables_date_time',))
+
+
+def test_other_errors_stop_the_runner(db, monkeypatch):
+    _reject(db, monkeypatch, 'WITH PARSER ngram', Exception(1205, 'Lock wait timeout exceeded'))
+
+    with pytest.raises(Exception, match='Lock wait timeout'):
+        run_migrations(db, log=lambda message: None)
+
+    assert 8 not in applied_versions(db)
+
+
+def test_watched_tables_get_updated_at_index(db):
+    run_migrations(db, log=lambda message: None)
+
+    for table in ('timetables', 'students', 'subjects'):
+        assert db.fetch_one("SELECT name FROM sqlite_master WHERE type = 'index' AND name = %s",
+                            (f'idx_{table}_updated_at',))
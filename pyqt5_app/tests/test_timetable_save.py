@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+시간표 저장 트랜잭션 테스트 (로컬 SQLite 백엔드)
+
+실행 (pyqt5_app 폴더에서):
+    python -m pytest tests
+"""
+
+from datetime import date, time
+import sys
+import os
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.sqlite_backend import init_database
+from utils.timetable_generator import save_lecture_rows
+
+COURSE = 'C-001'
+
+
+@pytest.fixture
+def db(db):
+    assert init_database(db, log=lambda message: None)
+    db.execute_query("INSERT INTO courses (code, name, capacity) VALUES (%s, %s, %s)", (COURSE, '과정', 30))
+    db.execute_many("INSERT INTO subjects (code, name, hours) VALUES (%s, %s, %s)",
+                    [('G-001', '파이썬', 40), ('G-002', '데이터베이스', 24)])
+    return db
+
+
+def _lecture_rows(db):
+    return db.fetch_all("""
+        SELECT class_date, start_time, subject_code FROM timetables
+        WHERE course_code = %s AND type = 'lecture' ORDER BY class_date, start_time
+    """, (COURSE,))
+
+
+class _FailingLockCursor:
+    """FOR UPDATE 조회에서 잠금 대기 시간 초과를 흉내 내는 커서"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, query, params=None):
+        if 'FOR UPDATE' in query:
+            raise Exception(1205, 'Lock wait timeout exceeded; try restarting transaction')
+        return self._cursor.execute(query, params)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def test_save_writes_only_changed_rows(db):
+    desired = {
+        (date(2026, 3, 2), time(9, 0)): ('G-001', time(13, 0), None),
+        (date(2026, 3, 2), time(14, 0)): ('G-002', time(18, 0), None),
+    }
+    assert save_lecture_rows(db, COURSE, desired) == (2, 0, 0)
+
+    desired[(date(2026, 3, 2), time(14, 0))] = ('G-001', time(18, 0), None)
+    del desired[(date(2026, 3, 2), time(9, 0))]
+    assert save_lecture_rows(db, COURSE, desired) == (0, 1, 1)
+    assert [row['subject_code'] for row in _lecture_rows(db)] == ['G-001']
+
+
+def test_failed_lock_read_writes_nothing(db, monkeypatch):
+    desired = {(date(2026, 3, 2), time(9, 0)): ('G-001', time(13, 0), None)}
+    save_lecture_rows(db, COURSE, desired)
+    before = _lecture_rows(db)
+
+    connection = db.connection
+    real_cursor = connection.cursor
+    monkeypatch.setattr(connection, 'cursor', lambda *args: _FailingLockCursor(real_cursor(*args)))
+
+    desired[(date(2026, 3, 3), time(9, 0))] = ('G-002', time(13, 0), None)
+    with pytest.raises(Exception, match='Lock wait timeout'):
+        save_lecture_rows(db, COURSE, desired)
+
+    monkeypatch.undo()
+    assert _lecture_rows(db) == before
+
+
+def test_fetch_raises_only_inside_transaction(db):
+    assert db.fetch_all("SELECT * FROM missing_table") == []
+    assert db.fetch_one("SELECT * FROM missing_table") is None
+    with pytest.raises(Exception):
+        with db.transaction():
+            db.fetch_all("SELECT * FROM missing_table")
+    assert db._transaction_depth == 0
+
+
+def _subject_codes(db):
+    return [row['code'] for row in db.fetch_all("SELECT code FROM subjects ORDER BY code")]
+
+
+def test_failed_nested_block_is_rolled_back_alone(db):
+    with db.transaction():
+        db.execute_query("INSERT INTO subjects (code, name, hours) VALUES (%s, %s, %s)", ('G-003', '통계', 16))
+        with pytest.raises(Exception, match='중단'):
+            with db.transaction():
+                db.execute_query("INSERT INTO subjects (code, name, hours) VALUES (%s, %s, %s)",
+                                 ('G-004', '머신러닝', 40))
+                raise Exception('중단')
+        assert len(db._pending_events) == 1
+    assert _subject_codes(db) == ['G-001', 'G-002', 'G-003']
+
+
+def test_nested_block_commits_with_the_outer_block(db):
+    with pytest.raises(Exception, match='중단'):
+        with db.transaction():
+            with db.transaction():
+                db.execute_query("INSERT INTO subjects (code, name, hours) VALUES (%s, %s, %s)",
+                                 ('G-004', '머신러닝', 40))
+            raise Exception('중단')
+    assert _subject_codes(db) == ['G-001', 'G-002']
+
+    with db.transaction():
+        with db.transaction():
+            db.execute_query("INSERT INTO subjects (code, name, hours) VALUES (%s, %s, %s)",
+                             ('G-004', '머신러닝', 40))
+    assert _subject_codes(db) == ['G-001', 'G-002', 'G-004']
@@ -9,12 +9,15 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QMessageBox, QFileDialog, QGroupBox, QGridLayout,
                              QHeaderView, QSplitter, QListWidget, QListWidgetItem,
                              QAbstractItemView)
-from PyQt5.QtCore import Qt, QDateTime, QDate
+from PyQt5.QtCore import Qt, QDateTime, QDate, QTimer
 from PyQt5.QtGui import QPixmap, QIcon
 from datetime import datetime, timedelta
 import os
 import shutil
 
+from database.consultation_search import SearchPage
+from ui.scroll_pager import ScrollPager
+
 
 class ConsultationDialog(QDialog):
     """면담 관리 다이얼로그"""
@@ -72,7 +75,12 @@ class ConsultationDialog(QDialog):
         filter_layout.addWidget(QLabel("검색:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("학생 이름, 주제, 상담사...")
-        self.search_input.textChanged.connect(self.search_consultations)
+        # 입력 중에는 검색하지 않고 잠시 멈췄을 때 한 번만 검색
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(300)
+        self.search_timer.timeout.connect(self.search_consultations)
+        self.search_input.textChanged.connect(self.search_timer.start)
         filter_layout.addWidget(self.search_input)
         
         # 면담 유형 필터
@@ -123,6 +131,25 @@ class ConsultationDialog(QDialog):
         self.consultation_table.cellClicked.connect(self.on_consultation_selected)
         layout.addWidget(self.consultation_table)
         
+        # 목록/검색 페이지 조회 (새 검색이 이전 검색을 취소, 끝까지 스크롤하면 다음 페이지)
+        self.list_pager = ScrollPager(self.consultation_table, self)
+        
+        # 로딩 표시
+        self.loading_label = QLabel("⏳ 면담 목록을 불러오는 중...")
+        self.loading_label.setStyleSheet("color: #666; padding: 4px;")
+        self.loading_label.setVisible(False)
+        layout.addWidget(self.loading_label)
+        
+        # 표시 중인 행 수 / 검색 결과 수
+        self.result_label = QLabel("")
+        self.result_label.setStyleSheet("color: #666; padding: 4px;")
+        layout.addWidget(self.result_label)
+        
+        self.list_pager.page_loaded.connect(self.show_results)
+        self.list_pager.query.failed.connect(
+            lambda msg: QMessageBox.warning(self, "오류", f"면담 목록 조회 실패: {msg}"))
+        self.list_pager.query.busy_changed.connect(self.loading_label.setVisible)
+        
         # 버튼
         button_layout = QHBoxLayout()
         
@@ -278,13 +305,22 @@ class ConsultationDialog(QDialog):
             self.student_combo.addItem(display_text, student['id'])
     
     def load_consultations(self):
-        """면담 목록 로드"""
-        consultations = self.db_manager.get_all_consultations()
-        self.populate_table(consultations)
+        """면담 목록 로드 (작업 스레드에서 최근 면담부터 페이지 단위로 조회)"""
+        self.list_pager.start(lambda db, after: db.list_consultations(after=after))
+    
+    def show_results(self, page, first):
+        """조회한 페이지 표시 (첫 페이지는 교체, 다음 페이지는 이어 붙임)"""
+        self.populate_table(page.rows, append=not first)
+        count = self.consultation_table.rowCount()
+        if isinstance(page, SearchPage):
+            self.result_label.setText(f"{count} / {page.total}건")
+        else:
+            self.result_label.setText(f"{count}건" + (" (스크롤하면 더 보기)" if page.has_more else ""))
     
-    def populate_table(self, consultations):
-        """테이블에 면담 목록 표시"""
-        self.consultation_table.setRowCount(0)
+    def populate_table(self, consultations, append=False):
+        """테이블에 면담 목록 표시 (append면 기존 행 뒤에 추가)"""
+        if not append:
+            self.consultation_table.setRowCount(0)
         
         for consultation in consultations:
             row = self.consultation_table.rowCount()
@@ -304,13 +340,14 @@ class ConsultationDialog(QDialog):
             self.consultation_table.setItem(row, 3, QTableWidgetItem(consultation.get('consultation_type', '')))
             
             # 주제
-            topic = consultation.get('main_topic', '')
+            topic = consultation.get('main_topic') or ''
             if len(topic) > 30:
                 topic = topic[:30] + '...'
             self.consultation_table.setItem(row, 4, QTableWidgetItem(topic))
     
     def search_consultations(self):
-        """면담 검색"""
+        """면담 검색 (관련도 순 첫 페이지)"""
+        self.search_timer.stop()
         keyword = self.search_input.text()
         consultation_type = self.type_filter.currentText()
         if consultation_type == '전체':
@@ -319,13 +356,15 @@ class ConsultationDialog(QDialog):
         date_from = self.date_from.date().toString('yyyy-MM-dd')
         date_to = self.date_to.date().toString('yyyy-MM-dd')
         
-        consultations = self.db_manager.search_consultations(
-            keyword=keyword,
-            consultation_type=consultation_type,
-            date_from=date_from,
-            date_to=date_to
+        self.list_pager.start(
+            lambda db, after: db.search_consultations(
+                keyword=keyword,
+                consultation_type=consultation_type,
+                date_from=date_from,
+                date_to=date_to,
+                page=after or 0
+            )
         )
-        self.populate_table(consultations)
     
     def on_consultation_selected(self, row, col):
         """면담 선택 시"""
@@ -570,8 +609,10 @@ class ConsultationDialog(QDialog):
             QMessageBox.information(self, "알림", "예정된 면담이 없습니다.")
             return
         
-        # 예정 면담 표시
+        # 예정 면담 표시 (진행 중인 목록 조회는 취소)
+        self.list_pager.cancel()
         self.populate_table(consultations)
+        self.result_label.setText(f"예정 면담 {len(consultations)}건")
         QMessageBox.information(self, "예정 면담", f"{len(consultations)}건의 예정된 면담이 있습니다.")
     
     def generate_report(self):
@@ -6,7 +6,8 @@
 from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QTableWidget, QTableWidgetItem, QLineEdit, QLabel,
                              QMessageBox, QHeaderView, QGroupBox, QGridLayout,
-                             QSpinBox, QTextEdit, QDateEdit, QFrame, QScrollArea, QCheckBox)
+                             QSpinBox, QTextEdit, QDateEdit, QFrame, QScrollArea, QCheckBox,
+                             QComboBox)
 from PyQt5.QtCore import Qt, QDate
 from datetime import datetime, timedelta
 import sys
@@ -14,7 +15,10 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
 from config_db import CODE_PREFIX
+from utils.work_calendar import get_work_calendar
+from utils.start_date_planner import plan_start_dates, SORT_ORDERS
 
 
 class CourseDialog(QWidget):
@@ -68,6 +72,12 @@ class CourseDialog(QWidget):
         self.start_date.setStyleSheet("font-size: 10pt;")
         date_layout.addWidget(self.start_date)
         
+        self.plan_btn = QPushButton("🔍 시작일 비교")
+        self.plan_btn.setStyleSheet("background-color: #00897B; color: white; padding: 4px 12px; font-size: 10pt;")
+        self.plan_btn.setMinimumHeight(28)
+        self.plan_btn.clicked.connect(self.open_start_date_planner)
+        date_layout.addWidget(self.plan_btn)
+        
         info_label = QLabel("ℹ️ 과정 기간 내 법정공휴일이 있다면 등록해주세요.")
         info_label.setStyleSheet("color: #2196F3; font-size: 10pt;")
         date_layout.addWidget(info_label)
@@ -406,21 +416,19 @@ class CourseDialog(QWidget):
         project_days = (project_hours + 7) // 8
         internship_days = (internship_hours + 7) // 8
         
-        # 공휴일 조회
-        holidays = self.get_holidays()
+        # 근무일 달력 (공휴일 반영)
+        calendar = get_work_calendar(self.db)
         
         # 강의 종료일 계산
-        lecture_end = self.calculate_end_date(start_date, lecture_days, holidays)
+        lecture_end = calendar.nth_working_day(start_date, lecture_days)
         
         # 프로젝트 종료일 계산 (강의 종료일 다음날부터 시작)
-        project_start = lecture_end + timedelta(days=1)
-        project_start = self.get_next_workday(project_start, holidays)
-        project_end = self.calculate_end_date(project_start, project_days, holidays)
+        project_start = calendar.next_working_day(lecture_end + timedelta(days=1))
+        project_end = calendar.nth_working_day(project_start, project_days)
         
         # 인턴쉽 종료일 계산 (프로젝트 종료일 다음날부터 시작)
-        internship_start = project_end + timedelta(days=1)
-        internship_start = self.get_next_workday(internship_start, holidays)
-        internship_end = self.calculate_end_date(internship_start, internship_days, holidays)
+        internship_start = calendar.next_working_day(project_end + timedelta(days=1))
+        internship_end = calendar.nth_working_day(internship_start, internship_days)
         
         # 계산된 날짜를 인스턴스 변수에 저장
         self.calculated_lecture_end = lecture_end
@@ -441,19 +449,11 @@ class CourseDialog(QWidget):
         total_work_days = lecture_days + project_days + internship_days
         excluded_days = total_calendar_days - total_work_days
         
-        # 주말과 공휴일 구분 계산
-        weekend_count = 0
-        holiday_count = 0
-        current = start_date
-        
-        while current <= internship_end:
-            # 주말 체크 (토요일=5, 일요일=6)
-            if current.weekday() >= 5:
-                weekend_count += 1
-            # 공휴일 체크 (주말이 아닌 날 중에서)
-            elif current in holidays:
-                holiday_count += 1
-            current += timedelta(days=1)
+        # 주말과 공휴일 구분 계산 (주말과 겹친 공휴일은 주말로 집계)
+        holiday_count = len(calendar.holidays_between(start_date, internship_end, weekdays_only=True))
+        weekend_count = (total_calendar_days
+                         - calendar.working_days_between(start_date, internship_end)
+                         - holiday_count)
         
         # 라벨 업데이트
         self.total_days_label.setText(f"{total_calendar_days}일")
@@ -464,73 +464,16 @@ class CourseDialog(QWidget):
         self.excluded_detail_label.setText(f"주말: {weekend_count}일/공휴일: {holiday_count}일")
         
         # 공휴일 목록 표시
-        self.update_holiday_list(start_date, internship_end, holidays)
-    
-    def get_holidays(self):
-        """공휴일 목록 조회"""
-        holidays = set()
-        try:
-            if self.db.connect():
-                query = "SELECT holiday_date FROM holidays"
-                rows = self.db.fetch_all(query)
-                for row in rows:
-                    holidays.add(row['holiday_date'])
-        except Exception as e:
-            print(f"공휴일 조회 오류: {str(e)}")
-        return holidays
-    
-    def is_workday(self, date, holidays):
-        """평일 여부 확인 (토요일, 일요일, 공휴일 제외)"""
-        # 토요일(5), 일요일(6) 제외
-        if date.weekday() >= 5:
-            return False
-        # 공휴일 제외
-        if date in holidays:
-            return False
-        return True
-    
-    def get_next_workday(self, date, holidays):
-        """다음 평일 찾기"""
-        while not self.is_workday(date, holidays):
-            date += timedelta(days=1)
-        return date
+        self.update_holiday_list(start_date, internship_end, calendar)
     
-    def calculate_end_date(self, start_date, work_days, holidays):
-        """종료일 계산 (평일 기준)"""
-        current_date = start_date
-        days_counted = 0
-        
-        while days_counted < work_days:
-            if self.is_workday(current_date, holidays):
-                days_counted += 1
-                if days_counted >= work_days:
-                    break
-            current_date += timedelta(days=1)
-        
-        return current_date
-    
-    def update_holiday_list(self, start_date, end_date, holidays):
+    def update_holiday_list(self, start_date, end_date, calendar):
         """과정 기간 내 공휴일 목록 표시"""
         try:
-            # 과정 기간 내 공휴일만 필터링
-            holidays_in_range = []
-            
-            # 공휴일 상세 정보 조회
-            if self.db.connect():
-                query = """
-                    SELECT holiday_date, name 
-                    FROM holidays 
-                    WHERE holiday_date BETWEEN %s AND %s
-                    ORDER BY holiday_date
-                """
-                rows = self.db.fetch_all(query, (start_date, end_date))
-                
-                for row in rows:
-                    holiday_date = row['holiday_date']
-                    # 주말이 아닌 공휴일만 표시
-                    if holiday_date.weekday() < 5:
-                        date_str = holiday_date.strftime("%m-%d")
-                        holidays_in_range.append(f"{date_str}({row['name']})")
+            # 과정 기간 내 공휴일 (주말이 아닌 공휴일만 표시)
+            holidays_in_range = [
+                f"{holiday_date.strftime('%m-%d')}({calendar.holiday_name(holiday_date)})"
+                for holiday_date in calendar.holidays_between(start_date, end_date, weekdays_only=True)
+            ]
             
             # 공휴일 목록 텍스트 생성
             if holidays_in_range:
@@ -553,8 +496,7 @@ class CourseDialog(QWidget):
             return
         
         try:
-            query = "SELECT * FROM courses ORDER BY code"
-            rows = self.db.fetch_all(query)
+            rows = get_reference_cache().rows('courses', self.db)
             
             self.table.setRowCount(0)
             for row in rows:
@@ -614,9 +556,9 @@ class CourseDialog(QWidget):
         # 과목 선택 버튼 활성화
         self.subject_select_btn.setEnabled(True)
         
-        # DB에서 전체 데이터 조회
-        query = "SELECT * FROM courses WHERE code = %s"
-        result = self.db.fetch_one(query, (code,))
+        # 전체 데이터 조회 (기준 데이터 캐시)
+        courses = get_reference_cache().rows('courses', self.db)
+        result = next((c for c in courses if c['code'] == code), None)
         
         if result:
             self.code_input.setText(result['code'])
@@ -677,22 +619,18 @@ class CourseDialog(QWidget):
                 
                 # 주말과 공휴일 구분 계산
                 if result.get('start_date') and result.get('internship_end_date'):
-                    holidays = self.get_holidays()
-                    weekend_count = 0
-                    holiday_count = 0
-                    current = result['start_date']
-                    
-                    while current <= result['internship_end_date']:
-                        if current.weekday() >= 5:
-                            weekend_count += 1
-                        elif current in holidays:
-                            holiday_count += 1
-                        current += timedelta(days=1)
+                    calendar = get_work_calendar(self.db)
+                    start_date = result['start_date']
+                    end_date = result['internship_end_date']
+                    holiday_count = len(calendar.holidays_between(start_date, end_date, weekdays_only=True))
+                    weekend_count = ((end_date - start_date).days + 1
+                                     - calendar.working_days_between(start_date, end_date)
+                                     - holiday_count)
                     
                     self.excluded_detail_label.setText(f"주말: {weekend_count}일/공휴일: {holiday_count}일")
                     
                     # 공휴일 목록 업데이트
-                    self.update_holiday_list(result['start_date'], result['internship_end_date'], holidays)
+                    self.update_holiday_list(start_date, end_date, calendar)
                 else:
                     self.excluded_detail_label.setText("주말: 0일/공휴일: 0일")
                     self.holiday_list_label.setText("공휴일이 없습니다.")
@@ -952,6 +890,165 @@ class CourseDialog(QWidget):
         if dialog.exec_() == QDialog.Accepted:
             # 다이얼로그가 저장되고 닫혔으면 과목 표시 업데이트
             self.load_and_display_selected_subjects(course_code)
+    
+    def open_start_date_planner(self):
+        """시작일 비교 다이얼로그 열기 (선택한 시작일을 과정 시작일로 적용)"""
+        dialog = StartDatePlannerDialog(
+            self.db, self.start_date.date(),
+            self.lecture_hours.value(), self.project_hours.value(), self.internship_hours.value(),
+            self
+        )
+        if dialog.exec_() == QDialog.Accepted and dialog.selected_date is not None:
+            selected = dialog.selected_date
+            # dateChanged → calculate_dates로 종료일 다시 계산
+            self.start_date.setDate(QDate(selected.year, selected.month, selected.day))
+
+
+class StartDatePlannerDialog(QDialog):
+    """과정 시작일 비교 다이얼로그
+    
+    후보 시작일 범위의 단계별 종료일과 주말/공휴일 수를 한 번에 계산해 표로 보여준다.
+    표 머리글을 누르면 그 열로 정렬되고, 선택한 행의 시작일을 과정에 적용할 수 있다.
+    """
+    
+    COLUMNS = [
+        ("시작일", 'start_date'), ("이론 종료", 'lecture_end'), ("프로젝트 종료", 'project_end'),
+        ("인턴쉽 종료", 'internship_end'), ("총 기간", 'total_days'), ("주말", 'weekend_days'),
+        ("공휴일", 'holiday_days'), ("이론 기간 공휴일", 'lecture_holidays'),
+    ]
+    
+    def __init__(self, db, start_date, lecture_hours, project_hours, internship_hours, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.selected_date = None
+        self.init_ui(start_date, lecture_hours, project_hours, internship_hours)
+        self.calculate()
+    
+    def init_ui(self, start_date, lecture_hours, project_hours, internship_hours):
+        """UI 초기화"""
+        self.setWindowTitle("과정 시작일 비교")
+        self.setMinimumSize(950, 600)
+        
+        layout = QVBoxLayout()
+        
+        form_layout = QGridLayout()
+        form_layout.addWidget(QLabel("후보 시작일:"), 0, 0)
+        self.first_date = QDateEdit()
+        self.first_date.setCalendarPopup(True)
+        self.first_date.setDisplayFormat("yyyy-MM-dd")
+        self.first_date.setDate(start_date)
+        form_layout.addWidget(self.first_date, 0, 1)
+        form_layout.addWidget(QLabel("~"), 0, 2)
+        self.last_date = QDateEdit()
+        self.last_date.setCalendarPopup(True)
+        self.last_date.setDisplayFormat("yyyy-MM-dd")
+        self.last_date.setDate(start_date.addMonths(3))
+        form_layout.addWidget(self.last_date, 0, 3)
+        self.working_only_check = QCheckBox("근무일에 시작하는 날만")
+        self.working_only_check.setChecked(True)
+        form_layout.addWidget(self.working_only_check, 0, 4)
+        
+        self.hour_inputs = []
+        for column, (title, value) in enumerate([("이론", lecture_hours), ("프로젝트", project_hours),
+                                                 ("인턴쉽", internship_hours)]):
+            form_layout.addWidget(QLabel(f"{title}:"), 1, column * 2)
+            spin = QSpinBox()
+            spin.setRange(0, 9999)
+            spin.setSuffix("h")
+            spin.setValue(value)
+            form_layout.addWidget(spin, 1, column * 2 + 1)
+            self.hour_inputs.append(spin)
+        
+        form_layout.addWidget(QLabel("정렬:"), 2, 0)
+        self.sort_combo = QComboBox()
+        for key, (title, _) in SORT_ORDERS.items():
+            self.sort_combo.addItem(title, key)
+        form_layout.addWidget(self.sort_combo, 2, 1)
+        
+        calc_btn = QPushButton("계산")
+        calc_btn.setStyleSheet("background-color: #00897B; color: white; padding: 6px 20px;")
+        calc_btn.clicked.connect(self.calculate)
+        form_layout.addWidget(calc_btn, 2, 3)
+        layout.addLayout(form_layout)
+        
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet("color: #666; padding: 5px;")
+        layout.addWidget(self.summary_label)
+        
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, _ in self.COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.cellDoubleClicked.connect(lambda row, column: self.apply_selected())
+        layout.addWidget(self.table)
+        
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        apply_btn = QPushButton("선택한 시작일 적용")
+        apply_btn.setStyleSheet("background-color: #4CAF50; color: white; padding: 8px 20px;")
+        apply_btn.clicked.connect(self.apply_selected)
+        btn_layout.addWidget(apply_btn)
+        close_btn = QPushButton("닫기")
+        close_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+        
+        self.setLayout(layout)
+        self.sort_combo.currentIndexChanged.connect(self.calculate)
+    
+    def calculate(self):
+        """후보 시작일 전체 계산 후 표 갱신"""
+        first = self.first_date.date().toPyDate()
+        last = self.last_date.date().toPyDate()
+        if last < first:
+            QMessageBox.warning(self, "경고", "후보 범위의 끝이 시작보다 빠릅니다.")
+            return
+        
+        try:
+            calendar = get_work_calendar(self.db)
+            plans = plan_start_dates(calendar, first, last,
+                                     *[spin.value() for spin in self.hour_inputs],
+                                     working_only=self.working_only_check.isChecked())
+        except ValueError as e:
+            QMessageBox.warning(self, "경고", str(e))
+            return
+        
+        sort = self.sort_combo.currentData()
+        rows = plans.rows(sort)
+        
+        # 정렬 기준 순서로 채운 뒤 첫 키 열을 정렬 표시로 둠 (이후 머리글 클릭으로 다시 정렬)
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row_index, plan in enumerate(rows):
+            for column, (_, field) in enumerate(self.COLUMNS):
+                value = getattr(plan, field)
+                item = QTableWidgetItem()
+                if field in ('start_date', 'lecture_end', 'project_end', 'internship_end'):
+                    item.setText(value.strftime("%Y-%m-%d"))
+                else:
+                    item.setData(Qt.DisplayRole, int(value))
+                item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row_index, column, item)
+        fields = [field for _, field in self.COLUMNS]
+        self.table.horizontalHeader().setSortIndicator(fields.index(SORT_ORDERS[sort][1][0]), Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
+        
+        self.summary_label.setText(
+            f"후보 {len(rows)}개 · 이론 {plans.lecture_days}일 / 프로젝트 {plans.project_days}일 / "
+            f"인턴쉽 {plans.internship_days}일 (하루 8시간 기준)"
+        )
+    
+    def apply_selected(self):
+        """선택한 행의 시작일을 과정 시작일로 적용"""
+        row = self.table.currentRow()
+        if row < 0:
+            QMessageBox.warning(self, "경고", "적용할 시작일을 선택하세요.")
+            return
+        self.selected_date = datetime.strptime(self.table.item(row, 0).text(), "%Y-%m-%d").date()
+        self.accept()
 
 
 class SubjectSelectionDialog(QDialog):
@@ -1087,25 +1184,27 @@ class SubjectSelectionDialog(QDialog):
                 QMessageBox.critical(self, "오류", "데이터베이스 연결 실패")
                 return
             
-            # 기존 선택 삭제
-            delete_query = "DELETE FROM course_subjects WHERE course_code = %s"
-            self.db.execute_query(delete_query, (self.course_code,))
-            
-            # 새로운 선택 저장
+            # 새로운 선택 목록
             insert_query = """
                 INSERT INTO course_subjects (course_code, subject_code, display_order)
                 VALUES (%s, %s, %s)
             """
             
-            selected_count = 0
+            rows = []
             for i in range(self.subject_table.rowCount()):
                 checkbox_widget = self.subject_table.cellWidget(i, 0)
                 checkbox = checkbox_widget.findChild(QCheckBox)
                 
                 if checkbox and checkbox.isChecked():
                     subject_code = self.subject_table.item(i, 1).text()
-                    self.db.execute_query(insert_query, (self.course_code, subject_code, i))
-                    selected_count += 1
+                    rows.append((self.course_code, subject_code, i))
+            
+            # 기존 선택 삭제 + 새 선택 저장 (한 번에 커밋)
+            delete_query = "DELETE FROM course_subjects WHERE course_code = %s"
+            with self.db.transaction():
+                self.db.execute_query(delete_query, (self.course_code,))
+                self.db.execute_many(insert_query, rows)
+            selected_count = len(rows)
             
             QMessageBox.information(
                 self, 
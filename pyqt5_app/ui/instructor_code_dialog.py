@@ -12,6 +12,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
 
 
 class InstructorCodeDialog(QWidget):
@@ -90,8 +91,7 @@ class InstructorCodeDialog(QWidget):
             return
         
         try:
-            query = "SELECT * FROM instructor_codes ORDER BY code"
-            rows = self.db.fetch_all(query)
+            rows = get_reference_cache().rows('instructor_codes', self.db)
             
             self.table.setRowCount(0)
             for row in rows:
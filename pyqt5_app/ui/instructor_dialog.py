@@ -13,6 +13,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
 from config_db import CODE_PREFIX
 
 
@@ -125,8 +126,8 @@ class InstructorDialog(QWidget):
             return
         
         try:
-            query = "SELECT code, name, type FROM instructor_codes ORDER BY type, code"
-            rows = self.db.fetch_all(query)
+            rows = sorted(get_reference_cache().rows('instructor_codes', self.db),
+                          key=lambda r: (str(r['type']), r['code']))
             
             self.type_combo.clear()
             for row in rows:
@@ -14,6 +14,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
 from config_db import APP_NAME, APP_VERSION, WINDOW_WIDTH, WINDOW_HEIGHT
+from database.migrations import run_migrations
 from utils.excel_manager import ExcelManager
 
 # 다이얼로그 임포트
@@ -359,6 +360,12 @@ class KDTMainWindowFull(QMainWindow):
         if reply == QMessageBox.Yes:
             if self.db.connect():
                 if self.db.create_tables():
+                    # 테이블 생성 후 미적용 스키마 변경(컬럼/인덱스) 반영
+                    try:
+                        run_migrations(self.db)
+                    except Exception as e:
+                        QMessageBox.critical(self, "오류", f"스키마 마이그레이션 실패: {str(e)}")
+                        return
                     QMessageBox.information(self, "성공", "데이터베이스 테이블이 생성되었습니다.")
                 else:
                     QMessageBox.critical(self, "오류", "테이블 생성 실패")
@@ -469,15 +476,14 @@ class KDTMainWindowFull(QMainWindow):
                 QMessageBox.critical(self, "오류", "데이터베이스 연결 실패")
                 return
             
-            query = f"SELECT * FROM {table_name}"
-            data = self.db.fetch_all(query)
+            # 서버 측 커서로 나눠 읽으면서 바로 파일에 씀 (대용량 테이블도 메모리 일정)
+            filename, count = ExcelManager.export_query(self.db, f"SELECT * FROM {table_name}", table_name)
             
-            if not data:
+            if not count:
                 QMessageBox.warning(self, "경고", "내보낼 데이터가 없습니다.")
                 return
             
-            filename = ExcelManager.export_to_excel(data, table_name)
-            QMessageBox.information(self, "성공", f"파일이 저장되었습니다:\n{filename}")
+            QMessageBox.information(self, "성공", f"파일이 저장되었습니다:\n{filename}\n({count}행)")
             self.statusBar().showMessage(f'Excel 내보내기 완료: {filename}')
             
         except Exception as e:
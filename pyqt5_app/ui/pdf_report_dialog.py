@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
 from utils.pdf_generator import PDFGenerator
 
 
@@ -121,8 +122,7 @@ class PDFReportDialog(QDialog):
             return
         
         try:
-            query = "SELECT * FROM courses ORDER BY code"
-            rows = self.db.fetch_all(query)
+            rows = get_reference_cache().rows('courses', self.db)
             
             self.course_combo.clear()
             self.course_combo.addItem("선택하세요", None)
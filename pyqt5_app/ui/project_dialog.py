@@ -13,6 +13,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
 from config_db import CODE_PREFIX
 
 
@@ -139,8 +140,7 @@ class ProjectDialog(QWidget):
             return
         
         try:
-            query = "SELECT code, name FROM courses ORDER BY code"
-            rows = self.db.fetch_all(query)
+            rows = get_reference_cache().rows('courses', self.db)
             
             self.course_combo.clear()
             self.course_combo.addItem("선택 안함", None)
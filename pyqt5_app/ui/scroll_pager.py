@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+스크롤 페이지 로더
+
+목록을 한 번에 전부 읽지 않고 첫 페이지만 조회한 뒤,
+사용자가 표의 끝 근처까지 스크롤하면 다음 페이지를 작업 스레드에서 이어서 조회한다.
+(첫 페이지가 화면을 다 채우지 못하면 스크롤바가 생길 때까지 계속 조회)
+
+사용 예:
+    self.list_pager = ScrollPager(self.table, self)
+    self.list_pager.page_loaded.connect(self.on_page_loaded)
+    self.list_pager.query.busy_changed.connect(self.loading_label.setVisible)
+    self.list_pager.start(lambda db, after: db.list_students(after=after))
+"""
+
+from PyQt5.QtCore import QObject, pyqtSignal
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.async_query import AsyncQuery
+
+
+class ScrollPager(QObject):
+    """스크롤 위치에 따라 다음 페이지를 조회
+
+    Args:
+        view: 스크롤을 감시할 QAbstractItemView (QTableView/QTableWidget)
+        threshold: 끝에서 몇 행 이내로 스크롤하면 다음 페이지를 조회할지
+
+    Signals:
+        page_loaded(object, bool): (페이지, 첫 페이지 여부)
+            페이지는 rows/after/has_more 속성을 가진 객체 (KeysetPage, SearchPage)
+    """
+
+    page_loaded = pyqtSignal(object, bool)
+
+    def __init__(self, view, parent=None, threshold=20):
+        super().__init__(parent)
+        self.view = view
+        self.threshold = threshold
+        self._fetch = None
+        self._after = None
+        self._has_more = False
+
+        self.query = AsyncQuery(self)
+        self.query.finished.connect(self._on_page)
+
+        scroll_bar = view.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._check_scroll)
+        scroll_bar.rangeChanged.connect(self._check_scroll)
+
+    @property
+    def has_more(self):
+        return self._has_more
+
+    def start(self, fetch):
+        """첫 페이지부터 다시 조회 (진행 중인 조회는 취소)
+
+        Args:
+            fetch: (db, after) → 페이지 (작업 스레드에서 실행, 첫 페이지는 after=None)
+        """
+        self._fetch = fetch
+        self._after = None
+        self._has_more = False
+        self.query.submit(self._fetch_page, fetch, None, True)
+
+    def load_more(self):
+        """다음 페이지 조회 (조회 중이거나 더 없으면 무시)"""
+        if not self._has_more or self.query.busy or self._fetch is None:
+            return
+        self.query.submit(self._fetch_page, self._fetch, self._after, False)
+
+    def cancel(self):
+        """진행 중인 조회 취소 (이후 스크롤해도 더 조회하지 않음)"""
+        self.query.cancel()
+        self._has_more = False
+
+    @staticmethod
+    def _fetch_page(db, fetch, after, first):
+        return fetch(db, after), first
+
+    def _on_page(self, result):
+        page, first = result
+        self._after = page.after
+        self._has_more = page.has_more
+        self.page_loaded.emit(page, first)
+
+    def _check_scroll(self, *args):
+        scroll_bar = self.view.verticalScrollBar()
+        if scroll_bar.value() >= scroll_bar.maximum() - self.threshold:
+            self.load_more()
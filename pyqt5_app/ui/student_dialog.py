@@ -4,7 +4,7 @@
 """
 
 from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QLineEdit, QLabel,
+                             QTableView, QLineEdit, QLabel,
                              QComboBox, QMessageBox, QHeaderView, QGroupBox,
                              QGridLayout, QTextEdit, QFileDialog, QProgressDialog)
 from PyQt5.QtCore import Qt
@@ -12,7 +12,6 @@ from PyQt5.QtGui import QPixmap, QImage
 import sys
 import os
 import traceback
-import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment
 from datetime import datetime
 from PIL import Image
@@ -20,6 +19,11 @@ import io
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
+from database.change_bus import TableSync, get_change_bus
+from ui.table_model import Column, RowTableModel, RowSortProxy
+from ui.scroll_pager import ScrollPager
+from utils.student_importer import import_students
 from config_db import CODE_PREFIX
 
 # 프로젝트 루트 디렉토리
@@ -43,6 +47,10 @@ class StudentDialog(QWidget):
         self.load_courses()
         self.load_data()
         
+        # 다른 탭/PC에서 바뀐 학생만 표에 반영
+        self.table_sync = TableSync(self.table_model, 'students', self.fetch_students, self.load_data, self)
+        get_change_bus().changed.connect(self.on_data_changed)
+        
     def init_ui(self):
         """UI 초기화"""
         layout = QVBoxLayout()
@@ -217,19 +225,48 @@ class StudentDialog(QWidget):
         
         layout.addLayout(btn_layout)
         
-        # 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(12)
-        self.table.setHorizontalHeaderLabels([
-            "코드", "이름", "생년월일", "성별", "휴대폰", "이메일", 
-            "관심분야", "최종학교", "캠퍼스", "배정과정", "등록일", "비고"
-        ])
+        # 테이블 (조회 결과 행 목록을 모델로 표시)
+        self.table_model = RowTableModel([
+            Column("코드", 'code'),
+            Column("이름", 'name'),
+            Column("생년월일", 'birth_date'),
+            Column("성별", 'gender'),
+            Column("휴대폰", 'phone'),
+            Column("이메일", 'email'),
+            Column("관심분야", 'interests'),
+            Column("최종학교", 'education'),
+            Column("캠퍼스", 'campus'),
+            Column("배정과정", 'course_name', display=lambda v, row: v or '미배정'),
+            Column("등록일", 'registered_at', display=self._format_registered_at),
+            Column("비고", 'notes'),
+        ], parent=self)
+        self.table_proxy = RowSortProxy(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        
+        self.table = QTableView()
+        self.table.setModel(self.table_proxy)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.cellClicked.connect(self.on_row_selected)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.clicked.connect(self.on_row_selected)
         layout.addWidget(self.table)
         
+        # 학생 목록 페이지 조회 (끝까지 스크롤하면 다음 페이지)
+        self.list_pager = ScrollPager(self.table, self)
+        
+        # 로딩 표시
+        self.loading_label = QLabel("⏳ 학생 목록을 불러오는 중...")
+        self.loading_label.setStyleSheet("color: #666; padding: 4px;")
+        self.loading_label.setVisible(False)
+        layout.addWidget(self.loading_label)
+        
+        self.list_pager.page_loaded.connect(self.populate_table)
+        self.list_pager.query.failed.connect(
+            lambda msg: QMessageBox.critical(self, "오류", f"데이터 로드 실패: {msg}"))
+        self.list_pager.query.busy_changed.connect(self.loading_label.setVisible)
+        
         self.setLayout(layout)
         
         # 과정 목록 로드
@@ -244,8 +281,7 @@ class StudentDialog(QWidget):
             self.course_combo.clear()
             self.course_combo.addItem("미배정", None)
             
-            query = "SELECT code, name FROM courses ORDER BY code"
-            courses = self.db.fetch_all(query)
+            courses = get_reference_cache().rows('courses', self.db)
             
             if courses:
                 for course in courses:
@@ -264,75 +300,17 @@ class StudentDialog(QWidget):
             if not file_path:
                 return
             
-            # 엑셀 파일 읽기
-            wb = openpyxl.load_workbook(file_path)
-            sheet = wb.active
-            
-            # 헤더 확인 (첫 번째 행)
-            headers = []
-            for col in range(1, sheet.max_column + 1):
-                headers.append(sheet.cell(1, col).value)
-            
-            # 데이터 읽기 (2행부터)
-            students_data = []
-            for row in range(2, sheet.max_row + 1):
-                row_data = {}
-                for col, header in enumerate(headers, 1):
-                    cell_value = sheet.cell(row, col).value
-                    row_data[header] = cell_value
-                students_data.append(row_data)
-            
-            wb.close()
-            
-            # 데이터 저장
-            if not self.db.connect():
-                QMessageBox.critical(self, "오류", "데이터베이스 연결 실패")
-                return
-            
-            success_count = 0
-            fail_count = 0
+            # 스트리밍 읽기 → 일괄 검사/중복 확인 → 코드 블록 예약 → 한 트랜잭션으로 등록
+            # (등록된 행은 변경 알림으로 표에 반영됨)
+            report = import_students(self.db, file_path)
             
-            for data in students_data:
-                try:
-                    # 코드 자동 생성
-                    code = self.db.get_next_code('students', 'S')
-                    
-                    # 데이터 매핑
-                    name = data.get('이름', '')
-                    birth_date = data.get('생년월일(78.01.12)', '')
-                    gender = data.get('성별\n(선택)', '')
-                    phone = data.get('휴대폰번호', '')
-                    email = data.get('이메일', '')
-                    address = data.get('주소', '')
-                    interests = data.get('관심 있는 분야(2개)', '')
-                    education = data.get('최종 학교/학년', '')
-                    introduction = data.get('자기소개 (200자 내외)', '')
-                    campus = data.get('지원하고자 하는 캠퍼스를 선택하세요', '')
-                    
-                    if not name or not phone:
-                        fail_count += 1
-                        continue
-                    
-                    query = """
-                        INSERT INTO students (code, name, birth_date, gender, phone, email, 
-                                            address, interests, education, introduction, campus)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """
-                    self.db.execute_query(query, (
-                        code, name, birth_date, gender, phone, email,
-                        address, interests, education, introduction, campus
-                    ))
-                    success_count += 1
-                    
-                except Exception as e:
-                    print(f"학생 등록 오류 ({name}): {str(e)}")
-                    fail_count += 1
-            
-            QMessageBox.information(
-                self, "완료", 
-                f"엑셀 업로드 완료\n성공: {success_count}명\n실패: {fail_count}명"
-            )
-            self.load_data()
+            box = QMessageBox(self)
+            box.setWindowTitle("완료")
+            box.setIcon(QMessageBox.Information if not report.errors else QMessageBox.Warning)
+            box.setText(f"엑셀 업로드 완료\n{report.summary()}")
+            if report.errors:
+                box.setDetailedText("\n".join(report.error_lines()))
+            box.exec_()
             
         except Exception as e:
             error_msg = f"엑셀 업로드 실패: {str(e)}\n\n상세 오류:\n{traceback.format_exc()}"
@@ -397,14 +375,19 @@ class StudentDialog(QWidget):
                                     address, interests, education, introduction, campus, course_code, notes, photo_path)
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
-            self.db.execute_query(query, (
+            cursor = self.db.execute_query(query, (
                 code, name, birth_date, gender, phone, email,
                 address, interests, education, introduction, campus, course_code, notes, self.current_photo_path
             ))
+            if cursor is None:
+                QMessageBox.critical(self, "오류", f"학생 {code} 추가에 실패했습니다.\n(상세 오류는 콘솔 로그 참고)")
+                return
+
+            # 엑셀 일괄 등록의 자동 번호가 직접 입력한 코드와 겹치지 않도록 (저장된 코드만 반영)
+            self.db.advance_code_sequence('students', CODE_PREFIX['student'], code)
             
             QMessageBox.information(self, "성공", f"학생 {code}가 추가되었습니다.")
             self.clear_form()
-            self.load_data()
             
         except Exception as e:
             error_msg = f"추가 실패: {str(e)}\n\n상세 오류:\n{traceback.format_exc()}"
@@ -458,7 +441,6 @@ class StudentDialog(QWidget):
             
             QMessageBox.information(self, "성공", "학생 정보가 수정되었습니다.")
             self.clear_form()
-            self.load_data()
             
         except Exception as e:
             error_msg = f"수정 실패: {str(e)}\n\n상세 오류:\n{traceback.format_exc()}"
@@ -485,87 +467,78 @@ class StudentDialog(QWidget):
                 self.db.execute_query(query, (code,))
                 QMessageBox.information(self, "성공", "학생이 삭제되었습니다.")
                 self.clear_form()
-                self.load_data()
             except Exception as e:
                 error_msg = f"삭제 실패: {str(e)}"
                 print(error_msg)
                 QMessageBox.critical(self, "오류", error_msg)
                 
     def load_data(self):
-        """데이터 로드"""
-        try:
-            if not self.db.connect():
-                return
-            
-            query = """
-                SELECT s.*, c.name as course_name
-                FROM students s
-                LEFT JOIN courses c ON s.course_code = c.code
-                ORDER BY s.code
-            """
-            students = self.db.fetch_all(query)
-            
-            self.table.setRowCount(0)
-            
-            if students:
-                self.table.setRowCount(len(students))
-                for row_position, student in enumerate(students):
-                    self.table.setItem(row_position, 0, QTableWidgetItem(student['code'] or ''))
-                    self.table.setItem(row_position, 1, QTableWidgetItem(student['name'] or ''))
-                    self.table.setItem(row_position, 2, QTableWidgetItem(student['birth_date'] or ''))
-                    self.table.setItem(row_position, 3, QTableWidgetItem(student['gender'] or ''))
-                    self.table.setItem(row_position, 4, QTableWidgetItem(student['phone'] or ''))
-                    self.table.setItem(row_position, 5, QTableWidgetItem(student['email'] or ''))
-                    self.table.setItem(row_position, 6, QTableWidgetItem(student['interests'] or ''))
-                    self.table.setItem(row_position, 7, QTableWidgetItem(student['education'] or ''))
-                    self.table.setItem(row_position, 8, QTableWidgetItem(student['campus'] or ''))
-                    
-                    course_display = student['course_name'] or '미배정'
-                    self.table.setItem(row_position, 9, QTableWidgetItem(course_display))
-                    
-                    registered_at = student.get('registered_at')
-                    if registered_at:
-                        reg_str = registered_at.strftime('%Y-%m-%d') if isinstance(registered_at, datetime) else str(registered_at)
-                        self.table.setItem(row_position, 10, QTableWidgetItem(reg_str))
-                    else:
-                        self.table.setItem(row_position, 10, QTableWidgetItem(''))
-                    
-                    self.table.setItem(row_position, 11, QTableWidgetItem(student['notes'] or ''))
-                    
-        except Exception as e:
-            error_msg = f"데이터 로드 실패: {str(e)}\n\n상세 오류:\n{traceback.format_exc()}"
-            print(error_msg)
-            QMessageBox.critical(self, "오류", error_msg)
-            
-    def on_row_selected(self, row, column):
+        """데이터 로드 (작업 스레드에서 첫 페이지 조회, 나머지는 스크롤할 때)"""
+        self.list_pager.start(lambda db, after: db.list_students(after=after))
+    
+    def populate_table(self, page, first):
+        """조회한 페이지를 테이블에 표시 (다음 페이지는 코드 기준으로 합침)"""
+        if first:
+            self.table_model.set_rows(page.rows)
+        else:
+            self.table_model.patch_rows('code', page.rows)
+    
+    @staticmethod
+    def fetch_students(db, column, keys):
+        """변경된 학생 행 조회 (작업 스레드, 목록과 같은 컬럼)"""
+        placeholders = ", ".join(["%s"] * len(keys))
+        cursor = db.connection.cursor()
+        cursor.execute(db.STUDENT_LIST_QUERY + f" WHERE s.{column} IN ({placeholders})", tuple(keys))
+        return cursor.fetchall()
+    
+    def on_data_changed(self, event):
+        """과정이 바뀌면 과정 목록과 배정과정 이름 다시 로드"""
+        if event.table == 'courses':
+            selected = self.course_combo.currentData()
+            self.load_courses()
+            index = self.course_combo.findData(selected)
+            if index >= 0:
+                self.course_combo.setCurrentIndex(index)
+            self.load_data()
+    
+    @staticmethod
+    def _format_registered_at(value, row):
+        """등록일 표시"""
+        if not value:
+            return ''
+        return value.strftime('%Y-%m-%d') if isinstance(value, datetime) else str(value)
+            
+    def on_row_selected(self, index):
         """행 선택 시"""
-        code = self.table.item(row, 0).text()
+        student = self.table_proxy.source_row(index)
+        if not student:
+            return
+        code = student['code']
         self.original_code = code
         
         self.code_input.setText(code)
-        self.name_input.setText(self.table.item(row, 1).text() if self.table.item(row, 1) else '')
-        self.birth_input.setText(self.table.item(row, 2).text() if self.table.item(row, 2) else '')
+        self.name_input.setText(student['name'] or '')
+        self.birth_input.setText(student['birth_date'] or '')
         
-        gender = self.table.item(row, 3).text() if self.table.item(row, 3) else ''
+        gender = student['gender'] or ''
         gender_index = self.gender_combo.findText(gender)
         if gender_index >= 0:
             self.gender_combo.setCurrentIndex(gender_index)
         
-        self.phone_input.setText(self.table.item(row, 4).text() if self.table.item(row, 4) else '')
-        self.email_input.setText(self.table.item(row, 5).text() if self.table.item(row, 5) else '')
-        self.interests_input.setText(self.table.item(row, 6).text() if self.table.item(row, 6) else '')
-        self.education_input.setText(self.table.item(row, 7).text() if self.table.item(row, 7) else '')
-        self.campus_input.setText(self.table.item(row, 8).text() if self.table.item(row, 8) else '')
+        self.phone_input.setText(student['phone'] or '')
+        self.email_input.setText(student['email'] or '')
+        self.campus_input.setText(student['campus'] or '')
         
-        # DB에서 상세 정보 조회
+        # DB에서 상세 정보 조회 (목록에는 TEXT 컬럼의 앞부분만 있음)
         try:
             if not self.db.connect():
                 return
             
-            query = "SELECT * FROM students WHERE code = %s"
-            student = self.db.fetch_one(query, (code,))
+            student = self.db.get_student(code)
             
             if student:
+                self.interests_input.setText(student.get('interests') or '')
+                self.education_input.setText(student.get('education') or '')
                 self.address_input.setText(student.get('address') or '')
                 self.introduction_input.setText(student.get('introduction') or '')
                 self.notes_input.setText(student.get('notes') or '')
@@ -4,7 +4,7 @@
 """
 
 from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QLineEdit, QLabel,
+                             QTableView, QLineEdit, QLabel,
                              QComboBox, QMessageBox, QHeaderView, QGroupBox,
                              QGridLayout, QSpinBox)
 from PyQt5.QtCore import Qt
@@ -14,6 +14,10 @@ import traceback
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
+from database.async_query import AsyncQuery
+from database.change_bus import TableSync, get_change_bus
+from ui.table_model import Column, RowTableModel, RowSortProxy
 from config_db import CODE_PREFIX
 
 
@@ -24,9 +28,14 @@ class SubjectDialog(QWidget):
         super().__init__(parent)
         self.db = DatabaseManager()
         self.original_code = None  # 수정 시 원본 코드 저장
+        self.instructor_query = AsyncQuery(self)  # 강사 목록 비동기 조회
         self.init_ui()
         self.load_data()
         
+        # 다른 탭/PC에서 바뀐 교과목만 표에 반영
+        self.table_sync = TableSync(self.table_model, 'subjects', self.fetch_subjects, self.load_data, self)
+        get_change_bus().changed.connect(self.on_data_changed)
+        
     def init_ui(self):
         """UI 초기화"""
         # 탭으로 사용되므로 setWindowTitle, setGeometry 불필요
@@ -40,7 +49,7 @@ class SubjectDialog(QWidget):
         # 코드
         form_layout.addWidget(QLabel("코드:"), 0, 0)
         self.code_input = QLineEdit()
-        self.code_input.setPlaceholderText("예: G-001, G-002")
+        self.code_input.setPlaceholderText("비워두면 자동 생성 (G-001)")
         self.code_input.setMaximumWidth(150)
         form_layout.addWidget(self.code_input, 0, 1)
         
@@ -135,15 +144,44 @@ class SubjectDialog(QWidget):
         layout.addLayout(btn_layout)
         
         # 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels(["코드", "과목명", "수업시수", "요일", "격주", "주차", "주강사", "보조강사", "예비강사"])
+        day_names = ["월", "화", "수", "목", "금"]
+        self.table_model = RowTableModel([
+            Column("코드", 'code'),
+            Column("과목명", 'name'),
+            Column("수업시수", 'hours', display=lambda v, row: f"{v} 시간"),
+            Column("요일", 'day_of_week',
+                   display=lambda v, row: day_names[v] if v is not None else '-'),
+            Column("격주", 'is_biweekly', display=lambda v, row: "격주" if v else "매주"),
+            Column("주차", 'week_offset',
+                   display=lambda v, row: ("1주차" if (v or 0) == 0 else "2주차") if row.get('is_biweekly') else '-'),
+            # 강사 이름 뒤에 구분 추가
+            Column("주강사", 'main_name', display=lambda v, row: f"{v}-주강사" if v else '-'),
+            Column("보조강사", 'assistant_name', display=lambda v, row: f"{v}-보조강사" if v else '-'),
+            Column("예비강사", 'reserve_name', display=lambda v, row: f"{v}-예비강사" if v else '-'),
+        ], parent=self)
+        self.table_proxy = RowSortProxy(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        
+        self.table = QTableView()
+        self.table.setModel(self.table_proxy)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.cellClicked.connect(self.on_row_selected)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.clicked.connect(self.on_row_selected)
         layout.addWidget(self.table)
         
+        # 로딩 표시
+        self.loading_label = QLabel("⏳ 강사 목록을 불러오는 중...")
+        self.loading_label.setStyleSheet("color: #666; padding: 4px;")
+        self.loading_label.setVisible(False)
+        layout.addWidget(self.loading_label)
+        
+        self.instructor_query.finished.connect(self.populate_instructor_combos)
+        self.instructor_query.failed.connect(lambda msg: print(f"강사 목록 로드 오류: {msg}"))
+        self.instructor_query.busy_changed.connect(self.loading_label.setVisible)
+        
         # 하단 버튼
         # 하단 버튼 (탭으로 사용되므로 닫기 버튼 불필요)
         
@@ -157,71 +195,44 @@ class SubjectDialog(QWidget):
         self.week_offset_combo.setEnabled(index == 1)  # 격주 선택 시만 활성화
         
     def load_instructors(self):
-        """강사 목록 로드 - 유형별 필터링"""
-        if not self.db.connect():
-            return
-        
-        try:
-            # 주강사용: type='1' (주강사)만
-            query_main = """
-                SELECT i.code, i.name, ic.type
-                FROM instructors i
-                LEFT JOIN instructor_codes ic ON i.instructor_type = ic.code
-                WHERE ic.type = '1'
-                ORDER BY i.code
-            """
-            main_rows = self.db.fetch_all(query_main)
+        """강사 목록 로드 - 유형별 필터링 (작업 스레드에서 기준 데이터 캐시로 조회)"""
+        def load_groups(db):
+            cache = get_reference_cache()
+            # 강사 구분 번호 ('1' 또는 '1. 주강사' 형식 모두 앞 번호로 비교)
+            type_numbers = {row['code']: str(row['type']).split('.')[0]
+                            for row in cache.rows('instructor_codes', db)}
+            rows = [{'code': i['code'], 'name': i['name'], 'type': type_numbers.get(i['instructor_type'])}
+                    for i in cache.rows('instructors', db)]
             
+            # 주강사용: type='1' (주강사)만
             # 보조강사용: type='1' (주강사) OR type='2' (보조강사)
-            query_assistant = """
-                SELECT i.code, i.name, ic.type
-                FROM instructors i
-                LEFT JOIN instructor_codes ic ON i.instructor_type = ic.code
-                WHERE ic.type IN ('1', '2')
-                ORDER BY i.code
-            """
-            assistant_rows = self.db.fetch_all(query_assistant)
-            
             # 예비강사용: type='1' (주강사) OR type='3' (멘토)
-            query_reserve = """
-                SELECT i.code, i.name, ic.type
-                FROM instructors i
-                LEFT JOIN instructor_codes ic ON i.instructor_type = ic.code
-                WHERE ic.type IN ('1', '3')
-                ORDER BY i.code
-            """
-            reserve_rows = self.db.fetch_all(query_reserve)
-            
-            # 주강사 콤보박스
-            self.main_combo.clear()
-            self.main_combo.addItem("선택 안함", None)
-            for row in main_rows:
-                # 이름을 10자로 맞춰서 정렬
-                name_padded = row['name'].ljust(10)
-                display_text = f"{name_padded} - 주강사"
-                self.main_combo.addItem(display_text, row['code'])
-            
-            # 보조강사 콤보박스
-            self.assistant_combo.clear()
-            self.assistant_combo.addItem("선택 안함", None)
-            for row in assistant_rows:
-                # 이름을 10자로 맞춰서 정렬
-                name_padded = row['name'].ljust(10)
-                # type에 따라 역할 표시
-                role = "주강사" if row['type'] == '1' else "보조강사"
-                display_text = f"{name_padded} - {role}"
-                self.assistant_combo.addItem(display_text, row['code'])
-            
-            # 예비강사 콤보박스
-            self.reserve_combo.clear()
-            self.reserve_combo.addItem("선택 안함", None)
-            for row in reserve_rows:
-                # 이름을 10자로 맞춰서 정렬
-                name_padded = row['name'].ljust(10)
-                # type에 따라 역할 표시
-                role = "주강사" if row['type'] == '1' else "멘토"
-                display_text = f"{name_padded} - {role}"
-                self.reserve_combo.addItem(display_text, row['code'])
+            return {
+                'main': [r for r in rows if r['type'] == '1'],
+                'assistant': [r for r in rows if r['type'] in ('1', '2')],
+                'reserve': [r for r in rows if r['type'] in ('1', '3')],
+            }
+        
+        self.instructor_query.submit(load_groups)
+    
+    def populate_instructor_combos(self, groups):
+        """강사 콤보박스 채우기 (선택되어 있던 강사는 유지)"""
+        try:
+            combos = [
+                (self.main_combo, groups['main'], lambda t: "주강사"),
+                (self.assistant_combo, groups['assistant'], lambda t: "주강사" if t == '1' else "보조강사"),
+                (self.reserve_combo, groups['reserve'], lambda t: "주강사" if t == '1' else "멘토"),
+            ]
+            for combo, rows, role_of in combos:
+                selected = combo.currentData()
+                combo.clear()
+                combo.addItem("선택 안함", None)
+                for row in rows:
+                    # 이름을 10자로 맞춰서 정렬, type에 따라 역할 표시
+                    name_padded = row['name'].ljust(10)
+                    combo.addItem(f"{name_padded} - {role_of(row['type'])}", row['code'])
+                if selected:
+                    self.set_combo_by_code(combo, selected)
                 
         except Exception as e:
             error_msg = f"강사 목록 로드 오류: {str(e)}\n{traceback.format_exc()}"
@@ -248,41 +259,8 @@ class SubjectDialog(QWidget):
                 ORDER BY s.code
             """
             rows = self.db.fetch_all(query)
+            self.table_model.set_rows(rows)
             
-            self.table.setRowCount(0)
-            for row in rows:
-                row_position = self.table.rowCount()
-                self.table.insertRow(row_position)
-                
-                self.table.setItem(row_position, 0, QTableWidgetItem(row['code'] or ''))
-                self.table.setItem(row_position, 1, QTableWidgetItem(row['name'] or ''))
-                self.table.setItem(row_position, 2, QTableWidgetItem(str(row['hours']) + ' 시간'))
-                
-                # 요일 표시
-                day_names = ["월", "화", "수", "목", "금"]
-                day_text = day_names[row['day_of_week']] if row.get('day_of_week') is not None else '-'
-                self.table.setItem(row_position, 3, QTableWidgetItem(day_text))
-                
-                # 격주 여부
-                biweekly_text = "격주" if row.get('is_biweekly') else "매주"
-                self.table.setItem(row_position, 4, QTableWidgetItem(biweekly_text))
-                
-                # 주차 표시
-                if row.get('is_biweekly'):
-                    week_text = "1주차" if row.get('week_offset', 0) == 0 else "2주차"
-                else:
-                    week_text = '-'
-                self.table.setItem(row_position, 5, QTableWidgetItem(week_text))
-                
-                # 강사 이름 뒤에 구분 추가
-                main_name = f"{row['main_name']}-주강사" if row['main_name'] else '-'
-                assistant_name = f"{row['assistant_name']}-보조강사" if row['assistant_name'] else '-'
-                reserve_name = f"{row['reserve_name']}-예비강사" if row['reserve_name'] else '-'
-                
-                self.table.setItem(row_position, 6, QTableWidgetItem(main_name))
-                self.table.setItem(row_position, 7, QTableWidgetItem(assistant_name))
-                self.table.setItem(row_position, 8, QTableWidgetItem(reserve_name))
-                
         except Exception as e:
             error_msg = f"데이터 로드 실패: {str(e)}\n\n상세 오류:\n{traceback.format_exc()}"
             print("=" * 80)
@@ -291,39 +269,61 @@ class SubjectDialog(QWidget):
             print("=" * 80)
             QMessageBox.critical(self, "오류", error_msg)
         
-    def on_row_selected(self, row, column):
+    @staticmethod
+    def fetch_subjects(db, column, keys):
+        """변경된 교과목 행 조회 (작업 스레드, load_data와 같은 컬럼)"""
+        placeholders = ", ".join(["%s"] * len(keys))
+        cursor = db.connection.cursor()
+        cursor.execute(f"""
+            SELECT s.*, 
+                   i1.name as main_name,
+                   i2.name as assistant_name,
+                   i3.name as reserve_name
+            FROM subjects s
+            LEFT JOIN instructors i1 ON s.main_instructor = i1.code
+            LEFT JOIN instructors i2 ON s.assistant_instructor = i2.code
+            LEFT JOIN instructors i3 ON s.reserve_instructor = i3.code
+            WHERE s.{column} IN ({placeholders})
+        """, tuple(keys))
+        return cursor.fetchall()
+    
+    def on_data_changed(self, event):
+        """강사가 바뀌면 강사 콤보와 강사 이름 다시 로드"""
+        if event.table in ('instructors', 'instructor_codes'):
+            self.load_instructors()
+            if event.table == 'instructors':
+                self.load_data()
+    
+    def on_row_selected(self, index):
         """행 선택 시"""
-        code = self.table.item(row, 0).text()
+        result = self.table_proxy.source_row(index)
+        if not result:
+            return
+        code = result['code']
         self.code_input.setText(code)
-        self.name_input.setText(self.table.item(row, 1).text())
-        hours_text = self.table.item(row, 2).text().replace(' 시간', '')
-        self.hours_input.setValue(int(hours_text))
+        self.name_input.setText(result['name'] or '')
+        self.hours_input.setValue(int(result['hours'] or 0))
         
         # 원본 코드 저장 (수정 시 중복 체크에 사용)
         self.original_code = code
         
-        # 강사 찾기 - 실제 DB에서 다시 조회
-        query = "SELECT * FROM subjects WHERE code = %s"
-        result = self.db.fetch_one(query, (code,))
+        # 요일 설정
+        if result.get('day_of_week') is not None:
+            self.day_combo.setCurrentIndex(result['day_of_week'])
         
-        if result:
-            # 요일 설정
-            if result.get('day_of_week') is not None:
-                self.day_combo.setCurrentIndex(result['day_of_week'])
-            
-            # 격주 여부 설정
-            is_biweekly = result.get('is_biweekly', False)
-            self.biweekly_combo.setCurrentIndex(1 if is_biweekly else 0)
-            
-            # 주차 설정 (격주인 경우에만)
-            if is_biweekly:
-                week_offset = result.get('week_offset', 0)
-                self.week_offset_combo.setCurrentIndex(week_offset)
-            
-            # 강사 설정
-            self.set_combo_by_code(self.main_combo, result['main_instructor'])
-            self.set_combo_by_code(self.assistant_combo, result['assistant_instructor'])
-            self.set_combo_by_code(self.reserve_combo, result['reserve_instructor'])
+        # 격주 여부 설정
+        is_biweekly = result.get('is_biweekly', False)
+        self.biweekly_combo.setCurrentIndex(1 if is_biweekly else 0)
+        
+        # 주차 설정 (격주인 경우에만)
+        if is_biweekly:
+            week_offset = result.get('week_offset', 0)
+            self.week_offset_combo.setCurrentIndex(week_offset)
+        
+        # 강사 설정 (목록 조회 시 s.* 로 함께 가져온 코드 사용)
+        self.set_combo_by_code(self.main_combo, result['main_instructor'])
+        self.set_combo_by_code(self.assistant_combo, result['assistant_instructor'])
+        self.set_combo_by_code(self.reserve_combo, result['reserve_instructor'])
     
     def set_combo_by_code(self, combo, code):
         """콤보박스를 코드로 설정"""
@@ -341,16 +341,12 @@ class SubjectDialog(QWidget):
         code = self.code_input.text().strip()
         name = self.name_input.text().strip()
         
-        if not code:
-            QMessageBox.warning(self, "경고", "코드를 입력하세요.")
-            return
-        
         if not name:
             QMessageBox.warning(self, "경고", "과목명을 입력하세요.")
             return
         
-        # 코드 중복 체크
-        if self.is_code_duplicate(code):
+        # 코드 중복 체크 (비워두면 저장할 때 자동 생성)
+        if code and self.is_code_duplicate(code):
             QMessageBox.warning(self, "경고", f"코드 '{code}'는 이미 사용 중입니다.\n다른 코드를 입력하세요.")
             return
         
@@ -363,6 +359,11 @@ class SubjectDialog(QWidget):
         reserve_instructor = self.reserve_combo.currentData()
         
         try:
+            if code:
+                self.db.advance_code_sequence('subjects', CODE_PREFIX['subject'], code)
+            else:
+                code = self.db.get_next_code('subjects', CODE_PREFIX['subject'])
+            
             query = """
                 INSERT INTO subjects (code, name, hours, day_of_week, is_biweekly, week_offset,
                                      main_instructor, assistant_instructor, reserve_instructor) 
@@ -373,7 +374,6 @@ class SubjectDialog(QWidget):
             
             QMessageBox.information(self, "성공", f"교과목 {code}가 추가되었습니다.")
             self.clear_form()
-            self.load_data()
             
         except Exception as e:
             error_msg = f"추가 실패: {str(e)}\n\n상세 오류:\n{traceback.format_exc()}"
@@ -458,7 +458,6 @@ class SubjectDialog(QWidget):
             
             QMessageBox.information(self, "성공", "교과목이 수정되었습니다.")
             self.clear_form()
-            self.load_data()
             
         except Exception as e:
             error_msg = f"수정 실패: {str(e)}\n\n상세 오류:\n{traceback.format_exc()}"
@@ -487,7 +486,6 @@ class SubjectDialog(QWidget):
                 
                 QMessageBox.information(self, "성공", "교과목이 삭제되었습니다.")
                 self.clear_form()
-                self.load_data()
                 
             except Exception as e:
                 error_msg = f"삭제 실패: {str(e)}\n\n상세 오류:\n{traceback.format_exc()}"
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+조회 결과 행 목록을 그대로 보여주는 테이블 모델
+
+QTableWidget처럼 셀마다 QTableWidgetItem을 만들지 않고, 뷰가 화면에 보이는 셀만
+data()로 요청할 때 행 dict에서 값을 꺼내 포맷한다. 행 목록 교체는 reset 한 번으로 끝난다.
+
+사용 예:
+    columns = [
+        Column("코드", 'code'),
+        Column("시수", 'hours', display=lambda v, row: f"{v} 시간"),
+    ]
+    self.table_model = RowTableModel(columns, parent=self)
+    self.table_proxy = RowSortProxy(self)
+    self.table_proxy.setSourceModel(self.table_model)
+    self.table.setModel(self.table_proxy)
+    self.table_model.set_rows(rows)
+"""
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QVariant
+from PyQt5.QtGui import QBrush, QColor
+from datetime import timedelta
+
+
+class Column:
+    """테이블 컬럼 정의
+
+    Args:
+        header: 헤더 텍스트
+        key: 행 dict 키 또는 row → 값 함수
+        display: (값, 행) → 표시 문자열 (기본: None이면 '', 아니면 str)
+        sort_key: 행 → 정렬 값 (기본: 값)
+        background: 행 → 배경색 (QColor/문자열/None)
+        alignment: Qt 정렬 플래그
+        tooltip: 행 → 툴팁 문자열 (기본: 표시 문자열)
+        font: 행 → QFont (기본: 뷰 글꼴)
+    """
+
+    def __init__(self, header, key=None, display=None, sort_key=None,
+                 background=None, alignment=None, tooltip=None, font=None):
+        self.header = header
+        self.key = key
+        self.display = display
+        self.sort_key = sort_key
+        self.background = background
+        self.alignment = alignment
+        self.tooltip = tooltip
+        self.font = font
+
+    def value(self, row):
+        if callable(self.key):
+            return self.key(row)
+        if self.key is None:
+            return None
+        return row.get(self.key)
+
+    def text(self, row):
+        value = self.value(row)
+        if self.display:
+            return self.display(value, row)
+        return '' if value is None else str(value)
+
+
+def _sortable(value):
+    """정렬 비교용 값 (None은 맨 뒤, 타입이 섞여도 비교 가능하도록)"""
+    if value is None:
+        return (2, '')
+    if isinstance(value, timedelta):
+        return (0, value.total_seconds())
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    if hasattr(value, 'isoformat'):
+        return (1, value.isoformat())
+    return (1, str(value))
+
+
+class RowTableModel(QAbstractTableModel):
+    """행 dict 목록 기반 테이블 모델"""
+
+    def __init__(self, columns, rows=None, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self._rows = list(rows or [])
+
+    # --- Qt 모델 인터페이스 ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Horizontal:
+            return self.columns[section].header
+        return section + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        row = self._rows[index.row()]
+        column = self.columns[index.column()]
+
+        if role == Qt.DisplayRole:
+            return column.text(row)
+        if role == Qt.ToolTipRole:
+            return column.tooltip(row) if column.tooltip else column.text(row)
+        if role == Qt.BackgroundRole and column.background:
+            color = column.background(row)
+            if color:
+                return QBrush(QColor(color))
+        if role == Qt.TextAlignmentRole and column.alignment is not None:
+            return column.alignment
+        if role == Qt.FontRole and column.font:
+            font = column.font(row)
+            if font is not None:
+                return font
+        return QVariant()
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # --- 행 관리 ---
+
+    @property
+    def rows(self):
+        return self._rows
+
+    def set_rows(self, rows):
+        """행 목록 전체 교체 (reset 한 번)"""
+        self.beginResetModel()
+        self._rows = list(rows or [])
+        self.endResetModel()
+
+    def row_at(self, row):
+        """행 번호 → 행 dict"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def update_row(self, row, data):
+        """한 행 교체 (해당 행만 다시 그림)"""
+        self._rows[row] = data
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+
+    def refresh_rows(self, first, last):
+        """first ~ last 행을 다시 그리도록 알림 (행 dict를 직접 수정한 경우)"""
+        if first > last or not self._rows:
+            return
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.columns) - 1))
+
+    def patch_rows(self, key, rows, removed=()):
+        """key 컬럼 기준으로 행 갱신/추가/삭제 (바뀐 행만 다시 그림)
+
+        Args:
+            key: 행을 식별하는 dict 키
+            rows: 새 값 행 목록 (같은 key가 있으면 교체, 없으면 끝에 추가)
+            removed: 삭제할 key 값 목록
+        """
+        index = {data.get(key): i for i, data in enumerate(self._rows)}
+        appended = []
+        for data in rows:
+            i = index.get(data.get(key))
+            if i is None:
+                appended.append(data)
+            else:
+                self.update_row(i, data)
+
+        if appended:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(appended) - 1)
+            self._rows.extend(appended)
+            self.endInsertRows()
+
+        # 뒤에서부터 지워야 앞쪽 행 번호가 바뀌지 않음
+        for i in sorted((index[k] for k in set(removed) if k in index), reverse=True):
+            self.beginRemoveRows(QModelIndex(), i, i)
+            del self._rows[i]
+            self.endRemoveRows()
+
+    def sort_value(self, row, column):
+        """정렬 값"""
+        data = self._rows[row]
+        col = self.columns[column]
+        value = col.sort_key(data) if col.sort_key else col.value(data)
+        return _sortable(value)
+
+
+class RowSortProxy(QSortFilterProxyModel):
+    """RowTableModel 정렬 프록시 (표시 문자열이 아니라 원래 값으로 정렬)"""
+
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        if isinstance(model, RowTableModel):
+            return (model.sort_value(left.row(), left.column())
+                    < model.sort_value(right.row(), right.column()))
+        return super().lessThan(left, right)
+
+    def source_row(self, proxy_index):
+        """프록시 인덱스 → 원본 행 dict"""
+        model = self.sourceModel()
+        return model.row_at(self.mapToSource(proxy_index).row())
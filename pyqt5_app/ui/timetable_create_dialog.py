@@ -5,18 +5,28 @@
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QComboBox, QMessageBox, QGroupBox,
-                             QTableWidget, QTableWidgetItem, QHeaderView,
+                             QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
                              QProgressBar, QFrame, QScrollArea, QDialog,
                              QDialogButtonBox, QFileDialog, QInputDialog)
 from PyQt5.QtCore import Qt, QDate
 from PyQt5.QtGui import QColor, QBrush, QFont
-from datetime import datetime, timedelta, time
+from datetime import date, datetime, timedelta, time
+from bisect import bisect_left, insort
 import random
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
+from database.async_query import AsyncQuery
+from utils.helpers import to_date
+from utils.schedule_engine import schedule
+from utils.instructor_conflicts import ConflictIndex, find_conflicts
+from utils.schedule_optimizer import optimize, DEFAULT_TIME_BUDGET
+from utils.work_calendar import get_work_calendar
+from utils.timetable_generator import save_lecture_rows
+from ui.table_model import Column, RowTableModel
 
 
 class TimetableCreateDialog(QWidget):
@@ -30,6 +40,7 @@ class TimetableCreateDialog(QWidget):
         self.holidays = set()
         self.subject_colors = {}
         self.current_timetable = []  # 현재 표시 중인 시간표
+        self.last_schedule = None  # 마지막 자동 배정 결과 (강사 대체/중복 집계용)
         self.timetable_id = None  # 저장된 시간표 ID
         self.init_ui()
         self.load_courses()
@@ -88,6 +99,15 @@ class TimetableCreateDialog(QWidget):
         self.auto_btn.setEnabled(False)
         btn_layout.addWidget(self.auto_btn)
         
+        self.optimize_btn = QPushButton("🧠 최적화 배정")
+        self.optimize_btn.setStyleSheet("background-color: #673AB7; color: white; padding: 10px 20px; font-size: 11pt;")
+        self.optimize_btn.setMinimumHeight(40)
+        self.optimize_btn.setToolTip(f"요일/연속성/강사 중복/종료일을 함께 따져 "
+                                     f"{DEFAULT_TIME_BUDGET:.0f}초 동안 더 나은 시간표를 찾습니다")
+        self.optimize_btn.clicked.connect(self.optimize_assign)
+        self.optimize_btn.setEnabled(False)
+        btn_layout.addWidget(self.optimize_btn)
+        
         self.save_btn = QPushButton("💾 저장")
         self.save_btn.setStyleSheet("background-color: #2196F3; color: white; padding: 10px 20px; font-size: 11pt;")
         self.save_btn.setMinimumHeight(40)
@@ -134,23 +154,21 @@ class TimetableCreateDialog(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setMinimumHeight(400)
         
-        self.timetable_table = QTableWidget()
-        self.timetable_table.setColumnCount(8)
-        self.timetable_table.setHorizontalHeaderLabels([
-            "주차", "날짜", "오전(09:00-13:00)", "오후(14:00-18:00)", "주강사", "보조강사", "예비강사", "진행도"
-        ])
+        self.timetable_model = RowTableModel(self._timetable_columns(), parent=self)
+        self.timetable_table = QTableView()
+        self.timetable_table.setModel(self.timetable_model)
         self.timetable_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.timetable_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.timetable_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.timetable_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
         self.timetable_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 font-size: 11pt;
                 gridline-color: #CCCCCC;
             }
         """)
         self.timetable_table.setShowGrid(True)
-        self.timetable_table.cellClicked.connect(self.on_cell_clicked)
+        self.timetable_table.clicked.connect(self.on_cell_clicked)
         
         scroll.setWidget(self.timetable_table)
         timetable_layout.addWidget(scroll)
@@ -159,13 +177,20 @@ class TimetableCreateDialog(QWidget):
         layout.addWidget(timetable_group)
         
         self.setLayout(layout)
+        
+        # 최적화 배정은 몇 초 걸리므로 작업 스레드에서 실행 (탐색은 다시 여러 프로세스로 나뉨)
+        self.optimize_query = AsyncQuery(self)
+        self.optimize_query.finished.connect(self.on_optimized)
+        self.optimize_query.failed.connect(self.on_optimize_failed)
     
     def load_courses(self):
         """과정 목록 로드"""
         try:
             if self.db.connect():
-                query = "SELECT code, name, start_date FROM courses ORDER BY start_date DESC"
-                courses = self.db.fetch_all(query)
+                # 시작일 최신순 (시작일 없는 과정은 마지막)
+                courses = sorted(get_reference_cache().rows('courses', self.db),
+                                 key=lambda c: (c['start_date'] is not None, c['start_date'] or date.min),
+                                 reverse=True)
                 
                 self.course_combo.clear()
                 self.course_combo.addItem("-- 과정 선택 --", None)
@@ -179,11 +204,17 @@ class TimetableCreateDialog(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "오류", f"과정 목록 로드 실패: {str(e)}")
     
+    def get_course(self, course_code):
+        """과정 행 (기준 데이터 캐시, 없으면 None)"""
+        courses = get_reference_cache().rows('courses', self.db)
+        return next((c for c in courses if c['code'] == course_code), None)
+    
     def on_course_selected(self, index):
         """과정 선택 시"""
         if index <= 0:
             self.selected_course = None
             self.auto_btn.setEnabled(False)
+            self.optimize_btn.setEnabled(False)
             self.course_info_label.setText("과정을 선택하세요")
             return
         
@@ -194,16 +225,12 @@ class TimetableCreateDialog(QWidget):
         self.load_holidays()
         self.load_existing_timetable()  # 기존 시간표 불러오기
         self.auto_btn.setEnabled(True)
+        self.optimize_btn.setEnabled(True)
     
     def load_course_info(self):
         """과정 정보 로드"""
         try:
-            query = """
-                SELECT start_date, lecture_end_date, lecture_hours 
-                FROM courses 
-                WHERE code = %s
-            """
-            result = self.db.fetch_one(query, (self.selected_course,))
+            result = self.get_course(self.selected_course)
             
             if result:
                 info = f"시작: {result['start_date'].strftime('%Y-%m-%d')}"
@@ -225,7 +252,7 @@ class TimetableCreateDialog(QWidget):
             
             # 해당 과정에 선택된 과목만 조회
             query = """
-                SELECT s.code, s.name, s.hours, 
+                SELECT s.code, s.name, s.hours, s.main_instructor, s.reserve_instructor,
                        s.day_of_week, s.is_biweekly, s.week_offset,
                        i1.name as main_instructor_name,
                        i2.name as assistant_instructor_name,
@@ -294,9 +321,7 @@ class TimetableCreateDialog(QWidget):
     def load_holidays(self):
         """공휴일 로드"""
         try:
-            query = "SELECT holiday_date FROM holidays"
-            rows = self.db.fetch_all(query)
-            self.holidays = set([row['holiday_date'] for row in rows])
+            self.holidays = get_work_calendar(self.db).holidays
         except Exception as e:
             print(f"공휴일 로드 오류: {str(e)}")
     
@@ -441,8 +466,7 @@ class TimetableCreateDialog(QWidget):
             else:
                 # 기존 시간표가 없음
                 print(f"ℹ️  저장된 시간표가 없습니다. '자동 배정' 버튼을 클릭하세요.")
-                self.timetable_table.setRowCount(0)
-                self.current_timetable = []
+                self.clear_timetable()
                 self.save_btn.setEnabled(False)
                 self.export_btn.setEnabled(False)
                 self.delete_btn.setEnabled(False)
@@ -476,8 +500,7 @@ class TimetableCreateDialog(QWidget):
             self.progress.setValue(0)
             
             # 과정 정보 가져오기
-            query = "SELECT start_date, lecture_end_date FROM courses WHERE code = %s"
-            course = self.db.fetch_one(query, (self.selected_course,))
+            course = self.get_course(self.selected_course)
             
             if not course or not course.get('start_date'):
                 QMessageBox.warning(self, "경고", "과정 시작일이 설정되지 않았습니다.")
@@ -498,454 +521,333 @@ class TimetableCreateDialog(QWidget):
             self.save_btn.setEnabled(True)
             self.export_btn.setEnabled(True)
             
-            QMessageBox.information(self, "완료", "시간표가 자동으로 생성되었습니다.")
+            message = "시간표가 자동으로 생성되었습니다."
+            if self.last_schedule is not None and self.last_schedule.instructors:
+                conflict_count = len(self.last_schedule.conflicts)
+                message += (f"\n\n👥 예비강사 대체: {self.last_schedule.substitutions}건"
+                            f"\n❗ 강사 중복 (대체 불가): {conflict_count}건")
+            QMessageBox.information(self, "완료", message)
             
         except Exception as e:
             self.progress.setVisible(False)
             QMessageBox.critical(self, "오류", f"시간표 생성 실패: {str(e)}")
     
-    def _make_subject_entry(self, subject, hours):
-        """과목 엔트리 생성 헬퍼"""
-        return {
-            'code': subject['code'],
-            'name': subject['name'],
-            'total_hours': subject['hours'],
-            'main_instructor': subject.get('main_instructor_name', '-'),
-            'assistant_instructor': subject.get('assistant_instructor_name', '-'),
-            'reserve_instructor': subject.get('reserve_instructor_name', '-'),
-            'hours': hours
-        }
+    def create_timetable(self, start_date, end_date):
+        """시간표 생성 - 요일 기반 배정 (utils.schedule_engine)
+        
+        Returns:
+            list: [{'date', 'am_subject', 'pm_subject'}, ...]
+        """
+        # 다른 과정에서 같은 반일에 수업 중인 주강사는 예비강사로 대체
+        conflicts = ConflictIndex.load(self.db, start_date, end_date, exclude_course=self.selected_course)
+        result = schedule(self.subjects, self.holidays, start_date, end_date, trace=print, conflicts=conflicts)
+        self.last_schedule = result
+        return result.to_timetable(self.subjects)
     
-    def _make_empty_entry(self):
-        """빈 시간 엔트리 생성 헬퍼"""
-        return {
-            'code': '',
-            'name': '-',
-            'total_hours': 0,
-            'main_instructor': '-',
-            'assistant_instructor': '-',
-            'reserve_instructor': '-',
-            'hours': 0
-        }
+    def optimize_assign(self):
+        """최적화 배정 (탐욕 배정과 벌점 비교)"""
+        if not self.selected_course or not self.subjects:
+            QMessageBox.warning(self, "경고", "과정과 과목을 먼저 선택하세요.")
+            return
+        
+        course = self.get_course(self.selected_course)
+        if not course or not course.get('start_date'):
+            QMessageBox.warning(self, "경고", "과정 시작일이 설정되지 않았습니다.")
+            return
+        
+        start_date = course['start_date']
+        end_date = course.get('lecture_end_date') or start_date + timedelta(days=100)
+        
+        self.optimize_btn.setEnabled(False)
+        self.auto_btn.setEnabled(False)
+        self.progress.setRange(0, 0)  # 진행률을 알 수 없으므로 바쁨 표시
+        self.progress.setVisible(True)
+        self.optimize_query.submit(self._optimize_timetable, [dict(s) for s in self.subjects],
+                                   set(self.holidays), start_date, end_date, self.selected_course)
     
-    def _find_most_remaining(self, remaining):
-        """가장 시수 많이 남은 과목 찾기"""
-        max_h = 0
-        best = None
-        for s in self.subjects:
-            h = remaining.get(s['code'], 0)
-            if h > max_h:
-                max_h = h
-                best = s
-        return best
+    @staticmethod
+    def _optimize_timetable(db, subjects, holidays, start_date, end_date, course_code):
+        """작업 스레드: 다른 과정 강사 배정을 읽고 최적화 배정 실행"""
+        conflicts = ConflictIndex.load(db, start_date, end_date, exclude_course=course_code)
+        return optimize(subjects, holidays, start_date, end_date, conflicts=conflicts)
     
-    def create_timetable(self, start_date, end_date):
-        """시간표 생성 - 완전히 단순화된 요일 기반 배정
-        
-        원칙:
-        1. 각 과목은 미리 지정된 요일(day_of_week)에만 배정
-        2. 격주 과목은 해당 주차에만 배정
-        3. 하루 = 8시간 (AM 4h + PM 4h), 1일 1과목 원칙
-        4. 모든 시수를 소진할 때까지 반복
-        
-        데이터베이스 필드:
-        - day_of_week: 0=월, 1=화, 2=수, 3=목, 4=금
-        - is_biweekly: True=격주, False=매주
-        - week_offset: 0=1주차, 1=2주차 (격주인 경우만 사용)
-        """
-        timetable = []
-        remaining = {s['code']: s['hours'] for s in self.subjects}
-        
-        print("\n" + "="*80)
-        print("🎯 시간표 생성 시작")
-        print(f"📅 기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
-        print(f"📚 과목 수: {len(self.subjects)}")
-        print(f"⏰ 총 시수: {sum(remaining.values())}시간")
-        
-        # 과목별 배정 요일 출력
-        day_names = ["월", "화", "수", "목", "금"]
-        print("\n📋 과목별 배정 정보:")
-        for s in self.subjects:
-            day = s.get('day_of_week')
-            day_str = day_names[day] if day is not None and 0 <= day <= 4 else "미설정"
-            biweekly = "격주" if s.get('is_biweekly') else "매주"
-            week = f"/{s.get('week_offset', 0)+1}주차" if s.get('is_biweekly') else ""
-            print(f"  • {s['name']:<25} : {day_str}요일, {biweekly}{week}, {s['hours']}시간")
-        print("="*80 + "\n")
-        
-        current_date = start_date
-        day_count = 0
-        
-        while current_date <= end_date and any(h > 0 for h in remaining.values()):
-            # 주말 스킵
-            if current_date.weekday() >= 5:
-                current_date += timedelta(days=1)
-                continue
-            
-            # 공휴일 스킵
-            if current_date in self.holidays:
-                print(f"🎊 {current_date.strftime('%Y-%m-%d')} - 공휴일 (스킵)")
-                current_date += timedelta(days=1)
-                continue
-            
-            # 현재 요일과 주차
-            weekday = current_date.weekday()  # 0=월, 1=화, 2=수, 3=목, 4=금
-            week_number = (current_date - start_date).days // 7  # 0부터 시작
-            
-            # 이 날짜에 배정할 과목 찾기
-            subject = None
-            candidates = []
-            
-            # 1단계: 요일이 일치하고 시수가 남은 과목 찾기
-            for s in self.subjects:
-                # 요일 체크
-                if s.get('day_of_week') != weekday:
-                    continue
-                
-                # 시수 체크
-                if remaining.get(s['code'], 0) <= 0:
-                    continue
-                
-                # 격주 체크
-                if s.get('is_biweekly', False):
-                    # 격주 과목: 주차 확인
-                    if week_number % 2 != s.get('week_offset', 0):
-                        continue
-                
-                candidates.append(s)
-            
-            # 2단계: 후보 중에서 선택 (시수가 많이 남은 것 우선)
-            if candidates:
-                subject = max(candidates, key=lambda x: remaining.get(x['code'], 0))
-            
-            # 3단계: 요일 매칭이 없으면 → 남은 시수가 있는 아무 과목이나 배정 (미완료 과목 방지)
-            if not subject:
-                # 요일 상관없이 시수가 남은 과목 찾기
-                any_remaining = []
-                for s in self.subjects:
-                    if remaining.get(s['code'], 0) > 0:
-                        any_remaining.append(s)
-                
-                if any_remaining:
-                    # 시수가 가장 많이 남은 과목 선택
-                    subject = max(any_remaining, key=lambda x: remaining.get(x['code'], 0))
-                    print(f"⚠️  {current_date.strftime('%Y-%m-%d')} ({day_names[weekday]}) - "
-                          f"요일 미지정 과목 우선 배정: {subject['name']}")
-                else:
-                    # 정말 모든 과목이 끝남
-                    print(f"✅ {current_date.strftime('%Y-%m-%d')} ({day_names[weekday]}) - 모든 과목 완료!")
-                    break
-            
-            # AM 시간 배정 (4시간)
-            code = subject['code']
-            am_hours = min(4, remaining[code])
-            am_subj = self._make_subject_entry(subject, am_hours) if am_hours > 0 else None
-            remaining[code] -= am_hours
-            
-            # 디버깅: 과목 코드 확인
-            if am_subj:
-                print(f"📅 {current_date.strftime('%m-%d')} AM: {am_subj['code']} ({am_subj['name']}) - {am_hours}h")
-            
-            # PM 시간 배정 (4시간)
-            # 1) 오전 과목이 끝났으면 (남은 시수 0) → 다른 과목 배정
-            # 2) 오전 과목이 계속되면 → 같은 과목 배정
-            pm_subject = None
-            pm_hours = 0
-            
-            if remaining[code] > 0:
-                # AM 과목이 계속됨
-                pm_subject = subject
-                pm_hours = min(4, remaining[code])
-            else:
-                # AM 과목 완료 → 남은 시수가 가장 많은 다른 과목 찾기
-                other_candidates = []
-                for s in self.subjects:
-                    if s['code'] == code:  # 같은 과목 제외
-                        continue
-                    if remaining.get(s['code'], 0) <= 0:  # 시수 없는 과목 제외
-                        continue
-                    other_candidates.append(s)
-                
-                if other_candidates:
-                    # 남은 시수가 가장 많은 과목 선택
-                    pm_subject = max(other_candidates, key=lambda x: remaining.get(x['code'], 0))
-                    pm_hours = min(4, remaining[pm_subject['code']])
-                    print(f"  ⚡ 오전 과목 완료 → 오후는 {pm_subject['name']} 배정")
-            
-            # PM 과목이 있으면 배정
-            pm_subj = None
-            if pm_subject and pm_hours > 0:
-                pm_subj = self._make_subject_entry(pm_subject, pm_hours)
-                remaining[pm_subject['code']] -= pm_hours
-                
-                # 디버깅: 과목 코드 확인
-                print(f"📅 {current_date.strftime('%m-%d')} PM: {pm_subj['code']} ({pm_subj['name']}) - {pm_hours}h")
-            
-            day_count += 1
-            
-            # 빈 슬롯 채우기
-            if not am_subj:
-                am_subj = self._make_empty_entry()
-            if not pm_subj:
-                pm_subj = self._make_empty_entry()
-            
-            timetable.append({
-                'date': current_date, 
-                'am_subject': am_subj, 
-                'pm_subject': pm_subj
-            })
-            
-            # 진행 상황 출력
-            biweekly_mark = "🔄" if subject.get('is_biweekly') else "📅"
-            if pm_subj and pm_subj.get('code') and am_subj.get('code') == pm_subj['code']:
-                # 같은 과목
-                print(f"{biweekly_mark} {current_date.strftime('%Y-%m-%d')} ({day_names[weekday]}) - "
-                      f"{subject['name']:<25} : AM {am_hours}h + PM {pm_hours}h = {am_hours + pm_hours}h "
-                      f"(남은 시수: {remaining.get(code, 0)}h)")
-            elif pm_subj and pm_subj.get('code'):
-                # 다른 과목
-                am_code = am_subj.get('code', '')
-                pm_code = pm_subj.get('code', '')
-                print(f"{biweekly_mark} {current_date.strftime('%Y-%m-%d')} ({day_names[weekday]}) - "
-                      f"AM: {am_subj.get('name', '-'):<20} {am_hours}h (남은: {remaining.get(am_code, 0)}h) | "
-                      f"PM: {pm_subj.get('name', '-'):<20} {pm_hours}h (남은: {remaining.get(pm_code, 0)}h)")
-            else:
-                # AM만 있음
-                am_code = am_subj.get('code', '')
-                print(f"{biweekly_mark} {current_date.strftime('%Y-%m-%d')} ({day_names[weekday]}) - "
-                      f"AM: {am_subj.get('name', '-'):<20} {am_hours}h (남은: {remaining.get(am_code, 0)}h) | PM: -")
-            
-            current_date += timedelta(days=1)
-        
-        # 최종 결과
-        print("\n" + "="*80)
-        print("✅ 시간표 생성 완료")
-        print(f"📊 총 {day_count}일 배정")
-        print(f"⏰ 배정된 시수: {sum(s['hours'] for s in self.subjects) - sum(remaining.values())}시간")
-        
-        # 미완료 과목 확인
-        incomplete = {k: v for k, v in remaining.items() if v > 0}
-        if incomplete:
-            print("\n⚠️  미완료 과목:")
-            for code, hours in incomplete.items():
-                subject_name = next((s['name'] for s in self.subjects if s['code'] == code), code)
-                print(f"  • {subject_name}: {hours}시간 남음")
-        else:
-            print("\n🎉 모든 과목 시수 배정 완료!")
-        
-        print("="*80 + "\n")
-        
-        return timetable
+    def _optimize_finished(self):
+        self.progress.setVisible(False)
+        self.progress.setRange(0, 100)
+        self.optimize_btn.setEnabled(bool(self.selected_course))
+        self.auto_btn.setEnabled(bool(self.selected_course))
     
-    def display_timetable(self, timetable):
-        """시간표 테이블에 표시"""
-        self.timetable_table.setRowCount(len(timetable))
-        
-        # 주차별 파스텔 오렌지 색상 팔레트
-        week_colors = [
-            QColor(255, 229, 204),  # 연한 오렌지 1
-            QColor(255, 218, 185),  # 연한 오렌지 2
-            QColor(255, 239, 213),  # 연한 피치
-            QColor(255, 228, 196),  # 비스크
-            QColor(255, 235, 205),  # 블랜치드 아몬드
-        ]
+    def on_optimized(self, outcome):
+        """최적화 배정 결과 표시"""
+        self._optimize_finished()
+        self.last_schedule = outcome.result
+        self.current_timetable = outcome.result.to_timetable(self.subjects)
+        self.display_timetable(self.current_timetable)
+        self.save_btn.setEnabled(True)
+        self.export_btn.setEnabled(True)
+        
+        summary = ("탐욕 배정보다 나은 시간표를 찾았습니다." if outcome.improved
+                   else "탐욕 배정보다 나은 시간표를 찾지 못해 탐욕 배정 결과를 표시합니다.")
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Information)
+        msg.setWindowTitle("최적화 배정 완료")
+        msg.setText(f"{summary}\n\n벌점: 탐욕 {outcome.baseline_score.total} → "
+                    f"최적화 {outcome.score.total} (낮을수록 좋음)")
+        msg.setDetailedText("\n".join(outcome.report()))
+        msg.exec_()
+    
+    def on_optimize_failed(self, message):
+        self._optimize_finished()
+        QMessageBox.critical(self, "오류", f"최적화 배정 실패: {message}")
+    
+    # 주차별 파스텔 오렌지 색상 팔레트
+    WEEK_COLORS = [
+        QColor(255, 229, 204),  # 연한 오렌지 1
+        QColor(255, 218, 185),  # 연한 오렌지 2
+        QColor(255, 239, 213),  # 연한 피치
+        QColor(255, 228, 196),  # 비스크
+        QColor(255, 235, 205),  # 블랜치드 아몬드
+    ]
+    
+    def _timetable_columns(self):
+        """시간표 테이블 컬럼 정의 (행: display_timetable이 만든 표시용 dict)"""
+        center = Qt.AlignCenter
+        week_font = QFont("맑은 고딕", 11, QFont.Bold)
+        
+        def week_background(row):
+            return row['week_color']
         
-        # 과목별 누적 시수 계산
-        subject_accumulated = {}
+        def slot_background(slot):
+            def background(row):
+                subject = row['entry'].get(slot)
+                if subject and subject.get('code'):
+                    return self.subject_colors.get(subject['code'], QColor(200, 200, 200))
+                return None
+            return background
         
-        # 시작일 기준으로 주차 계산
-        if timetable:
-            start_date = timetable[0]['date']
+        conflict_color = QColor(255, 190, 190)
         
+        def conflict_note(row):
+            # 다른 과정과 강사가 겹치는 반일 (자동 배정 때 표시한 항목)
+            notes = []
+            for slot, label in (('am_subject', "AM"), ('pm_subject', "PM")):
+                subject = row['entry'].get(slot) or {}
+                if subject.get('conflict_course'):
+                    notes.append(f"{label}: 강사 중복 ({subject['conflict_course']})")
+                elif subject.get('substituted'):
+                    notes.append(f"{label}: 주강사 다른 과정 수업 중 → 예비강사 배정")
+            return "\n".join(notes) or self._instructor_text(row['entry'], 'main_instructor')
+        
+        def main_instructor_background(row):
+            for slot in ('am_subject', 'pm_subject'):
+                if (row['entry'].get(slot) or {}).get('conflict_course'):
+                    return conflict_color
+            return week_background(row)
+        
+        def instructor_column(header, key):
+            return Column(header, lambda row: self._instructor_text(row['entry'], key),
+                          background=week_background, alignment=center)
+        
+        return [
+            Column("주차", lambda row: f"{row['week']}주차" if row['week_start'] else None,
+                   background=lambda row: self.WEEK_COLORS[(row['week'] - 1) % len(self.WEEK_COLORS)],
+                   alignment=center, font=lambda row: week_font),
+            Column("날짜", lambda row: row['entry']['date'].strftime("%Y-%m-%d (%a)"),
+                   background=week_background),
+            Column("오전(09:00-13:00)", lambda row: self._slot_text(row['entry'].get('am_subject'), row['am_acc']),
+                   background=slot_background('am_subject'), alignment=center,
+                   tooltip=lambda row: self._slot_tooltip(row['entry'].get('am_subject'), row['am_acc'], "AM")),
+            Column("오후(14:00-18:00)", lambda row: self._slot_text(row['entry'].get('pm_subject'), row['pm_acc']),
+                   background=slot_background('pm_subject'), alignment=center,
+                   tooltip=lambda row: self._slot_tooltip(row['entry'].get('pm_subject'), row['pm_acc'], "PM")),
+            Column("주강사", lambda row: self._instructor_text(row['entry'], 'main_instructor'),
+                   background=main_instructor_background, alignment=center, tooltip=conflict_note),
+            instructor_column("보조강사", 'assistant_instructor'),
+            instructor_column("예비강사", 'reserve_instructor'),
+            Column("진행도", lambda row: f"{row['progress']:.1f}%",
+                   background=week_background, alignment=center),
+        ]
+    
+    @staticmethod
+    def _slot_text(subject, accumulated):
+        """오전/오후 셀 텍스트 (과목명 축약 + 누적 시수)"""
+        if not subject or not subject.get('code'):
+            return "-"
+        name = subject['name']
+        short = name[:10] + "..." if len(name) > 10 else name
+        return f"{short}..({accumulated}h/{subject['total_hours']}h)"
+    
+    @staticmethod
+    def _slot_tooltip(subject, accumulated, label):
+        """오전/오후 셀 툴팁"""
+        if not subject or not subject.get('code'):
+            return "-"
+        return (f"{subject['name']}\n오늘 {label}: {subject.get('hours', 0)}h\n"
+                f"누적: {accumulated}h / {subject['total_hours']}h")
+    
+    @staticmethod
+    def _instructor_text(entry, key):
+        """강사 셀 텍스트 (오전/오후 과목이 다르면 둘 다 표시)"""
+        am_subject = entry.get('am_subject', {})
+        pm_subject = entry.get('pm_subject', {})
+        if am_subject and pm_subject:
+            if am_subject['code'] == pm_subject['code']:
+                return am_subject.get(key, '-')
+            return f"{am_subject.get(key, '-')} / {pm_subject.get(key, '-')}"
+        if am_subject:
+            return am_subject.get(key, '-')
+        if pm_subject:
+            return pm_subject.get(key, '-')
+        return '-'
+    
+    def display_timetable(self, timetable):
+        """시간표 테이블에 표시
+        
+        셀 아이템을 만들지 않고 행마다 주차/누적 시수만 계산해서 모델에 넘긴다.
+        (셀 텍스트와 색상은 뷰가 화면에 보이는 셀만 요청할 때 만들어짐)
+        """
+        rows = []
+        self.subject_rows = {}  # 과목 코드 → 해당 과목이 있는 행 번호 (오름차순)
+        start_date = timetable[0]['date'] if timetable else None
         previous_week = None
-        week_start_row = 0
         
         for i, entry in enumerate(timetable):
-            am_subject = entry.get('am_subject', {})
-            pm_subject = entry.get('pm_subject', {})
-            
             # 주차 계산 (시작일 기준)
-            current_date = entry['date']
-            days_diff = (current_date - start_date).days
-            week_number = (days_diff // 7) + 1
-            
-            # 주차가 바뀔 때 이전 주차 셀 병합
-            if previous_week is not None and week_number != previous_week:
-                # 이전 주차의 셀들을 병합
-                if i - week_start_row > 1:  # 2개 이상의 행이 있을 때만 병합
-                    self.timetable_table.setSpan(week_start_row, 0, i - week_start_row, 1)
-                week_start_row = i
-            
-            # 주차별 배경색 선택 (순환)
-            base_color = week_colors[(week_number - 1) % len(week_colors)]
+            week_number = (entry['date'] - start_date).days // 7 + 1
+            is_week_start = (week_number != previous_week)
+            previous_week = week_number
             
-            # 주차가 바뀌는 첫 행은 약간 더 진한 색으로 강조
-            is_week_start = (previous_week is None or week_number != previous_week)
+            # 주차별 배경색 (주차가 바뀌는 첫 행은 약간 더 진한 색으로 강조)
+            base_color = self.WEEK_COLORS[(week_number - 1) % len(self.WEEK_COLORS)]
             if is_week_start:
-                # 첫 행은 약간 더 진한 색
-                week_bg_color = QColor(
+                week_color = QColor(
                     max(base_color.red() - 20, 0),
                     max(base_color.green() - 20, 0),
                     max(base_color.blue() - 20, 0)
                 )
             else:
-                week_bg_color = base_color
-            
-            # 주차 표시 (첫 번째 행에만 설정, 병합 후 자동으로 표시됨)
-            if is_week_start:
-                week_item = QTableWidgetItem(f"{week_number}주차")
-                week_item.setTextAlignment(Qt.AlignCenter)
-                week_item.setBackground(QBrush(base_color))
-                week_item.setFont(QFont("맑은 고딕", 11, QFont.Bold))
-                self.timetable_table.setItem(i, 0, week_item)
-            
-            previous_week = week_number
-            
-            # 날짜
-            date_str = entry['date'].strftime("%Y-%m-%d (%a)")
-            date_item = QTableWidgetItem(date_str)
-            date_item.setData(Qt.UserRole, entry)  # 데이터 저장
-            date_item.setBackground(QBrush(week_bg_color))
-            self.timetable_table.setItem(i, 1, date_item)
-            
-            # 오전 과목 표시
-            if am_subject and am_subject.get('code'):
-                am_code = am_subject['code']
-                am_name = am_subject['name']
-                am_total = am_subject['total_hours']
-                am_hours_today = am_subject.get('hours', 0)
-                
-                # 누적 시수 계산 (오전)
-                if am_code not in subject_accumulated:
-                    subject_accumulated[am_code] = 0
-                subject_accumulated[am_code] += am_hours_today
-                am_accumulated = subject_accumulated[am_code]
-                
-                # 과목명 축약
-                if len(am_name) > 10:
-                    am_short = am_name[:10] + "..."
-                else:
-                    am_short = am_name
-                
-                # 누적 시수 표시
-                am_text = f"{am_short}..({am_accumulated}h/{am_total}h)"
-                am_item = QTableWidgetItem(am_text)
-                am_item.setToolTip(f"{am_name}\n오늘 AM: {am_hours_today}h\n누적: {am_accumulated}h / {am_total}h")
-                am_color = self.subject_colors.get(am_code, QColor(200, 200, 200))
-                am_item.setBackground(QBrush(am_color))
-                am_item.setTextAlignment(Qt.AlignCenter)
-                self.timetable_table.setItem(i, 2, am_item)
-            else:
-                empty_am = QTableWidgetItem("-")
-                empty_am.setTextAlignment(Qt.AlignCenter)
-                self.timetable_table.setItem(i, 2, empty_am)
-            
-            # 오후 과목 표시
-            if pm_subject and pm_subject.get('code'):
-                pm_code = pm_subject['code']
-                pm_name = pm_subject['name']
-                pm_total = pm_subject['total_hours']
-                pm_hours_today = pm_subject.get('hours', 0)
-                
-                # 누적 시수 계산 (오후)
-                if pm_code not in subject_accumulated:
-                    subject_accumulated[pm_code] = 0
-                subject_accumulated[pm_code] += pm_hours_today
-                pm_accumulated = subject_accumulated[pm_code]
-                
-                # 과목명 축약
-                if len(pm_name) > 10:
-                    pm_short = pm_name[:10] + "..."
-                else:
-                    pm_short = pm_name
-                
-                # 누적 시수 표시
-                pm_text = f"{pm_short}..({pm_accumulated}h/{pm_total}h)"
-                pm_item = QTableWidgetItem(pm_text)
-                pm_item.setToolTip(f"{pm_name}\n오늘 PM: {pm_hours_today}h\n누적: {pm_accumulated}h / {pm_total}h")
-                pm_color = self.subject_colors.get(pm_code, QColor(200, 200, 200))
-                pm_item.setBackground(QBrush(pm_color))
-                pm_item.setTextAlignment(Qt.AlignCenter)
-                self.timetable_table.setItem(i, 3, pm_item)
-            else:
-                empty_pm = QTableWidgetItem("-")
-                empty_pm.setTextAlignment(Qt.AlignCenter)
-                self.timetable_table.setItem(i, 3, empty_pm)
-            
-            # 주강사 (오전 과목 기준, 오전/오후 다르면 둘 다 표시)
-            if am_subject and pm_subject:
-                if am_subject['code'] == pm_subject['code']:
-                    instructor_text = am_subject.get('main_instructor', '-')
-                else:
-                    instructor_text = f"{am_subject.get('main_instructor', '-')} / {pm_subject.get('main_instructor', '-')}"
-            elif am_subject:
-                instructor_text = am_subject.get('main_instructor', '-')
-            elif pm_subject:
-                instructor_text = pm_subject.get('main_instructor', '-')
-            else:
-                instructor_text = '-'
-            
-            main_instructor_item = QTableWidgetItem(instructor_text)
-            main_instructor_item.setTextAlignment(Qt.AlignCenter)
-            main_instructor_item.setBackground(QBrush(week_bg_color))
-            self.timetable_table.setItem(i, 4, main_instructor_item)
-            
-            # 보조강사
-            if am_subject and pm_subject:
-                if am_subject['code'] == pm_subject['code']:
-                    assist_text = am_subject.get('assistant_instructor', '-')
-                else:
-                    assist_text = f"{am_subject.get('assistant_instructor', '-')} / {pm_subject.get('assistant_instructor', '-')}"
-            elif am_subject:
-                assist_text = am_subject.get('assistant_instructor', '-')
-            elif pm_subject:
-                assist_text = pm_subject.get('assistant_instructor', '-')
-            else:
-                assist_text = '-'
-            
-            assistant_instructor_item = QTableWidgetItem(assist_text)
-            assistant_instructor_item.setTextAlignment(Qt.AlignCenter)
-            assistant_instructor_item.setBackground(QBrush(week_bg_color))
-            self.timetable_table.setItem(i, 5, assistant_instructor_item)
-            
-            # 예비강사
-            if am_subject and pm_subject:
-                if am_subject['code'] == pm_subject['code']:
-                    reserve_text = am_subject.get('reserve_instructor', '-')
-                else:
-                    reserve_text = f"{am_subject.get('reserve_instructor', '-')} / {pm_subject.get('reserve_instructor', '-')}"
-            elif am_subject:
-                reserve_text = am_subject.get('reserve_instructor', '-')
-            elif pm_subject:
-                reserve_text = pm_subject.get('reserve_instructor', '-')
-            else:
-                reserve_text = '-'
-            
-            reserve_instructor_item = QTableWidgetItem(reserve_text)
-            reserve_instructor_item.setTextAlignment(Qt.AlignCenter)
-            reserve_instructor_item.setBackground(QBrush(week_bg_color))
-            self.timetable_table.setItem(i, 6, reserve_instructor_item)
-            
-            # 진행도 표시 (오전 과목 기준)
-            if am_subject:
-                am_code = am_subject['code']
-                am_total = am_subject['total_hours']
-                am_accumulated = subject_accumulated.get(am_code, 0)
-                progress_percent = (am_accumulated / am_total * 100) if am_total > 0 else 0
-            else:
-                progress_percent = 0
-            
-            progress_item = QTableWidgetItem(f"{progress_percent:.1f}%")
-            progress_item.setTextAlignment(Qt.AlignCenter)
-            progress_item.setBackground(QBrush(week_bg_color))
-            self.timetable_table.setItem(i, 7, progress_item)
-        
-        # 마지막 주차 병합 처리
-        if len(timetable) - week_start_row > 1:
-            self.timetable_table.setSpan(week_start_row, 0, len(timetable) - week_start_row, 1)
+                week_color = base_color
+            
+            rows.append({
+                'entry': entry,
+                'week': week_number,
+                'week_start': is_week_start,
+                'week_color': week_color,
+                'am_acc': 0,
+                'pm_acc': 0,
+                'progress': 0,
+            })
+            for code in self._entry_codes(entry):
+                self.subject_rows.setdefault(code, []).append(i)
+        
+        self.timetable_model.set_rows(rows)
+        self._accumulate_hours(self.subject_rows.keys(), 0)
+        
+        # 주차 셀 병합 (2개 이상의 행이 있을 때만)
+        self.timetable_table.clearSpans()
+        week_start_row = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i]['week_start']:
+                if i - week_start_row > 1:
+                    self.timetable_table.setSpan(week_start_row, 0, i - week_start_row, 1)
+                week_start_row = i
+    
+    @staticmethod
+    def _entry_codes(entry):
+        """하루 일정에 배정된 과목 코드 (오전, 오후 순서, 중복 제외)"""
+        codes = []
+        for slot in ('am_subject', 'pm_subject'):
+            subject = entry.get(slot)
+            if subject and subject.get('code') and subject['code'] not in codes:
+                codes.append(subject['code'])
+        return codes
+    
+    def _accumulate_hours(self, codes, first_row):
+        """codes 과목의 누적 시수와 진행도를 first_row 행부터 다시 계산
+        
+        subject_rows로 해당 과목이 있는 행만 찾아가므로 다른 과목 행은 건드리지 않는다.
+        first_row 이전 누적값은 직전 등장 행에 저장된 값을 그대로 이어받는다.
+        
+        Returns:
+            list: 값이 다시 계산된 행 번호
+        """
+        rows = self.timetable_model.rows
+        changed = []
+        for code in codes:
+            occurrences = self.subject_rows.get(code, [])
+            i = bisect_left(occurrences, first_row)
+            total = self._accumulated_at(rows[occurrences[i - 1]], code) if i > 0 else 0
+            for r in occurrences[i:]:
+                row = rows[r]
+                am_subject = row['entry'].get('am_subject')
+                pm_subject = row['entry'].get('pm_subject')
+                if am_subject and am_subject.get('code') == code:
+                    total += am_subject.get('hours', 0)
+                    row['am_acc'] = total
+                if pm_subject and pm_subject.get('code') == code:
+                    total += pm_subject.get('hours', 0)
+                    row['pm_acc'] = total
+                changed.append(r)
+        
+        for r in changed:
+            rows[r]['progress'] = self._row_progress(rows[r])
+        return changed
     
-    def on_cell_clicked(self, row, column):
+    @staticmethod
+    def _accumulated_at(row, code):
+        """행 끝 시점의 code 과목 누적 시수"""
+        pm_subject = row['entry'].get('pm_subject')
+        if pm_subject and pm_subject.get('code') == code:
+            return row['pm_acc']
+        return row['am_acc']
+    
+    def _row_progress(self, row):
+        """진행도 (오전 과목 기준, 그날 오후까지 누적)"""
+        am_subject = row['entry'].get('am_subject')
+        if not am_subject or not am_subject.get('code'):
+            return 0
+        am_total = am_subject.get('total_hours') or 0
+        if am_total <= 0:
+            return 0
+        return self._accumulated_at(row, am_subject['code']) / am_total * 100
+    
+    def update_subject_at(self, row, old_code):
+        """row 행의 오전/오후 과목이 old_code에서 바뀐 뒤 영향받는 행만 다시 계산/표시
+        
+        바뀐 두 과목의 누적 시수만 row 행부터 갱신하고, 값이 바뀐 행만 다시 그린다.
+        (주차 병합과 색상은 그대로 유지)
+        """
+        rows = self.timetable_model.rows
+        new_codes = self._entry_codes(rows[row]['entry'])
+        codes = set(new_codes)
+        if old_code:
+            codes.add(old_code)
+        
+        # 과목별 등장 행 목록 갱신
+        for code in codes:
+            occurrences = self.subject_rows.setdefault(code, [])
+            i = bisect_left(occurrences, row)
+            present = i < len(occurrences) and occurrences[i] == row
+            if code in new_codes and not present:
+                insort(occurrences, row)
+            elif code not in new_codes and present:
+                del occurrences[i]
+        
+        changed = set(self._accumulate_hours(codes, row))
+        changed.add(row)
+        for r in sorted(changed):
+            self.timetable_model.refresh_rows(r, r)
+    
+    def clear_timetable(self):
+        """시간표 표시 초기화"""
+        self.current_timetable = []
+        self.timetable_model.set_rows([])
+        self.timetable_table.clearSpans()
+    
+    def on_cell_clicked(self, index):
         """셀 클릭 시 수정 가능"""
+        row = index.row()
+        column = index.column()
         if not self.current_timetable or row >= len(self.current_timetable):
             return
         
@@ -975,8 +877,8 @@ class TimetableCreateDialog(QWidget):
                         am_subject['assistant_instructor'] = new_subject.get('assistant_instructor_name') or '-'
                         am_subject['reserve_instructor'] = new_subject.get('reserve_instructor_name') or '-'
                         
-                        # 테이블 전체 다시 표시 (진행도 재계산 필요)
-                        self.display_timetable(self.current_timetable)
+                        # 바뀐 과목이 있는 행만 누적 시수/진행도 재계산
+                        self.update_subject_at(row, current_code)
         
         elif column == 3:  # 오후 과목 - 과목 변경
             if not pm_subject:
@@ -1000,8 +902,8 @@ class TimetableCreateDialog(QWidget):
                         pm_subject['assistant_instructor'] = new_subject.get('assistant_instructor_name') or '-'
                         pm_subject['reserve_instructor'] = new_subject.get('reserve_instructor_name') or '-'
                         
-                        # 테이블 전체 다시 표시 (진행도 재계산 필요)
-                        self.display_timetable(self.current_timetable)
+                        # 바뀐 과목이 있는 행만 누적 시수/진행도 재계산
+                        self.update_subject_at(row, current_code)
         
         elif column == 4:  # 주강사 클릭 - 예비강사와 교체
             # 오전/오후 같은 과목인지 확인
@@ -1025,8 +927,7 @@ class TimetableCreateDialog(QWidget):
                             pm_subject['reserve_instructor'], pm_subject['main_instructor']
                         
                         # 테이블 업데이트
-                        self.timetable_table.item(row, 4).setText(am_subject['main_instructor'])
-                        self.timetable_table.item(row, 6).setText(am_subject['reserve_instructor'])
+                        self.timetable_model.refresh_rows(row, row)
             else:
                 # 다른 과목 - 둘 다 교체
                 QMessageBox.information(self, "알림", 
@@ -1056,7 +957,7 @@ class TimetableCreateDialog(QWidget):
                 if pm_subject:
                     pm_subject['assistant_instructor'] = new_value
                 
-                self.timetable_table.item(row, 5).setText(new_value)
+                self.timetable_model.refresh_rows(row, row)
         
         elif column == 6:  # 예비강사 클릭 - 주강사와 교체
             # 오전/오후 같은 과목인지 확인
@@ -1080,72 +981,58 @@ class TimetableCreateDialog(QWidget):
                             pm_subject['main_instructor'], pm_subject['reserve_instructor']
                         
                         # 테이블 업데이트
-                        self.timetable_table.item(row, 4).setText(am_subject['main_instructor'])
-                        self.timetable_table.item(row, 6).setText(am_subject['reserve_instructor'])
+                        self.timetable_model.refresh_rows(row, row)
             else:
                 # 다른 과목 - 둘 다 교체
                 QMessageBox.information(self, "알림", 
                     "오전과 오후 과목이 다릅니다.\n각 과목의 셀을 따로 클릭하여 교체해주세요.")
     
     def save_timetable(self):
-        """시간표 저장"""
+        """시간표 저장
+        
+        저장된 행과 현재 시간표를 (날짜, 시작시간) 기준으로 비교해서
+        바뀐 행만 INSERT/UPDATE/DELETE 한다. (변경 없는 행은 id/created_at 유지)
+        """
         if not self.current_timetable:
             QMessageBox.warning(self, "경고", "저장할 시간표가 없습니다.")
             return
         
         try:
-            # 기존 시간표 삭제 (있다면)
-            delete_query = "DELETE FROM timetables WHERE course_code = %s AND type = 'lecture'"
-            self.db.execute_query(delete_query, (self.selected_course,))
+            if not self.db.connect():
+                QMessageBox.critical(self, "오류", "데이터베이스 연결 실패")
+                return
             
-            # 새 시간표 저장
-            insert_query = """
-                INSERT INTO timetables 
-                (course_code, subject_code, class_date, start_time, end_time, instructor_code, type)
-                VALUES (%s, %s, %s, %s, %s, %s, 'lecture')
-            """
+            # 강사 이름 → 코드 (한 번만 조회)
+            instructor_codes = {}
+            for row in get_reference_cache().rows('instructors', self.db):
+                instructor_codes.setdefault(row['name'], row['code'])
             
+            # 현재 시간표: (날짜, 시작시간) → (과목코드, 종료시간, 강사코드)
+            desired = {}
             for entry in self.current_timetable:
-                am_subject = entry.get('am_subject', {})
-                pm_subject = entry.get('pm_subject', {})
-                
-                # 오전 시간표 저장
-                if am_subject:
-                    instructor_code = None
-                    main_instructor = am_subject.get('main_instructor', '-')
-                    if main_instructor and main_instructor != '-':
-                        query = "SELECT code FROM instructors WHERE name = %s LIMIT 1"
-                        result = self.db.fetch_one(query, (main_instructor,))
-                        if result:
-                            instructor_code = result['code']
-                    
-                    self.db.execute_query(insert_query, (
-                        self.selected_course,
-                        am_subject['code'],
-                        entry['date'],
-                        time(9, 0),
-                        time(13, 0),
-                        instructor_code
-                    ))
-                
-                # 오후 시간표 저장
-                if pm_subject:
-                    instructor_code = None
-                    main_instructor = pm_subject.get('main_instructor', '-')
-                    if main_instructor and main_instructor != '-':
-                        query = "SELECT code FROM instructors WHERE name = %s LIMIT 1"
-                        result = self.db.fetch_one(query, (main_instructor,))
-                        if result:
-                            instructor_code = result['code']
+                class_date = to_date(entry['date'])
+                for subject, start, end in ((entry.get('am_subject'), time(9, 0), time(13, 0)),
+                                            (entry.get('pm_subject'), time(14, 0), time(18, 0))):
+                    # 빈 슬롯은 저장하지 않음
+                    if not subject or not subject.get('code'):
+                        continue
                     
-                    self.db.execute_query(insert_query, (
-                        self.selected_course,
-                        pm_subject['code'],
-                        entry['date'],
-                        time(14, 0),
-                        time(18, 0),
-                        instructor_code
-                    ))
+                    main_instructor = subject.get('main_instructor', '-')
+                    instructor_code = instructor_codes.get(main_instructor) if main_instructor != '-' else None
+                    desired[(class_date, start)] = (subject['code'], end, instructor_code)
+            
+            # 다른 과정과 강사가 겹치는 배정 확인 (한 번의 쿼리)
+            conflicts = find_conflicts(self.db, self.selected_course, [
+                (instructor_code, class_date, start, end)
+                for (class_date, start), (_, end, instructor_code) in desired.items()
+            ])
+            if conflicts and not self._confirm_conflicts(conflicts):
+                return
+            
+            # 조회/비교/저장을 한 트랜잭션으로 (조회가 실패하면 아무것도 쓰지 않음)
+            inserted, updated, deleted = save_lecture_rows(self.db, self.selected_course, desired)
+            
+            print(f"💾 시간표 저장: 추가 {inserted}, 수정 {updated}, 삭제 {deleted}")
             
             self.delete_btn.setEnabled(True)
             QMessageBox.information(self, "완료", "시간표가 저장되었습니다.")
@@ -1153,6 +1040,23 @@ class TimetableCreateDialog(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "오류", f"시간표 저장 실패: {str(e)}")
     
+    def _confirm_conflicts(self, conflicts, limit=10):
+        """강사 중복 목록을 보여주고 그래도 저장할지 확인"""
+        lines = [
+            f"{c.class_date.strftime('%Y-%m-%d')} {'오전' if c.slot == 'am' else '오후'} - "
+            f"{c.instructor_name or c.instructor_code}: {c.course_name or c.course_code} 수업 중"
+            for c in conflicts[:limit]
+        ]
+        if len(conflicts) > limit:
+            lines.append(f"... 외 {len(conflicts) - limit}건")
+        reply = QMessageBox.question(
+            self, "강사 중복",
+            f"다른 과정과 강사 일정이 겹치는 수업이 {len(conflicts)}건 있습니다.\n\n"
+            + "\n".join(lines) + "\n\n그래도 저장하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        return reply == QMessageBox.Yes
+    
     def export_excel(self):
         """Excel 내보내기"""
         if not self.current_timetable:
@@ -1425,8 +1329,7 @@ class TimetableCreateDialog(QWidget):
                 self.db.execute_query(delete_query, (self.selected_course,))
                 
                 # 테이블 초기화
-                self.timetable_table.setRowCount(0)
-                self.current_timetable = []
+                self.clear_timetable()
                 self.save_btn.setEnabled(False)
                 self.export_btn.setEnabled(False)
                 self.delete_btn.setEnabled(False)
@@ -6,15 +6,18 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QComboBox, QMessageBox, QGroupBox,
                              QGridLayout, QDateEdit, QTimeEdit, QTextEdit,
-                             QProgressBar)
+                             QProgressBar, QListWidget, QListWidgetItem, QCheckBox)
 from PyQt5.QtCore import Qt, QDate, QTime
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
+from database.async_query import AsyncQuery
 from utils.timetable_generator import TimetableGenerator
+from utils.batch_timetable import generate_batch
 
 
 class TimetableGenerateDialog(QDialog):
@@ -148,6 +151,11 @@ class TimetableGenerateDialog(QDialog):
         self.generate_btn.clicked.connect(self.generate_timetable)
         btn_layout.addWidget(self.generate_btn)
         
+        self.batch_btn = QPushButton("여러 과정 일괄 생성")
+        self.batch_btn.setStyleSheet("background-color: #FF9800; color: white; padding: 10px 25px;")
+        self.batch_btn.clicked.connect(self.open_batch_dialog)
+        btn_layout.addWidget(self.batch_btn)
+        
         self.delete_btn = QPushButton("시간표 삭제")
         self.delete_btn.setStyleSheet("background-color: #f44336; color: white; padding: 10px 25px;")
         self.delete_btn.clicked.connect(self.delete_timetable)
@@ -170,8 +178,7 @@ class TimetableGenerateDialog(QDialog):
             return
         
         try:
-            query = "SELECT code, name, lecture_hours, project_hours, internship_hours FROM courses ORDER BY code"
-            rows = self.db.fetch_all(query)
+            rows = get_reference_cache().rows('courses', self.db)
             
             self.course_combo.clear()
             self.course_combo.addItem("선택하세요", None)
@@ -211,19 +218,17 @@ class TimetableGenerateDialog(QDialog):
         start_date = self.start_date.date().toPyDate()
         
         # 예상 날짜 계산
-        holidays = self.generator.get_holidays()
-        
         lecture_days = self.generator.calculate_working_days(course['lecture_hours'], 8)
-        lecture_dates = self.generator.generate_dates(datetime.combine(start_date, datetime.min.time()), lecture_days, holidays)
+        lecture_dates = self.generator.generate_dates(start_date, lecture_days)
         
-        project_start = lecture_dates[-1] + timedelta(days=1) if lecture_dates else datetime.combine(start_date, datetime.min.time())
+        project_start = lecture_dates[-1] + timedelta(days=1) if lecture_dates else start_date
         project_days = self.generator.calculate_working_days(course['project_hours'], 8)
-        project_dates = self.generator.generate_dates(project_start, project_days, holidays)
+        project_dates = self.generator.generate_dates(project_start, project_days)
         
         if course['internship_hours'] > 0:
             internship_start = project_dates[-1] + timedelta(days=1) if project_dates else project_start
             internship_days = self.generator.calculate_working_days(course['internship_hours'], 8)
-            internship_dates = self.generator.generate_dates(internship_start, internship_days, holidays)
+            internship_dates = self.generator.generate_dates(internship_start, internship_days)
         else:
             internship_dates = []
         
@@ -314,6 +319,10 @@ class TimetableGenerateDialog(QDialog):
   • 인턴쉽일수: {details['internship_days']}일
   • 총 수업일수: {details['total_days']}일
   • 총 항목 수: {details['total_entries']}개
+
+👥 강사 배정:
+  • 예비강사 대체: {details.get('instructor_substitutions', 0)}건
+  • 강사 중복 (대체 불가): {details.get('instructor_conflicts', 0)}건
                 """
                 
                 self.result_text.setText(result_text)
@@ -323,6 +332,12 @@ class TimetableGenerateDialog(QDialog):
             else:
                 QMessageBox.critical(self, "오류", result['message'])
     
+    def open_batch_dialog(self):
+        """여러 과정 일괄 생성 창 (현재 수업 시간 설정 사용)"""
+        dialog = BatchGenerateDialog(self.start_time.time().toString("HH:mm"),
+                                     self.end_time.time().toString("HH:mm"), self)
+        dialog.exec_()
+    
     def delete_timetable(self):
         """시간표 삭제"""
         course = self.course_combo.currentData()
@@ -351,3 +366,139 @@ class TimetableGenerateDialog(QDialog):
         """닫기 이벤트"""
         self.db.disconnect()
         event.accept()
+
+
+class BatchGenerateDialog(QDialog):
+    """여러 과정 시간표 일괄 생성 다이얼로그
+    
+    선택한 과정을 각 과정의 시작일 기준으로 작업 프로세스에서 병렬 생성하고,
+    과정 간 강사 중복을 확인한 뒤 하나의 트랜잭션으로 저장한다.
+    """
+    
+    def __init__(self, start_time="09:00", end_time="18:00", parent=None):
+        super().__init__(parent)
+        self.db = DatabaseManager()
+        self.start_time = start_time
+        self.end_time = end_time
+        self.init_ui()
+        
+    def init_ui(self):
+        """UI 초기화"""
+        self.setWindowTitle("여러 과정 시간표 일괄 생성")
+        self.setGeometry(250, 200, 700, 600)
+        
+        layout = QVBoxLayout()
+        
+        info = QLabel(f"📌 선택한 과정의 기존 시간표를 지우고 과정 시작일부터 새로 생성합니다.\n"
+                      f"• 수업 시간: {self.start_time} ~ {self.end_time}\n"
+                      f"• 과정 간 강사가 겹치면 예비강사로 대체하고, 대체할 수 없으면 결과에 표시합니다")
+        info.setStyleSheet("background-color: #FFF3E0; padding: 10px; border-radius: 5px;")
+        layout.addWidget(info)
+        
+        self.course_list = QListWidget()
+        layout.addWidget(self.course_list)
+        
+        option_layout = QHBoxLayout()
+        self.all_check = QCheckBox("전체 선택")
+        self.all_check.toggled.connect(self.toggle_all)
+        option_layout.addWidget(self.all_check)
+        self.dry_run_check = QCheckBox("저장하지 않고 미리 확인")
+        option_layout.addWidget(self.dry_run_check)
+        option_layout.addStretch()
+        layout.addLayout(option_layout)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        
+        self.result_text = QTextEdit()
+        self.result_text.setReadOnly(True)
+        layout.addWidget(self.result_text)
+        
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        self.generate_btn = QPushButton("일괄 생성")
+        self.generate_btn.setStyleSheet("background-color: #4CAF50; color: white; padding: 10px 25px;")
+        self.generate_btn.clicked.connect(self.generate)
+        btn_layout.addWidget(self.generate_btn)
+        close_btn = QPushButton("닫기")
+        close_btn.clicked.connect(self.close)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+        
+        self.setLayout(layout)
+        
+        self.batch_query = AsyncQuery(self)
+        self.batch_query.finished.connect(self.on_generated)
+        self.batch_query.failed.connect(self.on_failed)
+        self.batch_query.busy_changed.connect(self.progress_bar.setVisible)
+        
+        self.load_courses()
+    
+    def load_courses(self):
+        """과정 목록 로드 (시작일이 없는 과정은 선택 불가)"""
+        if not self.db.connect():
+            return
+        
+        for row in get_reference_cache().rows('courses', self.db):
+            start_date = row.get('start_date')
+            text = f"{row['name']} ({row['code']}) - 시작일 {start_date or '미설정'}"
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, row['code'])
+            if start_date:
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Unchecked)
+            else:
+                item.setFlags(item.flags() & ~Qt.ItemIsEnabled)
+            self.course_list.addItem(item)
+    
+    def toggle_all(self, checked):
+        state = Qt.Checked if checked else Qt.Unchecked
+        for index in range(self.course_list.count()):
+            item = self.course_list.item(index)
+            if item.flags() & Qt.ItemIsEnabled:
+                item.setCheckState(state)
+    
+    def selected_courses(self):
+        return [self.course_list.item(index).data(Qt.UserRole)
+                for index in range(self.course_list.count())
+                if self.course_list.item(index).checkState() == Qt.Checked]
+    
+    def generate(self):
+        """선택한 과정 일괄 생성 (작업 스레드)"""
+        codes = self.selected_courses()
+        if not codes:
+            QMessageBox.warning(self, "경고", "과정을 선택하세요.")
+            return
+        
+        dry_run = self.dry_run_check.isChecked()
+        if not dry_run:
+            reply = QMessageBox.question(self, "확인",
+                                         f"{len(codes)}개 과정의 시간표를 생성하시겠습니까?\n\n"
+                                         "선택한 과정의 기존 시간표는 삭제됩니다.",
+                                         QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        
+        self.generate_btn.setEnabled(False)
+        self.result_text.clear()
+        self.batch_query.submit(generate_batch, codes, self.start_time, self.end_time, dry_run=dry_run)
+    
+    def on_generated(self, report):
+        """과정별 결과 표시"""
+        self.generate_btn.setEnabled(True)
+        title = "🔍 미리 확인 (저장하지 않음)" if self.dry_run_check.isChecked() else "✅ 일괄 생성 완료"
+        self.result_text.setText(title + "\n\n" + "\n".join(report.lines()))
+        if report.errors:
+            QMessageBox.warning(self, "일부 실패", f"{len(report.errors)}개 과정은 생성하지 못했습니다.")
+    
+    def on_failed(self, message):
+        self.generate_btn.setEnabled(True)
+        QMessageBox.critical(self, "오류", f"일괄 생성 실패 (저장된 내용 없음): {message}")
+    
+    def closeEvent(self, event):
+        """닫기 이벤트"""
+        self.batch_query.cancel()
+        self.db.disconnect()
+        event.accept()
@@ -4,11 +4,11 @@
 """
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QLabel, QComboBox,
+                             QTableView, QLabel, QComboBox,
                              QMessageBox, QHeaderView, QGroupBox, QDateEdit,
                              QTimeEdit, QLineEdit, QTextEdit, QCalendarWidget,
                              QTabWidget, QWidget, QGridLayout)
-from PyQt5.QtCore import Qt, QDate, QTime
+from PyQt5.QtCore import Qt, QDate, QTime, QTimer
 from PyQt5.QtGui import QColor, QTextCharFormat
 import sys
 import os
@@ -16,6 +16,12 @@ from datetime import datetime, timedelta
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from database.reference_cache import get_reference_cache
+from database.change_bus import TableSync, get_change_bus
+from database.async_query import AsyncQuery
+from ui.table_model import Column, RowTableModel, RowSortProxy
+from ui.scroll_pager import ScrollPager
+from utils.helpers import to_time
 
 
 class TimetableViewDialog(QDialog):
@@ -25,8 +31,20 @@ class TimetableViewDialog(QDialog):
         super().__init__(parent)
         self.db = DatabaseManager()
         self.current_timetable_id = None
+        self.filter_snapshot = ([], [])  # 표에 표시 중인 검색 조건 (작업 스레드용 복사본)
+        self.calendar_query = AsyncQuery(self)  # 달력 표시 날짜 비동기 조회
+        
+        # 연달아 오는 시간표 변경 알림(저장 한 번에 삭제/수정/추가)은 모아서 달력을 한 번만 다시 읽음
+        self.calendar_timer = QTimer(self)
+        self.calendar_timer.setSingleShot(True)
+        self.calendar_timer.setInterval(300)
+        self.calendar_timer.timeout.connect(self.load_calendar)
         self.init_ui()
         
+        # 다른 탭/PC에서 바뀐 시간표만 표에 반영
+        get_change_bus().changed.connect(self.on_timetables_changed)
+        self.table_sync = TableSync(self.table_model, 'timetables', self.fetch_timetables, self.filter_table, self)
+        
     def init_ui(self):
         """UI 초기화"""
         self.setWindowTitle("시간표 조회/수정")
@@ -166,18 +184,45 @@ class TimetableViewDialog(QDialog):
         layout.addWidget(edit_group)
         
         # 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "과정", "날짜", "시작시간", "종료시간", "교과목", "강사", "유형", "비고"
-        ])
+        type_map = {"lecture": "강의", "project": "프로젝트", "internship": "인턴쉽"}
+        self.table_model = RowTableModel([
+            Column("ID", 'id'),
+            Column("과정", 'course_name'),
+            Column("날짜", 'class_date'),
+            Column("시작시간", 'start_time'),
+            Column("종료시간", 'end_time'),
+            Column("교과목", 'subject_name', display=lambda v, row: v or '-'),
+            Column("강사", 'instructor_name', display=lambda v, row: v or '-'),
+            Column("유형", 'type', display=lambda v, row: type_map.get(v, v)),
+            Column("비고", 'notes'),
+        ], parent=self)
+        self.table_proxy = RowSortProxy(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        
+        self.table = QTableView()
+        self.table.setModel(self.table_proxy)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(2, Qt.AscendingOrder)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.cellClicked.connect(self.on_row_selected)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.clicked.connect(self.on_row_selected)
         self.table.setColumnWidth(0, 50)
         layout.addWidget(self.table)
         
+        # 시간표 목록 페이지 조회 (끝까지 스크롤하면 다음 페이지)
+        self.table_pager = ScrollPager(self.table, self)
+        
+        # 로딩 표시
+        self.table_loading_label = QLabel("⏳ 시간표를 불러오는 중...")
+        self.table_loading_label.setStyleSheet("color: #666; padding: 4px;")
+        self.table_loading_label.setVisible(False)
+        layout.addWidget(self.table_loading_label)
+        
+        self.table_pager.page_loaded.connect(self.populate_table)
+        self.table_pager.query.failed.connect(lambda msg: print(f"테이블 로드 오류: {msg}"))
+        self.table_pager.query.busy_changed.connect(self.table_loading_label.setVisible)
+        
         tab.setLayout(layout)
         return tab
         
@@ -208,6 +253,9 @@ class TimetableViewDialog(QDialog):
         layout.addWidget(QLabel("선택한 날짜의 일정:"))
         layout.addWidget(self.date_schedule)
         
+        self.calendar_query.finished.connect(self.populate_calendar)
+        self.calendar_query.failed.connect(lambda msg: print(f"달력 로드 오류: {msg}"))
+        
         tab.setLayout(layout)
         return tab
         
@@ -243,11 +291,21 @@ class TimetableViewDialog(QDialog):
         layout.addLayout(filter_layout)
         
         # 강사 스케줄 테이블
-        self.instructor_table = QTableWidget()
-        self.instructor_table.setColumnCount(6)
-        self.instructor_table.setHorizontalHeaderLabels([
-            "날짜", "시작시간", "종료시간", "과정", "교과목", "비고"
-        ])
+        self.instructor_model = RowTableModel([
+            Column("날짜", 'class_date'),
+            Column("시작시간", 'start_time'),
+            Column("종료시간", 'end_time'),
+            Column("과정", 'course_name'),
+            Column("교과목", 'subject_name', display=lambda v, row: v or '-'),
+            Column("비고", 'notes'),
+        ], parent=self)
+        self.instructor_proxy = RowSortProxy(self)
+        self.instructor_proxy.setSourceModel(self.instructor_model)
+        
+        self.instructor_table = QTableView()
+        self.instructor_table.setModel(self.instructor_proxy)
+        self.instructor_table.setSortingEnabled(True)
+        self.instructor_table.sortByColumn(0, Qt.AscendingOrder)
         self.instructor_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.instructor_table)
         
@@ -260,8 +318,8 @@ class TimetableViewDialog(QDialog):
             return
         
         try:
-            query = "SELECT code, name FROM courses ORDER BY code"
-            rows = self.db.fetch_all(query)
+            cache = get_reference_cache()
+            rows = cache.rows('courses', self.db)
             
             # 각 콤보박스에 추가
             for combo in [self.table_course_combo, self.calendar_course_combo]:
@@ -271,8 +329,7 @@ class TimetableViewDialog(QDialog):
                     combo.addItem(f"{row['name']} ({row['code']})", row['code'])
             
             # 교과목 로드
-            subject_query = "SELECT code, name FROM subjects ORDER BY code"
-            subjects = self.db.fetch_all(subject_query)
+            subjects = cache.rows('subjects', self.db)
             
             self.edit_subject.clear()
             self.edit_subject.addItem("선택 안함", None)
@@ -280,8 +337,7 @@ class TimetableViewDialog(QDialog):
                 self.edit_subject.addItem(f"{subject['name']} ({subject['code']})", subject['code'])
             
             # 강사 로드
-            instructor_query = "SELECT code, name FROM instructors ORDER BY name"
-            instructors = self.db.fetch_all(instructor_query)
+            instructors = sorted(cache.rows('instructors', self.db), key=lambda r: r['name'])
             
             self.edit_instructor.clear()
             self.edit_instructor.addItem("선택 안함", None)
@@ -303,76 +359,74 @@ class TimetableViewDialog(QDialog):
         self.load_calendar()
         
     def filter_table(self):
-        """테이블 필터링"""
-        if not self.db.connect():
-            return
-        
-        try:
-            course_code = self.table_course_combo.currentData()
-            type_text = self.table_type_combo.currentText()
-            date_from = self.table_date_from.date().toString("yyyy-MM-dd")
-            date_to = self.table_date_to.date().toString("yyyy-MM-dd")
-            
-            query = """
-                SELECT t.*, c.name as course_name, s.name as subject_name, i.name as instructor_name
-                FROM timetables t
-                LEFT JOIN courses c ON t.course_code = c.code
-                LEFT JOIN subjects s ON t.subject_code = s.code
-                LEFT JOIN instructors i ON t.instructor_code = i.code
-                WHERE t.class_date BETWEEN %s AND %s
-            """
-            params = [date_from, date_to]
-            
-            if course_code:
-                query += " AND t.course_code = %s"
-                params.append(course_code)
-            
-            if type_text != "전체":
-                type_map = {"강의": "lecture", "프로젝트": "project", "인턴쉽": "internship"}
-                query += " AND t.type = %s"
-                params.append(type_map[type_text])
-            
-            query += " ORDER BY t.class_date, t.start_time"
-            
-            rows = self.db.fetch_all(query, tuple(params))
-            
-            self.table.setRowCount(0)
-            for row in rows:
-                row_position = self.table.rowCount()
-                self.table.insertRow(row_position)
-                
-                type_map = {"lecture": "강의", "project": "프로젝트", "internship": "인턴쉽"}
-                
-                self.table.setItem(row_position, 0, QTableWidgetItem(str(row['id'])))
-                self.table.setItem(row_position, 1, QTableWidgetItem(row['course_name'] or ''))
-                self.table.setItem(row_position, 2, QTableWidgetItem(str(row['class_date'])))
-                self.table.setItem(row_position, 3, QTableWidgetItem(str(row['start_time'])))
-                self.table.setItem(row_position, 4, QTableWidgetItem(str(row['end_time'])))
-                self.table.setItem(row_position, 5, QTableWidgetItem(row['subject_name'] or '-'))
-                self.table.setItem(row_position, 6, QTableWidgetItem(row['instructor_name'] or '-'))
-                self.table.setItem(row_position, 7, QTableWidgetItem(type_map.get(row['type'], row['type'])))
-                self.table.setItem(row_position, 8, QTableWidgetItem(row['notes'] or ''))
-                
-        except Exception as e:
-            print(f"테이블 로드 오류: {str(e)}")
+        """테이블 필터링 (작업 스레드에서 첫 페이지 조회, 이전 검색은 취소)"""
+        conditions, params = self.table_filter()
+        self.filter_snapshot = (conditions, params)
+        self.table_pager.start(
+            lambda db, after: db.list_timetables(conditions, params, after=after))
+    
+    def table_filter(self):
+        """현재 검색 조건 (WHERE 조건 목록, 파라미터 목록)"""
+        course_code = self.table_course_combo.currentData()
+        type_text = self.table_type_combo.currentText()
+        date_from = self.table_date_from.date().toString("yyyy-MM-dd")
+        date_to = self.table_date_to.date().toString("yyyy-MM-dd")
+        
+        conditions = ["t.class_date BETWEEN %s AND %s"]
+        params = [date_from, date_to]
+        
+        if course_code:
+            conditions.append("t.course_code = %s")
+            params.append(course_code)
+        
+        if type_text != "전체":
+            type_map = {"강의": "lecture", "프로젝트": "project", "인턴쉽": "internship"}
+            conditions.append("t.type = %s")
+            params.append(type_map[type_text])
+        
+        return conditions, params
+    
+    def fetch_timetables(self, db, column, keys):
+        """변경된 시간표 행 중 현재 검색 조건에 맞는 행 조회 (작업 스레드)
+        
+        조건에서 벗어난 행은 결과에 없으므로 표에서 빠진다.
+        """
+        conditions, params = self.filter_snapshot
+        conditions = conditions + [f"t.{column} IN ({', '.join(['%s'] * len(keys))})"]
+        cursor = db.connection.cursor()
+        cursor.execute(db.TIMETABLE_LIST_QUERY + " WHERE " + " AND ".join(conditions),
+                       tuple(params) + tuple(keys))
+        return cursor.fetchall()
+    
+    def on_timetables_changed(self, event):
+        """시간표가 바뀌면 달력 표시도 갱신 (표는 table_sync가 바뀐 행만 반영)"""
+        if event.table == 'timetables':
+            self.calendar_timer.start()
+    
+    def populate_table(self, page, first):
+        """조회한 페이지를 테이블에 표시 (다음 페이지는 id 기준으로 합침)"""
+        if first:
+            self.table_model.set_rows(page.rows)
+        else:
+            self.table_model.patch_rows('id', page.rows)
     
     def load_calendar(self):
-        """달력에 시간표 표시"""
-        if not self.db.connect():
-            return
+        """달력에 표시할 수업 날짜 조회 (작업 스레드, 이전 조회는 취소)"""
+        self.calendar_timer.stop()
+        course_code = self.calendar_course_combo.currentData()
         
+        query = "SELECT DISTINCT class_date, type FROM timetables"
+        params = []
+        
+        if course_code:
+            query += " WHERE course_code = %s"
+            params.append(course_code)
+        
+        self.calendar_query.fetch_all(query, tuple(params) if params else None)
+    
+    def populate_calendar(self, rows):
+        """달력에 시간표 표시"""
         try:
-            course_code = self.calendar_course_combo.currentData()
-            
-            query = "SELECT DISTINCT class_date, type FROM timetables"
-            params = []
-            
-            if course_code:
-                query += " WHERE course_code = %s"
-                params.append(course_code)
-            
-            rows = self.db.fetch_all(query, tuple(params) if params else None)
-            
             # 달력 포맷 초기화
             self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
             
@@ -466,42 +520,30 @@ class TimetableViewDialog(QDialog):
             """
             
             rows = self.db.fetch_all(query, (instructor_code, date_from, date_to))
+            self.instructor_model.set_rows(rows)
             
-            self.instructor_table.setRowCount(0)
-            for row in rows:
-                row_position = self.instructor_table.rowCount()
-                self.instructor_table.insertRow(row_position)
-                
-                self.instructor_table.setItem(row_position, 0, QTableWidgetItem(str(row['class_date'])))
-                self.instructor_table.setItem(row_position, 1, QTableWidgetItem(str(row['start_time'])))
-                self.instructor_table.setItem(row_position, 2, QTableWidgetItem(str(row['end_time'])))
-                self.instructor_table.setItem(row_position, 3, QTableWidgetItem(row['course_name'] or ''))
-                self.instructor_table.setItem(row_position, 4, QTableWidgetItem(row['subject_name'] or '-'))
-                self.instructor_table.setItem(row_position, 5, QTableWidgetItem(row['notes'] or ''))
-                
         except Exception as e:
             print(f"강사 스케줄 로드 오류: {str(e)}")
     
-    def on_row_selected(self, row, column):
-        """테이블 행 선택 시"""
-        timetable_id = int(self.table.item(row, 0).text())
-        
-        # DB에서 상세 정보 조회
-        query = "SELECT * FROM timetables WHERE id = %s"
-        result = self.db.fetch_one(query, (timetable_id,))
+    def on_row_selected(self, index):
+        """테이블 행 선택 시 (비고는 목록에 앞부분만 있으므로 상세 조회)"""
+        result = self.table_proxy.source_row(index)
         
         if result:
-            self.current_timetable_id = timetable_id
+            if self.db.connect():
+                result = self.db.get_timetable(result['id']) or result
+            
+            self.current_timetable_id = result['id']
             self.edit_id.setText(str(result['id']))
             
             date = QDate(result['class_date'].year, result['class_date'].month, result['class_date'].day)
             self.edit_date.setDate(date)
             
-            start_time = QTime.fromString(str(result['start_time']), "HH:mm:ss")
-            self.edit_start_time.setTime(start_time)
+            start_time = to_time(result['start_time'])
+            self.edit_start_time.setTime(QTime(start_time.hour, start_time.minute))
             
-            end_time = QTime.fromString(str(result['end_time']), "HH:mm:ss")
-            self.edit_end_time.setTime(end_time)
+            end_time = to_time(result['end_time'])
+            self.edit_end_time.setTime(QTime(end_time.hour, end_time.minute))
             
             # 교과목 찾기
             for i in range(self.edit_subject.count()):
@@ -541,7 +583,6 @@ class TimetableViewDialog(QDialog):
             self.db.execute_query(query, (date, start_time, end_time, subject_code, instructor_code, notes, self.current_timetable_id))
             
             QMessageBox.information(self, "성공", "시간표가 수정되었습니다.")
-            self.load_data()
             
         except Exception as e:
             QMessageBox.critical(self, "오류", f"저장 실패: {str(e)}")
@@ -563,12 +604,14 @@ class TimetableViewDialog(QDialog):
                 
                 QMessageBox.information(self, "성공", "시간표가 삭제되었습니다.")
                 self.current_timetable_id = None
-                self.load_data()
                 
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"삭제 실패: {str(e)}")
     
     def closeEvent(self, event):
         """닫기 이벤트"""
+        self.table_pager.cancel()
+        self.calendar_timer.stop()
+        self.calendar_query.cancel()
         self.db.disconnect()
         event.accept()
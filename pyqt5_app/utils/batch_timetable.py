@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+여러 과정 시간표 일괄 생성
+
+학기 초 8~15개 과정을 한 과정씩 만들지 않고 한 번에 생성한다.
+
+1. 스냅샷: 대상 과정, 과정별 과목(course_subjects), 공휴일, 강사,
+   다른 과정 강사 배정을 몇 번의 쿼리로 미리 읽음
+2. 생성: 스냅샷을 작업 프로세스마다 한 번만 넘기고(initializer)
+   과정별 시간표를 ProcessPoolExecutor에서 병렬 생성 (DB 접근 없음)
+3. 중복 확인: 생성된 과정끼리 같은 반일에 같은 강사가 있는지 과정 순서대로 확인하고,
+   겹치면 예비강사로 대체 (예비강사도 안 되면 중복으로 보고)
+4. 저장: 대상 과정의 기존 시간표 삭제 + 다중 행 INSERT를 하나의 트랜잭션에서 실행
+
+사용 예:
+    report = generate_batch(db, ['C-001', 'C-002', 'C-003'])
+    print("\\n".join(report.lines()))
+
+    python -m utils.batch_timetable C-001 C-002 C-003 --dry-run
+"""
+
+from collections import namedtuple
+from datetime import timedelta
+import argparse
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.reference_cache import get_reference_cache
+from utils.helpers import to_date
+from utils.instructor_conflicts import Conflict, ConflictIndex, half_days
+from utils.schedule_engine import SlotConfig
+from utils.timetable_generator import (INSERT_QUERY, SUBJECT_COLUMNS, SUBJECT_JOINS,
+                                       build_course_entries, entry_params)
+from utils.work_calendar import WorkCalendar, get_work_calendar
+from utils.process_pool import run_in_process_pool, default_workers
+
+# 최대 작업 프로세스 수
+DEFAULT_WORKERS = 4
+
+# 과정별 결과 요약
+CourseSummary = namedtuple('CourseSummary', [
+    'course_code', 'course_name', 'start_date', 'end_date',
+    'lecture_days', 'project_days', 'internship_days', 'entries',
+    'incomplete_hours', 'substitutions', 'conflicts'
+])
+
+
+class Snapshot:
+    """일괄 생성에 필요한 기준 데이터 (작업 프로세스로 전달되므로 피클 가능한 값만 보관)
+
+    Attributes:
+        courses: 과정코드 → courses 행
+        subjects: 과정코드 → 과목 목록 (get_course_subjects 형식)
+        holidays: 공휴일 frozenset
+        instructor_names: 강사코드 → 이름
+        busy: 대상 과정을 뺀 다른 과정 강사 배정 (ConflictIndex)
+        start_dates: 과정코드 → 시작일
+        start_time, end_time: 하루 수업 시간 ('HH:MM')
+    """
+
+    def __init__(self, courses, subjects, holidays, instructor_names, busy, start_dates,
+                 start_time="09:00", end_time="18:00"):
+        self.courses = courses
+        self.subjects = subjects
+        self.holidays = holidays
+        self.instructor_names = instructor_names
+        self.busy = busy
+        self.start_dates = start_dates
+        self.start_time = start_time
+        self.end_time = end_time
+
+    @property
+    def slots(self):
+        return SlotConfig.from_day(self.start_time, self.end_time)
+
+
+def load_snapshot(db, course_codes, start_time="09:00", end_time="18:00", start_dates=None):
+    """대상 과정의 기준 데이터를 한 번에 조회
+
+    Args:
+        course_codes: 과정코드 목록 (이 순서대로 강사 중복을 확인)
+        start_dates: 과정코드 → 시작일 (없으면 courses.start_date)
+
+    Returns:
+        tuple: (Snapshot, {과정코드: 오류 메시지}) 시작일/과정이 없는 과정은 오류로 빠짐
+    """
+    errors = {}
+    all_courses = {row['code']: row for row in get_reference_cache().rows('courses', db)}
+    courses = {}
+    dates = {}
+    for code in course_codes:
+        course = all_courses.get(code)
+        start_date = (start_dates or {}).get(code) or (course or {}).get('start_date')
+        if not course:
+            errors[code] = "과정을 찾을 수 없습니다."
+        elif not start_date:
+            errors[code] = "과정 시작일이 설정되지 않았습니다."
+        else:
+            courses[code] = dict(course)
+            dates[code] = to_date(start_date)
+
+    # 과정별 과목 (한 번의 쿼리)
+    subjects = {code: [] for code in courses}
+    if courses:
+        placeholders = ', '.join(['%s'] * len(courses))
+        rows = db.fetch_all(f"""
+            SELECT cs.course_code, {SUBJECT_COLUMNS}
+            FROM course_subjects cs
+            INNER JOIN subjects s ON s.code = cs.subject_code
+            {SUBJECT_JOINS}
+            WHERE cs.course_code IN ({placeholders})
+            ORDER BY cs.course_code, cs.display_order, s.hours ASC
+        """, tuple(courses))
+        for row in rows:
+            row = dict(row)
+            subjects[row.pop('course_code')].append(row)
+
+    # 과목을 선택하지 않은 과정은 전체 과목 (TimetableGenerator와 같음)
+    if any(not rows for rows in subjects.values()):
+        every = db.fetch_all(f"SELECT {SUBJECT_COLUMNS} FROM subjects s {SUBJECT_JOINS} ORDER BY s.code") or []
+        for code, rows in subjects.items():
+            if not rows:
+                subjects[code] = [dict(row) for row in every]
+
+    instructor_names = {row['code']: row['name'] for row in get_reference_cache().rows('instructors', db)}
+
+    # 대상 과정의 기존 시간표는 새로 만들 것이므로 빼고 읽음
+    busy = ConflictIndex()
+    if courses:
+        first = min(dates.values())
+        last = max(to_date(course.get('lecture_end_date') or dates[code] + timedelta(days=365))
+                   for code, course in courses.items())
+        busy = ConflictIndex.load(db, first, last, exclude_course=list(courses),
+                                  boundary=SlotConfig.from_day(start_time, end_time).am_end)
+
+    snapshot = Snapshot(courses, subjects, get_work_calendar(db).holidays, instructor_names, busy, dates,
+                        start_time, end_time)
+    return snapshot, errors
+
+
+_snapshot = None
+_calendar = None
+
+
+def _init_worker(snapshot):
+    """작업 프로세스 초기화: 스냅샷과 근무일 달력을 프로세스당 한 번만 준비"""
+    global _snapshot, _calendar
+    _snapshot = snapshot
+    _calendar = WorkCalendar(snapshot.holidays)
+
+
+def _generate(course_code):
+    """작업 프로세스: 과정 하나의 시간표 행 생성
+
+    Returns:
+        tuple: (과정코드, 행 목록, 요약 dict, 오류 메시지)
+    """
+    try:
+        entries, details, _ = build_course_entries(
+            _snapshot.courses[course_code], _snapshot.subjects[course_code], _calendar,
+            _snapshot.start_dates[course_code], _snapshot.start_time, _snapshot.end_time, _snapshot.busy)
+        return course_code, entries, details, None
+    except Exception as e:
+        return course_code, [], None, str(e)
+
+
+def _run_workers(snapshot, course_codes, workers):
+    """과정별 생성을 작업 프로세스에 나눠 실행 (프로세스를 못 띄우면 현재 프로세스에서 실행)"""
+    results = run_in_process_pool(_generate, course_codes, workers,
+                                  initializer=_init_worker, initargs=(snapshot,))
+    if results is not None:
+        return results
+    _init_worker(snapshot)
+    return [_generate(code) for code in course_codes]
+
+
+def _busy_course(index, instructor_code, class_date, slots):
+    """반일 목록 중 강사가 다른 과정 수업 중인 첫 과정코드 (없으면 None)"""
+    for slot in slots:
+        course_code = index.busy(instructor_code, class_date, slot)
+        if course_code:
+            return course_code
+    return None
+
+
+def resolve_conflicts(snapshot, generated):
+    """생성된 과정끼리 강사 중복 확인 (과정 순서대로, 앞 과정 배정 우선)
+
+    뒤 과정의 수업이 겹치면 예비강사가 비어 있을 때 예비강사로 바꾸고,
+    아니면 중복으로 남긴다. (행의 instructor_code를 직접 수정)
+
+    Args:
+        generated: [(과정코드, 행 목록)] 과정 순서
+
+    Returns:
+        tuple: ({과정코드: 대체 수}, {과정코드: [Conflict]})
+    """
+    boundary = snapshot.slots.am_end
+    index = snapshot.busy.copy()
+    substitutions = {}
+    conflicts = {}
+    for course_code, entries in generated:
+        subjects = {s['code']: s for s in snapshot.subjects[course_code]}
+        substitutions[course_code] = 0
+        conflicts[course_code] = []
+        for entry in entries:
+            instructor = entry['instructor_code']
+            if entry['type'] != 'lecture' or not instructor:
+                continue
+            class_date = to_date(entry['class_date'])
+            slots = half_days(entry['start_time'], entry['end_time'], boundary)
+            if _busy_course(index, instructor, class_date, slots):
+                reserve = subjects.get(entry['subject_code'], {}).get('reserve_instructor')
+                if reserve and reserve != instructor and not _busy_course(index, reserve, class_date, slots):
+                    entry['instructor_code'] = instructor = reserve
+                    substitutions[course_code] += 1
+                else:
+                    for slot in slots:
+                        other_course = index.busy(instructor, class_date, slot)
+                        if other_course:
+                            conflicts[course_code].append(Conflict(
+                                instructor, snapshot.instructor_names.get(instructor), class_date, slot,
+                                other_course, (snapshot.courses.get(other_course) or {}).get('name')))
+            for slot in slots:
+                index.add(instructor, class_date, slot, course_code)
+    return substitutions, conflicts
+
+
+class BatchReport:
+    """일괄 생성 결과
+
+    Attributes:
+        summaries: CourseSummary 목록 (생성된 과정, 요청 순서)
+        conflicts: 과정코드 → 남은 강사 중복 [Conflict]
+        errors: 과정코드 → 오류 메시지 (생성/저장하지 않은 과정)
+        inserted: 저장된 시간표 행 수 (dry_run이면 0)
+        workers: 사용한 프로세스 수
+        elapsed: 걸린 시간(초)
+    """
+
+    def __init__(self):
+        self.summaries = []
+        self.conflicts = {}
+        self.errors = {}
+        self.inserted = 0
+        self.workers = 1
+        self.elapsed = 0.0
+
+    @property
+    def success(self):
+        return bool(self.summaries) and not self.errors
+
+    def lines(self):
+        """과정별 요약 (줄 목록)"""
+        lines = []
+        for s in self.summaries:
+            lines.append(f"✅ {s.course_name} ({s.course_code}) {s.start_date} ~ {s.end_date}")
+            lines.append(f"   강의 {s.lecture_days}일 / 프로젝트 {s.project_days}일 / 인턴쉽 {s.internship_days}일, "
+                         f"{s.entries}행")
+            notes = []
+            if s.incomplete_hours:
+                notes.append(f"미배정 {s.incomplete_hours}시간")
+            if s.substitutions:
+                notes.append(f"예비강사 대체 {s.substitutions}건")
+            if s.conflicts:
+                notes.append(f"강사 중복 {s.conflicts}건")
+            if notes:
+                lines.append("   ⚠️ " + ", ".join(notes))
+            for c in self.conflicts.get(s.course_code, [])[:5]:
+                lines.append(f"      - {c.class_date.strftime('%Y-%m-%d')} {'오전' if c.slot == 'am' else '오후'} "
+                             f"{c.instructor_name or c.instructor_code}: {c.course_name or c.course_code} 수업 중")
+        for code, message in self.errors.items():
+            lines.append(f"❌ {code}: {message}")
+        lines.append(f"저장 {self.inserted}행, 프로세스 {self.workers}개, {self.elapsed:.1f}초")
+        return lines
+
+
+def generate_batch(db, course_codes, start_time="09:00", end_time="18:00", start_dates=None,
+                   workers=None, dry_run=False, trace=None):
+    """여러 과정 시간표 일괄 생성
+
+    생성에 실패한 과정은 기존 시간표를 그대로 두고 오류로 보고한다.
+    저장은 성공한 과정 전체를 하나의 트랜잭션으로 처리한다. (실패하면 전체 롤백)
+
+    Args:
+        db: 연결된 DatabaseManager
+        course_codes: 과정코드 목록
+        start_dates: 과정코드 → 시작일 (없으면 courses.start_date)
+        workers: 작업 프로세스 수 (기본: CPU 수, 최대 process_pool.DEFAULT_WORKERS)
+        dry_run: True면 저장하지 않고 결과만 보고
+        trace: 진행 메시지를 받을 함수 (예: print)
+
+    Returns:
+        BatchReport
+    """
+    started = time.time()
+    report = BatchReport()
+    if not db.connect():
+        raise Exception("데이터베이스 연결 실패")
+
+    course_codes = list(dict.fromkeys(course_codes))
+    snapshot, report.errors = load_snapshot(db, course_codes, start_time, end_time, start_dates)
+    targets = [code for code in course_codes if code in snapshot.courses]
+    report.workers = max(1, min(workers or default_workers(), len(targets)))
+    if trace:
+        trace(f"📦 일괄 생성: 과정 {len(targets)}개, 프로세스 {report.workers}개")
+
+    generated = []
+    details = {}
+    for code, entries, detail, error in _run_workers(snapshot, targets, report.workers):
+        if error:
+            report.errors[code] = f"시간표 생성 오류: {error}"
+            continue
+        generated.append((code, entries))
+        details[code] = detail
+        if trace:
+            trace(f"  • {code}: {len(entries)}행 생성")
+
+    substitutions, report.conflicts = resolve_conflicts(snapshot, generated)
+
+    for code, entries in generated:
+        detail = details[code]
+        report.summaries.append(CourseSummary(
+            code, snapshot.courses[code].get('name'), detail['start_date'], detail['end_date'],
+            detail['lecture_days'], detail['project_days'], detail['internship_days'], len(entries),
+            detail['incomplete_hours'],
+            # 중복은 기존 시간표 + 앞 과정을 모두 대조한 resolve_conflicts 결과만 사용
+            detail['instructor_substitutions'] + substitutions[code],
+            len(report.conflicts[code])))
+
+    if generated and not dry_run:
+        codes = [code for code, _ in generated]
+        with db.transaction():
+            db.execute_query(f"DELETE FROM timetables WHERE course_code IN ({', '.join(['%s'] * len(codes))})",
+                             tuple(codes))
+            report.inserted = db.execute_many(
+                INSERT_QUERY, [entry_params(entry) for _, entries in generated for entry in entries])
+
+    report.elapsed = time.time() - started
+    if trace:
+        for line in report.lines():
+            trace(line)
+    return report
+
+
+def main(argv=None):
+    """명령줄 실행: 과정코드 목록의 시간표를 일괄 생성"""
+    from database.db_manager import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="여러 과정 시간표 일괄 생성")
+    parser.add_argument('courses', nargs='+', help="과정코드 목록")
+    parser.add_argument('--day-start', default="09:00", help="하루 시작 시간 (기본 09:00)")
+    parser.add_argument('--day-end', default="18:00", help="하루 종료 시간 (기본 18:00)")
+    parser.add_argument('--workers', type=int, help="작업 프로세스 수")
+    parser.add_argument('--dry-run', action='store_true', help="저장하지 않고 결과만 출력")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager()
+    try:
+        report = generate_batch(db, args.courses, args.day_start, args.day_end, workers=args.workers,
+                                dry_run=args.dry_run, trace=print)
+    finally:
+        db.disconnect()
+    return 0 if report.success else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,64 +4,126 @@ Excel 관리 유틸리티
 """
 
 import pandas as pd
-from datetime import datetime
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from datetime import datetime, timedelta
+from itertools import chain, islice
 import os
 
 
 class ExcelManager:
     """Excel 내보내기/가져오기 관리"""
     
+    # 열 너비 계산에 사용할 앞부분 행 수
+    WIDTH_SAMPLE_ROWS = 200
+    
     @staticmethod
     def export_to_excel(data, filename, sheet_name='Sheet1'):
-        """데이터를 Excel로 내보내기"""
+        """데이터(행 dict 목록)를 Excel로 내보내기"""
         try:
-            df = pd.DataFrame(data)
-            
-            # 파일명에 타임스탬프 추가
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_name = os.path.splitext(filename)[0]
-            final_filename = f"{base_name}_{timestamp}.xlsx"
-            
-            # Excel 파일로 저장
-            writer = pd.ExcelWriter(final_filename, engine='xlsxwriter')
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            # 포맷팅
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
-            
-            # 헤더 포맷
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#4472C4',
-                'font_color': 'white',
-                'border': 1
-            })
-            
-            # 셀 포맷
-            cell_format = workbook.add_format({
-                'border': 1
-            })
-            
-            # 헤더 스타일 적용
-            for col_num, value in enumerate(df.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-            
-            # 열 너비 자동 조정
-            for idx, col in enumerate(df.columns):
-                max_len = max(
-                    df[col].astype(str).apply(len).max(),
-                    len(str(col))
-                ) + 2
-                worksheet.set_column(idx, idx, min(max_len, 50))
-            
-            writer.close()
+            columns = []
+            for row in data:
+                for key in row:
+                    if key not in columns:
+                        columns.append(key)
             
+            final_filename = ExcelManager._timestamped(filename)
+            ExcelManager._write_rows(final_filename, sheet_name, columns, iter(data))
             return final_filename
             
         except Exception as e:
             raise Exception(f"Excel 내보내기 실패: {str(e)}")
     
+    @staticmethod
+    def export_query(db, query, filename, sheet_name='Sheet1', params=None, chunk_size=1000):
+        """조회 결과를 스트리밍으로 Excel 내보내기
+        
+        서버 측 커서로 chunk_size 행씩 읽어서 write-only 워크북에 바로 쓰므로
+        행 수와 관계없이 메모리 사용량이 일정하다.
+        
+        Returns:
+            tuple: (저장된 파일명, 행 수) - 행이 없으면 파일을 만들지 않고 (None, 0)
+        """
+        try:
+            columns, rows = db.stream_rows(query, params, chunk_size)
+            final_filename = ExcelManager._timestamped(filename)
+            count = ExcelManager._write_rows(final_filename, sheet_name, columns, rows)
+            if count == 0:
+                os.remove(final_filename)
+                return None, 0
+            return final_filename, count
+            
+        except Exception as e:
+            raise Exception(f"Excel 내보내기 실패: {str(e)}")
+    
+    @staticmethod
+    def _timestamped(filename):
+        """파일명에 타임스탬프 추가"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_name = os.path.splitext(filename)[0]
+        return f"{base_name}_{timestamp}.xlsx"
+    
+    @staticmethod
+    def _cell_value(value):
+        """Excel에 쓸 수 있는 값으로 변환"""
+        if value is None:
+            return None
+        if isinstance(value, timedelta):
+            # MySQL TIME 컬럼
+            total = int(value.total_seconds())
+            return f"{total // 3600:02d}:{total % 3600 // 60:02d}:{total % 60:02d}"
+        if isinstance(value, (bytes, bytearray)):
+            return f"(바이너리 {len(value)} bytes)"
+        if isinstance(value, str):
+            return ILLEGAL_CHARACTERS_RE.sub('', value)
+        return value
+    
+    @staticmethod
+    def _write_rows(final_filename, sheet_name, columns, rows):
+        """행 이터레이터를 write-only 워크북에 쓰기
+        
+        열 너비는 앞부분 WIDTH_SAMPLE_ROWS 행으로 추정한다.
+        (write-only 시트는 첫 행을 쓰기 전에 열 너비를 정해야 함)
+        
+        Returns:
+            int: 쓴 행 수
+        """
+        sample = list(islice(rows, ExcelManager.WIDTH_SAMPLE_ROWS))
+        
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(title=sheet_name)
+        
+        # 열 너비 자동 조정 (샘플 기준)
+        for idx, col in enumerate(columns, start=1):
+            max_len = max([len(str(col))] + [len(str(row.get(col, ''))) for row in sample]) + 2
+            worksheet.column_dimensions[get_column_letter(idx)].width = min(max_len, 50)
+        
+        # 헤더 스타일
+        header_font = Font(bold=True, color='FFFFFF')
+        header_fill = PatternFill('solid', fgColor='4472C4')
+        thin = Side(style='thin')
+        header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        header = []
+        for col in columns:
+            cell = WriteOnlyCell(worksheet, value=str(col))
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.border = header_border
+            header.append(cell)
+        worksheet.append(header)
+        
+        count = 0
+        to_value = ExcelManager._cell_value
+        for row in chain(sample, rows):
+            worksheet.append([to_value(row.get(col)) for col in columns])
+            count += 1
+        
+        workbook.save(final_filename)
+        return count
+    
     @staticmethod
     def import_from_excel(filename, sheet_name=0):
         """Excel에서 데이터 가져오기"""
@@ -3,7 +3,7 @@
 유틸리티 헬퍼 함수들
 """
 
-from datetime import datetime
+from datetime import datetime, date, time, timedelta
 import re
 
 
@@ -23,6 +23,42 @@ def format_datetime(dt, format_str='%Y-%m-%d %H:%M:%S'):
     return str(dt)
 
 
+def to_date(value):
+    """
+    date/datetime/문자열을 date로 변환
+    
+    Args:
+        value: date, datetime 또는 'YYYY-MM-DD' 문자열
+    
+    Returns:
+        date: 변환된 날짜
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+def to_time(value):
+    """
+    DB TIME 값을 time으로 변환 (pymysql은 TIME 컬럼을 timedelta로 반환)
+    
+    Args:
+        value: time, timedelta 또는 'HH:MM[:SS]' 문자열
+    
+    Returns:
+        time: 변환된 시각
+    """
+    if isinstance(value, time):
+        return value
+    if isinstance(value, timedelta):
+        seconds = int(value.total_seconds())
+        return time(seconds // 3600, (seconds % 3600) // 60, seconds % 60)
+    parts = [int(p) for p in str(value).split(':')]
+    return time(*parts)
+
+
 def validate_email(email):
     """
     이메일 유효성 검사
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+과정 간 강사 중복 확인
+
+시간표 생성은 한 과정의 과목만 보기 때문에 같은 날 같은 반일(오전/오후)에
+다른 과정 수업이 있는 강사를 그대로 배정할 수 있다.
+
+- ConflictIndex: 기간 안의 다른 과정 시간표를 한 번에 읽어
+  (강사코드, 날짜, 'am'/'pm') → 과정코드 로 보관. 배정할 때마다 O(1)로 확인하고
+  주강사가 다른 과정 수업 중이면 예비강사로 대체한다.
+- find_conflicts: 저장 직전 배정 목록 전체를 한 번의 쿼리로 다른 과정 시간표와 대조
+
+사용 예:
+    conflicts = ConflictIndex.load(db, start_date, end_date, exclude_course='C-001')
+    result = schedule(subjects, holidays, start_date, end_date, conflicts=conflicts)
+"""
+
+from collections import namedtuple
+from datetime import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.helpers import to_date, to_time
+
+# 오전/오후를 나누는 기준 시각 (이 시각 전에 시작하면 오전, 이 시각 뒤에 끝나면 오후 포함)
+HALF_DAY_BOUNDARY = time(13, 0)
+
+# 한 번의 쿼리로 대조할 (강사, 날짜) 쌍 최대 수
+CHECK_CHUNK_SIZE = 500
+
+# code: 배정한 강사코드, substituted: 예비강사로 대체했는지, conflict_course: 대체하지 못한 중복 과정코드
+InstructorPick = namedtuple('InstructorPick', 'code substituted conflict_course')
+
+# 저장 시 발견한 중복: 강사코드/이름, 날짜, 'am'/'pm', 겹치는 과정코드/이름
+Conflict = namedtuple('Conflict', 'instructor_code instructor_name class_date slot course_code course_name')
+
+
+def half_days(start_time, end_time, boundary=HALF_DAY_BOUNDARY):
+    """수업 시간이 차지하는 반일 목록 (종일 수업은 ['am', 'pm'])"""
+    start_time = to_time(start_time)
+    end_time = to_time(end_time)
+    slots = []
+    if start_time < boundary:
+        slots.append('am')
+    if end_time > boundary:
+        slots.append('pm')
+    return slots
+
+
+class ConflictIndex:
+    """다른 과정의 강사 배정 색인 ((강사코드, 날짜, 반일) → 과정코드)"""
+
+    def __init__(self, busy=None):
+        self._busy = dict(busy or {})
+
+    @classmethod
+    def load(cls, db, start_date, end_date, exclude_course=None, boundary=HALF_DAY_BOUNDARY):
+        """기간 안의 다른 과정 시간표를 한 번의 쿼리로 읽어 색인 생성
+
+        Args:
+            exclude_course: 제외할 과정코드 (여러 과정이면 목록)
+        """
+        query = """
+            SELECT instructor_code, class_date, start_time, end_time, course_code
+            FROM timetables
+            WHERE class_date BETWEEN %s AND %s AND instructor_code IS NOT NULL
+        """
+        params = [to_date(start_date), to_date(end_date)]
+        if isinstance(exclude_course, (list, tuple, set, frozenset)):
+            if exclude_course:
+                query += f" AND course_code NOT IN ({', '.join(['%s'] * len(exclude_course))})"
+                params.extend(exclude_course)
+        elif exclude_course:
+            query += " AND course_code <> %s"
+            params.append(exclude_course)
+
+        index = cls()
+        for row in db.fetch_all(query, tuple(params)):
+            for slot in half_days(row['start_time'], row['end_time'], boundary):
+                index.add(row['instructor_code'], row['class_date'], slot, row['course_code'])
+        return index
+
+    def __len__(self):
+        return len(self._busy)
+
+    def copy(self):
+        return ConflictIndex(self._busy)
+
+    def add(self, instructor_code, class_date, slot, course_code):
+        """배정 추가 (같은 반일에 이미 있으면 먼저 등록된 과정 유지)"""
+        self._busy.setdefault((instructor_code, to_date(class_date), slot), course_code)
+
+    def busy(self, instructor_code, class_date, slot):
+        """해당 반일에 강사가 수업 중인 다른 과정코드 (없으면 None)"""
+        if not instructor_code:
+            return None
+        return self._busy.get((instructor_code, class_date, slot))
+
+    def pick(self, subject, class_date, slot):
+        """과목 수업을 맡을 강사 선택 (주강사 → 예비강사 순)
+
+        Returns:
+            InstructorPick: 둘 다 다른 과정 수업 중이면 주강사와 겹치는 과정코드를 함께 반환
+        """
+        main = subject.get('main_instructor')
+        main_course = self.busy(main, class_date, slot)
+        if main_course is None:
+            return InstructorPick(main, False, None)
+
+        reserve = subject.get('reserve_instructor')
+        if reserve and reserve != main and self.busy(reserve, class_date, slot) is None:
+            return InstructorPick(reserve, True, None)
+        return InstructorPick(main, False, main_course)
+
+
+def find_conflicts(db, course_code, placements, boundary=HALF_DAY_BOUNDARY):
+    """저장할 배정 중 다른 과정과 강사가 겹치는 항목 (집합 단위 조회)
+
+    (강사, 날짜) 쌍 목록을 IN ((%s, %s), ...) 한 번으로 대조하므로
+    배정 수와 관계없이 쿼리는 한 번이다. (쌍이 CHECK_CHUNK_SIZE를 넘으면 나눠서 조회)
+
+    Args:
+        course_code: 저장하는 과정 (자기 과정 행은 제외)
+        placements: [(강사코드, 날짜, 시작시간, 종료시간), ...]
+
+    Returns:
+        list: Conflict 목록 (날짜, 반일 순)
+    """
+    wanted = set()
+    for instructor_code, class_date, start_time, end_time in placements:
+        if not instructor_code:
+            continue
+        for slot in half_days(start_time, end_time, boundary):
+            wanted.add((instructor_code, to_date(class_date), slot))
+    pairs = sorted({(code, day) for code, day, _ in wanted})
+
+    conflicts = {}
+    for start in range(0, len(pairs), CHECK_CHUNK_SIZE):
+        chunk = pairs[start:start + CHECK_CHUNK_SIZE]
+        placeholders = ", ".join(["(%s, %s)"] * len(chunk))
+        rows = db.fetch_all(f"""
+            SELECT t.instructor_code, t.class_date, t.start_time, t.end_time, t.course_code,
+                   i.name AS instructor_name, c.name AS course_name
+            FROM timetables t
+            LEFT JOIN instructors i ON t.instructor_code = i.code
+            LEFT JOIN courses c ON t.course_code = c.code
+            WHERE t.course_code <> %s AND (t.instructor_code, t.class_date) IN ({placeholders})
+        """, (course_code,) + tuple(value for pair in chunk for value in pair))
+
+        for row in rows:
+            for slot in half_days(row['start_time'], row['end_time'], boundary):
+                key = (row['instructor_code'], to_date(row['class_date']), slot)
+                if key in wanted and key not in conflicts:
+                    conflicts[key] = Conflict(row['instructor_code'], row['instructor_name'], key[1], slot,
+                                              row['course_code'], row['course_name'])
+
+    return [conflicts[key] for key in sorted(conflicts, key=lambda k: (k[1], k[2], k[0]))]
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+한국 법정공휴일 계산
+
+해마다 공휴일 목록을 손으로 입력하지 않도록 연도만 주면 공휴일을 계산한다.
+
+- 양력 공휴일: 신정, 삼일절, 어린이날, 현충일, 광복절, 개천절, 한글날, 성탄절
+- 음력 공휴일: 설날(전날/다음날 연휴), 석가탄신일, 추석(전날/다음날 연휴)
+  → 내장 음력 표(LUNAR_TABLE)로 양력 날짜 변환
+- 대체공휴일
+  - 설날/추석 연휴: 일요일 또는 다른 공휴일과 겹치면 (2014년부터)
+  - 어린이날: 토/일요일 또는 다른 공휴일과 겹치면 (2014년부터)
+  - 삼일절/광복절/개천절/한글날: 토/일요일과 겹치면 (2021년부터)
+  - 석가탄신일/성탄절: 토/일요일과 겹치면 (2023년부터)
+  대체공휴일은 해당 공휴일(연휴) 다음의 첫 번째 비공휴일(평일)이다.
+
+선거일, 임시공휴일은 법으로 정해진 날짜가 아니므로 계산하지 않는다. (수동 등록)
+
+사용 예:
+    rows = holidays_between(2026, 2027)
+    inserted, updated, skipped = upsert_holidays(db, rows)
+"""
+
+from collections import namedtuple
+from datetime import date, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.helpers import to_date
+
+# 음력 표 첫 해
+LUNAR_TABLE_START = 2000
+
+# 연도별 음력 정보 (LUNAR_TABLE_START년부터)
+#   bit 17~ : 음력 1월 1일의 양력 1월 1일부터 일수
+#   bit 13~16: 윤달 (0이면 없음, 5면 5월 다음에 윤5월)
+#   bit 0~12 : 달 길이 (윤달 포함 순서대로 i번째 달이 30일이면 bit i = 1, 아니면 29일)
+# 한국 표준시(KST) 기준 합삭과 중기로 계산하고 한국천문연구원 발표 날짜와 대조한 값.
+# (중국 농력과는 일부 해의 날짜가 다르다)
+LUNAR_TABLE = (
+    0x460693, 0x2e9527, 0x54052b, 0x3e0a5b, 0x2a555a, 0x4e036a,  # 2000
+    0x38fb55, 0x600ba4, 0x4a0b49, 0x32ba93, 0x580a95, 0x42052d,  # 2006
+    0x2c6a5d, 0x500aad, 0x3d35aa, 0x6205d2, 0x4c0da5, 0x36bd4a,  # 2012
+    0x5c0d4a, 0x460a95, 0x30952d, 0x540556, 0x3e0ab5, 0x2a55aa,  # 2018
+    0x5006d2, 0x38cea5, 0x5e0ea5, 0x4a0e4a, 0x34ac96, 0x560c9b,  # 2024
+    0x42055a, 0x2c6ad5, 0x520b69, 0x3d7752, 0x620752, 0x4c0b25,  # 2030
+    0x36d64b, 0x5a0a4b, 0x4404ab, 0x2ea55b, 0x54056d, 0x3e0b69,  # 2036
+    0x2a5b52, 0x500d92, 0x3afd25, 0x5e0d25, 0x480a4d, 0x32b4ad,  # 2042
+    0x5802b6, 0x4005b5, 0x2c6da9, 0x520ea9, 0x3f1d92, 0x620e92,  # 2048
+    0x4c0d26, 0x36ca56, 0x5a0a57, 0x4404d6, 0x2e86b5, 0x5406d5,  # 2054
+    0x400ec9, 0x2a6e92, 0x4e0693, 0x38f52b, 0x5e052b, 0x460a5b,  # 2060
+    0x32b55a, 0x58056a, 0x420b55, 0x2c9749, 0x520b49, 0x3d1a93,  # 2066
+    0x620a95, 0x4a052d, 0x34caad, 0x5a0ab5, 0x4605aa, 0x2e8ba5,  # 2072
+    0x540da5, 0x400d4a, 0x2a7a95, 0x4e0c95, 0x38f52e, 0x5e0556,  # 2078
+    0x480ab5, 0x32b5b2, 0x5806d2, 0x420ea5, 0x2e9e4a, 0x52064a,  # 2084
+    0x3b0c97, 0x600cab, 0x4c055a, 0x34cad5, 0x5a0b69, 0x460752,  # 2090
+    0x3096a5, 0x540b25, 0x3e064b, 0x287497, 0x4e04ab,  # 2096
+)
+
+LUNAR_TABLE_END = LUNAR_TABLE_START + len(LUNAR_TABLE) - 1
+
+# (월, 일, 이름, 토/일요일 대체공휴일 적용 시작 연도 또는 None)
+SOLAR_HOLIDAYS = (
+    (1, 1, '신정', None),
+    (3, 1, '삼일절', 2021),
+    (5, 5, '어린이날', 2014),
+    (6, 6, '현충일', None),
+    (8, 15, '광복절', 2021),
+    (10, 3, '개천절', 2021),
+    (10, 9, '한글날', 2021),
+    (12, 25, '성탄절', 2023),
+)
+
+# 다른 공휴일과 겹칠 때도 대체공휴일을 주는 공휴일 (이름 → 적용 시작 연도)
+OVERLAP_SUBSTITUTE = {'어린이날': 2014}
+
+# 설날/추석 연휴 대체공휴일 (일요일 또는 다른 공휴일과 겹칠 때) 적용 시작 연도
+LUNAR_SUBSTITUTE_SINCE = 2014
+
+# 석가탄신일 토/일요일 대체공휴일 적용 시작 연도
+BUDDHA_SUBSTITUTE_SINCE = 2023
+
+Holiday = namedtuple('Holiday', 'holiday_date name is_legal')
+
+
+def _year_info(year):
+    if not LUNAR_TABLE_START <= year <= LUNAR_TABLE_END:
+        raise ValueError(f"음력 변환은 {LUNAR_TABLE_START}~{LUNAR_TABLE_END}년만 지원합니다: {year}")
+    info = LUNAR_TABLE[year - LUNAR_TABLE_START]
+    new_year = date(year, 1, 1) + timedelta(days=info >> 17)
+    leap_month = (info >> 13) & 0xF
+    month_count = 13 if leap_month else 12
+    lengths = [30 if info & (1 << i) else 29 for i in range(month_count)]
+    return new_year, leap_month, lengths
+
+
+def lunar_to_solar(year, month, day, leap=False):
+    """음력 날짜 → 양력 date
+
+    Args:
+        leap: 윤달이면 True (그 해에 해당 윤달이 없으면 ValueError)
+    """
+    new_year, leap_month, lengths = _year_info(year)
+    if leap and leap_month != month:
+        raise ValueError(f"{year}년에는 음력 윤{month}월이 없습니다.")
+
+    # 윤달 포함 순서에서의 위치 (윤달은 같은 숫자 달 바로 다음)
+    index = month - 1
+    if leap_month and (month > leap_month or leap):
+        index += 1
+    if not 1 <= day <= lengths[index]:
+        raise ValueError(f"음력 {year}년 {'윤' if leap else ''}{month}월에는 {day}일이 없습니다.")
+    return new_year + timedelta(days=sum(lengths[:index]) + day - 1)
+
+
+def _first_free_weekday(after, taken):
+    """after 다음의 첫 번째 평일 비공휴일"""
+    day = after + timedelta(days=1)
+    while day.weekday() >= 5 or day in taken:
+        day += timedelta(days=1)
+    return day
+
+
+def holidays_for_year(year):
+    """한 해의 법정공휴일 (날짜 순 Holiday 목록, 같은 날 공휴일은 이름을 ', '로 합침)"""
+    names = {}      # 날짜 → [이름, ...]
+    triggers = []   # (대체 여부 판단할 날짜들, 대체 기준일, 이름, 일요일만 대상인지)
+
+    def add(day, name):
+        names.setdefault(day, []).append(name)
+
+    for month, day, name, since in SOLAR_HOLIDAYS:
+        holiday = date(year, month, day)
+        add(holiday, name)
+        if since is not None and year >= since:
+            triggers.append(([holiday], holiday, name, False))
+
+    for month, day, name in ((1, 1, '설날'), (8, 15, '추석')):
+        center = lunar_to_solar(year, month, day)
+        span = [center - timedelta(days=1), center, center + timedelta(days=1)]
+        add(span[0], f'{name} 연휴')
+        add(center, name)
+        add(span[2], f'{name} 연휴')
+        if year >= LUNAR_SUBSTITUTE_SINCE:
+            triggers.append((span, span[-1], name, True))
+
+    buddha = lunar_to_solar(year, 4, 8)
+    add(buddha, '석가탄신일')
+    if year >= BUDDHA_SUBSTITUTE_SINCE:
+        triggers.append(([buddha], buddha, '석가탄신일', False))
+
+    # 대체공휴일 (같은 날 겹친 공휴일이 모두 대상이어도 하루만 지정)
+    taken = set(names)
+    handled = set()
+    substitutes = []
+    for days, last, name, sunday_only in sorted(triggers, key=lambda t: t[1]):
+        key = tuple(days)
+        if key in handled:
+            continue
+        overlap = name in OVERLAP_SUBSTITUTE and year >= OVERLAP_SUBSTITUTE[name]
+        needed = False
+        for day in days:
+            weekend = day.weekday() == 6 or (not sunday_only and day.weekday() == 5)
+            shared = len(names[day]) > 1 and (sunday_only or overlap)
+            if weekend or shared:
+                needed = True
+                break
+        if needed:
+            handled.add(key)
+            substitute = _first_free_weekday(last, taken)
+            taken.add(substitute)
+            substitutes.append((substitute, f'대체공휴일({name})'))
+
+    for day, name in substitutes:
+        add(day, name)
+    return [Holiday(day, ', '.join(names[day]), True) for day in sorted(names)]
+
+
+def holidays_between(start_year, end_year):
+    """start_year~end_year (양 끝 포함) 법정공휴일 목록"""
+    rows = []
+    for year in range(start_year, end_year + 1):
+        rows.extend(holidays_for_year(year))
+    return rows
+
+
+def upsert_holidays(db, holidays, overwrite=False):
+    """공휴일 일괄 저장 (INSERT … ON DUPLICATE KEY, 한 트랜잭션)
+
+    Args:
+        holidays: Holiday 또는 (날짜, 이름, 법정여부) 목록
+        overwrite: True면 이미 등록된 날짜의 이름/법정여부를 계산값으로 갱신,
+                   False면 이미 등록된 날짜는 건너뜀
+
+    Returns:
+        tuple: (추가 수, 갱신 수, 건너뛴 수)  오류는 호출한 쪽으로 전달
+    """
+    rows = [(to_date(day), name, bool(is_legal)) for day, name, is_legal in holidays]
+    if not rows:
+        return 0, 0, 0
+
+    existing = db.fetch_all(
+        "SELECT holiday_date, name, is_legal FROM holidays WHERE holiday_date BETWEEN %s AND %s",
+        (min(row[0] for row in rows), max(row[0] for row in rows))
+    )
+    current = {to_date(row['holiday_date']): (row['name'], bool(row['is_legal'])) for row in existing}
+
+    inserted = updated = skipped = 0
+    pending = []
+    for row in rows:
+        if row[0] not in current:
+            inserted += 1
+        elif overwrite and current[row[0]] != row[1:]:
+            updated += 1
+        else:
+            skipped += 1
+            continue
+        pending.append(row)
+
+    if pending:
+        if overwrite:
+            update = "name = VALUES(name), is_legal = VALUES(is_legal)"
+        else:
+            # 조회 후 다른 사용자가 먼저 등록한 날짜는 그대로 둠
+            update = "holiday_date = holiday_date"
+        query = f"""
+            INSERT INTO holidays (holiday_date, name, is_legal)
+            VALUES (%s, %s, %s)
+            ON DUPLICATE KEY UPDATE {update}
+        """
+        with db.transaction():
+            db.execute_many(query, pending)
+    return inserted, updated, skipped
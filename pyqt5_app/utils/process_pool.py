@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+작업 프로세스 병렬 실행 (ProcessPoolExecutor)
+
+시간표 일괄 생성(batch_timetable)과 최적화 배정(schedule_optimizer)이 함께 쓴다.
+프로세스를 띄우지 못하는 환경(권한, 패키징된 실행 파일 등)에서는 None을 돌려주고
+호출한 쪽이 현재 프로세스에서 실행한다.
+
+사용 예:
+    results = run_in_process_pool(_generate, course_codes, workers,
+                                  initializer=_init_worker, initargs=(snapshot,))
+    if results is None:
+        _init_worker(snapshot)
+        results = [_generate(code) for code in course_codes]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import pickle
+import os
+
+# 최대 작업 프로세스 수 (기본값)
+DEFAULT_WORKERS = 4
+
+
+def default_workers():
+    """기본 작업 프로세스 수 (CPU 수, 최대 DEFAULT_WORKERS)"""
+    return min(os.cpu_count() or 1, DEFAULT_WORKERS)
+
+
+def run_in_process_pool(fn, items, workers, initializer=None, initargs=()):
+    """items마다 fn(item)을 작업 프로세스에서 실행
+
+    fn, initializer는 모듈 최상위 함수여야 한다. (spawn 프로세스로 전달)
+
+    Args:
+        fn: 항목 하나를 처리할 함수
+        items: 항목 목록
+        workers: 작업 프로세스 수
+        initializer: 작업 프로세스마다 한 번 실행할 함수 (선택)
+        initargs: initializer 인자
+
+    Returns:
+        list: items 순서의 결과 (프로세스 1개 이하로 충분하거나 실행에 실패하면 None)
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return None
+    try:
+        # fork는 Qt/DB 스레드가 있는 프로세스에서 안전하지 않으므로 spawn 사용
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=initializer, initargs=initargs) as executor:
+            return list(executor.map(fn, items))
+    except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+        print(f"병렬 실행 실패, 현재 프로세스에서 실행합니다: {str(e)}")
+        return None
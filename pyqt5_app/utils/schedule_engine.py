@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+"""
+시간표 배정 엔진 (Qt/DB 비의존)
+
+과목 목록, 공휴일, 기간, 시간대 설정만 받아서 요일 기반 배정을 수행한다.
+시간표 작성 화면, TimetableGenerator, 명령줄(CLI)에서 같은 엔진을 사용한다.
+
+원칙:
+1. 각 과목은 미리 지정된 요일(day_of_week)에만 배정
+2. 격주 과목은 해당 주차에만 배정
+3. 하루 = 오전 + 오후 (기본 4h + 4h), 1일 1과목 원칙
+4. 모든 시수를 소진할 때까지 반복
+
+과목 필드:
+- code, name, hours
+- day_of_week: 0=월, 1=화, 2=수, 3=목, 4=금
+- is_biweekly: True=격주, False=매주
+- week_offset: 0=1주차, 1=2주차 (격주인 경우만 사용)
+- main/assistant/reserve_instructor_name (표시용, 선택)
+- main_instructor/reserve_instructor: 강사코드 (conflicts로 다른 과정과 중복 확인 시 사용, 선택)
+
+사용 예:
+    python -m utils.schedule_engine subjects.json --start 2025-01-06 --end 2025-06-30
+"""
+
+from collections import namedtuple
+import heapq
+from datetime import datetime, date, time, timedelta
+import argparse
+import json
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.helpers import to_date, to_time
+
+
+DAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+
+# 하루 배정 결과: 날짜, 오전 과목코드/시수, 오후 과목코드/시수 (빈 슬롯은 None/0)
+ScheduleDay = namedtuple('ScheduleDay', ['date', 'am_code', 'am_hours', 'pm_code', 'pm_hours'])
+
+
+class SlotConfig:
+    """오전/오후 시간대 설정"""
+
+    def __init__(self, am_start=time(9, 0), am_end=time(13, 0),
+                 pm_start=time(14, 0), pm_end=time(18, 0)):
+        self.am_start = am_start
+        self.am_end = am_end
+        self.pm_start = pm_start
+        self.pm_end = pm_end
+
+    @classmethod
+    def from_day(cls, start, end, am_hours=4, lunch_hours=1):
+        """하루 시작/종료 시간으로 설정 생성 (오전 am_hours, 점심 lunch_hours, 나머지 오후)
+
+        Args:
+            start: 시작 시간 (time 또는 'HH:MM')
+            end: 종료 시간 (time 또는 'HH:MM')
+        """
+        start = to_time(start)
+        end = to_time(end)
+        base = datetime.combine(date.min, start)
+        am_end = (base + timedelta(hours=am_hours)).time()
+        pm_start = (base + timedelta(hours=am_hours + lunch_hours)).time()
+        return cls(start, am_end, pm_start, end)
+
+    @staticmethod
+    def _hours(start, end):
+        return (datetime.combine(date.min, end) - datetime.combine(date.min, start)).seconds // 3600
+
+    @property
+    def am_hours(self):
+        return self._hours(self.am_start, self.am_end)
+
+    @property
+    def pm_hours(self):
+        return self._hours(self.pm_start, self.pm_end)
+
+
+class ScheduleResult:
+    """배정 결과
+
+    Attributes:
+        days: ScheduleDay 목록 (수업일만, 날짜순)
+        remaining: 과목코드 → 배정되지 못하고 남은 시수
+        skipped_holidays: 기간 중 건너뛴 평일 공휴일 수
+        slots: 사용한 SlotConfig
+        instructors: (날짜, 'am'/'pm') → InstructorPick (conflicts를 넘긴 경우만)
+    """
+
+    def __init__(self, days, remaining, skipped_holidays, slots, instructors=None):
+        self.days = days
+        self.remaining = remaining
+        self.skipped_holidays = skipped_holidays
+        self.slots = slots
+        self.instructors = instructors or {}
+
+    @property
+    def substitutions(self):
+        """주강사가 다른 과정 수업 중이라 예비강사로 대체한 반일 수"""
+        return sum(1 for pick in self.instructors.values() if pick.substituted)
+
+    @property
+    def conflicts(self):
+        """예비강사도 없거나 수업 중이라 중복이 남은 [(날짜, 반일, 과정코드)]"""
+        return [(day, slot, pick.conflict_course)
+                for (day, slot), pick in sorted(self.instructors.items())
+                if pick.conflict_course]
+
+    @property
+    def is_complete(self):
+        """모든 시수 배정 여부"""
+        return not any(h > 0 for h in self.remaining.values())
+
+    @property
+    def end_date(self):
+        """마지막 수업일"""
+        return self.days[-1].date if self.days else None
+
+    @property
+    def assigned_hours(self):
+        """배정된 총 시수"""
+        return sum(d.am_hours + d.pm_hours for d in self.days)
+
+    def to_rows(self):
+        """슬롯별 행 목록 [(날짜, 시작, 종료, 과목코드, 시수)] (빈 슬롯 제외)"""
+        rows = []
+        for d in self.days:
+            if d.am_code:
+                rows.append((d.date, self.slots.am_start, self.slots.am_end, d.am_code, d.am_hours))
+            if d.pm_code:
+                rows.append((d.date, self.slots.pm_start, self.slots.pm_end, d.pm_code, d.pm_hours))
+        return rows
+
+    def to_timetable(self, subjects):
+        """시간표 작성 화면 형식으로 변환
+
+        Returns:
+            list: [{'date', 'am_subject', 'pm_subject'}, ...]
+        """
+        by_code = {s['code']: s for s in subjects}
+
+        def entry(day, slot, code, hours):
+            if not code:
+                return make_empty_entry()
+            subject = by_code[code]
+            result = make_subject_entry(subject, hours)
+            pick = self.instructors.get((day, slot))
+            if pick and pick.substituted:
+                # 주강사 자리에 예비강사 (저장 시 주강사 이름으로 강사코드를 찾음)
+                result['main_instructor'] = subject.get('reserve_instructor_name', '-')
+                result['reserve_instructor'] = subject.get('main_instructor_name', '-')
+                result['substituted'] = True
+            elif pick and pick.conflict_course:
+                result['conflict_course'] = pick.conflict_course
+            return result
+
+        return [
+            {
+                'date': d.date,
+                'am_subject': entry(d.date, 'am', d.am_code, d.am_hours),
+                'pm_subject': entry(d.date, 'pm', d.pm_code, d.pm_hours)
+            }
+            for d in self.days
+        ]
+
+    def to_dict(self):
+        """JSON 직렬화용 dict"""
+        return {
+            'days': [
+                [d.date.isoformat(), d.am_code, d.am_hours, d.pm_code, d.pm_hours]
+                for d in self.days
+            ],
+            'remaining': self.remaining,
+            'skipped_holidays': self.skipped_holidays,
+            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'assigned_hours': self.assigned_hours,
+            'is_complete': self.is_complete,
+        }
+
+
+class SubjectQueue:
+    """남은 시수 기준 과목 우선순위 큐
+
+    전체 힙 하나와 (요일, 주차 홀짝) 버킷별 힙을 두고, 시수가 바뀔 때마다
+    새 항목을 push 한다 (O(log n)). 오래된 항목은 꺼낼 때 버린다 (지연 삭제).
+    힙 키는 (-남은 시수, 과목 순번)이므로 동점이면 목록 앞쪽 과목이 먼저 나온다.
+    """
+
+    def __init__(self, subjects):
+        self.subjects = subjects
+        self.remaining = {}
+        for s in subjects:
+            self.remaining.setdefault(s['code'], s['hours'])
+        self.pending = sum(1 for h in self.remaining.values() if h > 0)
+
+        self._all = []
+        self._buckets = {}      # (요일, 주차 홀짝) → 힙
+        self._subject_keys = [] # 과목 순번 → 소속 버킷 키 목록
+        self._indexes = {}      # 과목코드 → 과목 순번 목록
+
+        for idx, s in enumerate(subjects):
+            keys = []
+            day = s.get('day_of_week')
+            if day is not None:
+                if s.get('is_biweekly', False):
+                    keys.append((day, s.get('week_offset', 0)))
+                else:
+                    keys.extend([(day, 0), (day, 1)])
+            self._subject_keys.append(keys)
+            self._indexes.setdefault(s['code'], []).append(idx)
+            self._push(idx)
+
+    def _push(self, idx):
+        hours = self.remaining[self.subjects[idx]['code']]
+        if hours <= 0:
+            return
+        item = (-hours, idx)
+        heapq.heappush(self._all, item)
+        for key in self._subject_keys[idx]:
+            heapq.heappush(self._buckets.setdefault(key, []), item)
+
+    def _peek(self, heap):
+        while heap:
+            neg_hours, idx = heap[0]
+            if self.remaining[self.subjects[idx]['code']] == -neg_hours:
+                return self.subjects[idx]
+            heapq.heappop(heap)
+        return None
+
+    def best(self):
+        """남은 시수가 가장 많은 과목 (없으면 None)"""
+        return self._peek(self._all)
+
+    def best_on(self, weekday, parity):
+        """해당 요일/주차 홀짝에 배정 가능한 과목 중 남은 시수가 가장 많은 과목"""
+        heap = self._buckets.get((weekday, parity))
+        return self._peek(heap) if heap else None
+
+    def consume(self, code, hours):
+        """시수 차감"""
+        before = self.remaining[code]
+        self.remaining[code] = before - hours
+        if before > 0 and self.remaining[code] <= 0:
+            self.pending -= 1
+        for idx in self._indexes[code]:
+            self._push(idx)
+
+
+def make_subject_entry(subject, hours):
+    """과목 엔트리 생성 (시간표 작성 화면 형식)"""
+    return {
+        'code': subject['code'],
+        'name': subject['name'],
+        'total_hours': subject['hours'],
+        'main_instructor': subject.get('main_instructor_name', '-'),
+        'assistant_instructor': subject.get('assistant_instructor_name', '-'),
+        'reserve_instructor': subject.get('reserve_instructor_name', '-'),
+        'hours': hours
+    }
+
+
+def make_empty_entry():
+    """빈 시간 엔트리 생성 (시간표 작성 화면 형식)"""
+    return {
+        'code': '',
+        'name': '-',
+        'total_hours': 0,
+        'main_instructor': '-',
+        'assistant_instructor': '-',
+        'reserve_instructor': '-',
+        'hours': 0
+    }
+
+
+def schedule(subjects, holidays, start_date, end_date, slots=None, trace=None, conflicts=None):
+    """요일 기반 시간표 배정
+
+    Args:
+        subjects: 과목 dict 목록 (배정 우선순위 순)
+        holidays: 공휴일 date 모음 (set 권장)
+        start_date: 시작일 (주차 계산 기준)
+        end_date: 종료일 (포함)
+        slots: SlotConfig (기본 09-13 / 14-18)
+        trace: 진행 메시지를 받을 함수 (예: print). None이면 메시지를 만들지 않음
+        conflicts: 다른 과정 강사 배정 색인 (utils.instructor_conflicts.ConflictIndex, 선택)
+            반일마다 주강사가 비어 있는지 확인하고, 수업 중이면 예비강사로 대체
+
+    Returns:
+        ScheduleResult: 배정 결과
+    """
+    slots = slots or SlotConfig()
+    am_slot_hours = slots.am_hours
+    pm_slot_hours = slots.pm_hours
+    start_date = to_date(start_date)
+    end_date = to_date(end_date)
+    if not isinstance(holidays, (set, frozenset)):
+        holidays = set(to_date(h) for h in holidays)
+
+    days = []
+    instructors = {}
+    skipped_holidays = 0
+    queue = SubjectQueue(subjects)
+    by_code = {s['code']: s for s in subjects}
+    remaining = queue.remaining
+    names = {s['code']: s['name'] for s in subjects}
+
+    if trace:
+        trace("=" * 80)
+        trace("🎯 시간표 생성 시작")
+        trace(f"📅 기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
+        trace(f"📚 과목 수: {len(subjects)}")
+        trace(f"⏰ 총 시수: {sum(remaining.values())}시간")
+        trace("📋 과목별 배정 정보:")
+        for s in subjects:
+            day = s.get('day_of_week')
+            day_str = DAY_NAMES[day] if day is not None and 0 <= day <= 4 else "미설정"
+            biweekly = "격주" if s.get('is_biweekly') else "매주"
+            week = f"/{s.get('week_offset', 0)+1}주차" if s.get('is_biweekly') else ""
+            trace(f"  • {s['name']:<25} : {day_str}요일, {biweekly}{week}, {s['hours']}시간")
+        trace("=" * 80)
+
+    current_date = start_date
+
+    while current_date <= end_date and queue.pending:
+        # 주말 스킵
+        if current_date.weekday() >= 5:
+            current_date += timedelta(days=1)
+            continue
+
+        # 공휴일 스킵
+        if current_date in holidays:
+            skipped_holidays += 1
+            if trace:
+                trace(f"🎊 {current_date.strftime('%Y-%m-%d')} - 공휴일 (스킵)")
+            current_date += timedelta(days=1)
+            continue
+
+        # 현재 요일과 주차
+        weekday = current_date.weekday()
+        week_number = (current_date - start_date).days // 7  # 0부터 시작
+
+        # 1단계: 요일이 일치하고 시수가 남은 과목 중 시수가 가장 많이 남은 과목 (격주는 주차 확인)
+        subject = queue.best_on(weekday, week_number % 2)
+
+        # 2단계: 요일 매칭이 없으면 → 남은 시수가 있는 아무 과목 (미완료 과목 방지)
+        if not subject:
+            subject = queue.best()
+            if not subject:
+                break
+            if trace:
+                trace(f"⚠️  {current_date.strftime('%Y-%m-%d')} ({DAY_NAMES[weekday]}) - "
+                      f"요일 미지정 과목 우선 배정: {subject['name']}")
+
+        # 오전 배정
+        code = subject['code']
+        am_hours = min(am_slot_hours, remaining[code])
+        queue.consume(code, am_hours)
+
+        # 오후 배정: 오전 과목이 계속되면 같은 과목, 끝났으면 남은 시수가 가장 많은 다른 과목
+        pm_code = None
+        pm_hours = 0
+        if remaining[code] > 0:
+            pm_code = code
+        else:
+            other = queue.best()
+            if other:
+                pm_code = other['code']
+                if trace:
+                    trace(f"  ⚡ 오전 과목 완료 → 오후는 {names[pm_code]} 배정")
+
+        if pm_code:
+            pm_hours = min(pm_slot_hours, remaining[pm_code])
+            queue.consume(pm_code, pm_hours)
+            if not pm_hours:
+                pm_code = None
+
+        days.append(ScheduleDay(current_date, code if am_hours else None, am_hours, pm_code, pm_hours))
+
+        if conflicts is not None:
+            for slot, slot_code in (('am', code if am_hours else None), ('pm', pm_code)):
+                if not slot_code:
+                    continue
+                pick = conflicts.pick(by_code[slot_code], current_date, slot)
+                instructors[(current_date, slot)] = pick
+                if trace and pick.substituted:
+                    trace(f"  👥 {current_date.strftime('%Y-%m-%d')} {slot.upper()} - "
+                          f"주강사 다른 과정 수업 중 → 예비강사 배정")
+                elif trace and pick.conflict_course:
+                    trace(f"  ❗ {current_date.strftime('%Y-%m-%d')} {slot.upper()} - "
+                          f"강사 중복 ({pick.conflict_course}), 대체 강사 없음")
+
+        if trace:
+            mark = "🔄" if subject.get('is_biweekly') else "📅"
+            day_str = f"{current_date.strftime('%Y-%m-%d')} ({DAY_NAMES[weekday]})"
+            if pm_code == code:
+                trace(f"{mark} {day_str} - {names[code]:<25} : AM {am_hours}h + PM {pm_hours}h = "
+                      f"{am_hours + pm_hours}h (남은 시수: {remaining[code]}h)")
+            elif pm_code:
+                trace(f"{mark} {day_str} - AM: {names[code]:<20} {am_hours}h (남은: {remaining[code]}h) | "
+                      f"PM: {names[pm_code]:<20} {pm_hours}h (남은: {remaining[pm_code]}h)")
+            else:
+                trace(f"{mark} {day_str} - AM: {names[code]:<20} {am_hours}h (남은: {remaining[code]}h) | PM: -")
+
+        current_date += timedelta(days=1)
+
+    result = ScheduleResult(days, remaining, skipped_holidays, slots, instructors)
+
+    if trace:
+        trace("=" * 80)
+        trace("✅ 시간표 생성 완료")
+        trace(f"📊 총 {len(days)}일 배정")
+        trace(f"⏰ 배정된 시수: {result.assigned_hours}시간")
+        incomplete = {k: v for k, v in remaining.items() if v > 0}
+        if incomplete:
+            trace("⚠️  미완료 과목:")
+            for code, hours in incomplete.items():
+                trace(f"  • {names[code]}: {hours}시간 남음")
+        else:
+            trace("🎉 모든 과목 시수 배정 완료!")
+        trace("=" * 80)
+
+    return result
+
+
+def main(argv=None):
+    """명령줄 실행: 과목 JSON 파일로 시간표를 배정하고 결과를 출력"""
+    parser = argparse.ArgumentParser(description="요일 기반 시간표 배정 (GUI 없이 실행)")
+    parser.add_argument('subjects', help="과목 목록 JSON 파일 (code, name, hours, day_of_week, ...)")
+    parser.add_argument('--start', required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument('--end', help="종료일 (YYYY-MM-DD, 기본: 시작일 + 365일)")
+    parser.add_argument('--holidays', help="공휴일 JSON 파일 (날짜 문자열 목록)")
+    parser.add_argument('--day-start', default="09:00", help="하루 시작 시간 (기본 09:00)")
+    parser.add_argument('--day-end', default="18:00", help="하루 종료 시간 (기본 18:00)")
+    parser.add_argument('--trace', action='store_true', help="배정 과정 출력")
+    parser.add_argument('--json', action='store_true', help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    with open(args.subjects, encoding='utf-8') as f:
+        subjects = json.load(f)
+
+    holidays = set()
+    if args.holidays:
+        with open(args.holidays, encoding='utf-8') as f:
+            holidays = set(to_date(h) for h in json.load(f))
+
+    start_date = to_date(args.start)
+    end_date = to_date(args.end) if args.end else start_date + timedelta(days=365)
+    slots = SlotConfig.from_day(args.day_start, args.day_end)
+
+    result = schedule(subjects, holidays, start_date, end_date, slots,
+                      trace=print if args.trace else None)
+
+    if args.json:
+        print(json.dumps(result.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        print(f"수업일수: {len(result.days)}일, 종료일: {result.end_date}, "
+              f"배정 시수: {result.assigned_hours}시간, 공휴일 스킵: {result.skipped_holidays}일")
+        for code, hours in result.remaining.items():
+            if hours > 0:
+                print(f"  미완료 {code}: {hours}시간 남음")
+
+    return 0 if result.is_complete else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,602 @@
+# -*- coding: utf-8 -*-
+"""
+시간표 최적화 배정 (Qt/DB 비의존)
+
+schedule()의 탐욕 배정은 빠르지만 한 번 정한 배정을 되돌리지 않아서
+과목이 하루 중간에 끝나면 오후에 다른 과목이 붙고(1일 1과목 위반),
+요일/격주 조건이 빡빡하면 요일을 어기거나 종료일까지 시수를 못 채운다.
+
+최적화 모드는 후보 시간표를 벌점(낮을수록 좋음)으로 평가하고
+무작위 탐욕 배정으로 여러 번 다시 시작하면서 각 후보를 지역 탐색으로 다듬는다.
+탐색은 ProcessPoolExecutor로 여러 프로세스에 나눠 시간 예산 안에서 실행하고,
+가장 좋은 시간표와 함께 탐욕 배정(기준선)의 벌점 내역을 돌려준다.
+
+벌점 항목 (개수 × DEFAULT_WEIGHTS):
+- weekday: 지정 요일이 아닌 날에 배정된 반일
+- biweekly: 격주 과목이 해당 주차가 아닌 주에 배정된 반일
+- contiguity: 과목 수업이 끊긴 횟수 (배정 가능한 날 기준 연속 구간 수 - 1)
+- conflict: 다른 과정과 강사가 겹치고 예비강사도 없는 반일
+- late: 강의 종료일 이후에 배정된 반일
+- incomplete: 배정하지 못한 시수
+- split: 오전/오후 과목이 다른 날
+- idle: 마지막 수업일 전의 빈 반일
+
+사용 예:
+    outcome = optimize(subjects, holidays, start_date, end_date, conflicts=conflicts, time_budget=5)
+    timetable = outcome.result.to_timetable(subjects)
+    print("\\n".join(outcome.report()))
+
+    python -m utils.schedule_optimizer subjects.json --start 2025-01-06 --end 2025-06-30 --budget 5
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import timedelta
+import argparse
+import json
+import random
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.helpers import to_date
+from utils.schedule_engine import ScheduleDay, ScheduleResult, SlotConfig, schedule
+from utils.process_pool import run_in_process_pool, default_workers
+
+# 항목별 가중치 (미배정 1시간이 종료일 초과 반일보다 훨씬 나쁘도록)
+DEFAULT_WEIGHTS = {
+    'weekday': 10,
+    'biweekly': 6,
+    'contiguity': 2,
+    'conflict': 30,
+    'late': 8,
+    'incomplete': 20,
+    'split': 3,
+    'idle': 4,
+}
+
+# 보고서 표시 순서와 이름
+SCORE_TERMS = [
+    ('weekday', "요일 불일치 (반일)"),
+    ('biweekly', "격주 주차 불일치 (반일)"),
+    ('contiguity', "과목 끊김 (회)"),
+    ('conflict', "강사 중복 (반일)"),
+    ('late', "종료일 초과 (반일)"),
+    ('incomplete', "미배정 (시간)"),
+    ('split', "오전/오후 분할 (일)"),
+    ('idle', "빈 반일"),
+]
+
+# 기본 시간 예산(초)
+DEFAULT_TIME_BUDGET = 5.0
+
+SLOT_NAMES = ('am', 'pm')
+
+
+class Score(namedtuple('Score', 'counts total')):
+    """벌점 (counts: 항목 → 개수, total: 가중 합계)"""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_counts(cls, counts, weights):
+        return cls(dict(counts), sum(weights[key] * counts[key] for key in weights))
+
+
+class Problem:
+    """배정 문제 (작업 프로세스로 전달되므로 피클 가능한 값만 보관)
+
+    날짜는 시작일부터의 수업 가능일(평일, 공휴일 제외) 번호로 다루며,
+    종료일 뒤로도 모든 시수를 넣을 수 있을 만큼 늘려 둔다. (종료일 뒤는 late 벌점)
+    셀 번호는 날짜 번호 * 2 + (0=오전, 1=오후).
+    """
+
+    def __init__(self, subjects, holidays, start_date, end_date, slots=None, conflicts=None, weights=None):
+        self.start_date = to_date(start_date)
+        self.end_date = to_date(end_date)
+        self.slots = slots or SlotConfig()
+        self.capacity = (self.slots.am_hours, self.slots.pm_hours)
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        if not isinstance(holidays, (set, frozenset)):
+            holidays = set(to_date(h) for h in holidays)
+        self.holidays = holidays
+
+        # 같은 코드는 첫 항목만 사용 (SubjectQueue와 같음)
+        self.subjects = []
+        seen = set()
+        for s in subjects:
+            if s['code'] not in seen:
+                seen.add(s['code'])
+                self.subjects.append(s)
+        self.hours = [int(s['hours'] or 0) for s in self.subjects]
+
+        # 수업 가능일: 종료일까지 + 시수를 모두 넣을 만큼 (과목마다 반일 하나씩 남을 수 있음)
+        per_day = sum(self.capacity) or 1
+        needed = -(-sum(self.hours) // per_day) + len(self.subjects)
+        self.dates = []
+        current = self.start_date
+        while current <= self.end_date or len(self.dates) < needed:
+            if current.weekday() < 5 and current not in holidays:
+                self.dates.append(current)
+            current += timedelta(days=1)
+        self.end_index = bisect_right(self.dates, self.end_date)
+
+        # 과목별 날짜 적합도 (0=적합, 1=요일 불일치, 2=격주 주차 불일치)와 이전/다음 적합일 번호
+        self.constrained = []
+        self.mismatch = []
+        self.prev_eligible = []
+        self.next_eligible = []
+        for s in self.subjects:
+            day = s.get('day_of_week')
+            constrained = day is not None and 0 <= day <= 4
+            offset = s.get('week_offset') or 0
+            row = []
+            for d in self.dates:
+                if not constrained:
+                    row.append(0)
+                elif d.weekday() != day:
+                    row.append(1)
+                elif s.get('is_biweekly') and ((d - self.start_date).days // 7) % 2 != offset:
+                    row.append(2)
+                else:
+                    row.append(0)
+            prev, last = [], -1
+            for i, m in enumerate(row):
+                prev.append(last)
+                if m == 0:
+                    last = i
+            nxt, last = [-1] * len(row), -1
+            for i in range(len(row) - 1, -1, -1):
+                nxt[i] = last
+                if row[i] == 0:
+                    last = i
+            self.constrained.append(constrained)
+            self.mismatch.append(row)
+            self.prev_eligible.append(prev)
+            self.next_eligible.append(nxt)
+
+        # 주강사/예비강사 모두 다른 과정 수업 중인 (과목 순번, 셀 번호)
+        self.blocked = set()
+        if conflicts is not None and len(conflicts):
+            for si, s in enumerate(self.subjects):
+                for i, d in enumerate(self.dates):
+                    for slot in (0, 1):
+                        if conflicts.pick(s, d, SLOT_NAMES[slot]).conflict_course:
+                            self.blocked.add((si, 2 * i + slot))
+
+    def count_terms(self, cells, hours):
+        """셀 배정 → 항목별 개수"""
+        counts = dict.fromkeys(self.weights, 0)
+        n_days = len(self.dates)
+        occupied = [[0] * n_days for _ in self.subjects]
+        placed = [0] * len(self.subjects)
+        last = -1
+        filled = 0
+        for c, s in enumerate(cells):
+            if s < 0:
+                continue
+            i = c // 2
+            filled += 1
+            placed[s] += hours[c]
+            occupied[s][i] += 1
+            last = max(last, i)
+            m = self.mismatch[s][i]
+            if m == 1:
+                counts['weekday'] += 1
+            elif m == 2:
+                counts['biweekly'] += 1
+            if (s, c) in self.blocked:
+                counts['conflict'] += 1
+            if i >= self.end_index:
+                counts['late'] += 1
+
+        for i in range(n_days):
+            am, pm = cells[2 * i], cells[2 * i + 1]
+            if am >= 0 and pm >= 0 and am != pm:
+                counts['split'] += 1
+
+        for s, row in enumerate(occupied):
+            runs = sum(1 for i in range(n_days) if _run_start(self, row, s, i))
+            counts['contiguity'] += max(runs - 1, 0)
+
+        counts['idle'] = 2 * (last + 1) - filled
+        counts['incomplete'] = sum(max(h - p, 0) for h, p in zip(self.hours, placed))
+        return counts
+
+    def score(self, cells, hours):
+        return Score.from_counts(self.count_terms(cells, hours), self.weights)
+
+    def cells_from_result(self, result):
+        """ScheduleResult → (셀 배정, 셀 시수)"""
+        index = {d: i for i, d in enumerate(self.dates)}
+        order = {s['code']: si for si, s in enumerate(self.subjects)}
+        cells = [-1] * (2 * len(self.dates))
+        hours = [0] * (2 * len(self.dates))
+        for day in result.days:
+            i = index[day.date]
+            if day.am_code:
+                cells[2 * i], hours[2 * i] = order[day.am_code], day.am_hours
+            if day.pm_code:
+                cells[2 * i + 1], hours[2 * i + 1] = order[day.pm_code], day.pm_hours
+        return cells, hours
+
+    def to_result(self, cells, hours, conflicts=None):
+        """(셀 배정, 셀 시수) → ScheduleResult (중간의 빈 날도 포함)"""
+        remaining = {s['code']: h for s, h in zip(self.subjects, self.hours)}
+        days = []
+        instructors = {}
+        last = max((c // 2 for c, s in enumerate(cells) if s >= 0), default=-1)
+        for i in range(last + 1):
+            codes = []
+            for slot in (0, 1):
+                s = cells[2 * i + slot]
+                if s < 0:
+                    codes.append((None, 0))
+                    continue
+                subject = self.subjects[s]
+                remaining[subject['code']] -= hours[2 * i + slot]
+                codes.append((subject['code'], hours[2 * i + slot]))
+                if conflicts is not None:
+                    instructors[(self.dates[i], SLOT_NAMES[slot])] = conflicts.pick(
+                        subject, self.dates[i], SLOT_NAMES[slot])
+            days.append(ScheduleDay(self.dates[i], codes[0][0], codes[0][1], codes[1][0], codes[1][1]))
+
+        last_date = self.dates[last] if last >= 0 else self.start_date
+        skipped = sum(1 for h in self.holidays
+                      if self.start_date <= h <= last_date and h.weekday() < 5)
+        return ScheduleResult(days, remaining, skipped, self.slots, instructors)
+
+
+def _run_start(problem, row, s, i):
+    """과목 s의 i번째 날이 새 연속 구간의 시작인지 (전날 또는 이전 적합일에 같은 과목이 없으면 시작)"""
+    if not row[i]:
+        return False
+    if i > 0 and row[i - 1]:
+        return False
+    prev = problem.prev_eligible[s][i]
+    return not (prev >= 0 and row[prev])
+
+
+class _Plan:
+    """지역 탐색 중인 시간표 (셀 교환과 증분 벌점 계산)"""
+
+    def __init__(self, problem, cells, hours):
+        self.problem = problem
+        self.cells = cells
+        self.hours = hours
+        self.occupied = [[0] * len(problem.dates) for _ in problem.subjects]
+        for c, s in enumerate(cells):
+            if s >= 0:
+                self.occupied[s][c // 2] += 1
+        self.filled = sum(1 for s in cells if s >= 0)
+        self.last = max((c // 2 for c, s in enumerate(cells) if s >= 0), default=-1)
+        self.total = problem.score(cells, hours).total
+
+    def _cell_cost(self, c):
+        s = self.cells[c]
+        if s < 0:
+            return 0
+        p = self.problem
+        w = p.weights
+        i = c // 2
+        m = p.mismatch[s][i]
+        cost = w['weekday'] if m == 1 else w['biweekly'] if m == 2 else 0
+        if (s, c) in p.blocked:
+            cost += w['conflict']
+        if i >= p.end_index:
+            cost += w['late']
+        return cost
+
+    def _local_cost(self, days, subjects):
+        """교환에 관련된 날짜/과목의 벌점 (교환 전후 차이만 의미 있음)"""
+        p = self.problem
+        w = p.weights
+        n_days = len(p.dates)
+        cost = 0
+        for i in days:
+            cost += self._cell_cost(2 * i) + self._cell_cost(2 * i + 1)
+            am, pm = self.cells[2 * i], self.cells[2 * i + 1]
+            if am >= 0 and pm >= 0 and am != pm:
+                cost += w['split']
+        # 날짜 i의 배정이 바뀌면 i, i+1과 (i가 적합일이면) 다음 적합일까지의 구간 시작 여부가 바뀔 수 있음
+        for s in subjects:
+            row = self.occupied[s]
+            checked = set()
+            for i in days:
+                last = i + 1
+                if p.mismatch[s][i] == 0:
+                    nxt = p.next_eligible[s][i]
+                    last = nxt if nxt >= 0 else n_days - 1
+                for k in range(i, min(last, n_days - 1) + 1):
+                    if row[k] and k not in checked:
+                        checked.add(k)
+                        if _run_start(p, row, s, k):
+                            cost += w['contiguity']
+        cost += w['idle'] * (2 * (self.last + 1) - self.filled)
+        return cost
+
+    def _swap(self, pairs):
+        cells, hours = self.cells, self.hours
+        for a, b in pairs:
+            sa, sb = cells[a], cells[b]
+            if sa >= 0:
+                self.occupied[sa][a // 2] -= 1
+                self.occupied[sa][b // 2] += 1
+            if sb >= 0:
+                self.occupied[sb][b // 2] -= 1
+                self.occupied[sb][a // 2] += 1
+            cells[a], cells[b] = sb, sa
+            hours[a], hours[b] = hours[b], hours[a]
+        last = max([self.last] + [c // 2 for pair in pairs for c in pair])
+        while last >= 0 and cells[2 * last] < 0 and cells[2 * last + 1] < 0:
+            last -= 1
+        self.last = last
+
+    def try_swap(self, pairs):
+        """셀 교환을 적용하고 벌점 변화량 반환 (되돌리려면 같은 pairs로 undo)"""
+        days = {c // 2 for pair in pairs for c in pair}
+        subjects = {self.cells[c] for pair in pairs for c in pair} - {-1}
+        before = self._local_cost(days, subjects)
+        self._swap(pairs)
+        delta = self._local_cost(days, subjects) - before
+        self.total += delta
+        return delta
+
+    def undo(self, pairs, delta):
+        self._swap(pairs)
+        self.total -= delta
+
+
+def _construct(problem, rng, noise):
+    """무작위 탐욕 배정 (noise=0이면 schedule()과 같은 기준으로 결정적 배정)
+
+    날마다 요일이 맞는 과목 → 요일 미지정 과목 → 남은 아무 과목 순으로 후보를 정하고,
+    강사가 비어 있는 과목 중 남은 시수가 가장 많은 과목을 고른다. (noise 확률로 무작위 선택)
+    """
+    n_days = len(problem.dates)
+    remaining = list(problem.hours)
+    cells = [-1] * (2 * n_days)
+    hours = [0] * (2 * n_days)
+    subjects = range(len(problem.subjects))
+
+    def choose(candidates, c):
+        free = [s for s in candidates if (s, c) not in problem.blocked] or candidates
+        if noise and rng.random() < noise:
+            return rng.choice(free)
+        return max(free, key=lambda s: (remaining[s], -s))
+
+    def candidates(i, exclude=-1):
+        left = [s for s in subjects if remaining[s] > 0 and s != exclude]
+        return ([s for s in left if problem.constrained[s] and problem.mismatch[s][i] == 0]
+                or [s for s in left if not problem.constrained[s]]
+                or left)
+
+    for i in range(n_days):
+        for slot in (0, 1):
+            c = 2 * i + slot
+            if not problem.capacity[slot]:
+                continue
+            previous = cells[c - 1] if slot else -1
+            if previous >= 0 and remaining[previous] > 0:
+                s = previous  # 오전 과목이 남았으면 오후도 같은 과목
+            else:
+                options = candidates(i, previous)
+                if not options:
+                    break
+                s = choose(options, c)
+            cells[c] = s
+            hours[c] = min(problem.capacity[slot], remaining[s])
+            remaining[s] -= hours[c]
+        if not any(h > 0 for h in remaining):
+            break
+    return cells, hours
+
+
+def _local_search(plan, rng, deadline, patience_factor=40):
+    """무작위 교환 지역 탐색 (날짜 통째 교환 / 반일 교환, 나빠지지 않는 교환만 유지)
+
+    Returns:
+        int: 시도한 교환 수
+    """
+    p = plan.problem
+    n_days = len(p.dates)
+    capacity = p.capacity
+    moves = 0
+    stale = 0
+    while True:
+        span = min(plan.last + 2, n_days)
+        if span < 2 or stale >= patience_factor * span:
+            break
+        moves += 1
+        if not moves & 255 and time.time() >= deadline:
+            break
+
+        if rng.random() < 0.5:
+            i, j = rng.randrange(span), rng.randrange(span)
+            if i == j:
+                continue
+            pairs = ((2 * i, 2 * j), (2 * i + 1, 2 * j + 1))
+        else:
+            a, b = rng.randrange(2 * span), rng.randrange(2 * span)
+            if a // 2 == b // 2 or (plan.cells[a] == plan.cells[b] and plan.hours[a] == plan.hours[b]):
+                continue
+            if plan.hours[a] > capacity[b % 2] or plan.hours[b] > capacity[a % 2]:
+                continue
+            pairs = ((a, b),)
+
+        delta = plan.try_swap(pairs)
+        if delta < 0:
+            stale = 0
+        elif delta == 0:
+            stale += 1  # 같은 점수는 유지 (평탄한 구간 이동)
+        else:
+            plan.undo(pairs, delta)
+            stale += 1
+    return moves
+
+
+def _search(problem, seed, deadline, start_greedy=False):
+    """작업 프로세스 한 개의 탐색 (시간 예산 안에서 재시작 반복)
+
+    Returns:
+        tuple: (벌점 합계, 셀 배정, 셀 시수, 재시작 수, 교환 시도 수)
+    """
+    rng = random.Random(seed)
+    best = None
+    restarts = 0
+    moves = 0
+    while True:
+        noise = 0.0 if start_greedy and restarts == 0 else rng.uniform(0.05, 0.4)
+        plan = _Plan(problem, *_construct(problem, rng, noise))
+        moves += _local_search(plan, rng, deadline)
+        restarts += 1
+        if best is None or plan.total < best[0]:
+            best = (plan.total, list(plan.cells), list(plan.hours))
+        if time.time() >= deadline:
+            break
+    return best + (restarts, moves)
+
+
+def _search_task(args):
+    """작업 프로세스: _search(problem, seed, deadline, start_greedy)"""
+    return _search(*args)
+
+
+def _run_workers(problem, seeds, deadline, time_budget):
+    """시드마다 작업 프로세스에서 탐색 (프로세스를 못 띄우면 현재 프로세스에서 탐색)"""
+    tasks = [(problem, seed, deadline, k == 0) for k, seed in enumerate(seeds)]
+    runs = run_in_process_pool(_search_task, tasks, len(seeds))
+    if runs is not None:
+        return runs
+    if len(seeds) > 1:
+        # 병렬 실행에 실패해서 시간을 쓴 경우에도 최소한의 탐색 시간은 확보
+        deadline = max(deadline, time.time() + min(time_budget, 1.0))
+    return [_search(problem, seeds[0], deadline, True)]
+
+
+class OptimizeResult:
+    """최적화 결과
+
+    Attributes:
+        result: 선택된 시간표 (ScheduleResult, 탐욕 배정이 더 좋으면 탐욕 배정)
+        score: 선택된 시간표의 벌점
+        baseline: 탐욕 배정 결과 (ScheduleResult)
+        baseline_score: 탐욕 배정의 벌점
+        restarts: 전체 재시작 수
+        moves: 전체 교환 시도 수
+        workers: 사용한 프로세스 수
+        elapsed: 걸린 시간(초)
+    """
+
+    def __init__(self, result, score, baseline, baseline_score, restarts, moves, workers, elapsed):
+        self.result = result
+        self.score = score
+        self.baseline = baseline
+        self.baseline_score = baseline_score
+        self.restarts = restarts
+        self.moves = moves
+        self.workers = workers
+        self.elapsed = elapsed
+
+    @property
+    def improved(self):
+        return self.score.total < self.baseline_score.total
+
+    def report(self):
+        """벌점 비교표 (줄 목록)"""
+        lines = [f"{'항목':<22}{'탐욕':>8}{'최적화':>8}"]
+        for key, label in SCORE_TERMS:
+            lines.append(f"{label:<22}{self.baseline_score.counts[key]:>8}{self.score.counts[key]:>8}")
+        lines.append(f"{'벌점 합계':<22}{self.baseline_score.total:>8}{self.score.total:>8}")
+        lines.append(f"재시작 {self.restarts}회, 교환 시도 {self.moves}회, "
+                     f"프로세스 {self.workers}개, {self.elapsed:.1f}초")
+        return lines
+
+
+def optimize(subjects, holidays, start_date, end_date, slots=None, conflicts=None,
+             time_budget=DEFAULT_TIME_BUDGET, workers=None, seed=None, weights=None, trace=None):
+    """최적화 배정
+
+    Args:
+        subjects, holidays, start_date, slots, conflicts: schedule()과 같음
+        end_date: 강의 종료일 (넘겨서 배정하면 late 벌점)
+        time_budget: 탐색 시간(초)
+        workers: 작업 프로세스 수 (기본: CPU 수, 최대 process_pool.DEFAULT_WORKERS)
+        seed: 난수 시드 (None이면 무작위)
+        weights: 항목별 가중치 변경 (DEFAULT_WEIGHTS 일부만 넘겨도 됨)
+        trace: 진행 메시지를 받을 함수 (예: print)
+
+    Returns:
+        OptimizeResult
+    """
+    started = time.time()
+    problem = Problem(subjects, holidays, start_date, end_date, slots, conflicts, weights)
+    baseline = schedule(subjects, problem.holidays, start_date, end_date, problem.slots, conflicts=conflicts)
+    baseline_score = problem.score(*problem.cells_from_result(baseline))
+
+    workers = workers or default_workers()
+    base_seed = seed if seed is not None else random.randrange(1 << 30)
+    seeds = [base_seed + k for k in range(max(workers, 1))]
+    if trace:
+        trace(f"🧠 최적화 배정 시작: 과목 {len(problem.subjects)}개, 수업 가능일 {len(problem.dates)}일, "
+              f"프로세스 {len(seeds)}개, 예산 {time_budget}초")
+
+    runs = _run_workers(problem, seeds, started + time_budget, time_budget)
+    total, cells, hours, _, _ = min(runs, key=lambda run: run[0])
+    score = problem.score(cells, hours)
+    if score.total < baseline_score.total:
+        result = problem.to_result(cells, hours, conflicts)
+    else:
+        result, score = baseline, baseline_score
+
+    outcome = OptimizeResult(result, score, baseline, baseline_score,
+                             sum(run[3] for run in runs), sum(run[4] for run in runs),
+                             len(runs), time.time() - started)
+    if trace:
+        for line in outcome.report():
+            trace(line)
+    return outcome
+
+
+def main(argv=None):
+    """명령줄 실행: 과목 JSON 파일로 최적화 배정을 하고 탐욕 배정과 비교"""
+    parser = argparse.ArgumentParser(description="시간표 최적화 배정 (GUI 없이 실행)")
+    parser.add_argument('subjects', help="과목 목록 JSON 파일 (code, name, hours, day_of_week, ...)")
+    parser.add_argument('--start', required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument('--end', help="강의 종료일 (YYYY-MM-DD, 기본: 시작일 + 365일)")
+    parser.add_argument('--holidays', help="공휴일 JSON 파일 (날짜 문자열 목록)")
+    parser.add_argument('--day-start', default="09:00", help="하루 시작 시간 (기본 09:00)")
+    parser.add_argument('--day-end', default="18:00", help="하루 종료 시간 (기본 18:00)")
+    parser.add_argument('--budget', type=float, default=DEFAULT_TIME_BUDGET, help="탐색 시간(초)")
+    parser.add_argument('--workers', type=int, help="작업 프로세스 수")
+    parser.add_argument('--seed', type=int, help="난수 시드")
+    parser.add_argument('--json', action='store_true', help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    with open(args.subjects, encoding='utf-8') as f:
+        subjects = json.load(f)
+
+    holidays = set()
+    if args.holidays:
+        with open(args.holidays, encoding='utf-8') as f:
+            holidays = set(to_date(h) for h in json.load(f))
+
+    start_date = to_date(args.start)
+    end_date = to_date(args.end) if args.end else start_date + timedelta(days=365)
+    slots = SlotConfig.from_day(args.day_start, args.day_end)
+
+    outcome = optimize(subjects, holidays, start_date, end_date, slots, time_budget=args.budget,
+                       workers=args.workers, seed=args.seed, trace=None if args.json else print)
+
+    if args.json:
+        data = outcome.result.to_dict()
+        data['score'] = outcome.score._asdict()
+        data['baseline_score'] = outcome.baseline_score._asdict()
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+
+    return 0 if outcome.result.is_complete else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+과정 시작일 비교 (여러 후보 시작일의 일정을 한 번에 계산)
+
+CourseDialog.calculate_dates는 시작일 하나마다 근무일을 세므로 후보를 바꿔 가며
+비교하려면 매번 다시 계산해야 한다. 여기서는 기간 전체의 누적 근무일 배열을
+한 번 만들어 두고 모든 후보의 단계별 종료일과 주말/공휴일 수를 numpy 배열 연산으로 구한다.
+
+    working[i]  = i번째 날이 근무일이면 1
+    cum[i]      = i번째 날 전까지의 근무일 수 (cum[0] = 0)
+    days[k]     = k번째 근무일의 위치
+    → i부터 n번째 근무일 = days[cum[i] + n - 1],  [i, j] 근무일 수 = cum[j + 1] - cum[i]
+
+종료일 계산 규칙은 calculate_dates와 같다.
+(시수 → 하루 8시간 기준 일수 올림, 다음 단계는 이전 단계 종료일 다음 근무일부터)
+
+사용 예:
+    plans = plan_start_dates(get_work_calendar(db), '2026-03-02', '2026-06-30', 260, 220, 120)
+    for row in plans.rows('earliest_finish')[:5]:
+        print(row.start_date, row.internship_end)
+"""
+
+from collections import namedtuple
+from datetime import date, timedelta
+import argparse
+import time
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.helpers import to_date
+from utils.timetable_generator import HOURS_PER_DAY
+
+# 후보 시작일 최대 수 (하루 단위로 약 10년)
+MAX_CANDIDATES = 3660
+
+# 후보 한 건의 계산 결과
+StartDatePlan = namedtuple('StartDatePlan', [
+    'start_date', 'lecture_end', 'project_end', 'internship_end',
+    'total_days', 'working_days', 'weekend_days', 'holiday_days', 'lecture_holidays',
+])
+
+# 정렬 기준: 이름 → (표시명, 정렬 키 필드 목록 (앞이 우선))
+SORT_ORDERS = {
+    'earliest_finish': ("종료일 빠른 순", ('internship_end', 'start_date')),
+    'fewest_lecture_holidays': ("이론 기간 공휴일 적은 순", ('lecture_holidays', 'internship_end', 'start_date')),
+    'fewest_holidays': ("전체 공휴일 적은 순", ('holiday_days', 'internship_end', 'start_date')),
+    'shortest': ("총 기간 짧은 순", ('total_days', 'internship_end', 'start_date')),
+    'start_date': ("시작일 순", ('start_date',)),
+}
+
+
+def days_for_hours(hours, hours_per_day=HOURS_PER_DAY):
+    """시수 → 교육 일수 (올림)"""
+    return (int(hours) + hours_per_day - 1) // hours_per_day
+
+
+class StartDatePlans:
+    """후보 시작일별 일정 (필드마다 후보 수 길이의 numpy 배열, 날짜는 서수(ordinal))"""
+
+    DATE_FIELDS = ('start_date', 'lecture_end', 'project_end', 'internship_end')
+
+    def __init__(self, columns, lecture_days, project_days, internship_days):
+        self.columns = columns
+        self.lecture_days = lecture_days
+        self.project_days = project_days
+        self.internship_days = internship_days
+
+    def __len__(self):
+        return len(self.columns['start_date'])
+
+    def order(self, sort='earliest_finish'):
+        """정렬 순서 (후보 인덱스 배열)"""
+        keys = SORT_ORDERS[sort][1]
+        # np.lexsort는 마지막 키가 우선
+        return np.lexsort([self.columns[key] for key in reversed(keys)])
+
+    def rows(self, sort=None):
+        """StartDatePlan 목록 (sort가 없으면 시작일 순)"""
+        index = self.order(sort) if sort else np.arange(len(self))
+        values = []
+        for field in StartDatePlan._fields:
+            column = self.columns[field][index].tolist()
+            if field in self.DATE_FIELDS:
+                column = [date.fromordinal(value) for value in column]
+            values.append(column)
+        return [StartDatePlan(*row) for row in zip(*values)]
+
+
+def _calendar_arrays(holidays, first, last):
+    """[first, last] 범위의 (근무일 여부, 평일 공휴일 여부) 배열"""
+    ordinals = np.arange(first, last + 1)
+    weekday = (ordinals - 1) % 7  # date.fromordinal(1)은 월요일
+    holiday = np.isin(ordinals, np.fromiter((d.toordinal() for d in holidays), dtype=np.int64))
+    weekday_holiday = holiday & (weekday < 5)
+    return (weekday < 5) & ~holiday, weekday_holiday
+
+
+def candidate_dates(calendar, first, last, working_only=True):
+    """first ~ last 후보 시작일 목록 (working_only면 근무일만)"""
+    first = to_date(first)
+    last = to_date(last)
+    dates = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+    if working_only:
+        dates = [d for d in dates if calendar.is_working_day(d)]
+    return dates
+
+
+def plan_start_dates(calendar, first, last, lecture_hours, project_hours, internship_hours,
+                     working_only=True, hours_per_day=HOURS_PER_DAY):
+    """first ~ last 사이 후보 시작일마다 단계별 종료일과 주말/공휴일 수 계산
+
+    Args:
+        calendar: WorkCalendar (공휴일 목록만 사용)
+        first, last: 후보 시작일 범위 (양 끝 포함)
+        working_only: True면 근무일에 시작하는 후보만
+
+    Returns:
+        StartDatePlans
+    """
+    starts = np.array([d.toordinal() for d in candidate_dates(calendar, first, last, working_only)],
+                      dtype=np.int64)
+    if len(starts) > MAX_CANDIDATES:
+        raise ValueError(f"후보 시작일은 최대 {MAX_CANDIDATES}개까지 비교할 수 있습니다: {len(starts)}개")
+
+    lecture_days = days_for_hours(lecture_hours, hours_per_day)
+    project_days = days_for_hours(project_hours, hours_per_day)
+    internship_days = days_for_hours(internship_hours, hours_per_day)
+    if len(starts) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return StartDatePlans({field: empty for field in StartDatePlan._fields},
+                              lecture_days, project_days, internship_days)
+
+    # 마지막 후보의 과정이 끝날 때까지 (근무일 5/7 + 공휴일 여유, 모자라면 넓혀서 다시)
+    base = int(starts[0])
+    needed = lecture_days + project_days + internship_days + 2
+    span = int(starts[-1]) - base + needed * 7 // 5 + 60
+    while True:
+        working, weekday_holiday = _calendar_arrays(calendar.holidays, base, base + span)
+        cum = np.concatenate(([0], np.cumsum(working)))
+        days = np.flatnonzero(working)
+        if len(days) > cum[int(starts[-1]) - base] + needed:
+            break
+        span *= 2
+    holiday_cum = np.concatenate(([0], np.cumsum(weekday_holiday)))
+
+    def nth(pos, n):
+        # pos부터(당일 포함) n번째 근무일 (n이 0이면 pos 그대로, nth_working_day와 같음)
+        return days[cum[pos] + n - 1] if n > 0 else pos
+
+    def following(pos):
+        # pos 다음날부터 첫 근무일
+        return days[cum[pos + 1]]
+
+    start = starts - base
+    lecture_end = nth(start, lecture_days)
+    project_end = nth(following(lecture_end), project_days)
+    internship_end = nth(following(project_end), internship_days)
+
+    total_days = internship_end - start + 1
+    working_days = cum[internship_end + 1] - cum[start]
+    holiday_days = holiday_cum[internship_end + 1] - holiday_cum[start]
+    columns = {
+        'start_date': starts,
+        'lecture_end': lecture_end + base,
+        'project_end': project_end + base,
+        'internship_end': internship_end + base,
+        'total_days': total_days,
+        'working_days': working_days,
+        # 주말과 겹친 공휴일은 주말로 집계 (calculate_dates와 같음)
+        'weekend_days': total_days - working_days - holiday_days,
+        'holiday_days': holiday_days,
+        'lecture_holidays': holiday_cum[lecture_end + 1] - holiday_cum[start],
+    }
+    return StartDatePlans(columns, lecture_days, project_days, internship_days)
+
+
+def main(argv=None):
+    """명령줄 실행: 후보 시작일 비교 결과 출력"""
+    parser = argparse.ArgumentParser(description="과정 시작일 후보 비교")
+    parser.add_argument('first', help="후보 시작일 범위 시작 (YYYY-MM-DD)")
+    parser.add_argument('last', help="후보 시작일 범위 끝 (YYYY-MM-DD)")
+    parser.add_argument('--lecture-hours', type=int, default=260)
+    parser.add_argument('--project-hours', type=int, default=220)
+    parser.add_argument('--internship-hours', type=int, default=120)
+    parser.add_argument('--sort', choices=sorted(SORT_ORDERS), default='earliest_finish')
+    parser.add_argument('--limit', type=int, default=20, help="출력할 후보 수")
+    args = parser.parse_args(argv)
+
+    from database.db_manager import DatabaseManager
+    from utils.work_calendar import get_work_calendar
+
+    db = DatabaseManager()
+    if not db.connect():
+        print("데이터베이스 연결 실패")
+        return 1
+    try:
+        calendar = get_work_calendar(db)
+        started = time.perf_counter()
+        plans = plan_start_dates(calendar, args.first, args.last,
+                                 args.lecture_hours, args.project_hours, args.internship_hours)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.disconnect()
+
+    print(f"후보 {len(plans)}개 계산: {elapsed * 1000:.1f}ms ({SORT_ORDERS[args.sort][0]})")
+    for row in plans.rows(args.sort)[:args.limit]:
+        print(f"{row.start_date}  이론~{row.lecture_end}  프로젝트~{row.project_end}  "
+              f"인턴쉽~{row.internship_end}  총 {row.total_days}일  "
+              f"주말 {row.weekend_days}일  공휴일 {row.holiday_days}일 (이론 {row.lecture_holidays}일)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
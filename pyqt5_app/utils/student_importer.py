@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+학생 엑셀 일괄 등록
+
+- openpyxl read_only + iter_rows로 한 행씩 읽음 (셀 단위 접근 없음)
+- 필수값/길이 검사 후 휴대폰번호·이메일 중복은 미리 읽어 둔 집합으로 확인
+  (DB에 이미 있는 값 + 같은 파일의 앞 행)
+- 학생 코드는 한 번에 연속 블록으로 예약하고,
+  다중 행 INSERT를 청크로 나눠 하나의 트랜잭션에서 실행
+
+사용 예:
+    report = import_students(self.db, file_path)
+    print(report.summary())
+"""
+
+from datetime import date, datetime
+import re
+import sys
+import os
+import openpyxl
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config_db import CODE_PREFIX
+
+# 엑셀 헤더(공백 제거) → students 컬럼
+HEADER_COLUMNS = {
+    '이름': 'name',
+    '생년월일(78.01.12)': 'birth_date',
+    '성별(선택)': 'gender',
+    '휴대폰번호': 'phone',
+    '이메일': 'email',
+    '주소': 'address',
+    '관심있는분야(2개)': 'interests',
+    '최종학교/학년': 'education',
+    '자기소개(200자내외)': 'introduction',
+    '지원하고자하는캠퍼스를선택하세요': 'campus',
+}
+
+INSERT_COLUMNS = ('code', 'name', 'birth_date', 'gender', 'phone', 'email',
+                  'address', 'interests', 'education', 'introduction', 'campus')
+
+# 컬럼 최대 길이 (students 테이블 정의와 같음, TEXT 컬럼은 제외)
+MAX_LENGTHS = {'name': 50, 'birth_date': 20, 'gender': 10, 'phone': 20, 'email': 100, 'campus': 100}
+
+REQUIRED_COLUMNS = ('name', 'phone')
+
+STUDENT_PREFIX = CODE_PREFIX['student']
+
+_EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+class ImportReport:
+    """일괄 등록 결과
+
+    Attributes:
+        inserted: 등록된 학생 수
+        codes: 등록된 학생 코드 목록
+        errors: [(엑셀 행 번호, 이름, 사유), ...]
+    """
+
+    def __init__(self):
+        self.inserted = 0
+        self.codes = []
+        self.errors = []
+
+    def add_error(self, row_number, name, reason):
+        self.errors.append((row_number, name or '', reason))
+
+    def summary(self):
+        return f"성공: {self.inserted}명\n실패: {len(self.errors)}명"
+
+    def error_lines(self):
+        return [f"{row_number}행 ({name}): {reason}" for row_number, name, reason in self.errors]
+
+
+def _header_key(value):
+    return re.sub(r"\s+", "", str(value)) if value is not None else ''
+
+
+def _phone_key(phone):
+    """중복 비교용 휴대폰번호 (숫자만)"""
+    return re.sub(r"\D", "", phone or '')
+
+
+def _email_key(email):
+    return (email or '').strip().lower()
+
+
+def _cell_text(value, column):
+    """셀 값 → 저장할 문자열"""
+    if value is None:
+        return ''
+    if isinstance(value, (datetime, date)):
+        return value.strftime('%y.%m.%d') if column == 'birth_date' else value.strftime('%Y-%m-%d')
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    if column == 'phone' and isinstance(value, int) and not text.startswith('0'):
+        # 숫자 셀로 저장되어 앞자리 0이 빠진 번호 (1012345678 → 01012345678)
+        text = '0' + text
+    return text
+
+
+def read_rows(file_path):
+    """엑셀 첫 시트를 (행 번호, {컬럼: 값}) 으로 순차 반환 (읽기 전용 모드)"""
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        mapping = [(index, HEADER_COLUMNS.get(_header_key(value))) for index, value in enumerate(header)]
+        mapping = [(index, column) for index, column in mapping if column]
+        missing = set(REQUIRED_COLUMNS) - {column for _, column in mapping}
+        if missing:
+            raise ValueError(f"필수 헤더가 없습니다: {', '.join(sorted(missing))}")
+
+        for row_number, values in enumerate(rows, 2):
+            if not values or all(v is None or str(v).strip() == '' for v in values):
+                continue  # 빈 행
+            yield row_number, {
+                column: _cell_text(values[index] if index < len(values) else None, column)
+                for index, column in mapping
+            }
+    finally:
+        wb.close()
+
+
+def load_existing_keys(db):
+    """DB에 등록된 학생의 (휴대폰번호 집합, 이메일 집합)"""
+    phones, emails = set(), set()
+    for row in db.fetch_all("SELECT phone, email FROM students"):
+        if _phone_key(row['phone']):
+            phones.add(_phone_key(row['phone']))
+        if _email_key(row['email']):
+            emails.add(_email_key(row['email']))
+    return phones, emails
+
+
+def validate_rows(rows, phones, emails, report):
+    """검사를 통과한 행만 반환 (실패 사유는 report에 기록)
+
+    phones/emails에는 통과한 행의 값이 추가되므로 같은 파일 안의 중복도 걸러진다.
+    """
+    valid = []
+    for row_number, data in rows:
+        name = data.get('name', '')
+        missing = [column for column in REQUIRED_COLUMNS if not data.get(column)]
+        if missing:
+            report.add_error(row_number, name, f"필수값 누락 ({', '.join(missing)})")
+            continue
+        too_long = [column for column, limit in MAX_LENGTHS.items() if len(data.get(column, '')) > limit]
+        if too_long:
+            report.add_error(row_number, name, f"길이 초과 ({', '.join(too_long)})")
+            continue
+
+        phone = _phone_key(data['phone'])
+        email = _email_key(data.get('email'))
+        if len(phone) < 9:
+            report.add_error(row_number, name, f"휴대폰번호 형식 오류 ({data['phone']})")
+            continue
+        if email and not _EMAIL_PATTERN.match(email):
+            report.add_error(row_number, name, f"이메일 형식 오류 ({data['email']})")
+            continue
+        if phone in phones:
+            report.add_error(row_number, name, f"휴대폰번호 중복 ({data['phone']})")
+            continue
+        if email and email in emails:
+            report.add_error(row_number, name, f"이메일 중복 ({data['email']})")
+            continue
+
+        phones.add(phone)
+        if email:
+            emails.add(email)
+        valid.append((row_number, data))
+    return valid
+
+
+def import_students(db, file_path, chunk_size=500):
+    """엑셀 파일의 학생을 일괄 등록
+
+    검사를 통과한 행은 하나의 트랜잭션에서 모두 등록되며,
+    INSERT가 실패하면 전체 롤백하고 모든 행을 실패로 보고한다.
+
+    Returns:
+        ImportReport
+    """
+    report = ImportReport()
+    if not db.connect():
+        raise Exception("데이터베이스 연결 실패")
+
+    phones, emails = load_existing_keys(db)
+    valid = validate_rows(read_rows(file_path), phones, emails, report)
+    if not valid:
+        return report
+
+    query = f"""
+        INSERT INTO students ({', '.join(INSERT_COLUMNS)})
+        VALUES ({', '.join(['%s'] * len(INSERT_COLUMNS))})
+    """
+    try:
+        with db.transaction():
+            codes = db.reserve_codes('students', STUDENT_PREFIX, len(valid))
+            params = [
+                (code,) + tuple(data.get(column, '') for column in INSERT_COLUMNS[1:])
+                for code, (_, data) in zip(codes, valid)
+            ]
+            db.execute_many(query, params, chunk_size=chunk_size)
+    except Exception as e:
+        print(f"학생 일괄 등록 오류: {str(e)}")
+        for row_number, data in valid:
+            report.add_error(row_number, data.get('name'), f"저장 실패 (전체 롤백): {str(e)}")
+        return report
+
+    report.inserted = len(valid)
+    report.codes = codes
+    return report
@@ -3,12 +3,230 @@
 시간표 자동 생성 유틸리티
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database.db_manager import DatabaseManager
+from utils.helpers import to_date, to_time
+from utils.schedule_engine import schedule, SlotConfig
+from utils.instructor_conflicts import ConflictIndex
+from utils.work_calendar import get_work_calendar
+
+
+# timetables INSERT (모든 값을 %s로 전달해야 다중 행 VALUES로 묶임)
+INSERT_COLUMNS = ('course_code', 'subject_code', 'class_date', 'start_time', 'end_time',
+                  'instructor_code', 'type', 'notes')
+INSERT_QUERY = f"""
+    INSERT INTO timetables ({', '.join(INSERT_COLUMNS)})
+    VALUES ({', '.join(['%s'] * len(INSERT_COLUMNS))})
+"""
+
+# 배정에 필요한 과목 컬럼 (강사 이름은 표시용)
+SUBJECT_COLUMNS = """
+    s.code, s.name, s.hours, s.main_instructor, s.reserve_instructor,
+    s.day_of_week, s.is_biweekly, s.week_offset,
+    i1.name as main_instructor_name,
+    i2.name as assistant_instructor_name,
+    i3.name as reserve_instructor_name
+"""
+SUBJECT_JOINS = """
+    LEFT JOIN instructors i1 ON s.main_instructor = i1.code
+    LEFT JOIN instructors i2 ON s.assistant_instructor = i2.code
+    LEFT JOIN instructors i3 ON s.reserve_instructor = i3.code
+"""
+
+# 프로젝트/인턴쉽 일수 계산용 하루 수업 시간 (예: 09:00-18:00 = 8시간, 점심 1시간 제외)
+HOURS_PER_DAY = 8
+
+
+def entry_params(entry):
+    """시간표 행 dict → INSERT 파라미터 튜플"""
+    return tuple(entry[column] for column in INSERT_COLUMNS)
+
+
+def build_course_entries(course, subjects, calendar, start_date, start_time="09:00", end_time="18:00",
+                         conflicts=None):
+    """과정 시간표 행 생성 (DB 비의존, 일괄 생성 작업 프로세스에서도 사용)
+    
+    강의 → 프로젝트 → 인턴쉽 순으로 근무일에 배치한다.
+    
+    Args:
+        course: courses 행 (code, lecture_hours, project_hours, internship_hours)
+        subjects: 과정 과목 목록 (get_course_subjects 형식)
+        calendar: WorkCalendar
+        conflicts: 다른 과정 강사 배정 색인 (ConflictIndex, 선택)
+    
+    Returns:
+        tuple: (시간표 행 dict 목록, 요약 dict, 강의 ScheduleResult)
+    """
+    course_code = course['code']
+    start_date = to_date(start_date)
+    
+    # 강의 기간: 과정 강의 시수만큼의 근무일 (과정 등록 시 계산한 단계별 일정과 같은 기준)
+    lecture_days = working_days_needed(course['lecture_hours'] or 0)
+    project_start = (calendar.nth_working_day(start_date, lecture_days) + timedelta(days=1)
+                     if lecture_days else start_date)
+    
+    # 강의 단계: 강의 기간 안에서 과정 과목을 요일 기반으로 오전/오후 배정
+    # (기간 안에 못 채운 과목 시수는 incomplete_hours로 보고)
+    slots = SlotConfig.from_day(start_time, end_time)
+    lecture = schedule(subjects, calendar.holidays, start_date, project_start - timedelta(days=1), slots,
+                       conflicts=conflicts)
+    lecture_dates = [d.date for d in lecture.days]
+    
+    # 프로젝트 단계 (강의 기간 다음)
+    project_days = working_days_needed(course['project_hours'] or 0)
+    project_dates = calendar.working_dates(project_start, project_days) if project_days else []
+    
+    # 인턴쉽 단계 (프로젝트 다음)
+    internship_days = working_days_needed(course['internship_hours'] or 0)
+    if internship_days > 0:
+        internship_start = project_dates[-1] + timedelta(days=1) if project_dates else project_start
+        internship_dates = calendar.working_dates(internship_start, internship_days)
+    else:
+        internship_dates = []
+    
+    entries = []
+    subjects_by_code = {s['code']: s for s in subjects}
+    
+    # 강의 시간표 (오전/오후 슬롯별 1행)
+    for class_date, slot_start, slot_end, subject_code, hours in lecture.to_rows():
+        subject = subjects_by_code[subject_code]
+        pick = lecture.instructors.get((class_date, 'am' if slot_start == slots.am_start else 'pm'))
+        entries.append({
+            'course_code': course_code,
+            'subject_code': subject_code,
+            'class_date': class_date.strftime("%Y-%m-%d"),
+            'start_time': slot_start.strftime("%H:%M"),
+            'end_time': slot_end.strftime("%H:%M"),
+            'instructor_code': pick.code if pick else subject['main_instructor'],
+            'type': 'lecture',
+            'notes': f"{subject['name']} 수업"
+        })
+    
+    # 프로젝트/인턴쉽 시간표 (하루 1행)
+    for dates, entry_type, notes in ((project_dates, 'project', '프로젝트 실습'),
+                                     (internship_dates, 'internship', '인턴쉽')):
+        for day in dates:
+            entries.append({
+                'course_code': course_code,
+                'subject_code': None,
+                'class_date': day.strftime("%Y-%m-%d"),
+                'start_time': start_time,
+                'end_time': end_time,
+                'instructor_code': None,
+                'type': entry_type,
+                'notes': notes
+            })
+    
+    all_dates = lecture_dates + project_dates + internship_dates
+    end_date = all_dates[-1] if all_dates else start_date
+    details = {
+        "course_code": course_code,
+        "start_date": start_date.strftime("%Y-%m-%d"),
+        "end_date": end_date.strftime("%Y-%m-%d"),
+        "total_days": len(all_dates),
+        "lecture_days": len(lecture_dates),
+        "project_days": len(project_dates),
+        "internship_days": len(internship_dates),
+        "total_entries": len(entries),
+        "incomplete_hours": sum(h for h in lecture.remaining.values() if h > 0),
+        "instructor_substitutions": lecture.substitutions,
+        "instructor_conflicts": len(lecture.conflicts)
+    }
+    return entries, details, lecture
+
+
+def working_days_needed(total_hours, hours_per_day=HOURS_PER_DAY):
+    """필요한 근무일 수 (올림)"""
+    return (total_hours + hours_per_day - 1) // hours_per_day
+
+
+def diff_lecture_rows(desired, stored_rows):
+    """저장된 강의 행과 현재 시간표 비교
+    
+    Args:
+        desired: {(날짜, 시작시간): (과목코드, 종료시간, 강사코드)}
+        stored_rows: DB 행 목록 (id, class_date, start_time, end_time, subject_code, instructor_code)
+    
+    Returns:
+        tuple: (추가 [(키, 값)], 수정 [(과목코드, 종료시간, 강사코드, id)], 삭제 [id])
+    """
+    inserts = []
+    updates = []
+    deletes = []
+    
+    seen = set()
+    for row in stored_rows:
+        key = (to_date(row['class_date']), to_time(row['start_time']))
+        
+        # 현재 시간표에 없거나 같은 슬롯의 중복 행이면 삭제
+        if key not in desired or key in seen:
+            deletes.append(row['id'])
+            continue
+        seen.add(key)
+        
+        subject_code, end, instructor_code = desired[key]
+        if (row['subject_code'] != subject_code
+                or to_time(row['end_time']) != end
+                or row['instructor_code'] != instructor_code):
+            updates.append((subject_code, end, instructor_code, row['id']))
+    
+    for key, value in desired.items():
+        if key not in seen:
+            inserts.append((key, value))
+    
+    return inserts, updates, deletes
+
+
+def save_lecture_rows(db, course_code, desired):
+    """과정 강의 시간표를 현재 시간표와 같게 저장 (바뀐 행만 INSERT/UPDATE/DELETE)
+    
+    저장된 행을 FOR UPDATE로 읽고 비교/저장까지 한 트랜잭션에서 처리한다.
+    조회가 실패하면 예외가 그대로 전달되고 아무것도 쓰지 않는다.
+    (빈 결과로 비교하면 모든 행을 새로 INSERT해서 시간표가 중복됨)
+    
+    Args:
+        desired: {(날짜, 시작시간): (과목코드, 종료시간, 강사코드)}
+    
+    Returns:
+        tuple: (추가, 수정, 삭제 행 수)
+    """
+    with db.transaction():
+        stored_rows = db.fetch_all("""
+            SELECT id, class_date, start_time, end_time, subject_code, instructor_code
+            FROM timetables
+            WHERE course_code = %s AND type = 'lecture'
+            FOR UPDATE
+        """, (course_code,))
+        
+        inserts, updates, deletes = diff_lecture_rows(desired, stored_rows)
+        
+        if deletes:
+            placeholders = ', '.join(['%s'] * len(deletes))
+            db.execute_query(f"DELETE FROM timetables WHERE id IN ({placeholders})", tuple(deletes))
+        
+        if updates:
+            db.execute_many("""
+                UPDATE timetables
+                SET subject_code = %s, end_time = %s, instructor_code = %s
+                WHERE id = %s
+            """, updates)
+        
+        if inserts:
+            # pymysql이 다중 행 VALUES로 묶을 수 있도록 모든 값을 파라미터로 전달
+            db.execute_many("""
+                INSERT INTO timetables 
+                (course_code, subject_code, class_date, start_time, end_time, instructor_code, type)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """, [
+                (course_code, subject_code, class_date, start, end, instructor_code, 'lecture')
+                for (class_date, start), (subject_code, end, instructor_code) in inserts
+            ])
+    
+    return len(inserts), len(updates), len(deletes)
 
 
 class TimetableGenerator:
@@ -17,44 +235,41 @@ class TimetableGenerator:
     def __init__(self, db_manager):
         self.db = db_manager
         
+    def get_calendar(self):
+        """공용 근무일 달력 (공휴일 테이블 기준)"""
+        return get_work_calendar(self.db)
+    
     def get_holidays(self):
-        """공휴일 목록 조회"""
-        try:
-            query = "SELECT holiday_date FROM holidays"
-            rows = self.db.fetch_all(query)
-            return [row['holiday_date'] for row in rows]
-        except Exception as e:
-            print(f"공휴일 조회 오류: {str(e)}")
-            return []
+        """공휴일 목록 조회 (set)"""
+        return self.get_calendar().holidays
     
-    def is_working_day(self, date, holidays):
+    def is_working_day(self, date, holidays=None):
         """근무일 여부 확인 (월~금, 공휴일 제외)"""
-        # 토요일(5) 또는 일요일(6) 체크
-        if date.weekday() >= 5:
-            return False
-        
-        # 공휴일 체크
-        if date.date() in holidays:
-            return False
-        
-        return True
+        if holidays is None:
+            return self.get_calendar().is_working_day(date)
+        return date.weekday() < 5 and to_date(date) not in holidays
     
-    def calculate_working_days(self, start_date, total_hours, hours_per_day=8):
+    def calculate_working_days(self, total_hours, hours_per_day=8):
         """필요한 근무일 수 계산"""
-        days_needed = (total_hours + hours_per_day - 1) // hours_per_day  # 올림
-        return days_needed
+        return working_days_needed(total_hours, hours_per_day)
     
-    def generate_dates(self, start_date, days_needed, holidays):
-        """근무일만 포함한 날짜 리스트 생성"""
-        dates = []
-        current_date = start_date
-        
-        while len(dates) < days_needed:
-            if self.is_working_day(current_date, holidays):
-                dates.append(current_date)
-            current_date += timedelta(days=1)
-        
-        return dates
+    def generate_dates(self, start_date, days_needed):
+        """시작일부터(당일 포함) 근무일 days_needed개 목록"""
+        return self.get_calendar().working_dates(start_date, days_needed)
+    
+    def get_course_subjects(self, course_code):
+        """과정에 선택된 과목 조회 (선택된 과목이 없으면 전체 과목)"""
+        subjects = self.db.fetch_all(f"""
+            SELECT {SUBJECT_COLUMNS}
+            FROM subjects s
+            INNER JOIN course_subjects cs ON s.code = cs.subject_code
+            {SUBJECT_JOINS}
+            WHERE cs.course_code = %s
+            ORDER BY cs.display_order, s.hours ASC
+        """, (course_code,))
+        if subjects:
+            return subjects
+        return self.db.fetch_all(f"SELECT {SUBJECT_COLUMNS} FROM subjects s {SUBJECT_JOINS} ORDER BY s.code") or []
     
     def generate_timetable(self, course_code, start_date, start_time="09:00", end_time="18:00"):
         """
@@ -77,128 +292,27 @@ class TimetableGenerator:
             if not course:
                 return {"success": False, "message": "과정을 찾을 수 없습니다."}
             
-            lecture_hours = course['lecture_hours']
-            project_hours = course['project_hours']
-            internship_hours = course['internship_hours']
-            
-            # 2. 공휴일 목록 조회
-            holidays = self.get_holidays()
-            
-            # 3. 하루 수업 시간 계산 (예: 09:00-18:00 = 8시간, 점심 1시간 제외)
-            hours_per_day = 8
-            
-            # 4. 각 단계별 날짜 생성
-            if isinstance(start_date, str):
-                start_date = datetime.strptime(start_date, "%Y-%m-%d")
-            
-            # 강의 단계
-            lecture_days = self.calculate_working_days(lecture_hours, hours_per_day)
-            lecture_dates = self.generate_dates(start_date, lecture_days, holidays)
-            
-            # 프로젝트 단계 (강의 다음)
-            project_start = lecture_dates[-1] + timedelta(days=1) if lecture_dates else start_date
-            project_days = self.calculate_working_days(project_hours, hours_per_day)
-            project_dates = self.generate_dates(project_start, project_days, holidays)
-            
-            # 인턴쉽 단계 (프로젝트 다음)
-            if internship_hours > 0:
-                internship_start = project_dates[-1] + timedelta(days=1) if project_dates else project_start
-                internship_days = self.calculate_working_days(internship_hours, hours_per_day)
-                internship_dates = self.generate_dates(internship_start, internship_days, holidays)
-            else:
-                internship_dates = []
-            
-            # 5. 교과목 목록 조회
-            subjects_query = "SELECT * FROM subjects ORDER BY code"
-            subjects = self.db.fetch_all(subjects_query)
-            
-            # 6. 시간표 데이터 생성
-            timetable_entries = []
-            subject_idx = 0
-            
-            # 강의 시간표 생성
-            for date in lecture_dates:
-                if subject_idx < len(subjects):
-                    subject = subjects[subject_idx % len(subjects)]
-                    
-                    entry = {
-                        'course_code': course_code,
-                        'subject_code': subject['code'],
-                        'class_date': date.strftime("%Y-%m-%d"),
-                        'start_time': start_time,
-                        'end_time': end_time,
-                        'instructor_code': subject['main_instructor'],
-                        'type': 'lecture',
-                        'notes': f"{subject['name']} 수업"
-                    }
-                    timetable_entries.append(entry)
-                    subject_idx += 1
-            
-            # 프로젝트 시간표 생성
-            for date in project_dates:
-                entry = {
-                    'course_code': course_code,
-                    'subject_code': None,
-                    'class_date': date.strftime("%Y-%m-%d"),
-                    'start_time': start_time,
-                    'end_time': end_time,
-                    'instructor_code': None,
-                    'type': 'project',
-                    'notes': '프로젝트 실습'
-                }
-                timetable_entries.append(entry)
-            
-            # 인턴쉽 시간표 생성
-            for date in internship_dates:
-                entry = {
-                    'course_code': course_code,
-                    'subject_code': None,
-                    'class_date': date.strftime("%Y-%m-%d"),
-                    'start_time': start_time,
-                    'end_time': end_time,
-                    'instructor_code': None,
-                    'type': 'internship',
-                    'notes': '인턴쉽'
-                }
-                timetable_entries.append(entry)
-            
-            # 7. 데이터베이스에 저장
-            insert_query = """
-                INSERT INTO timetables 
-                (course_code, subject_code, class_date, start_time, end_time, instructor_code, type, notes)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            inserted_count = 0
-            for entry in timetable_entries:
-                if self.db.execute_query(insert_query, (
-                    entry['course_code'],
-                    entry['subject_code'],
-                    entry['class_date'],
-                    entry['start_time'],
-                    entry['end_time'],
-                    entry['instructor_code'],
-                    entry['type'],
-                    entry['notes']
-                )):
-                    inserted_count += 1
+            # 2. 강의/프로젝트/인턴쉽 시간표 행 생성
+            #    (다른 과정에서 같은 반일에 수업 중인 주강사는 예비강사로 대체)
+            subjects = self.get_course_subjects(course_code)
+            slots = SlotConfig.from_day(start_time, end_time)
+            lecture_end = course.get('lecture_end_date') or (to_date(start_date) + timedelta(days=365))
+            conflicts = ConflictIndex.load(self.db, start_date, lecture_end,
+                                           exclude_course=course_code, boundary=slots.am_end)
+            timetable_entries, details, lecture = build_course_entries(
+                course, subjects, self.get_calendar(), start_date, start_time, end_time, conflicts)
             
-            # 8. 결과 반환
-            end_date = internship_dates[-1] if internship_dates else (project_dates[-1] if project_dates else lecture_dates[-1])
+            # 3. 데이터베이스에 저장
+            inserted_count = self.db.execute_many(INSERT_QUERY, [entry_params(entry) for entry in timetable_entries])
+            if inserted_count is None:
+                return {"success": False, "message": "시간표 저장 중 오류가 발생했습니다."}
             
+            # 4. 결과 반환
+            details["total_entries"] = inserted_count
             return {
                 "success": True,
                 "message": f"{inserted_count}개의 시간표가 생성되었습니다.",
-                "details": {
-                    "course_code": course_code,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                    "total_days": len(lecture_dates) + len(project_dates) + len(internship_dates),
-                    "lecture_days": len(lecture_dates),
-                    "project_days": len(project_dates),
-                    "internship_days": len(internship_dates),
-                    "total_entries": inserted_count
-                }
+                "details": details
             }
             
         except Exception as e:
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+근무일 달력 (주말/공휴일 제외)
+
+공휴일 테이블로 한 번 만들어 두고 정렬된 근무일 배열을 bisect로 조회한다.
+- N번째 근무일, 두 날짜 사이 근무일 수, 기간 내 공휴일: O(log n)
+- 공휴일은 기준 데이터 캐시에서 읽고, 캐시가 바뀌면 달력을 다시 만든다
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.helpers import to_date
+from database.reference_cache import get_reference_cache, invalidate_reference
+
+
+class WorkCalendar:
+    """근무일 달력
+
+    Args:
+        holidays: 공휴일 date 모음 또는 {date: 이름} dict
+    """
+
+    # 근무일 배열을 만들 때 앞뒤로 둘 여유 (일)
+    MARGIN_DAYS = 366 * 3
+
+    def __init__(self, holidays=()):
+        if isinstance(holidays, dict):
+            self.names = {to_date(d): name for d, name in holidays.items()}
+        else:
+            self.names = {to_date(d): None for d in holidays}
+        self.holidays = frozenset(self.names)
+        self._sorted_holidays = sorted(self.holidays)
+        self._weekday_holidays = [d for d in self._sorted_holidays if d.weekday() < 5]
+
+        # 근무일 배열 범위 (포함): 공휴일 데이터와 오늘 주변
+        anchors = self._sorted_holidays + [date.today()]
+        self._first = None
+        self._last = None
+        self._days = []      # 근무일 서수(ordinal) 오름차순
+        self._build(min(anchors) - timedelta(days=self.MARGIN_DAYS),
+                    max(anchors) + timedelta(days=self.MARGIN_DAYS))
+
+    def _build(self, first, last):
+        """[first, last] 범위의 근무일 배열 생성"""
+        holidays = self.holidays
+        days = []
+        d = first
+        one = timedelta(days=1)
+        while d <= last:
+            if d.weekday() < 5 and d not in holidays:
+                days.append(d.toordinal())
+            d += one
+        self._first, self._last, self._days = first, last, days
+
+    def _ensure(self, first, last=None):
+        """조회 범위가 배열 밖이면 범위를 넓혀서 다시 생성"""
+        last = last or first
+        if self._first <= first and last <= self._last:
+            return
+        margin = timedelta(days=self.MARGIN_DAYS)
+        self._build(min(first - margin, self._first), max(last + margin, self._last))
+
+    def is_working_day(self, d):
+        """근무일 여부 (월~금, 공휴일 제외)"""
+        d = to_date(d)
+        return d.weekday() < 5 and d not in self.holidays
+
+    def next_working_day(self, d):
+        """d 이후(당일 포함) 첫 근무일"""
+        return self.nth_working_day(d, 1)
+
+    def nth_working_day(self, start, n):
+        """start부터(당일 포함) 세어 n번째 근무일
+
+        n이 0 이하이면 start를 그대로 반환한다.
+        """
+        start = to_date(start)
+        if n <= 0:
+            return start
+        self._ensure(start)
+        while True:
+            i = bisect_left(self._days, start.toordinal()) + n - 1
+            if i < len(self._days):
+                return date.fromordinal(self._days[i])
+            self._ensure(start, self._last + timedelta(days=n * 2))
+
+    def working_dates(self, start, n):
+        """start부터(당일 포함) 근무일 n개 목록"""
+        if n <= 0:
+            return []
+        start = to_date(start)
+        self.nth_working_day(start, n)  # 배열이 n개를 포함하도록 확장
+        i = bisect_left(self._days, start.toordinal())
+        return [date.fromordinal(o) for o in self._days[i:i + n]]
+
+    def working_days_between(self, start, end):
+        """start ~ end (양끝 포함) 근무일 수"""
+        start = to_date(start)
+        end = to_date(end)
+        if end < start:
+            return 0
+        self._ensure(start, end)
+        return bisect_right(self._days, end.toordinal()) - bisect_left(self._days, start.toordinal())
+
+    def holidays_between(self, start, end, weekdays_only=False):
+        """start ~ end (양끝 포함) 공휴일 목록 (날짜순)
+
+        Args:
+            weekdays_only: True면 주말과 겹치지 않는 공휴일만
+        """
+        start = to_date(start)
+        end = to_date(end)
+        source = self._weekday_holidays if weekdays_only else self._sorted_holidays
+        return source[bisect_left(source, start):bisect_right(source, end)]
+
+    def holiday_name(self, d):
+        """공휴일 이름 (공휴일이 아니거나 이름이 없으면 None)"""
+        return self.names.get(to_date(d))
+
+
+_calendar = None
+_calendar_rows = None  # _calendar를 만든 공휴일 행 목록 (기준 데이터 캐시의 목록)
+_calendar_lock = threading.Lock()
+
+
+def get_work_calendar(db=None):
+    """공휴일 테이블로 만든 공용 근무일 달력 반환
+
+    공휴일 행은 기준 데이터 캐시에서 가져오고, 캐시가 다시 로드되어
+    행 목록이 바뀌었을 때만 달력을 새로 만든다.
+
+    Args:
+        db: DatabaseManager (없으면 새로 생성)
+    """
+    global _calendar, _calendar_rows
+    rows = get_reference_cache().rows('holidays', db)
+    calendar = _calendar
+    if calendar is not None and _calendar_rows is rows:
+        return calendar
+
+    with _calendar_lock:
+        if _calendar is None or _calendar_rows is not rows:
+            _calendar = WorkCalendar({row['holiday_date']: row['name'] for row in rows})
+            _calendar_rows = rows
+        return _calendar
+
+
+def invalidate_work_calendar():
+    """공휴일이 변경되었을 때 호출 (다음 조회 시 다시 생성)"""
+    global _calendar, _calendar_rows
+    invalidate_reference('holidays')
+    with _calendar_lock:
+        _calendar = None
+        _calendar_rows = None